@@ -0,0 +1,139 @@
+"""add_search_index
+
+Revision ID: 5f3a9c2e7d41
+Revises: a7c5e2f9b813
+Create Date: 2026-10-18 22:05:12.418203
+
+"""
+import unicodedata
+from typing import Any, Dict, Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f3a9c2e7d41'
+down_revision: Union[str, Sequence[str], None] = 'a7c5e2f9b813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Espacio de rowids por tipo de entidad (igual que SearchIndex en SQLite)
+_ROWID_STRIDE = 1 << 40
+
+# Documentos a indexar por tabla, con los mismos campos que _ENTITY_SPECS:
+# (tipo, código de tipo, tabla, título, subtítulos por orden de preferencia, cuerpo)
+_SOURCES = (
+    ('client', 1, 'clients', 'name', ('code',),
+     ('code', 'contact_person', 'email', 'notes')),
+    ('project', 2, 'projects', 'name', ('reference',),
+     ('reference', 'trigram', 'job_code', 'responsible_person', 'details', 'notes')),
+    ('employee', 3, 'employees', 'full_name', ('employee_code', 'position'),
+     ('employee_code', 'email', 'position', 'department', 'qualification_type',
+      'skills', 'notes')),
+)
+
+_BATCH_SIZE = 1000
+
+
+def _normalize(value: Any) -> str:
+    """Minúsculas y sin diacríticos, como ``normalize_text``."""
+    if isinstance(value, (list, tuple)):
+        value = " ".join(str(item) for item in value)
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", str(value).lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def _document(source: tuple, row: Any) -> Dict[str, Any]:
+    """Parámetros del documento de una fila de origen."""
+    entity_type, type_code, _, title_column, subtitle_columns, body_columns = source
+    title = row[title_column] or ""
+    subtitle: Optional[str] = next(
+        (row[name] for name in subtitle_columns if row[name]), None
+    )
+    return {
+        'entity_type': entity_type,
+        'entity_id': row['id'],
+        'rowid': type_code * _ROWID_STRIDE + row['id'],
+        'title': title,
+        'subtitle': subtitle or "",
+        'title_terms': _normalize(title),
+        'body_terms': " ".join(_normalize(row[name]) for name in body_columns if row[name]),
+    }
+
+
+def _backfill(bind: Any) -> None:
+    """
+    Indexa los clientes, proyectos y empleados que ya existen.
+
+    Sin esto el índice quedaría vacío en bases con datos: ``is_available``
+    devolvería True y las búsquedas no encontrarían nada hasta reescribir
+    cada entidad.
+    """
+    if bind.dialect.name == 'sqlite':
+        insert = sa.text(
+            "INSERT INTO search_index (rowid, entity_type, entity_id, title, "
+            "subtitle, title_terms, body_terms) VALUES (:rowid, :entity_type, "
+            ":entity_id, :title, :subtitle, :title_terms, :body_terms)"
+        )
+    else:
+        insert = sa.text(
+            "INSERT INTO search_index (entity_type, entity_id, title, subtitle, document) "
+            "VALUES (:entity_type, :entity_id, :title, :subtitle, "
+            "setweight(to_tsvector('simple', :title_terms), 'A') || "
+            "setweight(to_tsvector('simple', :body_terms), 'B'))"
+        )
+
+    for source in _SOURCES:
+        _, _, table_name, title_column, subtitle_columns, body_columns = source
+        names = dict.fromkeys(('id', title_column, *subtitle_columns, *body_columns))
+        table = sa.table(table_name, *(
+            sa.column(name, sa.JSON() if name == 'skills' else sa.Text())
+            for name in names
+        ))
+        rows = bind.execute(sa.select(table).order_by(table.c.id)).mappings()
+        for partition in rows.partitions(_BATCH_SIZE):
+            bind.execute(insert, [_document(source, row) for row in partition])
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+            "entity_type UNINDEXED, entity_id UNINDEXED, "
+            "title UNINDEXED, subtitle UNINDEXED, "
+            "title_terms, body_terms, "
+            "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        )
+    elif dialect == 'postgresql':
+        op.create_table(
+            'search_index',
+            sa.Column('entity_type', sa.String(length=20), nullable=False),
+            sa.Column('entity_id', sa.Integer(), nullable=False),
+            sa.Column('title', sa.Text(), nullable=False),
+            sa.Column('subtitle', sa.Text(), nullable=False, server_default=''),
+            sa.Column('document', postgresql.TSVECTOR(), nullable=False),
+            sa.PrimaryKeyConstraint('entity_type', 'entity_id'),
+        )
+        op.create_index(
+            'ix_search_index_document', 'search_index', ['document'],
+            postgresql_using='gin',
+        )
+    else:
+        return
+
+    _backfill(op.get_bind())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.drop_index('ix_search_index_document', table_name='search_index')
+    if dialect in ('sqlite', 'postgresql'):
+        op.execute("DROP TABLE IF EXISTS search_index")
@@ -0,0 +1,201 @@
+"""Compact change_logs into per-change diffs partitioned by month
+
+Revision ID: a7c5e2f9b813
+Revises: f0b3c7d9a1e4
+Create Date: 2026-10-19 00:30:00.000000
+
+"""
+import json
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c5e2f9b813'
+down_revision: Union[str, Sequence[str], None] = 'f0b3c7d9a1e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columnas que identifican un mismo cambio en las filas por campo
+_CHANGE_COLUMNS = (
+    'entity_type', 'entity_id', 'action', 'change_reason', 'changed_by',
+    'change_date', 'ip_address', 'user_agent', 'session_id',
+)
+
+_change_logs = sa.table(
+    'change_logs',
+    sa.column('id', sa.Integer()),
+    sa.column('entity_type', sa.String()),
+    sa.column('entity_id', sa.Integer()),
+    sa.column('project_id', sa.Integer()),
+    sa.column('action', sa.String()),
+    sa.column('field_name', sa.String()),
+    sa.column('old_value', sa.Text()),
+    sa.column('new_value', sa.Text()),
+    sa.column('changes', sa.Text()),
+    sa.column('change_reason', sa.Text()),
+    sa.column('changed_by', sa.String()),
+    sa.column('change_date', sa.DateTime()),
+    sa.column('period', sa.Integer()),
+    sa.column('ip_address', sa.String()),
+    sa.column('user_agent', sa.Text()),
+    sa.column('session_id', sa.String()),
+    sa.column('created_at', sa.DateTime()),
+    sa.column('updated_at', sa.DateTime()),
+)
+
+
+def _merge_field_rows(bind: Any) -> None:
+    """
+    Convierte las filas por campo en una fila por cambio con el diff en JSON.
+
+    Las filas de un mismo cambio (mismos entidad, acción, usuario, fecha y
+    contexto) se funden en la primera: su ``changes`` recibe
+    ``{"campo": [anterior, nuevo]}`` y el resto de filas del grupo, ya
+    incluidas en ese diff, se eliminan. Si un campo se repite dentro del
+    grupo, se empieza un cambio nuevo para no perder ningún valor.
+    """
+    table = _change_logs
+    rows = bind.execute(
+        sa.select(
+            table.c.id, table.c.field_name, table.c.old_value, table.c.new_value,
+            *(table.c[name] for name in _CHANGE_COLUMNS)
+        ).order_by(table.c.id)
+    ).mappings()
+
+    groups: Dict[Tuple[Any, ...], List[List[Any]]] = {}
+    for row in rows:
+        chunks = groups.setdefault(tuple(row[name] for name in _CHANGE_COLUMNS), [[]])
+        if not row['field_name'] or any(
+            previous['field_name'] == row['field_name'] for previous in chunks[-1]
+        ):
+            chunks.append([])
+        chunks[-1].append(row)
+
+    updates = []
+    merged_ids = []
+    for group in (chunk for chunks in groups.values() for chunk in chunks if chunk):
+        kept = group[0]
+        diff = {
+            row['field_name']: [row['old_value'], row['new_value']]
+            for row in group if row['field_name']
+        }
+        updates.append({
+            'row_id': kept['id'],
+            'changes': json.dumps(diff, ensure_ascii=False, sort_keys=True) if diff else None,
+            'period': kept['change_date'].year * 100 + kept['change_date'].month,
+            'project_id': kept['entity_id'] if kept['entity_type'] == 'Project' else None,
+        })
+        merged_ids.extend(row['id'] for row in group[1:])
+
+    if updates:
+        bind.execute(
+            table.update()
+            .where(table.c.id == sa.bindparam('row_id'))
+            .values(
+                changes=sa.bindparam('changes'),
+                period=sa.bindparam('period'),
+                project_id=sa.bindparam('project_id'),
+            ),
+            updates,
+        )
+    if merged_ids:
+        bind.execute(table.delete().where(table.c.id.in_(merged_ids)))
+
+    # Proyecto de los horarios y asignaciones que aún existen
+    for entity_type, source in (('Schedule', 'schedules'), ('ProjectAssignment', 'project_assignments')):
+        source_table = sa.table(source, sa.column('id', sa.Integer()), sa.column('project_id', sa.Integer()))
+        bind.execute(
+            table.update()
+            .where(table.c.entity_type == entity_type)
+            .values(project_id=(
+                sa.select(source_table.c.project_id)
+                .where(source_table.c.id == table.c.entity_id)
+                .scalar_subquery()
+            ))
+        )
+
+
+def _text(value: Any) -> Any:
+    """Valor de un diff como texto de las columnas por campo."""
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _split_diffs(bind: Any) -> None:
+    """Vuelve a escribir cada diff como una fila por campo."""
+    table = _change_logs
+    rows = bind.execute(
+        sa.select(table).where(table.c.changes.is_not(None)).order_by(table.c.id)
+    ).mappings()
+
+    updates = []
+    inserts = []
+    for row in rows:
+        fields = [
+            {'field_name': name, 'old_value': _text(before), 'new_value': _text(after)}
+            for name, (before, after) in json.loads(row['changes']).items()
+        ]
+        if not fields:
+            continue
+        updates.append({'row_id': row['id'], **fields[0]})
+        context = {
+            name: row[name]
+            for name in (*_CHANGE_COLUMNS, 'project_id', 'period', 'created_at', 'updated_at')
+        }
+        inserts.extend({**context, **field} for field in fields[1:])
+
+    if updates:
+        bind.execute(
+            table.update()
+            .where(table.c.id == sa.bindparam('row_id'))
+            .values(
+                field_name=sa.bindparam('field_name'),
+                old_value=sa.bindparam('old_value'),
+                new_value=sa.bindparam('new_value'),
+            ),
+            updates,
+        )
+    if inserts:
+        bind.execute(table.insert(), inserts)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('change_logs') as batch_op:
+        batch_op.add_column(sa.Column('project_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('changes', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('period', sa.Integer(), nullable=True))
+
+    # Las filas existentes se convierten al nuevo formato en lugar de descartarse
+    _merge_field_rows(op.get_bind())
+
+    with op.batch_alter_table('change_logs') as batch_op:
+        batch_op.drop_column('field_name')
+        batch_op.drop_column('old_value')
+        batch_op.drop_column('new_value')
+        batch_op.alter_column('period', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_index('ix_change_logs_entity', ['entity_type', 'entity_id', 'change_date'], unique=False)
+        batch_op.create_index('ix_change_logs_project', ['project_id', 'change_date'], unique=False)
+        batch_op.create_index('ix_change_logs_period', ['period', 'change_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('change_logs') as batch_op:
+        batch_op.add_column(sa.Column('new_value', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('old_value', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('field_name', sa.String(length=100), nullable=True))
+
+    _split_diffs(op.get_bind())
+
+    with op.batch_alter_table('change_logs') as batch_op:
+        batch_op.drop_index('ix_change_logs_period')
+        batch_op.drop_index('ix_change_logs_project')
+        batch_op.drop_index('ix_change_logs_entity')
+        batch_op.drop_column('period')
+        batch_op.drop_column('changes')
+        batch_op.drop_column('project_id')
@@ -0,0 +1,33 @@
+"""Add covering period index to workloads
+
+Revision ID: b7d2c4e8f910
+Revises: a94aa19e97c8
+Create Date: 2026-10-18 22:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2c4e8f910'
+down_revision: Union[str, Sequence[str], None] = 'a94aa19e97c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_workloads_period',
+        'workloads',
+        ['year', 'month', 'week_number', 'date',
+         'employee_id', 'project_id', 'planned_hours', 'actual_hours', 'is_billable'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_workloads_period', table_name='workloads')
@@ -0,0 +1,81 @@
+"""Add vacation_balances ledger
+
+Revision ID: c3e8a1f5d207
+Revises: b7d2c4e8f910
+Create Date: 2026-10-18 22:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e8a1f5d207'
+down_revision: Union[str, Sequence[str], None] = 'b7d2c4e8f910'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('vacation_balances',
+    sa.Column('employee_id', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('vacation_type', sa.Enum('ANNUAL', 'SICK', 'PERSONAL', 'MATERNITY', 'PATERNITY', 'TRAINING', 'OTHER', name='vacationtype'), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'APPROVED', 'REJECTED', 'CANCELLED', name='vacationstatus'), nullable=False),
+    sa.Column('request_count', sa.Integer(), nullable=False),
+    sa.Column('total_days', sa.Integer(), nullable=False),
+    sa.Column('business_days', sa.Integer(), nullable=False),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('employee_id', 'year', 'vacation_type', 'status', name='uq_vacation_balance_key')
+    )
+
+    # Carga inicial del libro desde el histórico de vacaciones
+    vacations = sa.table(
+        'vacations',
+        sa.column('employee_id', sa.Integer()),
+        sa.column('start_date', sa.Date()),
+        sa.column('vacation_type', sa.String()),
+        sa.column('status', sa.String()),
+        sa.column('total_days', sa.Integer()),
+        sa.column('business_days', sa.Integer()),
+    )
+    balances = sa.table(
+        'vacation_balances',
+        sa.column('employee_id', sa.Integer()),
+        sa.column('year', sa.Integer()),
+        sa.column('vacation_type', sa.String()),
+        sa.column('status', sa.String()),
+        sa.column('request_count', sa.Integer()),
+        sa.column('total_days', sa.Integer()),
+        sa.column('business_days', sa.Integer()),
+        sa.column('created_at', sa.DateTime()),
+        sa.column('updated_at', sa.DateTime()),
+    )
+    year = sa.extract('year', vacations.c.start_date)
+    op.execute(balances.insert().from_select(
+        ['employee_id', 'year', 'vacation_type', 'status',
+         'request_count', 'total_days', 'business_days', 'created_at', 'updated_at'],
+        sa.select(
+            vacations.c.employee_id,
+            year,
+            vacations.c.vacation_type,
+            vacations.c.status,
+            sa.func.count(),
+            sa.func.sum(vacations.c.total_days),
+            sa.func.sum(vacations.c.business_days),
+            sa.func.now(),
+            sa.func.now(),
+        ).group_by(vacations.c.employee_id, year, vacations.c.vacation_type, vacations.c.status)
+    ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('vacation_balances')
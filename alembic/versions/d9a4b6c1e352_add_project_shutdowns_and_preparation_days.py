@@ -0,0 +1,43 @@
+"""Add project_shutdowns and projects.preparation_days
+
+Revision ID: d9a4b6c1e352
+Revises: c3e8a1f5d207
+Create Date: 2026-10-18 23:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a4b6c1e352'
+down_revision: Union[str, Sequence[str], None] = 'c3e8a1f5d207'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('project_shutdowns',
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('end_date', sa.Date(), nullable=False),
+    sa.Column('label', sa.String(length=100), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_project_shutdowns_project_id'), 'project_shutdowns', ['project_id'], unique=False)
+    op.add_column('projects', sa.Column('preparation_days', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('projects', 'preparation_days')
+    op.drop_index(op.f('ix_project_shutdowns_project_id'), table_name='project_shutdowns')
+    op.drop_table('project_shutdowns')
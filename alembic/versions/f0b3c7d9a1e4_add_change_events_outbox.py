@@ -0,0 +1,50 @@
+"""Add change_events outbox and change_event_checkpoints
+
+Revision ID: f0b3c7d9a1e4
+Revises: d9a4b6c1e352
+Create Date: 2026-10-18 23:55:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f0b3c7d9a1e4'
+down_revision: Union[str, Sequence[str], None] = 'd9a4b6c1e352'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('change_events',
+    sa.Column('entity', sa.String(length=50), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=True),
+    sa.Column('operation', sa.Enum('INSERT', 'UPDATE', 'DELETE', name='changeoperation'), nullable=False),
+    sa.Column('changed_columns', sa.Text(), nullable=True),
+    sa.Column('version', sa.Integer(), nullable=True),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_change_events_entity_entity_id', 'change_events', ['entity', 'entity_id'], unique=False)
+    op.create_table('change_event_checkpoints',
+    sa.Column('consumer', sa.String(length=100), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('consumer')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('change_event_checkpoints')
+    op.drop_index('ix_change_events_entity_entity_id', table_name='change_events')
+    op.drop_table('change_events')
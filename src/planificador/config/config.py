@@ -348,6 +348,22 @@ class Settings(BaseSettings):
         description="URL de conexión a la base de datos"
     )
     
+    # Configuraciones de instrumentación de consultas
+    db_instrumentation_enabled: bool = Field(
+        default=False,
+        description="Registra latencia y número de consultas por operación de repositorio"
+    )
+    db_slow_query_ms: float = Field(
+        default=200.0,
+        gt=0,
+        description="Umbral en milisegundos para registrar una consulta como lenta"
+    )
+    db_n_plus_one_threshold: int = Field(
+        default=10,
+        ge=1,
+        description="Sentencias por llamada a una fachada a partir de las cuales se marca un posible N+1"
+    )
+    
     # Configuraciones de fechas
     dates: DateSettings = Field(
         default_factory=DateSettings,
@@ -363,6 +379,29 @@ class Settings(BaseSettings):
         default=None,
         description="Archivo de log (opcional)"
     )
+    log_async_sink: bool = Field(
+        default=True,
+        description="Escribe los logs a archivo en lotes desde un hilo de fondo"
+    )
+    log_queue_size: int = Field(
+        default=10000,
+        ge=1,
+        description="Capacidad de la cola del sink asíncrono de logs"
+    )
+    log_batch_size: int = Field(
+        default=256,
+        ge=1,
+        description="Número máximo de mensajes escritos por lote"
+    )
+    log_flush_interval: float = Field(
+        default=0.2,
+        gt=0,
+        description="Espera máxima en segundos antes de escribir un lote incompleto"
+    )
+    log_overflow_policy: str = Field(
+        default="block",
+        description="Política con la cola llena: block, drop_newest o drop_oldest"
+    )
     
     # Configuraciones de seguridad
     secret_key: str = Field(
@@ -441,6 +480,31 @@ class Settings(BaseSettings):
                 original_error=e
             )
     
+    @field_validator('log_overflow_policy', mode='before')
+    def validate_log_overflow_policy(cls, v):
+        """Valida que la política de desbordamiento del sink de logs sea válida."""
+        try:
+            valid_policies = ['block', 'drop_newest', 'drop_oldest']
+            if v.lower() not in valid_policies:
+                raise create_configuration_error(
+                    message=f"Política de desbordamiento inválida: {v}. Debe ser una de: {valid_policies}",
+                    config_key="log_overflow_policy",
+                    config_file="config.py",
+                    expected_value=f"Una de: {valid_policies}",
+                    actual_value=v
+                )
+            return v.lower()
+        except ConfigurationError:
+            raise
+        except Exception as e:
+            logger.error(f"Error inesperado al validar política de desbordamiento: {e}")
+            raise create_configuration_error(
+                message=f"Error inesperado al validar política de desbordamiento: {e}",
+                config_key="log_overflow_policy",
+                config_file="config.py",
+                original_error=e
+            )
+
     @field_validator('secret_key', mode='before')
     def validate_secret_key(cls, v):
         """Valida que la clave secreta tenga una longitud mínima."""
@@ -5,16 +5,34 @@ Este módulo proporciona una configuración centralizada para el logging
 en toda la aplicación, asegurando que los logs sean consistentes,
 estructurados (en formato JSON) y fáciles de analizar.
 
+Clases:
+    AsyncBatchSink: Sink de Loguru que escribe en lotes desde un hilo de fondo.
+
 Funciones:
     setup_logging: Configura y activa el logger de Loguru.
 """
 
 import sys
+import gzip
+import queue
+import shutil
+import atexit
 import logging
+import threading
+import time
+from enum import Enum
 from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, Union
 from loguru import logger
 
 
+# Nivel a partir del cual los mensajes nunca se descartan (ERROR)
+CRITICAL_LEVEL_NO = 40
+
+# Marcador interno para detener el hilo escritor
+_STOP = object()
+
+
 class InterceptHandler(logging.Handler):
     """
     Handler para interceptar los logs estándar de Python y redirigirlos a Loguru.
@@ -42,11 +60,304 @@ class InterceptHandler(logging.Handler):
         )
 
 
+class OverflowPolicy(Enum):
+    """
+    Política a aplicar cuando la cola del sink asíncrono está llena.
+    """
+    BLOCK = "block"              # Backpressure: el llamador espera espacio
+    DROP_NEWEST = "drop_newest"  # Descarta el mensaje entrante
+    DROP_OLDEST = "drop_oldest"  # Descarta el mensaje más antiguo en cola
+
+
+class AsyncBatchSink:
+    """
+    Sink de Loguru que desacopla la escritura del hilo que genera el log.
+
+    Cada mensaje se encola en una cola acotada y un hilo de fondo la drena
+    en lotes, escribiendo y haciendo flush una sola vez por lote. Cuando la
+    cola se llena se aplica la política de desbordamiento configurada; los
+    mensajes de nivel ERROR o superior nunca se descartan por política, solo
+    esperan (con timeout) a que haya espacio.
+
+    Attributes:
+        overflow_policy: Política aplicada cuando la cola está llena.
+        batch_size: Número máximo de mensajes escritos por lote.
+        flush_interval: Tiempo máximo en segundos que un mensaje espera en cola.
+    """
+
+    def __init__(
+        self,
+        target: Union[str, Path, TextIO],
+        max_queue_size: int = 10000,
+        batch_size: int = 256,
+        flush_interval: float = 0.2,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        block_timeout: float = 1.0,
+        max_bytes: Optional[int] = None,
+        backup_count: int = 5,
+        compress: bool = False,
+        encoding: str = "utf-8"
+    ):
+        """
+        Inicializa el sink y arranca el hilo escritor.
+
+        Args:
+            target: Ruta del archivo de destino o stream de texto abierto.
+            max_queue_size: Capacidad máxima de la cola de mensajes.
+            batch_size: Número máximo de mensajes por lote.
+            flush_interval: Espera máxima en segundos para completar un lote.
+            overflow_policy: Política a aplicar con la cola llena.
+            block_timeout: Espera máxima del llamador cuando hay backpressure.
+            max_bytes: Tamaño máximo del archivo antes de rotar (solo archivos).
+            backup_count: Número de archivos rotados a conservar.
+            compress: Si es True, comprime con gzip los archivos rotados.
+            encoding: Codificación del archivo de destino.
+        """
+        self.overflow_policy = overflow_policy
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.block_timeout = block_timeout
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compress = compress
+        self.encoding = encoding
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._path: Optional[Path] = None
+        self._stream: Optional[TextIO] = None
+        self._owns_stream = False
+        self._bytes_written = 0
+        self._closed = False
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "batches": 0,
+            "errors": 0,
+        }
+
+        if isinstance(target, (str, Path)):
+            self._path = Path(target)
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._open_file()
+        else:
+            self._stream = target
+
+        self._worker = threading.Thread(
+            target=self._run,
+            name=f"AsyncBatchSink-{self._path.name if self._path else 'stream'}",
+            daemon=True
+        )
+        self._worker.start()
+        atexit.register(self.close)
+
+    def __call__(self, message: Any) -> None:
+        """
+        Encola un mensaje formateado por Loguru.
+
+        Args:
+            message: Mensaje formateado (str con atributo ``record``).
+        """
+        if self._closed:
+            return
+
+        level_no = self._level_no(message)
+        try:
+            if level_no >= CRITICAL_LEVEL_NO or self.overflow_policy == OverflowPolicy.BLOCK:
+                self._queue.put(message, timeout=self.block_timeout)
+            elif self.overflow_policy == OverflowPolicy.DROP_OLDEST:
+                self._put_dropping_oldest(message)
+            else:
+                self._queue.put_nowait(message)
+        except queue.Full:
+            self._increment("dropped")
+            return
+
+        self._increment("enqueued")
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Contadores de actividad del sink.
+
+        Returns:
+            Diccionario con mensajes encolados, escritos, descartados,
+            lotes escritos, errores de escritura y tamaño actual de la cola.
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["queue_size"] = self._queue.qsize()
+        return stats
+
+    def flush(self) -> None:
+        """
+        Bloquea hasta que todos los mensajes encolados hayan sido escritos.
+        """
+        if self._worker.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """
+        Escribe los mensajes pendientes, detiene el hilo y cierra el archivo.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        self._queue.put(_STOP)
+        self._worker.join()
+
+        if self._owns_stream and self._stream:
+            self._stream.close()
+            self._stream = None
+        atexit.unregister(self.close)
+
+    # ------------------------------------------------------------------
+    # Internos
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _level_no(message: Any) -> int:
+        """Obtiene el nivel numérico del registro asociado al mensaje."""
+        record = getattr(message, "record", None)
+        if record is None:
+            return 0
+        return record["level"].no
+
+    def _increment(self, key: str, amount: int = 1) -> None:
+        """Incrementa un contador de estadísticas de forma segura."""
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def _put_dropping_oldest(self, message: Any) -> None:
+        """
+        Encola descartando el mensaje descartable más antiguo si la cola está llena.
+
+        Los mensajes ERROR o superiores ya encolados nunca se desalojan; si
+        solo quedan mensajes de ese nivel se espera espacio como con BLOCK.
+        """
+        while True:
+            try:
+                self._queue.put_nowait(message)
+                return
+            except queue.Full:
+                pass
+            if self._evict_oldest_droppable():
+                self._increment("dropped")
+                continue
+            self._queue.put(message, timeout=self.block_timeout)
+            return
+
+    def _evict_oldest_droppable(self) -> bool:
+        """Retira de la cola el mensaje más antiguo por debajo del nivel ERROR."""
+        with self._queue.mutex:
+            pending = self._queue.queue
+            for index, queued in enumerate(pending):
+                if queued is _STOP or self._level_no(queued) >= CRITICAL_LEVEL_NO:
+                    continue
+                del pending[index]
+                self._queue.unfinished_tasks -= 1
+                if not self._queue.unfinished_tasks:
+                    self._queue.all_tasks_done.notify_all()
+                self._queue.not_full.notify()
+                return True
+        return False
+
+    def _run(self) -> None:
+        """Bucle del hilo escritor: drena la cola en lotes."""
+        stop = False
+        while not stop:
+            first = self._queue.get()
+            if first is _STOP:
+                self._queue.task_done()
+                break
+
+            batch: List[Any] = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        item = self._queue.get(timeout=remaining)
+                    else:
+                        item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    self._queue.task_done()
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._write_batch(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _write_batch(self, batch: List[Any]) -> None:
+        """Escribe un lote completo con un único flush."""
+        data = "".join(str(message) for message in batch)
+        try:
+            size = len(data.encode(self.encoding))
+            if self._path and self.max_bytes and self._bytes_written + size > self.max_bytes:
+                self._rotate()
+            self._stream.write(data)
+            self._stream.flush()
+            self._bytes_written += size
+            self._increment("written", len(batch))
+            self._increment("batches")
+        except Exception as e:
+            self._increment("errors")
+            sys.__stderr__.write(f"AsyncBatchSink: error al escribir lote de logs: {e}\n")
+
+    def _open_file(self) -> None:
+        """Abre el archivo de destino en modo append."""
+        self._stream = open(self._path, "a", encoding=self.encoding)
+        self._owns_stream = True
+        self._bytes_written = self._path.stat().st_size
+
+    def _rotate(self) -> None:
+        """Rota el archivo actual, opcionalmente comprimiéndolo."""
+        self._stream.close()
+
+        rotated = self._backup_path()
+        self._path.rename(rotated)
+        if self.compress:
+            with open(rotated, "rb") as source, gzip.open(f"{rotated}.gz", "wb") as dest:
+                shutil.copyfileobj(source, dest)
+            rotated.unlink()
+
+        backups = sorted(self._path.parent.glob(f"{self._path.stem}.*{self._path.suffix}*"))
+        for old_backup in backups[:-self.backup_count] if self.backup_count else backups:
+            old_backup.unlink(missing_ok=True)
+
+        self._open_file()
+
+    def _backup_path(self) -> Path:
+        """
+        Nombre libre para el archivo rotado.
+
+        Al timestamp se le añade un número de secuencia para que varias
+        rotaciones en el mismo segundo no se sobrescriban; el relleno con
+        ceros mantiene el orden cronológico al ordenar por nombre.
+        """
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
+        sequence = 0
+        while True:
+            rotated = self._path.with_name(
+                f"{self._path.stem}.{timestamp}-{sequence:03d}{self._path.suffix}"
+            )
+            if not rotated.exists() and not Path(f"{rotated}.gz").exists():
+                return rotated
+            sequence += 1
+
+
 def setup_logging(
     log_level: str = "INFO",
     log_dir: Path = Path("logs"),
-    serialize: bool = True
-) -> None:
+    serialize: bool = True,
+    async_sink: bool = True
+) -> Optional[AsyncBatchSink]:
     """
     Configura el logger de Loguru para la aplicación.
 
@@ -57,6 +368,12 @@ def setup_logging(
         log_level: El nivel mínimo de log a registrar (e.g., "INFO", "DEBUG").
         log_dir: El directorio donde se guardarán los ficheros de log.
         serialize: Si es True, los logs en fichero se guardarán en formato JSON.
+        async_sink: Si es True, el fichero se escribe en lotes desde un hilo
+            de fondo (AsyncBatchSink) en lugar de hacerlo en cada llamada.
+
+    Returns:
+        El AsyncBatchSink del fichero de log si se usa, para poder hacer
+        flush o cerrarlo al terminar la aplicación.
     """
     log_dir.mkdir(parents=True, exist_ok=True)
 
@@ -79,15 +396,27 @@ def setup_logging(
 
     # Configuración para el fichero de log
     log_file = log_dir / "planificador.log"
-    logger.add(
-        log_file,
-        level=log_level,
-        serialize=serialize, # Guardar en formato JSON
-        enqueue=True,        # Hacer el logging asíncrono y seguro para threads
-        backtrace=True,
-        diagnose=True,
-    )
+    file_sink = None
+    if async_sink:
+        file_sink = AsyncBatchSink(log_file)
+        logger.add(
+            file_sink,
+            level=log_level,
+            serialize=serialize, # Guardar en formato JSON
+            backtrace=True,
+            diagnose=True,
+        )
+    else:
+        logger.add(
+            log_file,
+            level=log_level,
+            serialize=serialize, # Guardar en formato JSON
+            enqueue=True,        # Hacer el logging asíncrono y seguro para threads
+            backtrace=True,
+            diagnose=True,
+        )
 
     # Interceptar logs de librerías estándar
     # logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
-    logger.info("Logging configurado correctamente (con intercepción deshabilitada temporalmente).")
\ No newline at end of file
+    logger.info("Logging configurado correctamente (con intercepción deshabilitada temporalmente).")
+    return file_sink
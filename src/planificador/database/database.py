@@ -89,6 +89,9 @@ class DatabaseManager:
                 autocommit=False,  # Control manual de transacciones
             )
             
+            if settings.db_instrumentation_enabled:
+                self._setup_instrumentation()
+            
             logger.info(f"Engine de base de datos inicializado: {settings.database_url}")
             
         except OperationalError as e:
@@ -115,6 +118,17 @@ class DatabaseManager:
                 original_error=e
             )
     
+    def _setup_instrumentation(self) -> None:
+        """
+        Instala la instrumentación de consultas en el engine y envía el
+        resumen de cada operación de repositorio al servicio de logging.
+        """
+        from .instrumentation import query_instrumentation
+        from ..services.infrastructure.logging_service import logging_service
+        
+        query_instrumentation.install(self._engine)
+        query_instrumentation.add_listener(logging_service.log_query_operation)
+    
     def _extract_host_from_url(self, url: str) -> str:
         """
         Extrae el host de la URL de la base de datos.
@@ -364,6 +378,12 @@ async def create_tables() -> None:
     try:
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+        
+        # Índice de búsqueda de texto completo (FTS5 / tsvector)
+        from ..repositories.search.search_index import SearchIndex
+        async with AsyncSessionLocal() as session:
+            await SearchIndex(session).ensure_index()
+            await session.commit()
         logger.info("Tablas de base de datos creadas")
     except OperationalError as e:
         logger.error(f"Error de conexión al crear tablas: {e}")
@@ -0,0 +1,541 @@
+# src/planificador/database/instrumentation.py
+
+"""
+Instrumentación de consultas a nivel de repositorio.
+
+Este módulo registra, mediante eventos de SQLAlchemy, la latencia de cada
+sentencia SQL, las filas afectadas y el número de consultas por sesión y por
+operación de repositorio. Permite detectar rutas calientes y patrones N+1 en
+producción sin necesidad de un profiler:
+
+- Cada sentencia se agrupa por su SQL normalizado (estadísticas acumuladas).
+- Cada llamada a una fachada abre un ámbito (``operation``) que acumula las
+  sentencias emitidas, incluidas las de llamadas anidadas.
+- Las consultas que superan ``slow_query_ms`` se registran como lentas.
+- Un ámbito raíz que emite más de ``n_plus_one_threshold`` sentencias se marca
+  como posible patrón N+1.
+
+``DatabaseManager`` la instala en su engine cuando ``db_instrumentation_enabled``
+está activo y envía cada operación raíz a ``LoggingService.log_performance``.
+
+Uso manual:
+    ```python
+    from planificador.database.instrumentation import query_instrumentation
+
+    query_instrumentation.install(engine)
+    query_instrumentation.add_listener(logging_service.log_query_operation)
+
+    with query_instrumentation.operation("EmployeeRepositoryFacade.get_all"):
+        ...
+
+    query_instrumentation.get_statement_stats(top=10)
+    ```
+"""
+
+import re
+import threading
+import time
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type, Union
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from ..config.config import settings
+
+
+# Clave usada en ``Session.info`` para los contadores por sesión
+SESSION_STATS_KEY = "query_instrumentation"
+
+# Clave usada en ``Connection.info`` para apilar los tiempos de inicio
+_START_TIMES_KEY = "query_instrumentation_start"
+
+# Colapsa listas de parámetros expandidas: "IN (?, ?, ?)" -> "IN (?)"
+_EXPANDED_PARAMS = re.compile(r"\(\s*(\?|%s|:\w+|\$\d+)(\s*,\s*(\?|%s|:\w+|\$\d+))+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class StatementStats:
+    """
+    Estadísticas acumuladas de una sentencia SQL normalizada.
+    """
+    statement: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int = 0
+
+    @property
+    def avg_ms(self) -> float:
+        """Latencia media en milisegundos."""
+        return self.total_ms / self.count if self.count else 0.0
+
+
+@dataclass
+class OperationStats:
+    """
+    Estadísticas acumuladas de una operación de repositorio.
+    """
+    name: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    db_time_ms: float = 0.0
+    statements: int = 0
+    rows: int = 0
+    n_plus_one_flags: int = 0
+
+    @property
+    def avg_ms(self) -> float:
+        """Duración media por llamada en milisegundos."""
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    @property
+    def avg_statements(self) -> float:
+        """Número medio de sentencias por llamada."""
+        return self.statements / self.calls if self.calls else 0.0
+
+
+@dataclass
+class OperationScope:
+    """
+    Ámbito activo de una operación de repositorio.
+
+    Acumula las sentencias emitidas mientras la operación (o cualquiera de sus
+    llamadas anidadas) está en curso.
+    """
+    name: str
+    parent: Optional["OperationScope"] = None
+    started_at: float = field(default_factory=time.perf_counter)
+    duration_ms: float = 0.0
+    statement_count: int = 0
+    db_time_ms: float = 0.0
+    rows: int = 0
+    statements: Counter = field(default_factory=Counter)
+    n_plus_one: bool = False
+
+    @property
+    def is_root(self) -> bool:
+        """Indica si el ámbito es el más externo (la llamada a la fachada)."""
+        return self.parent is None
+
+    def most_repeated(self, limit: int = 3) -> List[tuple]:
+        """Sentencias más repetidas dentro del ámbito."""
+        return self.statements.most_common(limit)
+
+
+_current_scope: ContextVar[Optional[OperationScope]] = ContextVar(
+    "query_instrumentation_scope", default=None
+)
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Normaliza una sentencia SQL para agruparla en las estadísticas.
+
+    Args:
+        statement: SQL tal como lo envía SQLAlchemy al driver.
+
+    Returns:
+        SQL con espacios colapsados y listas de parámetros expandidas reducidas.
+    """
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    return _EXPANDED_PARAMS.sub(r"(\1)", normalized)
+
+
+class QueryInstrumentation:
+    """
+    Instrumentación de consultas basada en eventos de SQLAlchemy.
+
+    Attributes:
+        slow_query_ms: Umbral en milisegundos para registrar una consulta lenta.
+        n_plus_one_threshold: Número de sentencias a partir del cual una
+            llamada raíz se marca como posible patrón N+1.
+        max_tracked_statements: Número máximo de sentencias distintas con
+            estadísticas propias; el resto se agrupa en una entrada común.
+    """
+
+    OTHER_STATEMENTS = "<otras sentencias>"
+
+    def __init__(
+        self,
+        slow_query_ms: float = 200.0,
+        n_plus_one_threshold: int = 10,
+        max_tracked_statements: int = 500
+    ):
+        """
+        Inicializa la instrumentación sin engines asociados.
+
+        Args:
+            slow_query_ms: Umbral de consulta lenta en milisegundos.
+            n_plus_one_threshold: Sentencias máximas por llamada raíz.
+            max_tracked_statements: Límite de sentencias distintas registradas.
+        """
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.max_tracked_statements = max_tracked_statements
+
+        self._engines: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+        self._session_info: "weakref.WeakKeyDictionary[Connection, Dict[str, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._statement_stats: Dict[str, StatementStats] = {}
+        self._operation_stats: Dict[str, OperationStats] = {}
+        self._listeners: List[Callable[[OperationScope], None]] = []
+        self._lock = threading.Lock()
+        self._session_hook_installed = False
+        self._logger = logger.bind(component="QueryInstrumentation")
+
+    @property
+    def enabled(self) -> bool:
+        """Indica si la instrumentación está instalada en algún engine."""
+        return len(self._engines) > 0
+
+    # ------------------------------------------------------------------
+    # Instalación
+    # ------------------------------------------------------------------
+
+    def install(self, engine: Union[Engine, AsyncEngine]) -> None:
+        """
+        Registra los eventos de instrumentación en un engine.
+
+        Args:
+            engine: Engine síncrono o asíncrono a instrumentar.
+        """
+        sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        if sync_engine in self._engines:
+            return
+
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engines.add(sync_engine)
+
+        if not self._session_hook_installed:
+            event.listen(Session, "after_begin", self._after_session_begin)
+            self._session_hook_installed = True
+
+        self._logger.info(
+            "Instrumentación de consultas instalada (lenta > {} ms, N+1 > {} sentencias)",
+            self.slow_query_ms, self.n_plus_one_threshold
+        )
+
+    def uninstall(self, engine: Union[Engine, AsyncEngine]) -> None:
+        """
+        Elimina los eventos de instrumentación de un engine.
+
+        Args:
+            engine: Engine previamente instrumentado.
+        """
+        sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        if sync_engine not in self._engines:
+            return
+
+        event.remove(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engines.discard(sync_engine)
+
+        if not self._engines and self._session_hook_installed:
+            event.remove(Session, "after_begin", self._after_session_begin)
+            self._session_hook_installed = False
+
+    def add_listener(self, callback: Callable[[OperationScope], None]) -> None:
+        """
+        Registra un callback invocado al terminar cada operación raíz.
+
+        Registrar dos veces el mismo callback no lo duplica.
+
+        Args:
+            callback: Función que recibe el OperationScope finalizado.
+        """
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[OperationScope], None]) -> None:
+        """
+        Elimina un callback registrado previamente.
+
+        Args:
+            callback: Callback a eliminar.
+        """
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    # ------------------------------------------------------------------
+    # Ámbitos de operación
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def operation(self, name: str) -> Iterator[Optional[OperationScope]]:
+        """
+        Abre un ámbito de operación de repositorio.
+
+        Es seguro usarlo dentro de corrutinas: el ámbito activo se propaga con
+        ``contextvars``, por lo que tareas concurrentes no se mezclan.
+
+        Args:
+            name: Nombre de la operación (p. ej. ``"Fachada.metodo"``).
+
+        Yields:
+            El ámbito creado, o None si la instrumentación no está instalada.
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        scope = OperationScope(name=name, parent=_current_scope.get())
+        token = _current_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            _current_scope.reset(token)
+            scope.duration_ms = (time.perf_counter() - scope.started_at) * 1000
+            self._finish_scope(scope)
+
+    def instrument(self, name: Optional[str] = None) -> Callable:
+        """
+        Decorador que ejecuta una corrutina dentro de un ámbito de operación.
+
+        Args:
+            name: Nombre de la operación (por defecto ``módulo.función``).
+        """
+        def decorator(func: Callable) -> Callable:
+            operation_name = name or func.__qualname__
+
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                with self.operation(operation_name):
+                    return await func(*args, **kwargs)
+
+            return wrapper
+        return decorator
+
+    # ------------------------------------------------------------------
+    # Consultas de estadísticas
+    # ------------------------------------------------------------------
+
+    def get_statement_stats(
+        self,
+        top: Optional[int] = None,
+        order_by: str = "total_ms"
+    ) -> List[StatementStats]:
+        """
+        Obtiene las estadísticas por sentencia ordenadas de mayor a menor.
+
+        Args:
+            top: Número máximo de sentencias a devolver.
+            order_by: Campo de ordenación (total_ms, count, max_ms, avg_ms, rows).
+
+        Returns:
+            Lista de estadísticas por sentencia.
+        """
+        with self._lock:
+            stats = list(self._statement_stats.values())
+        stats.sort(key=lambda s: getattr(s, order_by), reverse=True)
+        return stats[:top] if top else stats
+
+    def get_operation_stats(
+        self,
+        top: Optional[int] = None,
+        order_by: str = "total_ms"
+    ) -> List[OperationStats]:
+        """
+        Obtiene las estadísticas por operación de repositorio.
+
+        Args:
+            top: Número máximo de operaciones a devolver.
+            order_by: Campo de ordenación (total_ms, calls, statements, ...).
+
+        Returns:
+            Lista de estadísticas por operación.
+        """
+        with self._lock:
+            stats = list(self._operation_stats.values())
+        stats.sort(key=lambda s: getattr(s, order_by), reverse=True)
+        return stats[:top] if top else stats
+
+    @staticmethod
+    def get_session_stats(session: Union[Session, AsyncSession]) -> Dict[str, Any]:
+        """
+        Obtiene los contadores acumulados de una sesión.
+
+        Args:
+            session: Sesión síncrona o asíncrona.
+
+        Returns:
+            Diccionario con ``statements``, ``db_time_ms`` y ``rows``.
+        """
+        stats = session.info.get(SESSION_STATS_KEY)
+        if stats is None:
+            return {"statements": 0, "db_time_ms": 0.0, "rows": 0}
+        return dict(stats)
+
+    def reset(self) -> None:
+        """
+        Limpia las estadísticas acumuladas por sentencia y por operación.
+        """
+        with self._lock:
+            self._statement_stats.clear()
+            self._operation_stats.clear()
+
+    # ------------------------------------------------------------------
+    # Eventos de SQLAlchemy
+    # ------------------------------------------------------------------
+
+    def _after_session_begin(self, session: Session, transaction: Any, connection: Connection) -> None:
+        """Asocia la conexión con la sesión que la está usando."""
+        stats = session.info.setdefault(
+            SESSION_STATS_KEY, {"statements": 0, "db_time_ms": 0.0, "rows": 0}
+        )
+        self._session_info[connection] = stats
+
+    def _before_cursor_execute(
+        self, conn: Connection, cursor: Any, statement: str,
+        parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        """Apila el instante de inicio de la sentencia."""
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self, conn: Connection, cursor: Any, statement: str,
+        parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        """Registra la latencia y las filas de la sentencia ejecutada."""
+        start_times = conn.info.get(_START_TIMES_KEY)
+        if not start_times:
+            return
+        elapsed_ms = (time.perf_counter() - start_times.pop()) * 1000
+        rows = cursor.rowcount if cursor.rowcount and cursor.rowcount > 0 else 0
+        normalized = normalize_statement(statement)
+
+        self._record_statement(normalized, elapsed_ms, rows)
+
+        session_stats = self._session_info.get(conn)
+        if session_stats is not None:
+            session_stats["statements"] += 1
+            session_stats["db_time_ms"] += elapsed_ms
+            session_stats["rows"] += rows
+
+        scope = _current_scope.get()
+        while scope is not None:
+            scope.statement_count += 1
+            scope.db_time_ms += elapsed_ms
+            scope.rows += rows
+            scope.statements[normalized] += 1
+            scope = scope.parent
+
+        if elapsed_ms >= self.slow_query_ms:
+            current = _current_scope.get()
+            self._logger.warning(
+                "Consulta lenta ({:.1f} ms) en {}: {}",
+                elapsed_ms,
+                current.name if current else "<sin operación>",
+                normalized[:500],
+                duration_ms=round(elapsed_ms, 3),
+                rows=rows
+            )
+
+    # ------------------------------------------------------------------
+    # Internos
+    # ------------------------------------------------------------------
+
+    def _record_statement(self, normalized: str, elapsed_ms: float, rows: int) -> None:
+        """Acumula las estadísticas de una sentencia normalizada."""
+        with self._lock:
+            stats = self._statement_stats.get(normalized)
+            if stats is None:
+                if len(self._statement_stats) >= self.max_tracked_statements:
+                    normalized = self.OTHER_STATEMENTS
+                    stats = self._statement_stats.get(normalized)
+                if stats is None:
+                    stats = StatementStats(statement=normalized)
+                    self._statement_stats[normalized] = stats
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.rows += rows
+
+    def _finish_scope(self, scope: OperationScope) -> None:
+        """Acumula las estadísticas de la operación y notifica a los listeners."""
+        if scope.is_root and scope.statement_count > self.n_plus_one_threshold:
+            scope.n_plus_one = True
+            self._logger.warning(
+                "Posible patrón N+1 en {}: {} sentencias en una llamada ({:.1f} ms en BD). "
+                "Más repetidas: {}",
+                scope.name,
+                scope.statement_count,
+                scope.db_time_ms,
+                [(stmt[:120], count) for stmt, count in scope.most_repeated()],
+                operation=scope.name,
+                statements=scope.statement_count
+            )
+
+        with self._lock:
+            stats = self._operation_stats.get(scope.name)
+            if stats is None:
+                stats = OperationStats(name=scope.name)
+                self._operation_stats[scope.name] = stats
+            stats.calls += 1
+            stats.total_ms += scope.duration_ms
+            stats.max_ms = max(stats.max_ms, scope.duration_ms)
+            stats.db_time_ms += scope.db_time_ms
+            stats.statements += scope.statement_count
+            stats.rows += scope.rows
+            if scope.n_plus_one:
+                stats.n_plus_one_flags += 1
+
+        if scope.is_root:
+            for callback in self._listeners:
+                try:
+                    callback(scope)
+                except Exception as e:
+                    self._logger.warning("Error en listener de instrumentación: {}", e)
+
+
+def instrumented_repository(cls: Type) -> Type:
+    """
+    Decorador de clase que abre un ámbito de operación en cada método público.
+
+    Se aplica a las fachadas de repositorio para que cada llamada quede
+    registrada como ``Fachada.metodo`` y sus sentencias SQL (incluidas las de
+    los módulos internos) se atribuyan a esa llamada. Si la instrumentación no
+    está instalada, el coste es una comprobación por llamada.
+
+    Args:
+        cls: Clase de la fachada.
+
+    Returns:
+        La misma clase con sus corrutinas públicas envueltas.
+    """
+    for attr_name, attr in list(vars(cls).items()):
+        if attr_name.startswith("_") or not iscoroutinefunction(attr):
+            continue
+        setattr(cls, attr_name, _wrap_method(attr, f"{cls.__name__}.{attr_name}"))
+    return cls
+
+
+def _wrap_method(func: Callable, operation_name: str) -> Callable:
+    """Envuelve un método asíncrono en un ámbito de operación."""
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        if not query_instrumentation.enabled:
+            return await func(*args, **kwargs)
+        with query_instrumentation.operation(operation_name):
+            return await func(*args, **kwargs)
+    return wrapper
+
+
+# Instancia global de la instrumentación de consultas
+query_instrumentation = QueryInstrumentation(
+    slow_query_ms=settings.db_slow_query_ms,
+    n_plus_one_threshold=settings.db_n_plus_one_threshold
+)
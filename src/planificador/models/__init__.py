@@ -5,6 +5,7 @@
 from .base import BaseModel
 from .client import Client
 from .project import Project
+from .project_shutdown import ProjectShutdown
 from .employee import Employee
 from .team import Team
 from .team_membership import TeamMembership
@@ -12,13 +13,17 @@ from .project_assignment import ProjectAssignment
 from .schedule import Schedule
 from .status_code import StatusCode
 from .vacation import Vacation
+from .vacation_balance import VacationBalance
 from .workload import Workload
 from .alert import Alert
+from .change_event import ChangeEvent, ChangeEventCheckpoint
+from .change_log import ChangeLog
 
 __all__ = [
     "BaseModel",
     "Client",
     "Project",
+    "ProjectShutdown",
     "Employee",
     "Team",
     "TeamMembership",
@@ -26,6 +31,10 @@ __all__ = [
     "Schedule",
     "StatusCode",
     "Vacation",
+    "VacationBalance",
     "Workload",
     "Alert",
+    "ChangeEvent",
+    "ChangeEventCheckpoint",
+    "ChangeLog",
 ]
\ No newline at end of file
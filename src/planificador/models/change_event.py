@@ -0,0 +1,59 @@
+# src/planificador/models/change_event.py
+
+import enum
+from typing import List
+from sqlalchemy import Column, String, Integer, Text, Enum, Index
+
+from .base import BaseModel, Base
+
+class ChangeOperation(enum.Enum):
+    """Operaciones registradas en el flujo de cambios."""
+    INSERT = "insert"
+    UPDATE = "update"
+    DELETE = "delete"
+
+class ChangeEvent(BaseModel):
+    """
+    Evento de cambio (outbox) escrito en la misma transacción que el cambio.
+
+    El ``id`` es la posición del evento en el flujo. ``entity_id`` es None
+    cuando una sentencia en bloque no expone sus filas: los consumidores
+    deben tratar entonces la entidad completa como modificada.
+    """
+    __tablename__ = 'change_events'
+    __table_args__ = (
+        Index('ix_change_events_entity_entity_id', 'entity', 'entity_id'),
+    )
+
+    entity = Column(String(50), nullable=False)
+    entity_id = Column(Integer, nullable=True)
+    operation = Column(Enum(ChangeOperation), nullable=False)
+    changed_columns = Column(Text, nullable=True)
+    version = Column(Integer, nullable=True)
+
+    @property
+    def columns(self) -> List[str]:
+        """Columnas modificadas (vacío si no se conocen o es un alta o baja)."""
+        return self.changed_columns.split(",") if self.changed_columns else []
+
+    def touches(self, *columns: str) -> bool:
+        """Verifica si el evento puede afectar a alguna de las columnas."""
+        if self.operation != ChangeOperation.UPDATE or not self.changed_columns:
+            return True
+        return any(column in self.columns for column in columns)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ChangeEvent(id={self.id}, entity='{self.entity}', entity_id={self.entity_id}, "
+            f"operation='{self.operation.value}')>"
+        )
+
+class ChangeEventCheckpoint(BaseModel):
+    """Última posición del flujo de cambios procesada por un consumidor."""
+    __tablename__ = 'change_event_checkpoints'
+
+    consumer = Column(String(100), nullable=False, unique=True)
+    position = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ChangeEventCheckpoint(consumer='{self.consumer}', position={self.position})>"
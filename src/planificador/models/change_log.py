@@ -0,0 +1,53 @@
+# src/planificador/models/change_log.py
+
+import json
+from typing import Any, Dict, List
+from sqlalchemy import Column, String, Integer, Text, DateTime, Index
+
+from .base import BaseModel, Base
+
+class ChangeLog(BaseModel):
+    """
+    Entrada del registro de auditoría (solo se añaden filas).
+
+    Cada fila guarda un alta, cambio o baja de una entidad con el diff por
+    columna en ``changes`` (JSON ``{"columna": [anterior, nuevo]}``); las
+    altas guardan sus valores no nulos y las bajas ningún valor. ``period``
+    (``AAAAMM``) agrupa las filas por mes para consultar y purgar por rangos.
+    """
+    __tablename__ = 'change_logs'
+    __table_args__ = (
+        Index('ix_change_logs_entity', 'entity_type', 'entity_id', 'change_date'),
+        Index('ix_change_logs_project', 'project_id', 'change_date'),
+        Index('ix_change_logs_period', 'period', 'change_date'),
+    )
+
+    entity_type = Column(String(50), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    # Sin clave foránea: el historial sobrevive a la baja del proyecto
+    project_id = Column(Integer, nullable=True)
+    action = Column(String(20), nullable=False)
+    changes = Column(Text, nullable=True)
+    change_reason = Column(Text, nullable=True)
+    changed_by = Column(String(100), nullable=False)
+    change_date = Column(DateTime, nullable=False)
+    period = Column(Integer, nullable=False)
+    ip_address = Column(String(45), nullable=True)
+    user_agent = Column(Text, nullable=True)
+    session_id = Column(String(100), nullable=True)
+
+    @property
+    def diff(self) -> Dict[str, List[Any]]:
+        """Diff por columna: ``{"columna": [anterior, nuevo]}``."""
+        return json.loads(self.changes) if self.changes else {}
+
+    @property
+    def changed_columns(self) -> List[str]:
+        """Columnas modificadas."""
+        return list(self.diff)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ChangeLog(entity_type='{self.entity_type}', entity_id={self.entity_id}, "
+            f"action='{self.action}', changed_by='{self.changed_by}')>"
+        )
@@ -34,6 +34,7 @@ class Project(BaseModel):
     end_date = Column(Date, nullable=True)
     shutdown_dates = Column(Text, nullable=True)
     duration_days = Column(Integer, nullable=True)
+    preparation_days = Column(Integer, default=0, nullable=True)
     required_personnel = Column(Text, nullable=True)
     special_training = Column(Text, nullable=True)
     status = Column(Enum(ProjectStatus), default=ProjectStatus.PLANNED, nullable=False)
@@ -53,6 +54,10 @@ class Project(BaseModel):
     assignments = relationship("ProjectAssignment", back_populates="project", cascade="all, delete-orphan", lazy="noload")
     schedules = relationship("Schedule", back_populates="project", cascade="all, delete-orphan", lazy="noload")
     workloads = relationship("Workload", back_populates="project", cascade="all, delete-orphan", lazy="select")
+    shutdown_windows = relationship(
+        "ProjectShutdown", back_populates="project", cascade="all, delete-orphan",
+        lazy="noload", order_by="ProjectShutdown.start_date"
+    )
 
     def __repr__(self) -> str:
         return f"<Project(id={self.id}, reference='{self.reference}', name='{self.name}')>"
@@ -0,0 +1,31 @@
+# src/planificador/models/project_shutdown.py
+
+from sqlalchemy import Column, Integer, ForeignKey, Date, String, Text
+from sqlalchemy.orm import relationship
+
+from .base import BaseModel, Base
+
+class ProjectShutdown(BaseModel):
+    """Ventana de parada (arrêt) de la instalación asociada a un proyecto."""
+    __tablename__ = 'project_shutdowns'
+
+    project_id = Column(Integer, ForeignKey('projects.id', ondelete='CASCADE'), nullable=False, index=True)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)
+    label = Column(String(100), nullable=True)
+    notes = Column(Text, nullable=True)
+
+    # Relaciones
+    project = relationship("Project", back_populates="shutdown_windows")
+
+    @property
+    def duration_days(self) -> int:
+        """Duración de la parada en días (ambos extremos incluidos)."""
+        return (self.end_date - self.start_date).days + 1
+
+    def overlaps(self, start_date, end_date) -> bool:
+        """Verifica si la parada se solapa con un rango de fechas."""
+        return self.start_date <= end_date and self.end_date >= start_date
+
+    def __repr__(self) -> str:
+        return f"<ProjectShutdown(project_id={self.project_id}, start_date={self.start_date}, end_date={self.end_date})>"
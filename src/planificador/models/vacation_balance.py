@@ -0,0 +1,47 @@
+# src/planificador/models/vacation_balance.py
+
+"""
+Libro de saldos de vacaciones por empleado, año, tipo y estado.
+
+Cada fila acumula, para una clave (empleado, año, tipo de vacación,
+estado), el número de solicitudes y la suma de ``total_days`` y
+``business_days``. El año es el de ``start_date`` de la vacación.
+
+Las filas se mantienen en la misma transacción que las vacaciones desde
+los listeners de ``planificador.repositories.vacation_ledger``.
+"""
+
+from sqlalchemy import Column, Enum, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy.orm import relationship
+
+from .base import BaseModel
+from .vacation import VacationStatus, VacationType
+
+
+class VacationBalance(BaseModel):
+    """Totales acumulados de vacaciones por empleado, año, tipo y estado."""
+    __tablename__ = 'vacation_balances'
+    __table_args__ = (
+        UniqueConstraint(
+            'employee_id', 'year', 'vacation_type', 'status',
+            name='uq_vacation_balance_key'
+        ),
+    )
+
+    employee_id = Column(Integer, ForeignKey('employees.id'), nullable=False)
+    year = Column(Integer, nullable=False)
+    vacation_type = Column(Enum(VacationType), nullable=False)
+    status = Column(Enum(VacationStatus), nullable=False)
+    request_count = Column(Integer, default=0, nullable=False)
+    total_days = Column(Integer, default=0, nullable=False)
+    business_days = Column(Integer, default=0, nullable=False)
+
+    # Relaciones
+    employee = relationship("Employee")
+
+    def __repr__(self) -> str:
+        return (
+            f"<VacationBalance(employee_id={self.employee_id}, year={self.year}, "
+            f"type='{self.vacation_type.value}', status='{self.status.value}', "
+            f"total_days={self.total_days})>"
+        )
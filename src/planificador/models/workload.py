@@ -1,6 +1,6 @@
 # src/planificador/models/workload.py
 
-from sqlalchemy import Column, Integer, ForeignKey, Date, Numeric, Text, Boolean, UniqueConstraint
+from sqlalchemy import Column, Integer, ForeignKey, Date, Numeric, Text, Boolean, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 
 from .base import BaseModel, Base
@@ -30,6 +30,12 @@ class Workload(BaseModel):
     # Restricciones
     __table_args__ = (
         UniqueConstraint('employee_id', 'date', name='uq_workload_employee_date'),
+        # Índice cubriente para agrupar por período (semana, mes, año) sin leer la tabla
+        Index(
+            'ix_workloads_period',
+            'year', 'month', 'week_number', 'date',
+            'employee_id', 'project_id', 'planned_hours', 'actual_hours', 'is_billable'
+        ),
     )
 
     def __repr__(self) -> str:
@@ -9,14 +9,26 @@ Uso:
     from planificador.repositories.project import ProjectRepositoryFacade
     from planificador.repositories.client import ClientRepositoryFacade
     from planificador.repositories.employee import EmployeeRepositoryFacade
+
+Al importar el paquete se registran los listeners de ``change_feed``, que
+escriben el flujo de cambios de todas las escrituras, los de
+``audit_trail``, que registran los cambios de planificación, y los de
+``vacation_ledger``, que mantienen el libro de saldos de vacaciones.
 """
 
 __all__ = [
     "ProjectRepositoryFacade",
     "ClientRepositoryFacade",
     "EmployeeRepositoryFacade",
+    "ChangeFeed",
+    "AuditTrail",
+    "rebuild_vacation_balances",
 ]
 
+from .change_feed import ChangeFeed
+from .audit_trail import AuditTrail
+from .vacation_ledger import rebuild_vacation_balances
+
 from .client.client_repository_facade import ClientRepositoryFacade
 from .employee.employee_repository_facade import EmployeeRepositoryFacade
 from .project.project_repository_facade import ProjectRepositoryFacade
\ No newline at end of file
@@ -15,8 +15,10 @@ from .modules.validation_operations import ValidationOperations
 from planificador.models.alert import Alert, AlertType, AlertStatus
 from planificador.schemas.alert.alert import AlertCreate, AlertUpdate, AlertSearchFilter
 from planificador.exceptions import RepositoryError
+from planificador.database.instrumentation import instrumented_repository
 
 
+@instrumented_repository
 class AlertRepositoryFacade(IAlertRepository):
     """
     Facade principal para el repositorio de alertas.
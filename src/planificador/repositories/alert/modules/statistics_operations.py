@@ -10,6 +10,7 @@ import pendulum
 
 from planificador.models.alert import Alert, AlertType, AlertStatus
 from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.query_fusion import FusedAggregate
 from planificador.exceptions import (
     RepositoryError,
     convert_sqlalchemy_error
@@ -464,45 +465,21 @@ class StatisticsOperations(BaseRepository[Alert]):
             start_of_week = now.start_of('week')
             end_of_week = now.end_of('week')
             
-            # Total de la semana
-            total_stmt = select(func.count(Alert.id)).where(
-                and_(
+            # Total, desglose por estado y por tipo en una sola pasada
+            counts = await (
+                FusedAggregate(
+                    Alert,
                     Alert.created_at >= start_of_week,
                     Alert.created_at <= end_of_week
                 )
+                .count('total')
+                .count_each('by_status', Alert.status, list(AlertStatus))
+                .count_each('by_type', Alert.alert_type, list(AlertType))
+                .execute(self.session)
             )
-            total_result = await self.session.execute(total_stmt)
-            total = total_result.scalar() or 0
-            
-            # Por estado
-            status_stmt = select(
-                Alert.status,
-                func.count(Alert.id).label('count')
-            ).where(
-                and_(
-                    Alert.created_at >= start_of_week,
-                    Alert.created_at <= end_of_week
-                )
-            ).group_by(Alert.status)
-            
-            status_result = await self.session.execute(status_stmt)
-            status_rows = status_result.all()
-            status_counts = {status.value: count for status, count in status_rows}
-            
-            # Por tipo
-            type_stmt = select(
-                Alert.alert_type,
-                func.count(Alert.id).label('count')
-            ).where(
-                and_(
-                    Alert.created_at >= start_of_week,
-                    Alert.created_at <= end_of_week
-                )
-            ).group_by(Alert.alert_type)
-            
-            type_result = await self.session.execute(type_stmt)
-            type_rows = type_result.all()
-            type_counts = {alert_type.value: count for alert_type, count in type_rows}
+            total = counts['total']
+            status_counts = {key: count for key, count in counts['by_status'].items() if count}
+            type_counts = {key: count for key, count in counts['by_type'].items() if count}
             
             statistics = {
                 'period': 'current_week',
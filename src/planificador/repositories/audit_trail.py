@@ -0,0 +1,514 @@
+"""
+Registro de auditoría de los cambios de planificación.
+
+``Project.last_updated_by`` y ``revision_number`` solo guardan el último
+estado. Este módulo añade a ``change_logs`` una fila por cada alta, cambio o
+baja de proyectos, horarios (``Schedule``) y asignaciones
+(``ProjectAssignment``) con:
+
+    - el diff por columna (``{"columna": [anterior, nuevo]}``), no la fila
+      completa: las altas guardan sus valores no nulos y las bajas ninguno
+    - quién, cuándo y por qué (contexto de ``set_audit_context``; si no hay,
+      ``last_updated_by`` de la fila o ``"system"``)
+    - el proyecto afectado, para consultar el historial de un proyecto o
+      sitio junto con sus horarios y asignaciones
+    - el mes (``period`` = ``AAAAMM``), que agrupa las filas para consultar y
+      purgar por rangos con índices por entidad, proyecto y mes
+
+Captura:
+    - ``before_flush`` calcula los diffs de cambios y bajas; los valores
+      anteriores desconocidos (atributos expirados antes del cambio) se leen
+      de la base de datos con una consulta por modelo.
+    - ``after_flush`` añade las altas, ya con su ``id``, y escribe todas las
+      filas en la misma transacción.
+    - ``do_orm_execute`` audita las sentencias en bloque: lee las filas
+      afectadas antes de ejecutarlas (o las nuevas, después de insertar, por
+      las claves de los parámetros o de ``RETURNING``) y escribe sus diffs.
+
+    La opción de ejecución (o clave de ``Session.info``) ``SKIP_AUDIT_OPTION``
+    desactiva la captura.
+
+Uso:
+    ```python
+    set_audit_context(session, "jperez", change_reason="Retraso del cliente")
+    ...
+    history = await AuditTrail(session).get_project_history(project_id)
+    week = await AuditTrail(session).get_changes(monday, sunday, project_id=site_id)
+    ```
+"""
+
+import enum
+import json
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import delete, event, insert, inspect, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from planificador.exceptions import ValidationError
+from planificador.exceptions.repository.base_repository_exceptions import (
+    convert_sqlalchemy_error,
+)
+from planificador.models.change_event import ChangeOperation
+from planificador.models.change_log import ChangeLog
+from planificador.models.project import Project
+from planificador.models.project_assignment import ProjectAssignment
+from planificador.models.schedule import Schedule
+
+
+# Opción de ejecución / clave de ``Session.info`` para no auditar
+SKIP_AUDIT_OPTION = "skip_audit"
+
+# Claves en ``Session.info``
+AUDIT_CONTEXT_KEY = "audit_context"
+_PENDING_KEY = "audit_pending"
+
+_AUDITED_TABLES = {
+    model.__tablename__: model
+    for model in (Project, Schedule, ProjectAssignment)
+}
+_AUDITED_MODELS = frozenset(_AUDITED_TABLES.values())
+
+# Columnas que no forman parte del diff
+_IGNORED_COLUMNS = frozenset({"id", "created_at", "updated_at"})
+
+_SYSTEM_USER = "system"
+
+
+def set_audit_context(
+    session: Any,
+    changed_by: str,
+    change_reason: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+    session_id: Optional[str] = None,
+) -> None:
+    """
+    Fija quién y por qué cambia los datos en las siguientes escrituras de la sesión.
+
+    Args:
+        session: Sesión síncrona o asíncrona
+        changed_by: Usuario que realiza los cambios
+        change_reason: Motivo de los cambios
+        ip_address: Dirección IP del cliente
+        user_agent: Agente de usuario del cliente
+        session_id: Identificador de la sesión de usuario
+    """
+    session.info[AUDIT_CONTEXT_KEY] = {
+        "changed_by": changed_by,
+        "change_reason": change_reason,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+        "session_id": session_id,
+    }
+
+
+def clear_audit_context(session: Any) -> None:
+    """Elimina el contexto de auditoría de la sesión."""
+    session.info.pop(AUDIT_CONTEXT_KEY, None)
+
+
+def _period(moment: datetime) -> int:
+    return moment.year * 100 + moment.month
+
+
+# =============================================================================
+# CAPTURA
+# =============================================================================
+
+def _json_value(value: Any) -> Any:
+    """Valor serializable en JSON (fechas en ISO, decimales como texto)."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _audited_columns(model: Any) -> List[str]:
+    return [
+        column.key for column in model.__table__.columns
+        if column.key not in _IGNORED_COLUMNS
+    ]
+
+
+def _entry(
+    model: Any,
+    action: ChangeOperation,
+    values: Dict[str, Any],
+    diff: Optional[Dict[str, List[Any]]],
+) -> Dict[str, Any]:
+    """Fila de auditoría sin el contexto de usuario ni la fecha."""
+    return {
+        "entity_type": model.__name__,
+        "entity_id": values["id"],
+        "project_id": values["id"] if model is Project else values.get("project_id"),
+        "action": action.value,
+        "changes": json.dumps(diff, ensure_ascii=False, sort_keys=True) if diff else None,
+        "changed_by": values.get("last_updated_by"),
+    }
+
+
+def _row_diff(model: Any, old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, List[Any]]:
+    diff = {}
+    for name in _audited_columns(model):
+        before, after = _json_value(old.get(name)), _json_value(new.get(name))
+        if before != after:
+            diff[name] = [before, after]
+    return diff
+
+
+def _insert_entry(model: Any, values: Dict[str, Any]) -> Dict[str, Any]:
+    diff = {
+        name: [None, _json_value(values[name])]
+        for name in _audited_columns(model)
+        if values.get(name) is not None
+    }
+    return _entry(model, ChangeOperation.INSERT, values, diff)
+
+
+def _instance_values(instance: Any, names: Iterable[str]) -> Dict[str, Any]:
+    return {name: getattr(instance, name, None) for name in names}
+
+
+def _update_entries(session: Session, instances: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Filas de auditoría de las instancias modificadas en el flush en curso.
+
+    Los valores anteriores se toman del historial de atributos; los que no
+    se conocen (atributo expirado o anterior nulo) se leen de la base de
+    datos en una consulta por modelo.
+    """
+    diffs: List[Tuple[Any, Dict[str, List[Any]]]] = []
+    missing: Dict[Any, Dict[int, Dict[str, List[Any]]]] = {}
+    for instance in instances:
+        state = inspect(instance)
+        diff = {}
+        for name in _audited_columns(type(instance)):
+            history = state.attrs[name].history
+            if not history.added:
+                continue
+            diff[name] = [history.deleted[0] if history.deleted else None, history.added[0]]
+            if not history.deleted:
+                missing.setdefault(type(instance), {})[instance.id] = diff
+        diffs.append((instance, diff))
+
+    for model, by_id in missing.items():
+        table = model.__table__
+        rows = session.connection().execute(
+            select(table).where(table.c.id.in_(list(by_id)))
+        )
+        for row in rows.mappings():
+            for name, values in by_id[row["id"]].items():
+                values[0] = row[name]
+
+    entries = []
+    for instance, diff in diffs:
+        diff = {
+            name: [_json_value(before), _json_value(after)]
+            for name, (before, after) in diff.items()
+            if _json_value(before) != _json_value(after)
+        }
+        if diff:
+            values = _instance_values(instance, ("id", "project_id", "last_updated_by"))
+            entries.append(_entry(type(instance), ChangeOperation.UPDATE, values, diff))
+    return entries
+
+
+def _write_entries(session: Session, entries: List[Dict[str, Any]]) -> None:
+    """Completa las filas con el contexto de auditoría y las escribe."""
+    if not entries:
+        return
+    context = session.info.get(AUDIT_CONTEXT_KEY) or {}
+    now = datetime.now()
+    rows = [
+        {
+            **entry,
+            "changed_by": context.get("changed_by") or entry["changed_by"] or _SYSTEM_USER,
+            "change_reason": context.get("change_reason"),
+            "ip_address": context.get("ip_address"),
+            "user_agent": context.get("user_agent"),
+            "session_id": context.get("session_id"),
+            "change_date": now,
+            "period": _period(now),
+        }
+        for entry in entries
+    ]
+    session.connection().execute(insert(ChangeLog.__table__), rows)
+
+
+@event.listens_for(Session, "before_flush")
+def _capture_audit_diffs(session: Session, flush_context: Any, instances: Any) -> None:
+    if session.info.get(SKIP_AUDIT_OPTION):
+        session.info[_PENDING_KEY] = []
+        return
+    dirty = [
+        instance for instance in session.dirty
+        if type(instance) in _AUDITED_MODELS and session.is_modified(instance)
+    ]
+    entries = _update_entries(session, dirty) if dirty else []
+    # Las bajas se leen antes del flush: después ya no hay fila que cargar
+    for instance in session.deleted:
+        if type(instance) in _AUDITED_MODELS:
+            values = _instance_values(instance, ("id", "project_id", "last_updated_by"))
+            entries.append(_entry(type(instance), ChangeOperation.DELETE, values, None))
+    session.info[_PENDING_KEY] = entries
+
+
+@event.listens_for(Session, "after_flush")
+def _write_audit_entries(session: Session, flush_context: Any) -> None:
+    entries = session.info.pop(_PENDING_KEY, [])
+    if not session.info.get(SKIP_AUDIT_OPTION):
+        for instance in session.new:
+            model = type(instance)
+            if model in _AUDITED_MODELS:
+                values = _instance_values(instance, ["id", "last_updated_by", *_audited_columns(model)])
+                entries.append(_insert_entry(model, values))
+    _write_entries(session, entries)
+
+
+def _invoke_insert(orm_execute_state: Any, table: Any) -> Tuple[Any, List[int]]:
+    """
+    Ejecuta una inserción en bloque y devuelve su resultado y los IDs insertados.
+
+    Los IDs se toman de los parámetros si todas las filas los incluyen y,
+    si no, de ``RETURNING``, de modo que nunca se confunden con filas que
+    otra transacción inserte a la vez. La columna añadida a ``RETURNING``
+    se retira del resultado que recibe quien ejecutó la sentencia.
+    """
+    parameters = orm_execute_state.parameters
+    rows = parameters if isinstance(parameters, list) else [parameters] if parameters else []
+    if rows and all(row.get("id") is not None for row in rows):
+        return orm_execute_state.invoke_statement(), [row["id"] for row in rows]
+
+    frozen = orm_execute_state.invoke_statement(
+        statement=orm_execute_state.statement.returning(table.c.id)
+    ).freeze()
+    result = frozen()
+    inserted_ids = [row[-1] for row in frozen().all()]
+    columns = len(result.keys())
+    return (result.columns(*range(columns - 1)) if columns > 1 else result), inserted_ids
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _audit_statement(orm_execute_state: Any) -> Any:
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return None
+    session = orm_execute_state.session
+    if orm_execute_state.execution_options.get(SKIP_AUDIT_OPTION) or session.info.get(SKIP_AUDIT_OPTION):
+        return None
+    mapper = orm_execute_state.bind_mapper
+    model = mapper.class_ if mapper is not None else None
+    if model is None:
+        table = getattr(orm_execute_state.statement, "table", None)
+        model = _AUDITED_TABLES.get(getattr(table, "name", None))
+    if model not in _AUDITED_MODELS:
+        return None
+
+    table = model.__table__
+    connection = session.connection()
+    if orm_execute_state.is_insert:
+        result, inserted_ids = _invoke_insert(orm_execute_state, table)
+        rows = connection.execute(select(table).where(table.c.id.in_(inserted_ids))).mappings()
+        _write_entries(session, [_insert_entry(model, dict(row)) for row in rows])
+        return result
+
+    # Filas afectadas antes de ejecutar: por clave primaria o por el WHERE
+    parameters = orm_execute_state.parameters
+    query = select(table)
+    if isinstance(parameters, list) and parameters and all("id" in row for row in parameters):
+        query = query.where(table.c.id.in_([row["id"] for row in parameters]))
+    elif orm_execute_state.statement.whereclause is not None:
+        query = query.where(orm_execute_state.statement.whereclause)
+    before = {row["id"]: dict(row) for row in connection.execute(query).mappings()}
+    result = orm_execute_state.invoke_statement()
+
+    if orm_execute_state.is_delete:
+        entries = [_entry(model, ChangeOperation.DELETE, row, None) for row in before.values()]
+    else:
+        entries = []
+        if before:
+            after = connection.execute(select(table).where(table.c.id.in_(list(before))))
+            for row in after.mappings():
+                diff = _row_diff(model, before[row["id"]], row)
+                if diff:
+                    entries.append(_entry(model, ChangeOperation.UPDATE, dict(row), diff))
+    _write_entries(session, entries)
+    return result
+
+
+# =============================================================================
+# CONSULTA
+# =============================================================================
+
+class AuditTrail:
+    """
+    Consultas sobre el registro de auditoría.
+
+    Los rangos son ``[start, end]``; una fecha sin hora como ``end`` incluye
+    el día completo.
+
+    Attributes:
+        session: Sesión asíncrona
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._logger = logger.bind(module="audit_trail")
+
+    @staticmethod
+    def _bounds(start: Optional[date], end: Optional[date]) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Convierte el rango a ``[inicio, fin)`` en fechas con hora."""
+        if start is not None and not isinstance(start, datetime):
+            start = datetime.combine(start, time.min)
+        if end is not None and not isinstance(end, datetime):
+            end = datetime.combine(end + timedelta(days=1), time.min)
+        elif end is not None:
+            end = end + timedelta(microseconds=1)
+        if start is not None and end is not None and start >= end:
+            raise ValidationError(
+                message="La fecha de inicio debe ser anterior a la de fin",
+                field="start",
+                value=start
+            )
+        return start, end
+
+    async def _fetch(
+        self,
+        operation: str,
+        criteria: List[Any],
+        start: Optional[date],
+        end: Optional[date],
+        limit: Optional[int],
+    ) -> List[ChangeLog]:
+        start, end = self._bounds(start, end)
+        if start is not None:
+            criteria.append(ChangeLog.period >= _period(start))
+            criteria.append(ChangeLog.change_date >= start)
+        if end is not None:
+            criteria.append(ChangeLog.period <= _period(end))
+            criteria.append(ChangeLog.change_date < end)
+        query = select(ChangeLog).where(*criteria).order_by(ChangeLog.change_date, ChangeLog.id)
+        if limit is not None:
+            query = query.limit(limit)
+        try:
+            result = await self.session.execute(query)
+            return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            self._logger.error(f"Error al consultar el registro de auditoría ({operation}): {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation=operation,
+                entity_type="ChangeLog"
+            )
+
+    async def get_entity_history(
+        self,
+        entity_type: str,
+        entity_id: int,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        limit: Optional[int] = None,
+    ) -> List[ChangeLog]:
+        """
+        Obtiene el historial de una entidad.
+
+        Args:
+            entity_type: Nombre del modelo (``Project``, ``Schedule``, ``ProjectAssignment``)
+            entity_id: ID de la entidad
+            start: Inicio del rango
+            end: Fin del rango
+            limit: Número máximo de entradas
+
+        Returns:
+            List[ChangeLog]: Entradas en orden cronológico
+        """
+        criteria = [ChangeLog.entity_type == entity_type, ChangeLog.entity_id == entity_id]
+        return await self._fetch("get_entity_history", criteria, start, end, limit)
+
+    async def get_project_history(
+        self,
+        project_id: int,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        entity_types: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[ChangeLog]:
+        """
+        Obtiene el historial de un proyecto, sus horarios y sus asignaciones.
+
+        Args:
+            project_id: ID del proyecto
+            start: Inicio del rango
+            end: Fin del rango
+            entity_types: Limita a estos modelos
+            limit: Número máximo de entradas
+
+        Returns:
+            List[ChangeLog]: Entradas en orden cronológico
+        """
+        criteria = [ChangeLog.project_id == project_id]
+        if entity_types is not None:
+            criteria.append(ChangeLog.entity_type.in_(list(entity_types)))
+        return await self._fetch("get_project_history", criteria, start, end, limit)
+
+    async def get_changes(
+        self,
+        start: date,
+        end: date,
+        entity_types: Optional[Iterable[str]] = None,
+        project_id: Optional[int] = None,
+        changed_by: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[ChangeLog]:
+        """
+        Obtiene los cambios de un rango de fechas.
+
+        Args:
+            start: Inicio del rango
+            end: Fin del rango
+            entity_types: Limita a estos modelos
+            project_id: Limita a un proyecto
+            changed_by: Limita a un usuario
+            limit: Número máximo de entradas
+
+        Returns:
+            List[ChangeLog]: Entradas en orden cronológico
+        """
+        criteria = []
+        if entity_types is not None:
+            criteria.append(ChangeLog.entity_type.in_(list(entity_types)))
+        if project_id is not None:
+            criteria.append(ChangeLog.project_id == project_id)
+        if changed_by is not None:
+            criteria.append(ChangeLog.changed_by == changed_by)
+        return await self._fetch("get_changes", criteria, start, end, limit)
+
+    async def prune_before(self, month: date) -> int:
+        """
+        Elimina los meses completos anteriores al mes de ``month``.
+
+        Args:
+            month: Cualquier fecha del primer mes que se conserva
+
+        Returns:
+            int: Número de entradas eliminadas
+        """
+        try:
+            result = await self.session.execute(
+                delete(ChangeLog).where(ChangeLog.period < _period(month))
+            )
+            return result.rowcount
+        except SQLAlchemyError as e:
+            self._logger.error(f"Error al purgar el registro de auditoría: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="prune_before",
+                entity_type="ChangeLog"
+            )
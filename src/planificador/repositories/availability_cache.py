@@ -0,0 +1,727 @@
+"""
+Caché de disponibilidad de la plantilla en bitmaps de días ocupados.
+
+Responder "quién está libre estos días" combinando horarios, vacaciones y
+membresías de equipo por empleado cuesta varias consultas por persona. Este
+módulo mantiene en memoria, por engine, año y empleado, un entero de Python
+usado como bitset: el bit ``i`` indica que el empleado está ocupado el día
+``i`` del año (tiene algún horario o una vacación aprobada). Las consultas
+se resuelven con operaciones de bits sobre esos enteros:
+
+    - ``find_free_employees``: libres en todos los días D1..Dn (una máscara
+      por año y un ``AND`` por empleado)
+    - ``free_count_per_day``: número de empleados libres por día del rango
+    - ``first_free_window``: primer hueco de N días libres consecutivos,
+      calculado por duplicación de desplazamientos (``log2 N`` operaciones
+      por empleado)
+
+La plantilla de cada año son los empleados activos y disponibles
+(``EmployeeStatus.ACTIVE`` e ``is_available``); quien no está en ella cuenta
+como ocupado. El filtro por equipo se resuelve con una consulta a
+``TeamMembership`` en cada llamada.
+
+Invalidación:
+    Los listeners de sesión registran los pares (empleado, año) tocados por
+    altas, cambios y bajas de ``Schedule``, ``Vacation`` y ``Employee``
+    (incluidas las inserciones en bloque con parámetros) y los aplican al
+    terminar la transacción (``commit`` o ``rollback``): solo esos
+    empleados se releen en la siguiente consulta, con una única consulta
+    por año. Las actualizaciones y borrados en bloque por sentencia no
+    exponen sus filas y descartan la caché completa de su engine.
+
+    Hasta el ``commit``, una sesión no ve en la caché sus propios cambios.
+
+Uso:
+    ```python
+    free = await availability_cache.find_free_employees(session, [d1, d2], team_id=3)
+    per_day = await availability_cache.free_count_per_day(session, start, end)
+    window = await availability_cache.first_free_window(session, 5, start, end)
+    ```
+"""
+
+import weakref
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from loguru import logger
+from sqlalchemy import event, inspect, or_, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from planificador.exceptions import ValidationError
+from planificador.exceptions.repository.base_repository_exceptions import (
+    convert_sqlalchemy_error,
+)
+from planificador.models.employee import Employee, EmployeeStatus
+from planificador.models.schedule import Schedule
+from planificador.models.team_membership import TeamMembership
+from planificador.models.vacation import Vacation, VacationStatus
+
+
+# Claves en ``Session.info`` para los cambios pendientes de la transacción
+_PENDING_KEY = "availability_pending"
+_RESET_KEY = "availability_reset"
+
+_TRACKED_TABLES = {
+    Schedule.__tablename__: Schedule,
+    Vacation.__tablename__: Vacation,
+    Employee.__tablename__: Employee,
+}
+
+# (empleado, año); año None = todos los años cargados
+_Change = Tuple[int, Optional[int]]
+# (bitmaps del año, desplazamiento en el año, ancho, desplazamiento en el rango)
+_Segment = Tuple[Dict[int, int], int, int, int]
+
+
+def _day_offset(day: date) -> int:
+    """Índice del día dentro de su año (0 = 1 de enero)."""
+    return day.toordinal() - date(day.year, 1, 1).toordinal()
+
+
+def _runs(free: int, length: int) -> int:
+    """
+    Bits ``i`` a partir de los cuales ``free`` tiene ``length`` bits a 1.
+
+    Duplica la longitud cubierta en cada paso (1, 2, 4...), por lo que basta
+    con ``log2 length`` desplazamientos.
+    """
+    runs, covered = free, 1
+    while covered < length and runs:
+        step = min(covered, length - covered)
+        runs &= runs >> step
+        covered += step
+    return runs
+
+
+def _lowest_bit(value: int) -> int:
+    """Posición del bit a 1 menos significativo."""
+    return (value & -value).bit_length() - 1
+
+
+class AvailabilityIndex:
+    """
+    Bitmaps de días ocupados por año y empleado de un engine.
+
+    Solo contiene datos y operaciones en memoria; la carga y la
+    invalidación las coordina ``AvailabilityCache``.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa un índice sin años cargados."""
+        self._busy: Dict[int, Dict[int, int]] = {}
+        self._stale: Dict[int, Set[int]] = {}
+        self._loading: Set[int] = set()
+        self.generation = 0
+
+    @property
+    def years(self) -> List[int]:
+        """Años cargados."""
+        return sorted(self._busy)
+
+    def is_loaded(self, year: int) -> bool:
+        """Indica si el año está cargado."""
+        return year in self._busy
+
+    def stale_employees(self, year: int) -> Set[int]:
+        """Empleados del año pendientes de releer."""
+        return self._stale.get(year, set())
+
+    # Carga -----------------------------------------------------------------
+
+    def begin_load(self, year: int) -> None:
+        """Marca el año en carga; las invalidaciones durante la carga se conservan."""
+        self._stale.pop(year, None)
+        self._loading.add(year)
+
+    def end_load(self, year: int) -> None:
+        """Termina la carga de un año."""
+        self._loading.discard(year)
+
+    def store_year(self, year: int, busy: Dict[int, int]) -> None:
+        """Guarda los bitmaps de un año completo."""
+        self._busy[year] = busy
+
+    def take_stale(self, year: int) -> Set[int]:
+        """Extrae los empleados pendientes de releer de un año."""
+        return self._stale.pop(year, set())
+
+    def store_employees(self, year: int, employee_ids: Iterable[int], busy: Dict[int, int]) -> None:
+        """Reemplaza los bitmaps de algunos empleados de un año cargado."""
+        year_map = self._busy.get(year)
+        if year_map is None:
+            return
+        for employee_id in employee_ids:
+            if employee_id in busy:
+                year_map[employee_id] = busy[employee_id]
+            else:
+                year_map.pop(employee_id, None)
+
+    # Invalidación ----------------------------------------------------------
+
+    def invalidate(self, employee_id: int, year: Optional[int] = None) -> None:
+        """
+        Marca un empleado para releerlo.
+
+        Args:
+            employee_id: ID del empleado.
+            year: Año afectado; None marca todos los años cargados o en carga.
+        """
+        years = [year] if year is not None else set(self._busy) | self._loading
+        for affected in years:
+            if affected in self._busy or affected in self._loading:
+                self._stale.setdefault(affected, set()).add(employee_id)
+
+    def clear(self) -> None:
+        """Descarta todos los años; las cargas en curso se repiten."""
+        self._busy.clear()
+        self._stale.clear()
+        self.generation += 1
+
+    # Consultas -------------------------------------------------------------
+
+    def _require(self, years: Iterable[int]) -> None:
+        missing = [year for year in years if year not in self._busy]
+        if missing:
+            raise KeyError(f"Años no cargados en la caché de disponibilidad: {missing}")
+
+    def _segments(self, start_date: date, end_date: date) -> List[_Segment]:
+        """Tramos por año de un rango de fechas."""
+        self._require(range(start_date.year, end_date.year + 1))
+        segments = []
+        for year in range(start_date.year, end_date.year + 1):
+            low = max(start_date, date(year, 1, 1))
+            high = min(end_date, date(year, 12, 31))
+            segments.append((
+                self._busy[year],
+                _day_offset(low),
+                (high - low).days + 1,
+                (low - start_date).days,
+            ))
+        return segments
+
+    @staticmethod
+    def _range_bits(employee_id: int, segments: Sequence[_Segment]) -> int:
+        """Días ocupados de un empleado en el rango (bit 0 = primer día)."""
+        bits = 0
+        for year_map, year_offset, width, range_offset in segments:
+            full = (1 << width) - 1
+            value = year_map.get(employee_id)
+            chunk = full if value is None else (value >> year_offset) & full
+            bits |= chunk << range_offset
+        return bits
+
+    def workforce(self, start_date: date, end_date: date) -> List[int]:
+        """Empleados de la plantilla en alguno de los años del rango."""
+        self._require(range(start_date.year, end_date.year + 1))
+        employee_ids: Set[int] = set()
+        for year in range(start_date.year, end_date.year + 1):
+            employee_ids.update(self._busy[year])
+        return sorted(employee_ids)
+
+    def busy_days(self, employee_id: int, start_date: date, end_date: date) -> List[date]:
+        """Días ocupados de un empleado en el rango."""
+        bits = self._range_bits(employee_id, self._segments(start_date, end_date))
+        days = []
+        while bits:
+            low = bits & -bits
+            days.append(start_date + timedelta(days=low.bit_length() - 1))
+            bits ^= low
+        return days
+
+    def free_on_all(self, days: Iterable[date], employee_ids: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        Empleados libres en todos los días indicados.
+
+        Args:
+            days: Días a comprobar.
+            employee_ids: Candidatos; por defecto la plantilla de esos años.
+
+        Returns:
+            IDs de empleados libres, ordenados.
+        """
+        masks: Dict[int, int] = {}
+        for day in days:
+            masks[day.year] = masks.get(day.year, 0) | (1 << _day_offset(day))
+        if not masks:
+            return []
+        self._require(masks)
+        year_masks = [(self._busy[year], mask) for year, mask in masks.items()]
+
+        if employee_ids is None:
+            candidates: Iterable[int] = set().union(*(year_map for year_map, _ in year_masks))
+        else:
+            candidates = employee_ids
+        free = []
+        for employee_id in candidates:
+            for year_map, mask in year_masks:
+                busy = year_map.get(employee_id)
+                if busy is None or busy & mask:
+                    break
+            else:
+                free.append(employee_id)
+        return sorted(free)
+
+    def free_count_per_day(
+        self,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[Iterable[int]] = None
+    ) -> Dict[date, int]:
+        """
+        Número de empleados libres por día del rango.
+
+        Args:
+            start_date: Primer día.
+            end_date: Último día.
+            employee_ids: Candidatos; por defecto la plantilla del rango.
+
+        Returns:
+            Diccionario día -> empleados libres.
+        """
+        segments = self._segments(start_date, end_date)
+        candidates = self.workforce(start_date, end_date) if employee_ids is None else list(employee_ids)
+        width = (end_date - start_date).days + 1
+        busy_counts = [0] * width
+        for employee_id in candidates:
+            bits = self._range_bits(employee_id, segments)
+            while bits:
+                low = bits & -bits
+                busy_counts[low.bit_length() - 1] += 1
+                bits ^= low
+        total = len(candidates)
+        return {
+            start_date + timedelta(days=offset): total - busy
+            for offset, busy in enumerate(busy_counts)
+        }
+
+    def first_free_windows(
+        self,
+        length: int,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[Iterable[int]] = None
+    ) -> Dict[int, date]:
+        """
+        Primer día de cada empleado con ``length`` días libres consecutivos.
+
+        Args:
+            length: Número de días naturales del hueco.
+            start_date: Primer día del rango de búsqueda.
+            end_date: Último día en que puede terminar el hueco.
+            employee_ids: Candidatos; por defecto la plantilla del rango.
+
+        Returns:
+            Diccionario empleado -> inicio del hueco (sin los que no tienen).
+        """
+        segments = self._segments(start_date, end_date)
+        candidates = self.workforce(start_date, end_date) if employee_ids is None else employee_ids
+        full = (1 << ((end_date - start_date).days + 1)) - 1
+        windows = {}
+        for employee_id in candidates:
+            runs = _runs(~self._range_bits(employee_id, segments) & full, length)
+            if runs:
+                windows[employee_id] = start_date + timedelta(days=_lowest_bit(runs))
+        return windows
+
+    def first_free_window(
+        self,
+        length: int,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[Iterable[int]] = None
+    ) -> Optional[Tuple[date, List[int]]]:
+        """
+        Primer hueco de ``length`` días libres de la plantilla.
+
+        Returns:
+            (inicio del hueco, empleados libres en él) o None si no existe.
+        """
+        windows = self.first_free_windows(length, start_date, end_date, employee_ids)
+        if not windows:
+            return None
+        first = min(windows.values())
+        return first, sorted(employee_id for employee_id, day in windows.items() if day == first)
+
+
+class AvailabilityCache:
+    """
+    Registro de índices de disponibilidad por engine.
+
+    Cada año se carga de forma perezosa en la primera consulta que lo
+    necesita y a partir de ahí solo se releen los empleados invalidados.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa el registro sin índices cargados."""
+        self._indexes: "weakref.WeakKeyDictionary[Any, AvailabilityIndex]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._logger = logger.bind(component="AvailabilityCache")
+
+    @staticmethod
+    def _engine_key(bind: Any) -> Optional[Any]:
+        """Engine síncrono de una sesión o conexión, usado como clave del registro."""
+        bind = getattr(bind, "bind", bind)
+        bind = getattr(bind, "sync_engine", bind)
+        return getattr(bind, "engine", None)
+
+    def loaded_index(self, session: AsyncSession) -> Optional[AvailabilityIndex]:
+        """Índice ya creado para el engine de la sesión, si existe."""
+        engine = self._engine_key(session)
+        return self._indexes.get(engine) if engine is not None else None
+
+    async def _read_year(
+        self,
+        session: AsyncSession,
+        year: int,
+        employee_ids: Optional[Set[int]] = None
+    ) -> Dict[int, int]:
+        """Lee los bitmaps de un año (de todos o de algunos empleados)."""
+        first, last = date(year, 1, 1), date(year, 12, 31)
+        employees = select(Employee.id).where(
+            Employee.status == EmployeeStatus.ACTIVE,
+            Employee.is_available.is_(True)
+        )
+        schedules = select(Schedule.employee_id, Schedule.date).where(
+            Schedule.date >= first, Schedule.date <= last
+        )
+        vacations = select(Vacation.employee_id, Vacation.start_date, Vacation.end_date).where(
+            Vacation.status == VacationStatus.APPROVED,
+            Vacation.start_date <= last,
+            Vacation.end_date >= first
+        )
+        if employee_ids is not None:
+            employees = employees.where(Employee.id.in_(employee_ids))
+            schedules = schedules.where(Schedule.employee_id.in_(employee_ids))
+            vacations = vacations.where(Vacation.employee_id.in_(employee_ids))
+
+        busy = {employee_id: 0 for employee_id in (await session.execute(employees)).scalars()}
+        for employee_id, day in await session.execute(schedules):
+            if employee_id in busy:
+                busy[employee_id] |= 1 << _day_offset(day)
+        for employee_id, start_date, end_date in await session.execute(vacations):
+            if employee_id in busy:
+                low, high = max(start_date, first), min(end_date, last)
+                busy[employee_id] |= ((1 << ((high - low).days + 1)) - 1) << _day_offset(low)
+        return busy
+
+    async def ensure_loaded(self, session: AsyncSession, start_date: date, end_date: date) -> AvailabilityIndex:
+        """
+        Devuelve el índice con los años del rango cargados y al día.
+
+        Args:
+            session: Sesión asíncrona.
+            start_date: Primer día del rango.
+            end_date: Último día del rango.
+
+        Returns:
+            Índice de disponibilidad.
+
+        Raises:
+            RepositoryError: Si falla la lectura desde la base de datos.
+        """
+        engine = self._engine_key(session)
+        index = self._indexes.get(engine) if engine is not None else None
+        if index is None:
+            index = AvailabilityIndex()
+            if engine is not None:
+                self._indexes[engine] = index
+
+        try:
+            for year in range(start_date.year, end_date.year + 1):
+                while True:
+                    generation = index.generation
+                    if not index.is_loaded(year):
+                        index.begin_load(year)
+                        try:
+                            busy = await self._read_year(session, year)
+                        finally:
+                            index.end_load(year)
+                        if index.generation == generation:
+                            index.store_year(year, busy)
+                            self._logger.debug(
+                                "Disponibilidad de {} cargada: {} empleados", year, len(busy)
+                            )
+                    elif index.stale_employees(year):
+                        employee_ids = index.take_stale(year)
+                        busy = await self._read_year(session, year, employee_ids)
+                        if index.generation == generation:
+                            index.store_employees(year, employee_ids, busy)
+                    else:
+                        break
+        except SQLAlchemyError as e:
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="ensure_loaded",
+                entity_type=Schedule.__name__,
+            )
+        return index
+
+    async def _candidates(
+        self,
+        session: AsyncSession,
+        employee_ids: Optional[Iterable[int]],
+        team_id: Optional[int],
+        start_date: date,
+        end_date: date
+    ) -> Optional[List[int]]:
+        """Candidatos explícitos, restringidos a los miembros activos del equipo."""
+        if team_id is None:
+            return None if employee_ids is None else list(employee_ids)
+        try:
+            result = await session.execute(
+                select(TeamMembership.employee_id).where(
+                    TeamMembership.team_id == team_id,
+                    TeamMembership.is_active.is_(True),
+                    TeamMembership.start_date <= end_date,
+                    or_(TeamMembership.end_date.is_(None), TeamMembership.end_date >= start_date)
+                ).distinct()
+            )
+        except SQLAlchemyError as e:
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="get_team_members",
+                entity_type=TeamMembership.__name__,
+            )
+        members = set(result.scalars())
+        if employee_ids is None:
+            return sorted(members)
+        return [employee_id for employee_id in employee_ids if employee_id in members]
+
+    @staticmethod
+    def _validate_range(start_date: date, end_date: date) -> None:
+        if end_date < start_date:
+            raise ValidationError(
+                message="La fecha de fin no puede ser anterior a la de inicio",
+                field="end_date",
+                value=end_date,
+            )
+
+    async def find_free_employees(
+        self,
+        session: AsyncSession,
+        days: Sequence[date],
+        employee_ids: Optional[Iterable[int]] = None,
+        team_id: Optional[int] = None
+    ) -> List[int]:
+        """
+        Empleados libres en todos los días indicados.
+
+        Args:
+            session: Sesión asíncrona.
+            days: Días que deben estar libres.
+            employee_ids: Candidatos (por defecto toda la plantilla).
+            team_id: Restringe a los miembros activos del equipo.
+
+        Returns:
+            IDs de empleados libres, ordenados.
+        """
+        if not days:
+            return []
+        start_date, end_date = min(days), max(days)
+        candidates = await self._candidates(session, employee_ids, team_id, start_date, end_date)
+        index = await self.ensure_loaded(session, start_date, end_date)
+        return index.free_on_all(days, candidates)
+
+    async def free_count_per_day(
+        self,
+        session: AsyncSession,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[Iterable[int]] = None,
+        team_id: Optional[int] = None
+    ) -> Dict[date, int]:
+        """
+        Número de empleados libres por día del rango.
+
+        Args:
+            session: Sesión asíncrona.
+            start_date: Primer día.
+            end_date: Último día.
+            employee_ids: Candidatos (por defecto toda la plantilla).
+            team_id: Restringe a los miembros activos del equipo.
+
+        Returns:
+            Diccionario día -> empleados libres.
+
+        Raises:
+            ValidationError: Si el rango es inválido.
+        """
+        self._validate_range(start_date, end_date)
+        candidates = await self._candidates(session, employee_ids, team_id, start_date, end_date)
+        index = await self.ensure_loaded(session, start_date, end_date)
+        return index.free_count_per_day(start_date, end_date, candidates)
+
+    async def first_free_window(
+        self,
+        session: AsyncSession,
+        length: int,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[Iterable[int]] = None,
+        team_id: Optional[int] = None
+    ) -> Optional[Tuple[date, List[int]]]:
+        """
+        Primer hueco de ``length`` días naturales libres en la plantilla.
+
+        Args:
+            session: Sesión asíncrona.
+            length: Días consecutivos requeridos.
+            start_date: Primer día del rango de búsqueda.
+            end_date: Último día en que puede terminar el hueco.
+            employee_ids: Candidatos (por defecto toda la plantilla).
+            team_id: Restringe a los miembros activos del equipo.
+
+        Returns:
+            (inicio del hueco, empleados libres en él) o None si no existe.
+
+        Raises:
+            ValidationError: Si la longitud o el rango son inválidos.
+        """
+        if length < 1:
+            raise ValidationError(
+                message="La longitud del hueco debe ser al menos 1 día",
+                field="length",
+                value=length,
+            )
+        self._validate_range(start_date, end_date)
+        candidates = await self._candidates(session, employee_ids, team_id, start_date, end_date)
+        index = await self.ensure_loaded(session, start_date, end_date)
+        return index.first_free_window(length, start_date, end_date, candidates)
+
+    def apply_changes(self, bind: Any, changes: Iterable[_Change], reset: bool = False) -> None:
+        """
+        Aplica los cambios de una transacción terminada al índice de su engine.
+
+        Args:
+            bind: Engine o conexión de la sesión.
+            changes: Pares (empleado, año) modificados.
+            reset: Descarta el índice completo (cambios en bloque sin filas).
+        """
+        engine = self._engine_key(bind)
+        index = self._indexes.get(engine) if engine is not None else None
+        if index is None:
+            return
+        if reset:
+            index.clear()
+            self._logger.debug("Caché de disponibilidad descartada por un cambio en bloque")
+            return
+        for employee_id, year in changes:
+            index.invalidate(employee_id, year)
+
+    def invalidate(self, session: Optional[AsyncSession] = None) -> None:
+        """
+        Descarta los índices cargados para que se reconstruyan.
+
+        Args:
+            session: Si se indica, solo se descarta el de su engine.
+        """
+        if session is None:
+            for index in list(self._indexes.values()):
+                index.clear()
+            return
+        index = self.loaded_index(session)
+        if index is not None:
+            index.clear()
+
+
+# Instancia global de la caché de disponibilidad
+availability_cache = AvailabilityCache()
+
+
+# =============================================================================
+# REGISTRO DE CAMBIOS DE SESIÓN
+# =============================================================================
+
+def _values(instance: Any, name: str) -> Set[Any]:
+    """Valor actual y anterior (si cambió) de un atributo, sin nulos."""
+    values = {getattr(instance, name), *inspect(instance).attrs[name].history.deleted}
+    values.discard(None)
+    return values
+
+
+def _instance_changes(instance: Any) -> List[_Change]:
+    """Pares (empleado, año) afectados por una instancia modificada."""
+    if isinstance(instance, Schedule):
+        return [
+            (employee_id, day.year)
+            for employee_id in _values(instance, "employee_id")
+            for day in _values(instance, "date")
+        ]
+    if isinstance(instance, Vacation):
+        bounds = _values(instance, "start_date") | _values(instance, "end_date")
+        if not bounds:
+            return []
+        years = range(min(bounds).year, max(bounds).year + 1)
+        return [
+            (employee_id, year)
+            for employee_id in _values(instance, "employee_id")
+            for year in years
+        ]
+    if isinstance(instance, Employee) and instance.id is not None:
+        return [(instance.id, None)]
+    return []
+
+
+def _row_changes(model: Any, row: Dict[str, Any]) -> Optional[List[_Change]]:
+    """Pares afectados por una fila de una inserción en bloque (None si no se sabe)."""
+    if model is Schedule and row.get("employee_id") and row.get("date"):
+        return [(row["employee_id"], row["date"].year)]
+    if model is Vacation and row.get("employee_id") and row.get("start_date") and row.get("end_date"):
+        return [
+            (row["employee_id"], year)
+            for year in range(row["start_date"].year, row["end_date"].year + 1)
+        ]
+    return None
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flush_changes(session: Session, flush_context: Any) -> None:
+    changes = [
+        change
+        for instance in (*session.new, *session.dirty, *session.deleted)
+        for change in _instance_changes(instance)
+    ]
+    if changes:
+        session.info.setdefault(_PENDING_KEY, set()).update(changes)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statement_changes(orm_execute_state: Any) -> None:
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    model = mapper.class_ if mapper is not None else None
+    if model is None:
+        table = getattr(orm_execute_state.statement, "table", None)
+        model = _TRACKED_TABLES.get(getattr(table, "name", None))
+    if model not in (Schedule, Vacation, Employee):
+        return
+
+    session = orm_execute_state.session
+    parameters = orm_execute_state.parameters
+    if isinstance(parameters, dict):
+        parameters = [parameters]
+    if orm_execute_state.is_insert and parameters:
+        changes: List[_Change] = []
+        for row in parameters:
+            row_changes = _row_changes(model, row)
+            if row_changes is None:
+                break
+            changes.extend(row_changes)
+        else:
+            session.info.setdefault(_PENDING_KEY, set()).update(changes)
+            return
+    # Sin filas conocidas: se descarta la caché del engine al terminar
+    session.info[_RESET_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _apply_pending_changes(session: Session) -> None:
+    changes = session.info.pop(_PENDING_KEY, None)
+    reset = session.info.pop(_RESET_KEY, False)
+    if changes or reset:
+        availability_cache.apply_changes(session.bind, changes or (), reset)
@@ -32,6 +32,7 @@ from ..exceptions import (
     NotFoundError
 )
 from ..config.config import settings
+from .projections import defer_heavy_columns
 
 # Type variable para el modelo genérico
 ModelType = TypeVar('ModelType', bound=BaseModel)
@@ -60,14 +61,20 @@ class BaseRepository(Generic[ModelType], ABC):
         """
         self.session = session
         self.model_class = model_class
+        # Los mensajes usan plantillas "{}" en lugar de f-strings para que
+        # Loguru solo los formatee si algún handler acepta el nivel
         self._logger = logger.bind(
             repository=self.__class__.__name__,
             model=model_class.__name__
         )
-        
+
         # Configuración de logging según el entorno
         if settings.debug_mode:
-            self._logger.debug(f"Repositorio {self.__class__.__name__} inicializado para modelo {model_class.__name__}")
+            self._logger.debug(
+                "Repositorio {} inicializado para modelo {}",
+                self.__class__.__name__,
+                model_class.__name__
+            )
     
     # ========================================================================
     # OPERACIONES CRUD BÁSICAS
@@ -92,7 +99,8 @@ class BaseRepository(Generic[ModelType], ABC):
             await self.session.refresh(entity)  # Refresca para obtener valores calculados
             
             self._logger.info(
-                f"Entidad {self.model_class.__name__} creada exitosamente",
+                "Entidad {} creada exitosamente",
+                self.model_class.__name__,
                 entity_id=entity.id
             )
             
@@ -100,7 +108,8 @@ class BaseRepository(Generic[ModelType], ABC):
             
         except SQLAlchemyError as e:
             self._logger.error(
-                f"Error al crear {self.model_class.__name__}: {e}",
+                "Error al crear {}: {}",
+                self.model_class.__name__, e,
                 error_type=type(e).__name__
             )
             await self.session.rollback()
@@ -111,7 +120,8 @@ class BaseRepository(Generic[ModelType], ABC):
             )
         except Exception as e:
             self._logger.error(
-                f"Error inesperado al crear {self.model_class.__name__}: {e}",
+                "Error inesperado al crear {}: {}",
+                self.model_class.__name__, e,
                 error_type=type(e).__name__
             )
             await self.session.rollback()
@@ -142,12 +152,14 @@ class BaseRepository(Generic[ModelType], ABC):
             
             if entity:
                 self._logger.debug(
-                    f"{self.model_class.__name__} encontrado",
+                    "{} encontrado",
+                    self.model_class.__name__,
                     entity_id=entity_id
                 )
             else:
                 self._logger.debug(
-                    f"{self.model_class.__name__} no encontrado",
+                    "{} no encontrado",
+                    self.model_class.__name__,
                     entity_id=entity_id
                 )
             
@@ -155,7 +167,8 @@ class BaseRepository(Generic[ModelType], ABC):
             
         except SQLAlchemyError as e:
             self._logger.error(
-                f"Error al buscar {self.model_class.__name__} por ID {entity_id}: {e}",
+                "Error al buscar {} por ID {}: {}",
+                self.model_class.__name__, entity_id, e,
                 entity_id=entity_id,
                 error_type=type(e).__name__
             )
@@ -167,7 +180,8 @@ class BaseRepository(Generic[ModelType], ABC):
             )
         except Exception as e:
             self._logger.error(
-                f"Error inesperado al buscar {self.model_class.__name__} por ID {entity_id}: {e}",
+                "Error inesperado al buscar {} por ID {}: {}",
+                self.model_class.__name__, entity_id, e,
                 entity_id=entity_id,
                 error_type=type(e).__name__
             )
@@ -183,7 +197,8 @@ class BaseRepository(Generic[ModelType], ABC):
         self, 
         limit: Optional[int] = None, 
         offset: Optional[int] = None,
-        order_by: Optional[str] = None
+        order_by: Optional[str] = None,
+        defer_heavy: bool = False
     ) -> List[ModelType]:
         """
         Obtiene todas las entidades con paginación opcional.
@@ -192,6 +207,8 @@ class BaseRepository(Generic[ModelType], ABC):
             limit: Número máximo de resultados
             offset: Número de resultados a omitir
             order_by: Campo por el cual ordenar (por defecto 'id')
+            defer_heavy: Difiere las columnas pesadas (Text/JSON) del modelo;
+                solo para listados que no acceden a ellas
             
         Returns:
             Lista de entidades
@@ -201,6 +218,8 @@ class BaseRepository(Generic[ModelType], ABC):
         """
         try:
             stmt = select(self.model_class)
+            if defer_heavy:
+                stmt = stmt.options(*defer_heavy_columns(self.model_class))
             
             # Aplicar ordenamiento
             if order_by:
@@ -208,7 +227,8 @@ class BaseRepository(Generic[ModelType], ABC):
                     stmt = stmt.order_by(getattr(self.model_class, order_by))
                 else:
                     self._logger.warning(
-                        f"Campo de ordenamiento '{order_by}' no existe en {self.model_class.__name__}, usando 'id'"
+                        "Campo de ordenamiento '{}' no existe en {}, usando 'id'",
+                        order_by, self.model_class.__name__
                     )
                     stmt = stmt.order_by(self.model_class.id)
             else:
@@ -224,7 +244,8 @@ class BaseRepository(Generic[ModelType], ABC):
             entities = result.scalars().all()
             
             self._logger.debug(
-                f"Obtenidas {len(entities)} entidades de {self.model_class.__name__}",
+                "Obtenidas {} entidades de {}",
+                len(entities), self.model_class.__name__,
                 count=len(entities),
                 limit=limit,
                 offset=offset
@@ -234,7 +255,8 @@ class BaseRepository(Generic[ModelType], ABC):
             
         except SQLAlchemyError as e:
             self._logger.error(
-                f"Error al obtener todas las entidades de {self.model_class.__name__}: {e}",
+                "Error al obtener todas las entidades de {}: {}",
+                self.model_class.__name__, e,
                 error_type=type(e).__name__
             )
             raise convert_sqlalchemy_error(
@@ -244,7 +266,8 @@ class BaseRepository(Generic[ModelType], ABC):
             )
         except Exception as e:
             self._logger.error(
-                f"Error inesperado al obtener todas las entidades de {self.model_class.__name__}: {e}",
+                "Error inesperado al obtener todas las entidades de {}: {}",
+                self.model_class.__name__, e,
                 error_type=type(e).__name__
             )
             raise RepositoryError(
@@ -281,7 +304,8 @@ class BaseRepository(Generic[ModelType], ABC):
             await self.session.refresh(entity)
             
             self._logger.info(
-                f"Entidad {self.model_class.__name__} actualizada exitosamente",
+                "Entidad {} actualizada exitosamente",
+                self.model_class.__name__,
                 entity_id=entity.id
             )
             
@@ -289,7 +313,8 @@ class BaseRepository(Generic[ModelType], ABC):
             
         except SQLAlchemyError as e:
             self._logger.error(
-                f"Error al actualizar {self.model_class.__name__} ID {entity.id}: {e}",
+                "Error al actualizar {} ID {}: {}",
+                self.model_class.__name__, entity.id, e,
                 entity_id=entity.id,
                 error_type=type(e).__name__
             )
@@ -302,7 +327,8 @@ class BaseRepository(Generic[ModelType], ABC):
             )
         except Exception as e:
             self._logger.error(
-                f"Error inesperado al actualizar {self.model_class.__name__} ID {entity.id}: {e}",
+                "Error inesperado al actualizar {} ID {}: {}",
+                self.model_class.__name__, entity.id, e,
                 entity_id=entity.id,
                 error_type=type(e).__name__
             )
@@ -333,7 +359,8 @@ class BaseRepository(Generic[ModelType], ABC):
             entity = await self.get_by_id(entity_id)
             if not entity:
                 self._logger.warning(
-                    f"Intento de eliminar {self.model_class.__name__} inexistente",
+                    "Intento de eliminar {} inexistente",
+                    self.model_class.__name__,
                     entity_id=entity_id
                 )
                 return False
@@ -342,7 +369,8 @@ class BaseRepository(Generic[ModelType], ABC):
             await self.session.flush()
             
             self._logger.info(
-                f"Entidad {self.model_class.__name__} eliminada exitosamente",
+                "Entidad {} eliminada exitosamente",
+                self.model_class.__name__,
                 entity_id=entity_id
             )
             
@@ -350,7 +378,8 @@ class BaseRepository(Generic[ModelType], ABC):
             
         except SQLAlchemyError as e:
             self._logger.error(
-                f"Error al eliminar {self.model_class.__name__} ID {entity_id}: {e}",
+                "Error al eliminar {} ID {}: {}",
+                self.model_class.__name__, entity_id, e,
                 entity_id=entity_id,
                 error_type=type(e).__name__
             )
@@ -363,7 +392,8 @@ class BaseRepository(Generic[ModelType], ABC):
             )
         except Exception as e:
             self._logger.error(
-                f"Error inesperado al eliminar {self.model_class.__name__} ID {entity_id}: {e}",
+                "Error inesperado al eliminar {} ID {}: {}",
+                self.model_class.__name__, entity_id, e,
                 entity_id=entity_id,
                 error_type=type(e).__name__
             )
@@ -402,7 +432,8 @@ class BaseRepository(Generic[ModelType], ABC):
             
             exists = count > 0
             self._logger.debug(
-                f"Verificación de existencia de {self.model_class.__name__}",
+                "Verificación de existencia de {}",
+                self.model_class.__name__,
                 entity_id=entity_id,
                 exists=exists
             )
@@ -411,7 +442,8 @@ class BaseRepository(Generic[ModelType], ABC):
             
         except SQLAlchemyError as e:
             self._logger.error(
-                f"Error al verificar existencia de {self.model_class.__name__} ID {entity_id}: {e}",
+                "Error al verificar existencia de {} ID {}: {}",
+                self.model_class.__name__, entity_id, e,
                 entity_id=entity_id,
                 error_type=type(e).__name__
             )
@@ -423,7 +455,8 @@ class BaseRepository(Generic[ModelType], ABC):
             )
         except Exception as e:
             self._logger.error(
-                f"Error inesperado al verificar existencia de {self.model_class.__name__} ID {entity_id}: {e}",
+                "Error inesperado al verificar existencia de {} ID {}: {}",
+                self.model_class.__name__, entity_id, e,
                 entity_id=entity_id,
                 error_type=type(e).__name__
             )
@@ -459,7 +492,8 @@ class BaseRepository(Generic[ModelType], ABC):
                         conditions.append(getattr(self.model_class, field) == value)
                     else:
                         self._logger.warning(
-                            f"Campo de filtro '{field}' no existe en {self.model_class.__name__}"
+                            "Campo de filtro '{}' no existe en {}",
+                            field, self.model_class.__name__
                         )
                 
                 if conditions:
@@ -469,7 +503,8 @@ class BaseRepository(Generic[ModelType], ABC):
             count = result.scalar()
             
             self._logger.debug(
-                f"Conteo de {self.model_class.__name__} completado",
+                "Conteo de {} completado",
+                self.model_class.__name__,
                 count=count,
                 filters=filters
             )
@@ -478,7 +513,8 @@ class BaseRepository(Generic[ModelType], ABC):
             
         except SQLAlchemyError as e:
             self._logger.error(
-                f"Error al contar entidades de {self.model_class.__name__}: {e}",
+                "Error al contar entidades de {}: {}",
+                self.model_class.__name__, e,
                 filters=filters,
                 error_type=type(e).__name__
             )
@@ -489,7 +525,8 @@ class BaseRepository(Generic[ModelType], ABC):
             )
         except Exception as e:
             self._logger.error(
-                f"Error inesperado al contar entidades de {self.model_class.__name__}: {e}",
+                "Error inesperado al contar entidades de {}: {}",
+                self.model_class.__name__, e,
                 filters=filters,
                 error_type=type(e).__name__
             )
@@ -561,7 +598,8 @@ class BaseRepository(Generic[ModelType], ABC):
                         conditions.append(getattr(self.model_class, field) == value)
                 else:
                     self._logger.warning(
-                        f"Campo de criterio '{field}' no existe en {self.model_class.__name__}"
+                        "Campo de criterio '{}' no existe en {}",
+                        field, self.model_class.__name__
                     )
             
             if conditions:
@@ -583,7 +621,8 @@ class BaseRepository(Generic[ModelType], ABC):
             entities = result.scalars().all()
             
             self._logger.debug(
-                f"Búsqueda por criterios en {self.model_class.__name__} completada",
+                "Búsqueda por criterios en {} completada",
+                self.model_class.__name__,
                 count=len(entities),
                 criteria=criteria
             )
@@ -592,7 +631,8 @@ class BaseRepository(Generic[ModelType], ABC):
             
         except SQLAlchemyError as e:
             self._logger.error(
-                f"Error en búsqueda por criterios de {self.model_class.__name__}: {e}",
+                "Error en búsqueda por criterios de {}: {}",
+                self.model_class.__name__, e,
                 criteria=criteria,
                 error_type=type(e).__name__
             )
@@ -603,7 +643,8 @@ class BaseRepository(Generic[ModelType], ABC):
             )
         except Exception as e:
             self._logger.error(
-                f"Error inesperado en búsqueda por criterios de {self.model_class.__name__}: {e}",
+                "Error inesperado en búsqueda por criterios de {}: {}",
+                self.model_class.__name__, e,
                 criteria=criteria,
                 error_type=type(e).__name__
             )
@@ -627,11 +668,12 @@ class BaseRepository(Generic[ModelType], ABC):
         """
         try:
             await self.session.commit()
-            self._logger.debug(f"Transacción confirmada para {self.model_class.__name__}")
+            self._logger.debug("Transacción confirmada para {}", self.model_class.__name__)
             
         except SQLAlchemyError as e:
             self._logger.error(
-                f"Error al confirmar transacción para {self.model_class.__name__}: {e}",
+                "Error al confirmar transacción para {}: {}",
+                self.model_class.__name__, e,
                 error_type=type(e).__name__
             )
             await self.session.rollback()
@@ -642,7 +684,8 @@ class BaseRepository(Generic[ModelType], ABC):
             )
         except Exception as e:
             self._logger.error(
-                f"Error inesperado al confirmar transacción para {self.model_class.__name__}: {e}",
+                "Error inesperado al confirmar transacción para {}: {}",
+                self.model_class.__name__, e,
                 error_type=type(e).__name__
             )
             await self.session.rollback()
@@ -662,11 +705,12 @@ class BaseRepository(Generic[ModelType], ABC):
         """
         try:
             await self.session.rollback()
-            self._logger.debug(f"Transacción revertida para {self.model_class.__name__}")
+            self._logger.debug("Transacción revertida para {}", self.model_class.__name__)
             
         except SQLAlchemyError as e:
             self._logger.error(
-                f"Error al revertir transacción para {self.model_class.__name__}: {e}",
+                "Error al revertir transacción para {}: {}",
+                self.model_class.__name__, e,
                 error_type=type(e).__name__
             )
             raise convert_sqlalchemy_error(
@@ -676,7 +720,8 @@ class BaseRepository(Generic[ModelType], ABC):
             )
         except Exception as e:
             self._logger.error(
-                f"Error inesperado al revertir transacción para {self.model_class.__name__}: {e}",
+                "Error inesperado al revertir transacción para {}: {}",
+                self.model_class.__name__, e,
                 error_type=type(e).__name__
             )
             raise RepositoryError(
@@ -736,7 +781,8 @@ class BaseRepository(Generic[ModelType], ABC):
         """
         if settings.debug_mode:
             self._logger.debug(
-                f"Iniciando operación {operation} en {self.model_class.__name__}",
+                "Iniciando operación {} en {}",
+                operation, self.model_class.__name__,
                 operation=operation,
                 **context
             )
@@ -750,7 +796,8 @@ class BaseRepository(Generic[ModelType], ABC):
             **context: Contexto adicional para el log
         """
         self._logger.info(
-            f"Operación {operation} completada exitosamente en {self.model_class.__name__}",
+            "Operación {} completada exitosamente en {}",
+            operation, self.model_class.__name__,
             operation=operation,
             **context
         )
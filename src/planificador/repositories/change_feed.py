@@ -0,0 +1,468 @@
+"""
+Flujo de cambios (outbox) de las escrituras de la capa de repositorios.
+
+Varios consumidores (refresco de la rejilla, agregados, índice de búsqueda,
+feeds iCal, generador de alertas) necesitan saber qué ha cambiado. En lugar
+de recalcular desde cero, leen eventos compactos de ``change_events``:
+
+    (posición, entidad, id, operación, columnas cambiadas, versión)
+
+Captura:
+    Los listeners de sesión escriben los eventos en la misma transacción
+    que el cambio, de modo que un rollback descarta ambos:
+
+    - ``after_flush``: altas, cambios y bajas de instancias de las entidades
+      capturadas. Los cambios solo registran las columnas modificadas y se
+      omiten si únicamente cambian relaciones.
+    - ``do_orm_execute``: sentencias ``insert``/``update``/``delete`` sobre
+      esas entidades, tras ejecutarse. Las inserciones y actualizaciones en
+      bloque con parámetros que incluyen ``id`` generan un evento por fila;
+      el resto genera un único evento con ``entity_id`` None, que significa
+      "cualquier fila de la entidad".
+
+    La opción de ejecución (o clave de ``Session.info``)
+    ``SKIP_CAPTURE_OPTION`` desactiva la captura, p. ej. en recargas masivas
+    seguidas de una reconstrucción completa.
+
+Consumo:
+    ``ChangeFeed`` lee por lotes los eventos posteriores al checkpoint de un
+    consumidor y lo avanza en la misma transacción que los efectos del
+    manejador, por lo que los datos derivados en la base de datos se
+    actualizan exactamente una vez; los efectos externos, al menos una vez.
+    ``prune_change_events`` elimina los eventos ya leídos por todos los
+    consumidores.
+
+    La posición es el ``id`` autoincremental, que se asigna al insertar y no
+    al confirmar. En SQLite las escrituras se confirman de una en una y en
+    orden, pero en PostgreSQL (o MySQL) una transacción que empezó antes
+    puede confirmar después: su evento aparecería por detrás de un
+    checkpoint ya avanzado. Por eso, fuera de SQLite, la lectura se detiene
+    ante un hueco en las posiciones hasta que se rellena o pasa
+    ``gap_timeout`` desde que se vio (entonces se da por revertido y se
+    salta).
+
+Uso:
+    ```python
+    feed = ChangeFeed(session, "search_index", entities=["Project", "Client"])
+    processed = await feed.consume(reindex_events)
+    ```
+"""
+
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from loguru import logger
+from sqlalchemy import delete, event, func, inspect, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from planificador.exceptions import RepositoryError, ValidationError
+from planificador.exceptions.repository.base_repository_exceptions import (
+    convert_sqlalchemy_error,
+)
+from planificador.models.alert import Alert
+from planificador.models.change_event import (
+    ChangeEvent,
+    ChangeEventCheckpoint,
+    ChangeOperation,
+)
+from planificador.models.client import Client
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.models.project_assignment import ProjectAssignment
+from planificador.models.project_shutdown import ProjectShutdown
+from planificador.models.schedule import Schedule
+from planificador.models.status_code import StatusCode
+from planificador.models.team import Team
+from planificador.models.team_membership import TeamMembership
+from planificador.models.vacation import Vacation
+from planificador.models.workload import Workload
+
+
+# Opción de ejecución / clave de ``Session.info`` para no capturar cambios
+SKIP_CAPTURE_OPTION = "skip_change_capture"
+
+# Entidades capturadas por nombre de tabla (los datos derivados no se capturan)
+_CAPTURED_TABLES = {
+    model.__tablename__: model
+    for model in (
+        Alert, Client, Employee, Project, ProjectAssignment, ProjectShutdown,
+        Schedule, StatusCode, Team, TeamMembership, Vacation, Workload,
+    )
+}
+_CAPTURED_MODELS = frozenset(_CAPTURED_TABLES.values())
+
+# Columnas de auditoría que no cuentan como cambio
+_IGNORED_COLUMNS = frozenset({"created_at", "updated_at"})
+
+_EventHandler = Callable[[List[ChangeEvent]], Awaitable[Any]]
+
+# Segundos que se espera a que se rellene un hueco en las posiciones (fuera de SQLite)
+DEFAULT_GAP_TIMEOUT = 30.0
+
+
+# =============================================================================
+# CAPTURA
+# =============================================================================
+
+def _event_row(
+    model: Any,
+    operation: ChangeOperation,
+    entity_id: Optional[int] = None,
+    columns: Optional[Iterable[str]] = None,
+    version: Optional[int] = None,
+) -> Dict[str, Any]:
+    return {
+        "entity": model.__name__,
+        "entity_id": entity_id,
+        "operation": operation,
+        "changed_columns": ",".join(sorted(columns)) if columns else None,
+        "version": version,
+    }
+
+
+def _instance_row(instance: Any, operation: ChangeOperation) -> Optional[Dict[str, Any]]:
+    """Evento de una instancia del flush (None si no hay columnas modificadas)."""
+    state = inspect(instance)
+    columns = None
+    if operation == ChangeOperation.UPDATE:
+        columns = [
+            attr.key
+            for attr in state.mapper.column_attrs
+            if attr.key not in _IGNORED_COLUMNS and state.attrs[attr.key].history.has_changes()
+        ]
+        if not columns:
+            return None
+    # Se lee el diccionario de estado para no disparar cargas durante el flush
+    entity_id = state.dict.get("id")
+    if entity_id is None and state.identity:
+        entity_id = state.identity[0]
+    return _event_row(
+        type(instance), operation, entity_id, columns, state.dict.get("revision_number")
+    )
+
+
+def _statement_rows(
+    model: Any,
+    operation: ChangeOperation,
+    parameters: Any,
+) -> List[Dict[str, Any]]:
+    """Eventos de una sentencia en bloque ya ejecutada."""
+    if isinstance(parameters, dict) and operation == ChangeOperation.INSERT:
+        parameters = [parameters]
+    if isinstance(parameters, list) and parameters and operation != ChangeOperation.DELETE:
+        if all(row.get("id") is not None for row in parameters):
+            return [
+                _event_row(
+                    model,
+                    operation,
+                    row["id"],
+                    set(row) - {"id"} - _IGNORED_COLUMNS if operation == ChangeOperation.UPDATE else None,
+                    row.get("revision_number"),
+                )
+                for row in parameters
+            ]
+    return [_event_row(model, operation)]
+
+
+def _write_events(session: Session, rows: List[Dict[str, Any]]) -> None:
+    if rows:
+        session.connection().execute(insert(ChangeEvent.__table__), rows)
+
+
+@event.listens_for(Session, "after_flush")
+def _capture_flush_changes(session: Session, flush_context: Any) -> None:
+    if session.info.get(SKIP_CAPTURE_OPTION):
+        return
+    rows = []
+    for instances, operation in (
+        (session.new, ChangeOperation.INSERT),
+        (session.dirty, ChangeOperation.UPDATE),
+        (session.deleted, ChangeOperation.DELETE),
+    ):
+        for instance in instances:
+            if type(instance) in _CAPTURED_MODELS:
+                row = _instance_row(instance, operation)
+                if row is not None:
+                    rows.append(row)
+    _write_events(session, rows)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _capture_statement_changes(orm_execute_state: Any) -> Any:
+    if orm_execute_state.is_insert:
+        operation = ChangeOperation.INSERT
+    elif orm_execute_state.is_update:
+        operation = ChangeOperation.UPDATE
+    elif orm_execute_state.is_delete:
+        operation = ChangeOperation.DELETE
+    else:
+        return None
+    session = orm_execute_state.session
+    if orm_execute_state.execution_options.get(SKIP_CAPTURE_OPTION) or session.info.get(SKIP_CAPTURE_OPTION):
+        return None
+
+    mapper = orm_execute_state.bind_mapper
+    model = mapper.class_ if mapper is not None else None
+    if model is None:
+        table = getattr(orm_execute_state.statement, "table", None)
+        model = _CAPTURED_TABLES.get(getattr(table, "name", None))
+    if model not in _CAPTURED_MODELS:
+        return None
+
+    # Los eventos se escriben solo si la sentencia se ejecuta sin errores
+    result = orm_execute_state.invoke_statement()
+    _write_events(session, _statement_rows(model, operation, orm_execute_state.parameters))
+    return result
+
+
+# =============================================================================
+# CONSUMO
+# =============================================================================
+
+class ChangeFeed:
+    """
+    Consumidor del flujo de cambios con checkpoint persistente.
+
+    Attributes:
+        session: Sesión asíncrona del consumidor
+        consumer: Nombre único del consumidor
+        entities: Entidades que interesan al consumidor (todas si es None)
+        batch_size: Número máximo de eventos por lote
+        gap_timeout: Segundos de espera ante un hueco en las posiciones
+            (None: 0 en SQLite y ``DEFAULT_GAP_TIMEOUT`` en el resto)
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        consumer: str,
+        entities: Optional[Iterable[str]] = None,
+        batch_size: int = 500,
+        gap_timeout: Optional[float] = None,
+    ):
+        if not consumer:
+            raise ValidationError(
+                message="El consumidor debe tener nombre",
+                field="consumer",
+                value=consumer
+            )
+        if batch_size < 1:
+            raise ValidationError(
+                message="El tamaño de lote debe ser al menos 1",
+                field="batch_size",
+                value=batch_size
+            )
+        self.session = session
+        self.consumer = consumer
+        self.entities = sorted(entities) if entities is not None else None
+        self.batch_size = batch_size
+        if gap_timeout is None:
+            dialect = getattr(getattr(session, "bind", None), "dialect", None)
+            sqlite = dialect is None or dialect.name == "sqlite"
+            gap_timeout = 0.0 if sqlite else DEFAULT_GAP_TIMEOUT
+        self.gap_timeout = gap_timeout
+        # Primer instante (monotónico) en que se vio cada hueco, por su posición inicial
+        self._gaps_seen: Dict[int, float] = {}
+        self._logger = logger.bind(module="change_feed", consumer=consumer)
+
+    async def get_position(self) -> int:
+        """
+        Obtiene la última posición procesada por el consumidor.
+
+        Returns:
+            int: Posición del checkpoint (0 si el consumidor es nuevo)
+        """
+        try:
+            result = await self.session.execute(
+                select(ChangeEventCheckpoint.position)
+                .where(ChangeEventCheckpoint.consumer == self.consumer)
+            )
+            return result.scalar_one_or_none() or 0
+        except SQLAlchemyError as e:
+            self._logger.error(f"Error al leer el checkpoint de {self.consumer}: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="get_position",
+                entity_type="ChangeEventCheckpoint",
+                entity_id=self.consumer
+            )
+
+    async def read(self, after: Optional[int] = None, limit: Optional[int] = None) -> List[ChangeEvent]:
+        """
+        Lee eventos posteriores a una posición, en orden.
+
+        Si entre ``after`` y los eventos leídos falta alguna posición que
+        aún puede confirmarse, solo se devuelven los eventos anteriores al
+        hueco.
+
+        Args:
+            after: Posición de partida (por defecto el checkpoint)
+            limit: Número máximo de eventos (por defecto ``batch_size``)
+
+        Returns:
+            List[ChangeEvent]: Eventos ordenados por posición
+        """
+        try:
+            if after is None:
+                after = await self.get_position()
+            query = select(ChangeEvent).where(ChangeEvent.id > after)
+            if self.entities is not None:
+                query = query.where(ChangeEvent.entity.in_(self.entities))
+            result = await self.session.execute(
+                query.order_by(ChangeEvent.id).limit(limit or self.batch_size)
+            )
+            events = list(result.scalars().all())
+            if events and self.gap_timeout > 0:
+                horizon = await self._settled_position(after, events[-1].id)
+                events = [event for event in events if event.id <= horizon]
+            return events
+        except SQLAlchemyError as e:
+            self._logger.error(f"Error al leer eventos para {self.consumer}: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="read",
+                entity_type="ChangeEvent",
+                entity_id=self.consumer
+            )
+
+    async def _settled_position(self, after: int, last: int) -> int:
+        """
+        Última posición hasta ``last`` sin huecos que puedan rellenarse aún.
+
+        Un hueco es una posición sin evento: o su transacción se revirtió o
+        todavía no se ha confirmado. Se espera ``gap_timeout`` segundos desde
+        que se ve por primera vez antes de saltarlo.
+        """
+        result = await self.session.execute(
+            select(ChangeEvent.id)
+            .where(ChangeEvent.id > after, ChangeEvent.id <= last)
+            .order_by(ChangeEvent.id)
+        )
+        now = time.monotonic()
+        expected = after + 1
+        horizon = last
+        for event_id in result.scalars():
+            if event_id != expected:
+                first_seen = self._gaps_seen.setdefault(expected, now)
+                if now - first_seen < self.gap_timeout:
+                    horizon = expected - 1
+                    break
+                self._logger.warning(
+                    f"Posiciones {expected}-{event_id - 1} sin evento tras "
+                    f"{self.gap_timeout}s; se saltan"
+                )
+            expected = event_id + 1
+        self._gaps_seen = {
+            start: seen for start, seen in self._gaps_seen.items() if start > horizon
+        }
+        return horizon
+
+    async def acknowledge(self, position: int) -> None:
+        """
+        Avanza el checkpoint del consumidor dentro de la transacción actual.
+
+        Args:
+            position: Última posición procesada
+        """
+        try:
+            checkpoint = (await self.session.execute(
+                select(ChangeEventCheckpoint)
+                .where(ChangeEventCheckpoint.consumer == self.consumer)
+            )).scalar_one_or_none()
+            if checkpoint is None:
+                self.session.add(ChangeEventCheckpoint(consumer=self.consumer, position=position))
+            elif position > checkpoint.position:
+                checkpoint.position = position
+            await self.session.flush()
+        except SQLAlchemyError as e:
+            self._logger.error(f"Error al guardar el checkpoint de {self.consumer}: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="acknowledge",
+                entity_type="ChangeEventCheckpoint",
+                entity_id=self.consumer
+            )
+
+    async def consume(self, handler: _EventHandler, max_batches: Optional[int] = None) -> int:
+        """
+        Procesa lotes de eventos pendientes hasta agotarlos.
+
+        Cada lote se entrega al manejador y, si termina sin errores, el
+        checkpoint avanza y se confirma la transacción junto con lo que haya
+        escrito el manejador. Si falla, se revierte el lote completo y el
+        error se propaga.
+
+        Args:
+            handler: Corrutina que recibe la lista de eventos del lote
+            max_batches: Número máximo de lotes a procesar (sin límite si es None)
+
+        Returns:
+            int: Número de eventos procesados
+        """
+        processed = 0
+        batches = 0
+        position = await self.get_position()
+        while max_batches is None or batches < max_batches:
+            events = await self.read(after=position)
+            if not events:
+                break
+            try:
+                await handler(events)
+                position = events[-1].id
+                await self.acknowledge(position)
+                await self.session.commit()
+            except RepositoryError:
+                await self.session.rollback()
+                raise
+            except SQLAlchemyError as e:
+                await self.session.rollback()
+                self._logger.error(f"Error al procesar eventos para {self.consumer}: {e}")
+                raise convert_sqlalchemy_error(
+                    error=e,
+                    operation="consume",
+                    entity_type="ChangeEvent",
+                    entity_id=self.consumer
+                )
+            except Exception as e:
+                await self.session.rollback()
+                self._logger.error(f"Error inesperado al procesar eventos para {self.consumer}: {e}")
+                raise RepositoryError(
+                    message=f"Error inesperado al procesar eventos para {self.consumer}: {e}",
+                    operation="consume",
+                    entity_type="ChangeEvent",
+                    entity_id=self.consumer,
+                    original_error=e
+                )
+            processed += len(events)
+            batches += 1
+        self._logger.debug(f"{processed} eventos procesados por {self.consumer} hasta la posición {position}")
+        return processed
+
+
+async def prune_change_events(session: AsyncSession) -> int:
+    """
+    Elimina los eventos ya procesados por todos los consumidores registrados.
+
+    Args:
+        session: Sesión asíncrona
+
+    Returns:
+        int: Número de eventos eliminados (0 si no hay consumidores)
+    """
+    try:
+        position = (await session.execute(
+            select(func.min(ChangeEventCheckpoint.position))
+        )).scalar()
+        if not position:
+            return 0
+        result = await session.execute(delete(ChangeEvent).where(ChangeEvent.id <= position))
+        return result.rowcount
+    except SQLAlchemyError as e:
+        logger.error(f"Error al purgar eventos de cambio: {e}")
+        raise convert_sqlalchemy_error(
+            error=e,
+            operation="prune_change_events",
+            entity_type="ChangeEvent"
+        )
@@ -41,7 +41,9 @@ from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from planificador.models import Client
+from planificador.repositories.search.fuzzy_matcher import FuzzyMatch
 from planificador.schemas.client import ClientCreate, ClientUpdate
+from planificador.schemas.response import ClientListResponse
 
 # Módulos 
 from .modules.advanced_query_operations import AdvancedQueryOperations
@@ -52,8 +54,10 @@ from .modules.query_operations import QueryOperations
 from .modules.relationship_operations import RelationshipOperations
 from .modules.statistics_operations import StatisticsOperations
 from .modules.validation_operations import ValidationOperations
+from planificador.database.instrumentation import instrumented_repository
 
 
+@instrumented_repository
 class ClientRepositoryFacade:
     """
     Facade que unifica el acceso a las operaciones del repositorio de clientes.
@@ -212,6 +216,14 @@ class ClientRepositoryFacade:
 
     async def get_all_clients(self, limit: int | None = None, offset: int = 0) -> list[Client]:
         return await self._query_operations.get_all_clients(limit, offset)
+
+    async def list_client_summaries(
+        self,
+        is_active: bool | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[ClientListResponse]:
+        return await self._query_operations.list_client_summaries(is_active, limit, offset)
     
     # --- Relationship Operations ---
     async def transfer_projects_to_client(self, from_client_id: int, to_client_id: int) -> bool:
@@ -251,11 +263,21 @@ class ClientRepositoryFacade:
         self, 
         client_data: dict[str, Any], 
         exclude_id: int | None = None
-    ) -> None:
+    ) -> list[FuzzyMatch]:
         return await self._validation_operations.validate_unique_fields(
             client_data, exclude_id
         )
 
+    async def find_near_duplicates(
+        self,
+        client_data: dict[str, Any],
+        exclude_id: int | None = None,
+        threshold: float = 0.6
+    ) -> list[FuzzyMatch]:
+        return await self._validation_operations.find_near_duplicates(
+            client_data, exclude_id, threshold
+        )
+
     def validate_email_format(self, email: str) -> None:
         return self._validation_operations.validate_email_format(email)
 
@@ -11,6 +11,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
 from planificador.models.client import Client
+from planificador.schemas.response import ClientListResponse
 
 
 class IQueryOperations(ABC):
@@ -48,6 +49,16 @@ class IQueryOperations(ABC):
         """Obtiene todos los clientes con paginación opcional."""
         pass
 
+    @abstractmethod
+    async def list_client_summaries(
+        self,
+        is_active: bool | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[ClientListResponse]:
+        """Obtiene el listado de clientes proyectando solo las columnas de la vista."""
+        pass
+
 
 class IAdvancedQueryOperations(ABC):
     """Interfaz para operaciones de consulta avanzadas de clientes."""
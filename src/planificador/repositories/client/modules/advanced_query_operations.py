@@ -22,6 +22,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from planificador.models.client import Client
 from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.search.fuzzy_matcher import fuzzy_matcher
 from planificador.exceptions import (
     RepositoryError,
     ValidationError,
@@ -209,18 +210,19 @@ class AdvancedQueryOperations(BaseRepository[Client], IQueryOperations):
         search_term: str, 
         similarity_threshold: float = 0.3
     ) -> List[Client]:
-        """Realiza búsqueda difusa de clientes.
+        """Realiza búsqueda difusa de clientes por nombre y código.
         
-        En esta implementación, se simula una búsqueda difusa usando ILIKE.
-        Para una búsqueda más avanzada, se recomienda usar extensiones de
-        base de datos como pg_trgm en PostgreSQL.
+        Usa el índice de trigramas en memoria (``fuzzy_matcher``), por lo que
+        tolera errores tipográficos sin recorrer la tabla en cada búsqueda.
+        La similitud se mide sobre los trigramas del término, de modo que
+        escribir solo parte del nombre también encuentra el cliente.
         
         Args:
             search_term: Término de búsqueda
-            similarity_threshold: Umbral de similitud (no utilizado en esta simulación)
+            similarity_threshold: Similitud mínima (0-1) para incluir un cliente
             
         Returns:
-            Lista de clientes ordenados por relevancia
+            Lista de clientes ordenados por similitud descendente
             
         Raises:
             RepositoryError: Si ocurre un error en la consulta
@@ -229,21 +231,28 @@ class AdvancedQueryOperations(BaseRepository[Client], IQueryOperations):
             return []
             
         self._logger.debug(
-            f"Búsqueda difusa (simulada): '{search_term}'"
+            "Búsqueda difusa: '{}' (umbral {})",
+            search_term,
+            similarity_threshold
         )
         
-        search_pattern = f"%{search_term.strip()}%"
-        
-        criteria = {
-            "or": [
-                {"name": {"operator": "ilike", "value": search_pattern}},
-                {"email": {"operator": "ilike", "value": search_pattern}},
-                {"code": {"operator": "ilike", "value": search_pattern}},
-            ]
-        }
-        
-        return await self.find_by_criteria(
-            criteria=criteria,
+        matches = await fuzzy_matcher.find_similar(
+            self.session,
+            "client",
+            search_term.strip(),
+            threshold=similarity_threshold,
             limit=50,
-            order_by="name"
-        )
\ No newline at end of file
+            word_match=True,
+        )
+        if not matches:
+            return []
+        
+        clients = await self.find_by_criteria(
+            criteria={"id": [match.entity_id for match in matches]}
+        )
+        clients_by_id = {client.id: client for client in clients}
+        return [
+            clients_by_id[match.entity_id]
+            for match in matches
+            if match.entity_id in clients_by_id
+        ]
@@ -11,6 +11,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from planificador.models.client import Client
 from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.search.search_index import (
+    remove_from_search_index,
+    sync_search_index,
+)
 from ..interfaces.crud_interface import ICrudOperations
 
 
@@ -41,7 +45,9 @@ class CrudOperations(BaseRepository[Client], ICrudOperations):
             Cliente creado
         """
         self._logger.debug(f"Creando cliente con datos: {client_data}")
-        return await self.create(client_data)
+        client = await self.create(client_data)
+        await sync_search_index(self.session, client)
+        return client
 
     async def update_client(
         self, client_id: int, client_data: dict[str, Any]
@@ -58,7 +64,10 @@ class CrudOperations(BaseRepository[Client], ICrudOperations):
         self._logger.debug(
             f"Actualizando cliente ID {client_id} con datos: {client_data}"
         )
-        return await self.update(client_id, client_data)
+        client = await self.update(client_id, client_data)
+        if client:
+            await sync_search_index(self.session, client)
+        return client
 
     async def delete_client(self, client_id: int) -> bool:
         """Elimina un cliente delegando en el repositorio base.
@@ -70,4 +79,7 @@ class CrudOperations(BaseRepository[Client], ICrudOperations):
             True si se eliminó correctamente, False en caso contrario
         """
         self._logger.debug(f"Eliminando cliente ID {client_id}")
-        return await self.delete(client_id)
\ No newline at end of file
+        deleted = await self.delete(client_id)
+        if deleted:
+            await remove_from_search_index(self.session, Client, client_id)
+        return deleted
\ No newline at end of file
@@ -9,10 +9,14 @@ Versión: 2.1.0
 
 from typing import Any
 
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from planificador.exceptions.repository import convert_sqlalchemy_error
 from planificador.models.client import Client
 from planificador.repositories.base_repository import BaseRepository, ModelType
+from planificador.repositories.projections import CLIENT_SUMMARY
+from planificador.schemas.response import ClientListResponse
 from ..interfaces.query_interface import IQueryOperations
 
 
@@ -68,6 +72,42 @@ class QueryOperations(BaseRepository[Client], IQueryOperations):
         """Obtiene todos los clientes con paginación opcional."""
         return await self.get_all(limit=limit, offset=offset)
 
+    async def list_client_summaries(
+        self,
+        is_active: bool | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[ClientListResponse]:
+        """Obtiene el listado de clientes proyectando solo las columnas de la vista.
+
+        El número de proyectos se calcula con una subconsulta correlacionada,
+        sin cargar entidades ni las notas de los clientes.
+
+        Args:
+            is_active: Filtra por estado activo.
+            limit: Número máximo de resultados.
+            offset: Número de resultados a omitir.
+
+        Returns:
+            Lista de ClientListResponse ordenada por nombre.
+
+        Raises:
+            RepositoryError: Si falla la consulta.
+        """
+        conditions = []
+        if is_active is not None:
+            conditions.append(Client.is_active == is_active)
+        try:
+            return await CLIENT_SUMMARY.fetch(
+                self.session, *conditions, limit=limit, offset=offset
+            )
+        except SQLAlchemyError as e:
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="list_client_summaries",
+                entity_type="Client",
+            )
+
     async def get_by_unique_field(self, field_name: str, value: Any) -> ModelType | None:
         """Obtiene una entidad por un campo único específico."""
         return await self._find_one_by_criteria({field_name: value})
\ No newline at end of file
@@ -11,7 +11,10 @@ from loguru import logger
 from sqlalchemy import func, select
 from sqlalchemy.exc import SQLAlchemyError
 
+from planificador.exceptions.repository import convert_sqlalchemy_error
 from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.dashboard_composer import DashboardComposer
+from planificador.repositories.query_fusion import FusedAggregate
 from planificador.models.client import Client
 from planificador.models.project import Project
 from planificador.repositories.client.interfaces.statistics_interface import (
@@ -51,13 +54,32 @@ class StatisticsOperations(BaseRepository[Client], IStatisticsOperations):
             Diccionario con el número de clientes activos e inactivos.
         """
         self._logger.debug("Contando clientes por estado (activo/inactivo)")
-        active_count = await self.count([self.model_class.is_active == True])
-        inactive_count = await self.count([self.model_class.is_active == False])
-        
-        counts = {"active": active_count, "inactive": inactive_count}
+        metrics = await self._get_status_metrics()
+        counts = {"active": metrics["active"], "inactive": metrics["inactive"]}
         self._logger.info(f"Clientes por estado: {counts}")
         return counts
 
+    async def _get_status_metrics(self) -> dict[str, int]:
+        """Obtiene total, activos e inactivos en una sola consulta.
+        
+        Returns:
+            Diccionario con las claves ``total``, ``active`` e ``inactive``.
+        """
+        try:
+            return await (
+                FusedAggregate(self.model_class)
+                .count("total")
+                .count("active", self.model_class.is_active == True)
+                .count("inactive", self.model_class.is_active == False)
+                .execute(self.session)
+            )
+        except SQLAlchemyError as e:
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="get_client_counts_by_status",
+                entity_type="Client",
+            )
+
     async def get_client_count(self, is_active: bool | None = None) -> int:
         """Obtiene el número total de clientes.
         
@@ -177,20 +199,47 @@ class StatisticsOperations(BaseRepository[Client], IStatisticsOperations):
                 for row in result
             ]
 
-    async def get_comprehensive_dashboard_metrics(self) -> dict[str, Any]:
+    async def get_comprehensive_dashboard_metrics(
+        self, widget_timeout: float = 5.0
+    ) -> dict[str, Any]:
         """
         Recopila una serie de métricas clave sobre los clientes para un
         dashboard.
 
+        Los conteos y las tendencias se calculan en paralelo, cada uno en su
+        propia sesión. Si alguno falla o supera el timeout, su sección se
+        devuelve vacía y se indica en ``incomplete_sections``.
+
+        Args:
+            widget_timeout: Timeout por sección en segundos.
+
         Returns:
             Un diccionario con métricas completas.
         """
-        total_clients = await self.get_client_count()
-        clients_by_status = await self.get_client_counts_by_status()
-        trends = await self.get_client_creation_trends(days=30)
-
-        return {
-            "total_clients": total_clients,
-            "clients_by_status": clients_by_status,
-            "creation_trends_last_30_days": trends,
-        }
\ No newline at end of file
+        composer = DashboardComposer.from_session(
+            self.session, default_timeout=widget_timeout
+        )
+        composer.add_widget(
+            "status",
+            lambda session: type(self)(session)._get_status_metrics(),
+            default={"total": 0, "active": 0, "inactive": 0},
+        )
+        composer.add_widget(
+            "trends",
+            lambda session: type(self)(session).get_client_creation_trends(days=30),
+            default=[],
+        )
+        dashboard = await composer.compose()
+        metrics = dashboard.values["status"]
+
+        result = {
+            "total_clients": metrics["total"],
+            "clients_by_status": {
+                "active": metrics["active"],
+                "inactive": metrics["inactive"],
+            },
+            "creation_trends_last_30_days": dashboard.values["trends"],
+        }
+        if dashboard.partial:
+            result["incomplete_sections"] = dashboard.failed
+        return result
@@ -17,11 +17,12 @@ Versión: 2.0.0
 """
 
 import re
-from typing import Any, Coroutine, Dict, Optional
+from typing import Any, Coroutine, Dict, List, Optional
 
 from loguru import logger
 
 from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.search.fuzzy_matcher import FuzzyMatch, fuzzy_matcher
 from planificador.exceptions.repository.client_repository_exceptions import (
     ClientDuplicateError,
     ClientValidationError,
@@ -57,13 +58,25 @@ class ValidationOperations(BaseRepository[Client], IValidationOperations):
         self._logger.debug("ValidationOperations inicializado")
 
     async def validate_unique_fields(
-        self, client_data: Dict[str, Any], exclude_id: Optional[int] = None
-    ) -> None:
+        self,
+        client_data: Dict[str, Any],
+        exclude_id: Optional[int] = None,
+        near_duplicate_threshold: float = 0.6,
+    ) -> List[FuzzyMatch]:
         """Valida que los campos únicos no estén duplicados.
 
+        Además de los duplicados exactos (que lanzan excepción), busca en el
+        índice de trigramas clientes con nombre o código muy parecido y los
+        devuelve como posibles duplicados para que el llamador los muestre.
+
         Args:
             client_data: Datos del cliente a validar
             exclude_id: ID del cliente a excluir de la validación (para updates)
+            near_duplicate_threshold: Similitud mínima (0-1) para considerar
+                un cliente como posible duplicado
+
+        Returns:
+            Lista de posibles duplicados ordenados por similitud
 
         Raises:
             ClientDuplicateError: Si se encuentra un campo duplicado
@@ -82,7 +95,57 @@ class ValidationOperations(BaseRepository[Client], IValidationOperations):
 
             await self._check_field_uniqueness(field_name, field_value, exclude_id)
 
+        near_duplicates = await self.find_near_duplicates(
+            client_data, exclude_id, near_duplicate_threshold
+        )
+
         self._logger.debug("Validación de campos únicos completada")
+        return near_duplicates
+
+    async def find_near_duplicates(
+        self,
+        client_data: Dict[str, Any],
+        exclude_id: Optional[int] = None,
+        threshold: float = 0.6,
+    ) -> List[FuzzyMatch]:
+        """Busca clientes con nombre o código parecido a los datos dados.
+
+        Args:
+            client_data: Datos del cliente (se usan ``name`` y ``code``)
+            exclude_id: ID del cliente a excluir (para updates)
+            threshold: Similitud mínima (0-1)
+
+        Returns:
+            Lista de posibles duplicados ordenados por similitud
+        """
+        candidates: Dict[int, FuzzyMatch] = {}
+        for field_name in ("name", "code"):
+            value = client_data.get(field_name)
+            if not value:
+                continue
+
+            matches = await fuzzy_matcher.find_similar(
+                self.session,
+                "client",
+                value,
+                threshold=threshold,
+                limit=10,
+                fields=[field_name],
+                exclude_id=exclude_id,
+            )
+            for match in matches:
+                current = candidates.get(match.entity_id)
+                if current is None or match.score > current.score:
+                    candidates[match.entity_id] = match
+
+        near_duplicates = sorted(candidates.values(), key=lambda m: m.score, reverse=True)
+        if near_duplicates:
+            self._logger.warning(
+                "Posibles clientes duplicados para '{}': {}",
+                client_data.get("name") or client_data.get("code"),
+                [(m.text, m.score) for m in near_duplicates],
+            )
+        return near_duplicates
 
     async def _check_field_uniqueness(
         self, field_name: str, field_value: Any, exclude_id: Optional[int]
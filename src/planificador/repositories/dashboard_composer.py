@@ -0,0 +1,247 @@
+"""
+Composición concurrente de widgets de dashboard.
+
+Una ``AsyncSession`` no admite sentencias concurrentes, por lo que los
+resúmenes que esperan una docena de consultas estadísticas sobre la misma
+sesión tardan la suma de todas ellas. ``DashboardComposer`` ejecuta cada
+widget (una consulta de solo lectura independiente) en su propia sesión del
+pool, con un límite de concurrencia y un timeout por widget. Si un widget
+falla o tarda demasiado, el resto del dashboard se devuelve igualmente y el
+widget queda marcado como parcial.
+
+Uso:
+    ```python
+    composer = DashboardComposer.from_session(session, max_concurrency=4)
+    composer.add_widget("by_status", lambda s: StatisticsOperations(s).get_employee_count_by_status())
+    composer.add_widget("skills", lambda s: StatisticsOperations(s).get_skills_distribution(10), timeout=2.0)
+    dashboard = await composer.compose()
+    dashboard.values["by_status"], dashboard.partial
+    ```
+
+Las sesiones de los widgets no ven los cambios sin confirmar de la sesión de
+origen; los dashboards solo deben leer datos ya persistidos.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+WidgetQuery = Callable[[AsyncSession], Awaitable[Any]]
+
+
+@dataclass
+class WidgetResult:
+    """
+    Resultado de un widget.
+
+    Attributes:
+        name: Nombre del widget.
+        status: "ok", "timeout" o "error".
+        value: Valor calculado (o el valor por defecto si no es "ok").
+        elapsed_ms: Tiempo de ejecución en milisegundos.
+        error: Mensaje de error si el widget falló.
+    """
+    name: str
+    status: str
+    value: Any = None
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Indica si el widget se calculó correctamente."""
+        return self.status == "ok"
+
+
+@dataclass
+class DashboardResult:
+    """
+    Resultado de la composición de un dashboard.
+
+    Attributes:
+        widgets: Resultado de cada widget por nombre.
+        elapsed_ms: Tiempo total de la composición en milisegundos.
+    """
+    widgets: Dict[str, WidgetResult] = field(default_factory=dict)
+    elapsed_ms: float = 0.0
+
+    @property
+    def values(self) -> Dict[str, Any]:
+        """Valores de los widgets por nombre."""
+        return {name: result.value for name, result in self.widgets.items()}
+
+    @property
+    def partial(self) -> bool:
+        """Indica si algún widget no se pudo calcular."""
+        return any(not result.ok for result in self.widgets.values())
+
+    @property
+    def failed(self) -> Dict[str, str]:
+        """Estado de los widgets que no se pudieron calcular."""
+        return {
+            name: result.error or result.status
+            for name, result in self.widgets.items()
+            if not result.ok
+        }
+
+
+@dataclass
+class _Widget:
+    """Definición interna de un widget."""
+    name: str
+    query: WidgetQuery
+    timeout: float
+    default: Any
+
+
+class DashboardComposer:
+    """
+    Ejecuta consultas de dashboard independientes de forma concurrente.
+
+    Attributes:
+        session_factory: Fábrica de sesiones del pool.
+        max_concurrency: Número máximo de widgets ejecutándose a la vez.
+        default_timeout: Timeout por widget en segundos.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        max_concurrency: int = 4,
+        default_timeout: float = 5.0,
+    ) -> None:
+        """
+        Inicializa el compositor.
+
+        Args:
+            session_factory: Fábrica de sesiones; cada widget abre la suya.
+            max_concurrency: Widgets simultáneos (acotado por el tamaño del pool).
+            default_timeout: Timeout por widget en segundos.
+
+        Raises:
+            ValueError: Si ``max_concurrency`` o ``default_timeout`` no son positivos.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency debe ser mayor que 0")
+        if default_timeout <= 0:
+            raise ValueError("default_timeout debe ser mayor que 0")
+
+        self.session_factory = session_factory
+        self.max_concurrency = max_concurrency
+        self.default_timeout = default_timeout
+        self._widgets: List[_Widget] = []
+        self._logger = logger.bind(component="DashboardComposer")
+
+    @classmethod
+    def from_session(cls, session: AsyncSession, **kwargs: Any) -> "DashboardComposer":
+        """
+        Crea un compositor que abre sesiones sobre el mismo engine que ``session``.
+
+        Args:
+            session: Sesión de referencia (solo se usa su engine).
+            **kwargs: Argumentos adicionales del constructor.
+
+        Returns:
+            Compositor listo para añadir widgets.
+        """
+        factory = async_sessionmaker(
+            bind=session.bind,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+        return cls(factory, **kwargs)
+
+    def add_widget(
+        self,
+        name: str,
+        query: WidgetQuery,
+        timeout: Optional[float] = None,
+        default: Any = None,
+    ) -> "DashboardComposer":
+        """
+        Registra un widget.
+
+        Args:
+            name: Nombre único del widget.
+            query: Corrutina que recibe una sesión propia y devuelve el valor.
+            timeout: Timeout del widget (por defecto ``default_timeout``).
+            default: Valor a devolver si el widget falla o expira.
+
+        Returns:
+            El propio compositor, para encadenar llamadas.
+
+        Raises:
+            ValueError: Si ya existe un widget con ese nombre.
+        """
+        if any(widget.name == name for widget in self._widgets):
+            raise ValueError(f"Widget duplicado: {name}")
+        self._widgets.append(
+            _Widget(name, query, timeout or self.default_timeout, default)
+        )
+        return self
+
+    async def _run_widget(self, widget: _Widget, semaphore: asyncio.Semaphore) -> WidgetResult:
+        """Ejecuta un widget en su propia sesión respetando el límite de concurrencia."""
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                async with self.session_factory() as session:
+                    value = await asyncio.wait_for(widget.query(session), widget.timeout)
+                return WidgetResult(
+                    name=widget.name,
+                    status="ok",
+                    value=value,
+                    elapsed_ms=(time.perf_counter() - start) * 1000,
+                )
+            except asyncio.TimeoutError:
+                self._logger.warning(
+                    "Widget '{}' superó el timeout de {}s", widget.name, widget.timeout
+                )
+                return WidgetResult(
+                    name=widget.name,
+                    status="timeout",
+                    value=widget.default,
+                    elapsed_ms=(time.perf_counter() - start) * 1000,
+                    error=f"timeout tras {widget.timeout}s",
+                )
+            except Exception as e:
+                self._logger.error("Error en widget '{}': {}", widget.name, e)
+                return WidgetResult(
+                    name=widget.name,
+                    status="error",
+                    value=widget.default,
+                    elapsed_ms=(time.perf_counter() - start) * 1000,
+                    error=str(e),
+                )
+
+    async def compose(self) -> DashboardResult:
+        """
+        Ejecuta todos los widgets registrados.
+
+        Los errores y timeouts de cada widget no se propagan: quedan
+        registrados en su ``WidgetResult`` y el dashboard se marca como parcial.
+
+        Returns:
+            Resultado con un ``WidgetResult`` por widget, en orden de registro.
+        """
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(
+            *(self._run_widget(widget, semaphore) for widget in self._widgets)
+        )
+        dashboard = DashboardResult(
+            widgets={result.name: result for result in results},
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+        )
+        self._logger.debug(
+            "Dashboard compuesto: {} widgets en {:.1f} ms (parcial: {})",
+            len(results),
+            dashboard.elapsed_ms,
+            dashboard.partial,
+        )
+        return dashboard
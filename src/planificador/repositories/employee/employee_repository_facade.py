@@ -4,6 +4,8 @@ from datetime import date
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...models.employee import Employee, EmployeeStatus
+from ...schemas.response import EmployeeListResponse
+from ..search.fuzzy_matcher import FuzzyMatch
 from .interfaces.crud_interface import IEmployeeCrudOperations
 from .interfaces.date_interface import IEmployeeDateOperations
 from .interfaces.query_interface import IEmployeeQueryOperations
@@ -16,8 +18,10 @@ from .modules.query_operations import QueryOperations
 from .modules.relationship_operations import RelationshipOperations
 from .modules.statistics_operations import StatisticsOperations
 from .modules.validation_operations import ValidationOperations
+from ...database.instrumentation import instrumented_repository
 
 
+@instrumented_repository
 class EmployeeRepositoryFacade(
     IEmployeeCrudOperations,
     IEmployeeDateOperations,
@@ -196,6 +200,23 @@ class EmployeeRepositoryFacade(
         """Obtiene todos los empleados activos."""
         return await self._queries.get_active_employees()
 
+    async def list_employee_summaries(
+        self,
+        status: Optional[EmployeeStatus] = None,
+        department: Optional[str] = None,
+        is_available: Optional[bool] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> List[EmployeeListResponse]:
+        """Obtiene el listado de empleados proyectando solo las columnas de la vista."""
+        return await self._queries.list_employee_summaries(
+            status=status,
+            department=department,
+            is_available=is_available,
+            limit=limit,
+            offset=offset,
+        )
+
     async def get_with_teams(self, employee_id: int) -> Optional[Employee]:
         """Obtiene un empleado con sus equipos."""
         return await self._queries.get_with_teams(employee_id)
@@ -208,6 +229,12 @@ class EmployeeRepositoryFacade(
         """Verifica si un nombre completo de empleado ya existe."""
         return await self._queries.full_name_exists(full_name, exclude_id)
 
+    async def find_similar_names(
+        self, full_name: str, exclude_id: Optional[int] = None, threshold: float = 0.6
+    ) -> List[FuzzyMatch]:
+        """Busca empleados con nombre completo parecido (posibles duplicados)."""
+        return await self._queries.find_similar_names(full_name, exclude_id, threshold)
+
     async def employee_code_exists(self, employee_code: str, exclude_id: Optional[int] = None) -> bool:
         """Verifica si un código de empleado ya existe."""
         return await self._queries.employee_code_exists(employee_code, exclude_id)
@@ -3,6 +3,8 @@ from typing import Any, Dict, List, Optional, Union
 from datetime import date
 
 from planificador.models.employee import Employee, EmployeeStatus
+from planificador.repositories.search.fuzzy_matcher import FuzzyMatch
+from planificador.schemas.response import EmployeeListResponse
 
 
 class IEmployeeQueryOperations(ABC):
@@ -241,6 +243,30 @@ class IEmployeeQueryOperations(ABC):
         """
         pass
 
+    @abstractmethod
+    async def list_employee_summaries(
+        self,
+        status: Optional[EmployeeStatus] = None,
+        department: Optional[str] = None,
+        is_available: Optional[bool] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[EmployeeListResponse]:
+        """
+        Obtiene el listado de empleados proyectando solo las columnas de la vista.
+        
+        Args:
+            status: Filtra por estado
+            department: Filtra por departamento
+            is_available: Filtra por disponibilidad
+            limit: Número máximo de registros
+            offset: Número de registros a omitir
+            
+        Returns:
+            Lista de EmployeeListResponse ordenada por nombre
+        """
+        pass
+
     @abstractmethod
     async def get_with_teams(self, employee_id: int) -> Optional[Employee]:
         """
@@ -281,6 +307,26 @@ class IEmployeeQueryOperations(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_similar_names(
+        self,
+        full_name: str,
+        exclude_id: Optional[int] = None,
+        threshold: float = 0.6,
+    ) -> List[FuzzyMatch]:
+        """
+        Busca empleados con nombre completo parecido (posibles duplicados).
+        
+        Args:
+            full_name: Nombre completo a comparar
+            exclude_id: ID a excluir de la búsqueda (para actualizaciones)
+            threshold: Similitud mínima (0-1)
+            
+        Returns:
+            Posibles duplicados ordenados por similitud descendente
+        """
+        pass
+
     @abstractmethod
     async def employee_code_exists(self, employee_code: str, exclude_id: Optional[int] = None) -> bool:
         """
@@ -14,6 +14,10 @@ from ....exceptions.repository import (
 )
 from .validation_operations import ValidationOperations as EmployeeValidator
 from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.search.search_index import (
+    remove_from_search_index,
+    sync_search_index,
+)
 
 
 class CrudOperations(BaseRepository[Employee], IEmployeeCrudOperations):
@@ -60,6 +64,7 @@ class CrudOperations(BaseRepository[Employee], IEmployeeCrudOperations):
             
             # Crear empleado usando el método heredado de BaseRepository
             employee = await self.create(employee_data)
+            await sync_search_index(self.session, employee)
             self.logger.info(f"Empleado creado exitosamente: {employee.full_name} (ID: {employee.id})")
             return employee
             
@@ -111,6 +116,7 @@ class CrudOperations(BaseRepository[Employee], IEmployeeCrudOperations):
             # Actualizar empleado usando el método heredado de BaseRepository
             employee = await self.update(employee_id, update_data)
             if employee:
+                await sync_search_index(self.session, employee)
                 self.logger.info(f"Empleado actualizado exitosamente: {employee.full_name} (ID: {employee.id})")
             return employee
             
@@ -160,6 +166,7 @@ class CrudOperations(BaseRepository[Employee], IEmployeeCrudOperations):
             # Usar el método heredado de BaseRepository
             result = await self.delete(employee_id)
             if result:
+                await remove_from_search_index(self.session, Employee, employee_id)
                 self.logger.info(f"Empleado eliminado exitosamente (ID: {employee_id})")
             return result
             
@@ -2,9 +2,19 @@ from typing import List, Optional, Dict, Any
 from datetime import date
 
 from loguru import logger
+from sqlalchemy import or_, select
+from sqlalchemy.exc import SQLAlchemyError
 
 from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.projections import EMPLOYEE_SUMMARY
+from planificador.repositories.search.fuzzy_matcher import FuzzyMatch, fuzzy_matcher
+from planificador.repositories.search.search_index import SearchIndex
 from planificador.models.employee import Employee, EmployeeStatus
+from planificador.schemas.response import EmployeeListResponse
+from planificador.exceptions.repository import (
+    convert_sqlalchemy_error,
+    EmployeeRepositoryError,
+)
 from ..interfaces.query_interface import IEmployeeQueryOperations
 
 
@@ -162,6 +172,10 @@ class QueryOperations(BaseRepository[Employee], IEmployeeQueryOperations):
         """
         Busca empleados cuyo nombre contenga el término de búsqueda.
         
+        Si no hay coincidencias exactas se recurre al índice de trigramas
+        (``fuzzy_matcher``), de modo que un error tipográfico ("Munos")
+        sigue encontrando al empleado.
+        
         Args:
             name: Término a buscar en el nombre
             **kwargs: Parámetros adicionales de filtrado
@@ -175,19 +189,38 @@ class QueryOperations(BaseRepository[Employee], IEmployeeQueryOperations):
                 self._logger.debug("Término de búsqueda vacío, retornando lista vacía")
                 return []
             
-            query = select(Employee).where(
-                or_(
-                    Employee.full_name.ilike(f"%{name}%"),
-                    Employee.first_name.ilike(f"%{name}%"),
-                    Employee.last_name.ilike(f"%{name}%")
+            search_index = SearchIndex(self.session)
+            if await search_index.is_available():
+                employee_ids = await search_index.search_ids(
+                    name, "employee", limit=kwargs.get("limit", 1000), title_only=True
                 )
-            ).order_by(Employee.full_name)
-            
-            result = await self.session.execute(query)
-            employees = result.scalars().all()
-            
-            self._logger.debug(f"Encontrados {len(employees)} empleados con término: {name}")
-            return list(employees)
+                if employee_ids:
+                    return await self._employees_in_order(employee_ids)
+            else:
+                query = select(Employee).where(
+                    or_(
+                        Employee.full_name.ilike(f"%{name}%"),
+                        Employee.first_name.ilike(f"%{name}%"),
+                        Employee.last_name.ilike(f"%{name}%")
+                    )
+                ).order_by(Employee.full_name)
+                
+                result = await self.session.execute(query)
+                employees = result.scalars().all()
+                if employees:
+                    self._logger.debug(f"Encontrados {len(employees)} empleados con término: {name}")
+                    return list(employees)
+            
+            matches = await fuzzy_matcher.find_similar(
+                self.session,
+                "employee",
+                name.strip(),
+                threshold=kwargs.get("similarity_threshold", 0.4),
+                limit=kwargs.get("limit", 50),
+                word_match=True,
+            )
+            self._logger.debug(f"Búsqueda difusa de '{name}': {len(matches)} candidatos")
+            return await self._employees_in_order([match.entity_id for match in matches])
             
         except SQLAlchemyError as e:
             self._logger.error(f"Error de base de datos buscando empleados con término '{name}': {e}")
@@ -204,6 +237,16 @@ class QueryOperations(BaseRepository[Employee], IEmployeeQueryOperations):
                 entity_type=self.model_class.__name__,
             )
     
+    async def _employees_in_order(self, employee_ids: List[int]) -> List[Employee]:
+        """Carga empleados por ID conservando el orden de ``employee_ids``."""
+        if not employee_ids:
+            return []
+        result = await self.session.execute(
+            select(Employee).where(Employee.id.in_(employee_ids))
+        )
+        employees = {employee.id: employee for employee in result.scalars().all()}
+        return [employees[eid] for eid in employee_ids if eid in employees]
+    
     async def get_by_email(self, email: str) -> Optional[Employee]:
         """
         Busca un empleado por su email (insensible a mayúsculas/minúsculas).
@@ -575,6 +618,56 @@ class QueryOperations(BaseRepository[Employee], IEmployeeQueryOperations):
                 entity_type=self.model_class.__name__,
             )
     
+    async def list_employee_summaries(
+        self,
+        status: Optional[EmployeeStatus] = None,
+        department: Optional[str] = None,
+        is_available: Optional[bool] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[EmployeeListResponse]:
+        """
+        Obtiene el listado de empleados proyectando solo las columnas de la vista.
+        
+        No carga entidades ni las columnas pesadas (habilidades,
+        certificaciones, notas).
+        
+        Args:
+            status: Filtra por estado
+            department: Filtra por departamento
+            is_available: Filtra por disponibilidad
+            limit: Número máximo de registros
+            offset: Número de registros a omitir
+            
+        Returns:
+            Lista de EmployeeListResponse ordenada por nombre
+        """
+        conditions = []
+        if status is not None:
+            conditions.append(self.model_class.status == status)
+        if department is not None:
+            conditions.append(self.model_class.department == department)
+        if is_available is not None:
+            conditions.append(self.model_class.is_available == is_available)
+        try:
+            return await EMPLOYEE_SUMMARY.fetch(
+                self.session, *conditions, limit=limit, offset=offset
+            )
+        except SQLAlchemyError as e:
+            self._logger.error(f"Error de base de datos listando resúmenes de empleados: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="list_employee_summaries",
+                entity_type=self.model_class.__name__,
+            )
+        except Exception as e:
+            self._logger.error(f"Error inesperado listando resúmenes de empleados: {e}")
+            raise EmployeeRepositoryError(
+                message="Error inesperado al listar resúmenes de empleados",
+                operation="list_employee_summaries",
+                entity_type=self.model_class.__name__,
+            )
+    
     async def get_with_teams(self, employee_id: int) -> Optional[Employee]:
         """
         Obtiene un empleado con sus equipos cargados.
@@ -682,6 +775,46 @@ class QueryOperations(BaseRepository[Employee], IEmployeeQueryOperations):
                 entity_type=self.model_class.__name__,
             )
     
+    async def find_similar_names(
+        self,
+        full_name: str,
+        exclude_id: Optional[int] = None,
+        threshold: float = 0.6,
+    ) -> List[FuzzyMatch]:
+        """
+        Busca empleados con nombre completo parecido (posibles duplicados).
+        
+        Complementa a ``full_name_exists``, que solo detecta nombres
+        idénticos: "Jose Munoz" o "José Muñós" se señalan frente a
+        "José Muñoz".
+        
+        Args:
+            full_name: Nombre completo a comparar
+            exclude_id: ID a excluir de la verificación
+            threshold: Similitud mínima (0-1)
+            
+        Returns:
+            Posibles duplicados ordenados por similitud descendente
+        """
+        if not full_name or not full_name.strip():
+            return []
+        
+        matches = await fuzzy_matcher.find_similar(
+            self.session,
+            "employee",
+            full_name.strip(),
+            threshold=threshold,
+            limit=10,
+            exclude_id=exclude_id,
+        )
+        if matches:
+            self._logger.warning(
+                "Posibles empleados duplicados para '{}': {}",
+                full_name,
+                [(m.text, m.score) for m in matches],
+            )
+        return matches
+    
     async def employee_code_exists(self, employee_code: str, exclude_id: Optional[int] = None) -> bool:
         """
         Verifica si ya existe un empleado con el código especificado.
@@ -19,6 +19,7 @@ from planificador.utils.date_utils import get_current_time
 from planificador.models.project import Project
 from planificador.models.team import Team
 from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.dashboard_composer import DashboardComposer
 from planificador.exceptions.repository.employee_repository_exceptions import (
     create_employee_statistics_error,
     create_employee_validation_repository_error
@@ -709,29 +710,93 @@ class StatisticsOperations(BaseRepository, IEmployeeStatisticsOperations):
     # RESUMEN COMPLETO
     # ============================================================================
     
-    async def get_comprehensive_summary(self) -> Dict[str, Any]:
+    async def get_comprehensive_summary(
+        self,
+        max_concurrency: int = 4,
+        widget_timeout: float = 5.0
+    ) -> Dict[str, Any]:
         """Obtiene un resumen completo de estadísticas de empleados.
         
+        Cada sección se calcula en su propia sesión y de forma concurrente,
+        por lo que la latencia es la de la sección más lenta. Si una sección
+        falla o supera el timeout se devuelve su valor por defecto (con la
+        misma forma que el resultado real, con conteos a cero) y se lista en
+        ``incomplete_sections``.
+        
+        Args:
+            max_concurrency: Número máximo de secciones calculadas a la vez
+            widget_timeout: Timeout por sección en segundos
+        
         Returns:
             Diccionario con resumen completo
         """
         try:
-            summary = {
-                'status_distribution': await self.get_employee_count_by_status(),
-                'department_distribution': await self.get_employee_count_by_department(),
-                'position_distribution': await self.get_employee_count_by_position(),
-                'salary_statistics': await self.get_salary_statistics(),
-                'team_participation': await self.get_team_participation_stats(),
-                'project_participation': await self.get_project_participation_stats(),
-                'vacation_statistics': await self.get_vacation_statistics(),
-                'top_skills': await self.get_skills_distribution(10),
-                'hire_trends': await self.get_hire_date_distribution()
+            # Sección -> (cálculo, valor por defecto con la forma del resultado)
+            sections = {
+                'status_distribution': (
+                    lambda ops: ops.get_employee_count_by_status(), {}
+                ),
+                'department_distribution': (
+                    lambda ops: ops.get_employee_count_by_department(), {}
+                ),
+                'position_distribution': (
+                    lambda ops: ops.get_employee_count_by_position(), {}
+                ),
+                'salary_statistics': (
+                    lambda ops: ops.get_salary_statistics(),
+                    {'count': 0, 'average': 0.0, 'minimum': 0.0, 'maximum': 0.0, 'total': 0.0}
+                ),
+                'team_participation': (
+                    lambda ops: ops.get_team_participation_stats(),
+                    {'distribution': {}, 'total_employees_with_teams': 0, 'employees_without_teams': 0}
+                ),
+                'project_participation': (
+                    lambda ops: ops.get_project_participation_stats(),
+                    {'distribution': {}, 'total_employees_with_projects': 0, 'employees_without_projects': 0}
+                ),
+                'vacation_statistics': (
+                    lambda ops: ops.get_vacation_statistics(),
+                    {
+                        'year': get_current_time().year,
+                        'total_requests': 0,
+                        'approved_requests': 0,
+                        'pending_requests': 0,
+                        'rejected_requests': 0,
+                        'approval_rate': 0.0,
+                        'rejection_rate': 0.0
+                    }
+                ),
+                'top_skills': (
+                    lambda ops: ops.get_skills_distribution(10), {}
+                ),
+                'hire_trends': (
+                    lambda ops: ops.get_hire_date_distribution(), {}
+                )
             }
             
+            composer = DashboardComposer.from_session(
+                self.session,
+                max_concurrency=max_concurrency,
+                default_timeout=widget_timeout
+            )
+            for name, (section, default) in sections.items():
+                composer.add_widget(
+                    name,
+                    lambda session, section=section: section(type(self)(session)),
+                    default=default
+                )
+            dashboard = await composer.compose()
+            
+            summary = dashboard.values
+            if dashboard.partial:
+                summary['incomplete_sections'] = dashboard.failed
+            
             # Agregar timestamp
             summary['generated_at'] = get_current_time().isoformat()
             
-            self._logger.debug("Resumen completo de estadísticas generado")
+            self._logger.debug(
+                "Resumen completo de estadísticas generado en {:.1f} ms", dashboard.elapsed_ms
+            )
             return summary
             
         except SQLAlchemyError as e:
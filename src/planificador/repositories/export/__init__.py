@@ -0,0 +1,26 @@
+"""
+Exportación de datos de planificación.
+
+Este paquete exporta horarios, cargas de trabajo y vacaciones a CSV o
+Parquet leyendo las filas con cursores del servidor, de modo que un año de
+datos se exporta sin cargarlo completo en memoria, y genera los feeds
+iCalendar de los horarios de empleados y equipos.
+
+Uso:
+    from planificador.repositories.export import StreamingExporter
+
+    result = await StreamingExporter(session).export("vacations", "exports/")
+"""
+
+__all__ = [
+    "StreamingExporter",
+    "ExportResult",
+    "EXPORT_FORMATS",
+    "ICalFeedGenerator",
+    "ICalFeed",
+    "FeedCache",
+    "FeedRefreshReport",
+]
+
+from .ical_feed import FeedCache, FeedRefreshReport, ICalFeed, ICalFeedGenerator
+from .streaming_exporter import EXPORT_FORMATS, ExportResult, StreamingExporter
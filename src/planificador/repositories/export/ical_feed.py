@@ -0,0 +1,736 @@
+"""
+Feeds iCalendar (RFC 5545) de los horarios de empleados y equipos.
+
+Cada empleado (o equipo) tiene un feed ``.ics`` con sus horarios y sus
+vacaciones aprobadas, que los técnicos suscriben desde el calendario del
+teléfono. Los UID de los eventos son estables (``schedule-<id>@dominio``,
+``vacation-<id>@dominio``), de modo que un horario modificado actualiza el
+evento existente en lugar de duplicarlo.
+
+El ETag de cada feed se deriva de su estado en la base de datos (último
+``updated_at`` y número de filas), obtenido para todos los empleados con una
+sola consulta agregada. Un feed cuyo estado no ha cambiado se sirve desde
+``FeedCache`` sin volver a generarse, y ``refresh`` regenera solo los feeds
+de los empleados con cambios desde la última ejecución.
+
+Uso:
+    ```python
+    generator = ICalFeedGenerator(session, FeedCache("feeds/"))
+    feed = await generator.employee_feed(employee_id)
+    if feed.is_not_modified(request_etag):
+        ...  # 304 Not Modified
+    report = await generator.refresh()
+    ```
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from loguru import logger
+from sqlalchemy import func, select, union_all
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from planificador.exceptions import convert_sqlalchemy_error
+from planificador.exceptions.infrastructure import create_file_system_error
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.models.schedule import Schedule
+from planificador.models.status_code import StatusCode
+from planificador.models.team_membership import TeamMembership
+from planificador.models.vacation import Vacation, VacationStatus
+
+
+PRODID = "-//Planificador//Planning//ES"
+
+# Empleados por consulta IN al generar feeds en bloque
+_CHUNK_SIZE = 500
+
+_VACATION_LABELS = {
+    "annual": "Vacaciones",
+    "sick": "Baja médica",
+    "personal": "Asuntos propios",
+    "maternity": "Permiso de maternidad",
+    "paternity": "Permiso de paternidad",
+    "training": "Formación",
+    "other": "Ausencia",
+}
+
+
+def _escape(text: Any) -> str:
+    """Escapa un valor TEXT según RFC 5545 (sección 3.3.11)."""
+    return (
+        str(text)
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Pliega una línea de contenido a 75 octetos (RFC 5545, sección 3.1)."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # No partir caracteres multibyte: retroceder hasta un inicio de carácter
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+        limit = 74  # el espacio inicial de la continuación cuenta
+    return "\r\n ".join(parts)
+
+
+def _utc(value: datetime) -> datetime:
+    """Normaliza un ``datetime`` a UTC (los naive se consideran UTC)."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _format_utc(value: datetime) -> str:
+    return _utc(value).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _format_date(value: date) -> str:
+    return value.strftime("%Y%m%d")
+
+
+def _format_local(day: date, moment: dt_time) -> str:
+    return datetime.combine(day, moment).strftime("%Y%m%dT%H%M%S")
+
+
+@dataclass(frozen=True)
+class _FeedState:
+    """Estado de un feed en la base de datos."""
+    last_modified: Optional[datetime]
+    rows: int
+
+    def etag(self, key: str, extra: str = "") -> str:
+        stamp = self.last_modified.isoformat() if self.last_modified else "-"
+        digest = hashlib.sha1(f"{key}|{stamp}|{self.rows}|{extra}".encode()).hexdigest()
+        return f'"{digest[:20]}"'
+
+
+@dataclass
+class ICalFeed:
+    """
+    Feed iCalendar generado.
+
+    Attributes:
+        key: Identificador del feed ("employee-<id>" o "team-<id>").
+        content: Documento ``text/calendar`` con saltos de línea CRLF.
+        etag: ETag HTTP (entre comillas) del estado del feed.
+        last_modified: Último ``updated_at`` de las filas del feed.
+        events: Número de eventos del feed.
+    """
+    key: str
+    content: str
+    etag: str
+    last_modified: Optional[datetime] = None
+    events: int = 0
+
+    @property
+    def http_headers(self) -> Dict[str, str]:
+        """Cabeceras HTTP para servir el feed."""
+        headers = {
+            "Content-Type": "text/calendar; charset=utf-8",
+            "ETag": self.etag,
+        }
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(_utc(self.last_modified), usegmt=True)
+        return headers
+
+    def is_not_modified(
+        self,
+        if_none_match: Optional[str] = None,
+        if_modified_since: Optional[str] = None,
+    ) -> bool:
+        """
+        Indica si una petición condicional puede responderse con 304.
+
+        ``If-None-Match`` tiene prioridad sobre ``If-Modified-Since``
+        (RFC 9110, sección 13.2.2).
+
+        Args:
+            if_none_match: Cabecera ``If-None-Match`` de la petición.
+            if_modified_since: Cabecera ``If-Modified-Since`` de la petición.
+
+        Returns:
+            True si el cliente ya tiene la versión actual del feed.
+        """
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or self.etag in tags or f"W/{self.etag}" in tags
+        if if_modified_since is not None and self.last_modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            return _utc(self.last_modified).replace(microsecond=0) <= _utc(since)
+        return False
+
+
+@dataclass
+class FeedRefreshReport:
+    """
+    Resultado de una regeneración incremental de feeds.
+
+    Attributes:
+        regenerated: Empleados cuyo feed se ha regenerado.
+        unchanged: Feeds servidos desde la caché sin regenerar.
+        elapsed_seconds: Duración de la regeneración.
+    """
+    regenerated: List[int] = field(default_factory=list)
+    unchanged: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class FeedCache:
+    """
+    Caché de feeds generados, en memoria y opcionalmente en disco.
+
+    Con ``directory`` cada feed se guarda como ``<clave>.ics`` y los ETag se
+    indexan en ``feeds.json``, de modo que la regeneración nocturna conserva
+    el estado entre ejecuciones y un servidor estático puede servir los
+    ficheros directamente.
+    """
+
+    INDEX_FILE = "feeds.json"
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None):
+        """
+        Inicializa la caché.
+
+        Args:
+            directory: Directorio de persistencia; None para caché solo en memoria.
+
+        Raises:
+            FileSystemError: Si el índice existente no se puede leer.
+        """
+        self.directory = Path(directory) if directory is not None else None
+        self._feeds: Dict[str, ICalFeed] = {}
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        if self.directory is not None:
+            self._load_index()
+
+    def _load_index(self) -> None:
+        path = self.directory / self.INDEX_FILE
+        if not path.exists():
+            return
+        try:
+            self._index = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            raise create_file_system_error(
+                message=f"No se pudo leer el índice de feeds: {e}",
+                file_path=str(path),
+                operation="read",
+            )
+
+    def keys(self) -> List[str]:
+        """Claves de los feeds almacenados."""
+        return sorted(set(self._feeds) | set(self._index))
+
+    def etag(self, key: str) -> Optional[str]:
+        """ETag almacenado de un feed, sin cargar su contenido."""
+        feed = self._feeds.get(key)
+        if feed is not None:
+            return feed.etag
+        entry = self._index.get(key)
+        return entry["etag"] if entry else None
+
+    def get(self, key: str) -> Optional[ICalFeed]:
+        """
+        Feed almacenado, leyéndolo del disco si no está en memoria.
+
+        Raises:
+            FileSystemError: Si el fichero del feed no se puede leer.
+        """
+        feed = self._feeds.get(key)
+        if feed is not None or key not in self._index:
+            return feed
+        entry = self._index[key]
+        path = self.directory / f"{key}.ics"
+        try:
+            content = path.read_bytes().decode("utf-8")
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            raise create_file_system_error(
+                message=f"No se pudo leer el feed {key}: {e}",
+                file_path=str(path),
+                operation="read",
+            )
+        last_modified = entry.get("last_modified")
+        feed = ICalFeed(
+            key=key,
+            content=content,
+            etag=entry["etag"],
+            last_modified=datetime.fromisoformat(last_modified) if last_modified else None,
+            events=entry.get("events", 0),
+        )
+        self._feeds[key] = feed
+        return feed
+
+    def put(self, feed: ICalFeed) -> None:
+        """
+        Almacena un feed (y su fichero ``.ics`` si la caché persiste en disco).
+
+        El índice se escribe con ``flush``.
+
+        Raises:
+            FileSystemError: Si el fichero no se puede escribir.
+        """
+        self._feeds[feed.key] = feed
+        if self.directory is None:
+            return
+        path = self.directory / f"{feed.key}.ics"
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(feed.content.encode("utf-8"))
+        except OSError as e:
+            raise create_file_system_error(
+                message=f"No se pudo escribir el feed {feed.key}: {e}",
+                file_path=str(path),
+                operation="write",
+            )
+        self._index[feed.key] = {
+            "etag": feed.etag,
+            "last_modified": feed.last_modified.isoformat() if feed.last_modified else None,
+            "events": feed.events,
+        }
+        self._dirty = True
+
+    def flush(self) -> None:
+        """
+        Escribe el índice de ETags si ha cambiado.
+
+        Raises:
+            FileSystemError: Si el índice no se puede escribir.
+        """
+        if self.directory is None or not self._dirty:
+            return
+        path = self.directory / self.INDEX_FILE
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps(self._index, sort_keys=True), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError as e:
+            raise create_file_system_error(
+                message=f"No se pudo escribir el índice de feeds: {e}",
+                file_path=str(path),
+                operation="write",
+            )
+        self._dirty = False
+
+
+class ICalFeedGenerator:
+    """
+    Generador de feeds iCalendar de horarios y vacaciones aprobadas.
+
+    Attributes:
+        session: Sesión asíncrona.
+        cache: Caché de feeds generados.
+        domain: Dominio de los UID de los eventos.
+        start_date: Primer día incluido en los feeds (None para sin límite).
+        end_date: Último día incluido en los feeds (None para sin límite).
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache: Optional[FeedCache] = None,
+        domain: str = "planificador",
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ):
+        """
+        Inicializa el generador.
+
+        Args:
+            session: Sesión asíncrona.
+            cache: Caché de feeds; por defecto una caché en memoria.
+            domain: Dominio de los UID de los eventos.
+            start_date: Primer día incluido en los feeds.
+            end_date: Último día incluido en los feeds.
+        """
+        self.session = session
+        self.cache = cache if cache is not None else FeedCache()
+        self.domain = domain
+        self.start_date = start_date
+        self.end_date = end_date
+        self._logger = logger.bind(component="ICalFeedGenerator")
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def _schedule_conditions(self, employee_ids: Optional[Sequence[int]]) -> List[Any]:
+        conditions = []
+        if self.start_date is not None:
+            conditions.append(Schedule.date >= self.start_date)
+        if self.end_date is not None:
+            conditions.append(Schedule.date <= self.end_date)
+        if employee_ids is not None:
+            conditions.append(Schedule.employee_id.in_(list(employee_ids)))
+        return conditions
+
+    def _vacation_conditions(self, employee_ids: Optional[Sequence[int]]) -> List[Any]:
+        conditions = [Vacation.status == VacationStatus.APPROVED]
+        if self.start_date is not None:
+            conditions.append(Vacation.end_date >= self.start_date)
+        if self.end_date is not None:
+            conditions.append(Vacation.start_date <= self.end_date)
+        if employee_ids is not None:
+            conditions.append(Vacation.employee_id.in_(list(employee_ids)))
+        return conditions
+
+    @staticmethod
+    def _key(employee_id: int) -> str:
+        return f"employee-{employee_id}"
+
+    @property
+    def _window(self) -> str:
+        return f"{self.start_date}:{self.end_date}"
+
+    async def _feed_states(
+        self, employee_ids: Optional[Sequence[int]] = None
+    ) -> Dict[int, _FeedState]:
+        """
+        Estado de los feeds de los empleados con una sola consulta agregada.
+
+        El número de filas forma parte del estado para que un horario
+        eliminado (o una vacación que deja de estar aprobada) cambie el ETag
+        aunque no haya ningún ``updated_at`` más reciente.
+        """
+        rows = union_all(
+            select(Schedule.employee_id.label("employee_id"),
+                   Schedule.updated_at.label("updated_at"))
+            .where(*self._schedule_conditions(employee_ids)),
+            select(Vacation.employee_id, Vacation.updated_at)
+            .where(*self._vacation_conditions(employee_ids)),
+        ).subquery()
+        stmt = (
+            select(rows.c.employee_id, func.max(rows.c.updated_at), func.count())
+            .group_by(rows.c.employee_id)
+        )
+        try:
+            result = await self.session.execute(stmt)
+        except SQLAlchemyError as e:
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="feed_states",
+                entity_type="Schedule",
+            )
+        return {
+            employee_id: _FeedState(last_modified, count)
+            for employee_id, last_modified, count in result.all()
+        }
+
+    async def _events_by_employee(
+        self, employee_ids: Sequence[int]
+    ) -> Dict[int, List[Tuple[str, Any]]]:
+        """Horarios y vacaciones aprobadas de varios empleados, agrupados por empleado."""
+        events: Dict[int, List[Tuple[str, Any]]] = {employee_id: [] for employee_id in employee_ids}
+        ids = list(employee_ids)
+        try:
+            for offset in range(0, len(ids), _CHUNK_SIZE):
+                chunk = ids[offset:offset + _CHUNK_SIZE]
+                schedules = await self.session.execute(
+                    select(
+                        Schedule.id,
+                        Schedule.employee_id,
+                        Schedule.date,
+                        Schedule.start_time,
+                        Schedule.end_time,
+                        Schedule.location,
+                        Schedule.description,
+                        Schedule.updated_at,
+                        Project.reference,
+                        Project.name,
+                        StatusCode.code,
+                        StatusCode.name,
+                    )
+                    .outerjoin(Project, Project.id == Schedule.project_id)
+                    .outerjoin(StatusCode, StatusCode.id == Schedule.status_code_id)
+                    .where(*self._schedule_conditions(chunk))
+                    .order_by(Schedule.employee_id, Schedule.date, Schedule.id)
+                )
+                for employee_id, rows in groupby(schedules.all(), key=lambda row: row[1]):
+                    events[employee_id].extend(("schedule", row) for row in rows)
+
+                vacations = await self.session.execute(
+                    select(
+                        Vacation.id,
+                        Vacation.employee_id,
+                        Vacation.start_date,
+                        Vacation.end_date,
+                        Vacation.vacation_type,
+                        Vacation.updated_at,
+                    )
+                    .where(*self._vacation_conditions(chunk))
+                    .order_by(Vacation.employee_id, Vacation.start_date, Vacation.id)
+                )
+                for employee_id, rows in groupby(vacations.all(), key=lambda row: row[1]):
+                    events[employee_id].extend(("vacation", row) for row in rows)
+        except SQLAlchemyError as e:
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="generate_feed",
+                entity_type="Schedule",
+            )
+        return events
+
+    # ------------------------------------------------------------------
+    # Formato RFC 5545
+    # ------------------------------------------------------------------
+
+    def _schedule_event(self, row: Any, prefix: str) -> List[str]:
+        (schedule_id, _, day, start_time, end_time, location, description,
+         updated_at, reference, project_name, code, code_name) = row
+        summary = " - ".join(part for part in (code, reference or project_name) if part)
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:schedule-{schedule_id}@{self.domain}",
+            f"DTSTAMP:{_format_utc(updated_at)}",
+            f"LAST-MODIFIED:{_format_utc(updated_at)}",
+        ]
+        if start_time is not None and end_time is not None:
+            end_day = day + timedelta(days=1) if end_time <= start_time else day
+            lines.append(f"DTSTART:{_format_local(day, start_time)}")
+            lines.append(f"DTEND:{_format_local(end_day, end_time)}")
+        else:
+            lines.append(f"DTSTART;VALUE=DATE:{_format_date(day)}")
+            lines.append(f"DTEND;VALUE=DATE:{_format_date(day + timedelta(days=1))}")
+        lines.append(f"SUMMARY:{_escape(prefix + (summary or 'Planificado'))}")
+        if location:
+            lines.append(f"LOCATION:{_escape(location)}")
+        details = [
+            text for text in (project_name if reference else None, code_name, description) if text
+        ]
+        if details:
+            lines.append(f"DESCRIPTION:{_escape(chr(10).join(details))}")
+        lines.append("END:VEVENT")
+        return lines
+
+    def _vacation_event(self, row: Any, prefix: str) -> List[str]:
+        vacation_id, _, start_date, end_date, vacation_type, updated_at = row
+        label = _VACATION_LABELS.get(getattr(vacation_type, "value", vacation_type), "Ausencia")
+        return [
+            "BEGIN:VEVENT",
+            f"UID:vacation-{vacation_id}@{self.domain}",
+            f"DTSTAMP:{_format_utc(updated_at)}",
+            f"LAST-MODIFIED:{_format_utc(updated_at)}",
+            f"DTSTART;VALUE=DATE:{_format_date(start_date)}",
+            f"DTEND;VALUE=DATE:{_format_date(end_date + timedelta(days=1))}",
+            f"SUMMARY:{_escape(prefix + label)}",
+            "TRANSP:TRANSPARENT",
+            "END:VEVENT",
+        ]
+
+    def _render(
+        self,
+        key: str,
+        name: str,
+        events: Iterable[Tuple[str, Any, str]],
+        etag: str,
+        last_modified: Optional[datetime],
+    ) -> ICalFeed:
+        """Construye el documento ``VCALENDAR`` de un feed."""
+        lines = [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{PRODID}",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            f"X-WR-CALNAME:{_escape(name)}",
+        ]
+        count = 0
+        for kind, row, prefix in events:
+            if kind == "schedule":
+                lines.extend(self._schedule_event(row, prefix))
+            else:
+                lines.extend(self._vacation_event(row, prefix))
+            count += 1
+        lines.append("END:VCALENDAR")
+        content = "\r\n".join(_fold(line) for line in lines) + "\r\n"
+        return ICalFeed(
+            key=key, content=content, etag=etag, last_modified=last_modified, events=count
+        )
+
+    async def _employee_names(self, employee_ids: Sequence[int]) -> Dict[int, str]:
+        try:
+            result = await self.session.execute(
+                select(Employee.id, Employee.full_name).where(Employee.id.in_(list(employee_ids)))
+            )
+        except SQLAlchemyError as e:
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="generate_feed",
+                entity_type="Employee",
+            )
+        return dict(result.all())
+
+    async def _generate(self, employee_ids: Sequence[int], states: Dict[int, _FeedState]) -> None:
+        """Genera y almacena los feeds de varios empleados."""
+        names = await self._employee_names(employee_ids)
+        events = await self._events_by_employee(employee_ids)
+        for employee_id in employee_ids:
+            key = self._key(employee_id)
+            state = states.get(employee_id, _FeedState(None, 0))
+            self.cache.put(self._render(
+                key,
+                names.get(employee_id, key),
+                ((kind, row, "") for kind, row in events[employee_id]),
+                state.etag(key, self._window),
+                state.last_modified,
+            ))
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    async def employee_feed(self, employee_id: int) -> ICalFeed:
+        """
+        Feed de un empleado, regenerado solo si su estado ha cambiado.
+
+        Args:
+            employee_id: ID del empleado.
+
+        Returns:
+            ICalFeed con el documento y su ETag.
+
+        Raises:
+            RepositoryError: Si falla la consulta.
+            FileSystemError: Si la caché no puede leer o escribir el feed.
+        """
+        key = self._key(employee_id)
+        states = await self._feed_states([employee_id])
+        state = states.get(employee_id, _FeedState(None, 0))
+        if self.cache.etag(key) == state.etag(key, self._window):
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        await self._generate([employee_id], states)
+        self.cache.flush()
+        return self.cache.get(key)
+
+    async def team_feed(self, team_id: int) -> ICalFeed:
+        """
+        Feed combinado de los miembros activos de un equipo.
+
+        Los eventos llevan el nombre del empleado como prefijo. El ETag
+        incluye la lista de miembros, de modo que un alta o baja en el
+        equipo también invalida el feed.
+
+        Args:
+            team_id: ID del equipo.
+
+        Returns:
+            ICalFeed del equipo.
+
+        Raises:
+            RepositoryError: Si falla la consulta.
+            FileSystemError: Si la caché no puede leer o escribir el feed.
+        """
+        key = f"team-{team_id}"
+        try:
+            result = await self.session.execute(
+                select(TeamMembership.employee_id)
+                .where(TeamMembership.team_id == team_id, TeamMembership.is_active.is_(True))
+                .distinct()
+                .order_by(TeamMembership.employee_id)
+            )
+        except SQLAlchemyError as e:
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="team_feed",
+                entity_type="TeamMembership",
+            )
+        member_ids = list(result.scalars().all())
+
+        states = await self._feed_states(member_ids) if member_ids else {}
+        stamps = [state.last_modified for state in states.values() if state.last_modified]
+        state = _FeedState(max(stamps) if stamps else None,
+                           sum(state.rows for state in states.values()))
+        etag = state.etag(key, f"{self._window}|{member_ids}")
+        if self.cache.etag(key) == etag:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        names = await self._employee_names(member_ids) if member_ids else {}
+        events = await self._events_by_employee(member_ids) if member_ids else {}
+        merged = sorted(
+            (
+                (kind, row, f"{names.get(employee_id, '')}: ")
+                for employee_id in member_ids
+                for kind, row in events[employee_id]
+            ),
+            key=lambda event: (event[1][2], event[0], event[1][0]),
+        )
+        self.cache.put(self._render(key, f"Equipo {team_id}", merged, etag, state.last_modified))
+        self.cache.flush()
+        return self.cache.get(key)
+
+    async def refresh(self, employee_ids: Optional[Sequence[int]] = None) -> FeedRefreshReport:
+        """
+        Regenera solo los feeds de empleados cuyo estado ha cambiado.
+
+        Se consideran los empleados con filas en la ventana y los que ya
+        tienen un feed en la caché (para vaciar el feed de quien ya no tiene
+        eventos). Pensado para la ejecución nocturna.
+
+        Args:
+            employee_ids: Limita la regeneración a estos empleados.
+
+        Returns:
+            FeedRefreshReport con los empleados regenerados.
+
+        Raises:
+            RepositoryError: Si falla la consulta.
+            FileSystemError: Si la caché no puede escribir los feeds.
+        """
+        start = time.perf_counter()
+        states = await self._feed_states(employee_ids)
+        candidates = set(states)
+        for key in self.cache.keys():
+            if key.startswith("employee-"):
+                candidates.add(int(key.split("-", 1)[1]))
+        if employee_ids is not None:
+            candidates &= set(employee_ids)
+
+        report = FeedRefreshReport()
+        changed = []
+        for employee_id in sorted(candidates):
+            key = self._key(employee_id)
+            state = states.get(employee_id, _FeedState(None, 0))
+            if self.cache.etag(key) == state.etag(key, self._window):
+                report.unchanged += 1
+            else:
+                changed.append(employee_id)
+
+        if changed:
+            await self._generate(changed, states)
+            self.cache.flush()
+        report.regenerated = changed
+        report.elapsed_seconds = time.perf_counter() - start
+        self._logger.info(
+            f"Feeds iCalendar: {len(changed)} regenerados, {report.unchanged} sin cambios "
+            f"en {report.elapsed_seconds:.2f}s"
+        )
+        return report
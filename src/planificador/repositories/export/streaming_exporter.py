@@ -0,0 +1,448 @@
+"""
+Exportación en streaming de horarios, cargas de trabajo y vacaciones.
+
+Las filas se leen con un cursor del servidor (``session.stream`` con
+``yield_per``) y se escriben por lotes a medida que llegan, por lo que la
+memoria usada depende del tamaño del lote y no del número de filas. La salida
+puede ser CSV (opcionalmente comprimido con gzip) o Parquet si ``pyarrow``
+está instalado (extra ``parquet``), y puede dividirse en un fichero por mes.
+La escritura y compresión de cada lote se hace en un hilo aparte
+(``asyncio.to_thread``) para no bloquear el bucle de eventos.
+
+Uso:
+    ```python
+    exporter = StreamingExporter(session)
+    result = await exporter.export(
+        "schedules", "exports/", start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31), compress=True, split_by_month=True,
+    )
+    result.files, result.rows
+    ```
+"""
+
+import asyncio
+import csv
+import gzip
+import io
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
+
+from loguru import logger
+from sqlalchemy import and_, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from planificador.exceptions import ValidationError, convert_sqlalchemy_error
+from planificador.exceptions.infrastructure import create_file_system_error
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.models.schedule import Schedule
+from planificador.models.status_code import StatusCode
+from planificador.models.vacation import Vacation
+from planificador.models.workload import Workload
+
+
+EXPORT_FORMATS = ("csv", "parquet")
+
+
+@dataclass(frozen=True)
+class _ExportSpec:
+    """Definición de una entidad exportable."""
+    model: Any
+    columns: Tuple[Tuple[str, Any], ...]
+    date_column: Any
+    end_date_column: Any
+    joins: Tuple[Tuple[Any, Any], ...]
+
+
+def _employee_columns(model: Any) -> Tuple[Tuple[str, Any], ...]:
+    """Columnas comunes del empleado asociado."""
+    return (
+        ("employee_id", model.employee_id),
+        ("employee_code", Employee.employee_code),
+        ("employee_name", Employee.full_name),
+    )
+
+
+_SPECS: Dict[str, _ExportSpec] = {
+    "schedules": _ExportSpec(
+        model=Schedule,
+        columns=(
+            ("id", Schedule.id),
+            ("date", Schedule.date),
+            *_employee_columns(Schedule),
+            ("project_reference", Project.reference),
+            ("status_code", StatusCode.code),
+            ("start_time", Schedule.start_time),
+            ("end_time", Schedule.end_time),
+            ("is_confirmed", Schedule.is_confirmed),
+            ("location", Schedule.location),
+        ),
+        date_column=Schedule.date,
+        end_date_column=Schedule.date,
+        joins=(
+            (Project, Schedule.project_id == Project.id),
+            (StatusCode, Schedule.status_code_id == StatusCode.id),
+        ),
+    ),
+    "workloads": _ExportSpec(
+        model=Workload,
+        columns=(
+            ("id", Workload.id),
+            ("date", Workload.date),
+            *_employee_columns(Workload),
+            ("project_reference", Project.reference),
+            ("planned_hours", Workload.planned_hours),
+            ("actual_hours", Workload.actual_hours),
+            ("utilization_percentage", Workload.utilization_percentage),
+            ("is_billable", Workload.is_billable),
+        ),
+        date_column=Workload.date,
+        end_date_column=Workload.date,
+        joins=((Project, Workload.project_id == Project.id),),
+    ),
+    "vacations": _ExportSpec(
+        model=Vacation,
+        columns=(
+            ("id", Vacation.id),
+            ("start_date", Vacation.start_date),
+            ("end_date", Vacation.end_date),
+            *_employee_columns(Vacation),
+            ("vacation_type", Vacation.vacation_type),
+            ("status", Vacation.status),
+            ("total_days", Vacation.total_days),
+            ("business_days", Vacation.business_days),
+            ("approved_date", Vacation.approved_date),
+        ),
+        date_column=Vacation.start_date,
+        end_date_column=Vacation.end_date,
+        joins=(),
+    ),
+}
+
+
+@dataclass
+class ExportResult:
+    """
+    Resultado de una exportación.
+
+    Attributes:
+        entity: Entidad exportada.
+        format: Formato de salida.
+        files: Ficheros escritos, en orden.
+        rows: Filas exportadas.
+        elapsed_seconds: Duración de la exportación.
+    """
+    entity: str
+    format: str
+    files: List[Path] = field(default_factory=list)
+    rows: int = 0
+    elapsed_seconds: float = 0.0
+
+
+def _plain_value(value: Any) -> Any:
+    """Convierte un valor de la base de datos a un tipo simple exportable."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _csv_value(value: Any) -> Any:
+    """Formatea un valor para CSV (fechas en ISO 8601, None como vacío)."""
+    value = _plain_value(value)
+    if value is None:
+        return ""
+    if isinstance(value, (date, datetime, dt_time)):
+        return value.isoformat()
+    return value
+
+
+def _arrow_type(pyarrow: Any, column: Any) -> Any:
+    """Tipo Arrow de una columna según su tipo SQL (texto si no se conoce)."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return pyarrow.string()
+    types = {
+        bool: pyarrow.bool_(),
+        int: pyarrow.int64(),
+        float: pyarrow.float64(),
+        Decimal: pyarrow.float64(),
+        date: pyarrow.date32(),
+        datetime: pyarrow.timestamp("us"),
+        dt_time: pyarrow.time64("us"),
+    }
+    return types.get(python_type, pyarrow.string())
+
+
+class _CsvSink:
+    """Escritor CSV incremental, opcionalmente comprimido."""
+
+    def __init__(self, path: Path, columns: Sequence[Tuple[str, Any]], compress: bool):
+        raw = gzip.open(path, "wb") if compress else open(path, "wb")
+        self._stream = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+        self._writer = csv.writer(self._stream)
+        self._writer.writerow([name for name, _ in columns])
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> None:
+        self._writer.writerows([_csv_value(v) for v in row] for row in rows)
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class _ParquetSink:
+    """
+    Escritor Parquet incremental: un row group por lote.
+
+    El esquema se deriva de los tipos SQL de las columnas y no del primer
+    lote, de modo que una columna vacía en ese lote no queda con tipo
+    ``null`` e incompatible con los siguientes.
+    """
+
+    def __init__(self, path: Path, columns: Sequence[Tuple[str, Any]], compress: bool):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ValidationError(
+                message="La exportación a Parquet requiere el paquete 'pyarrow'",
+                field="format",
+                value="parquet",
+            )
+        self._pa = pyarrow
+        self._schema = pyarrow.schema([
+            (name, _arrow_type(pyarrow, column)) for name, column in columns
+        ])
+        self._writer = pyarrow.parquet.ParquetWriter(
+            str(path), self._schema, compression="gzip" if compress else "snappy"
+        )
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> None:
+        columns = {
+            name: [_plain_value(row[i]) for row in rows]
+            for i, name in enumerate(self._schema.names)
+        }
+        self._writer.write_table(self._pa.table(columns, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class StreamingExporter:
+    """
+    Exportador en streaming de horarios, cargas de trabajo y vacaciones.
+
+    Attributes:
+        session: Sesión asíncrona.
+        batch_size: Filas leídas del cursor y escritas por lote.
+    """
+
+    def __init__(self, session: AsyncSession, batch_size: int = 1000):
+        """
+        Inicializa el exportador.
+
+        Args:
+            session: Sesión asíncrona.
+            batch_size: Filas por lote.
+        """
+        self.session = session
+        self.batch_size = batch_size
+        self._logger = logger.bind(component="StreamingExporter")
+
+    @staticmethod
+    def entities() -> List[str]:
+        """Entidades exportables."""
+        return list(_SPECS)
+
+    @staticmethod
+    def _spec(entity: str) -> _ExportSpec:
+        """Definición de una entidad exportable."""
+        spec = _SPECS.get(entity)
+        if spec is None:
+            raise ValidationError(
+                message=f"Entidad no exportable: {entity}",
+                field="entity",
+                value=entity,
+            )
+        return spec
+
+    def _statement(
+        self,
+        spec: _ExportSpec,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        employee_ids: Optional[Sequence[int]],
+    ):
+        """SELECT proyectado de una entidad, ordenado por fecha."""
+        stmt = select(*(column for _, column in spec.columns)).select_from(spec.model)
+        stmt = stmt.join(Employee, spec.model.employee_id == Employee.id)
+        for target, on_clause in spec.joins:
+            stmt = stmt.outerjoin(target, on_clause)
+
+        conditions = []
+        if start_date is not None:
+            conditions.append(spec.end_date_column >= start_date)
+        if end_date is not None:
+            conditions.append(spec.date_column <= end_date)
+        if employee_ids:
+            conditions.append(spec.model.employee_id.in_(list(employee_ids)))
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+        return stmt.order_by(spec.date_column, spec.model.employee_id, spec.model.id)
+
+    async def iter_batches(
+        self,
+        entity: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        employee_ids: Optional[Sequence[int]] = None,
+    ) -> AsyncIterator[List[Tuple[Any, ...]]]:
+        """
+        Recorre las filas de una entidad en lotes usando un cursor del servidor.
+
+        Args:
+            entity: "schedules", "workloads" o "vacations".
+            start_date: Fecha inicial (incluida).
+            end_date: Fecha final (incluida).
+            employee_ids: Limita la exportación a estos empleados.
+
+        Yields:
+            Listas de hasta ``batch_size`` tuplas, en el orden de ``headers``.
+
+        Raises:
+            ValidationError: Si la entidad no es exportable.
+            RepositoryError: Si falla la consulta.
+        """
+        spec = self._spec(entity)
+        stmt = self._statement(spec, start_date, end_date, employee_ids)
+        try:
+            result = await self.session.stream(
+                stmt.execution_options(yield_per=self.batch_size)
+            )
+            async for partition in result.partitions():
+                yield [tuple(row) for row in partition]
+        except SQLAlchemyError as e:
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="export",
+                entity_type=spec.model.__name__,
+            )
+
+    @staticmethod
+    def headers(entity: str) -> List[str]:
+        """Cabeceras de columna de una entidad."""
+        return [name for name, _ in StreamingExporter._spec(entity).columns]
+
+    async def export(
+        self,
+        entity: str,
+        destination: Union[str, Path],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        format: str = "csv",
+        compress: bool = False,
+        split_by_month: bool = False,
+        employee_ids: Optional[Sequence[int]] = None,
+    ) -> ExportResult:
+        """
+        Exporta una entidad a uno o varios ficheros.
+
+        Los ficheros se nombran ``<entidad>[_<AAAA-MM>].<formato>[.gz]``
+        dentro de ``destination``. Con ``split_by_month`` cada mes (según la
+        fecha de inicio de la fila) va a su propio fichero.
+
+        Args:
+            entity: "schedules", "workloads" o "vacations".
+            destination: Directorio de salida (se crea si no existe).
+            start_date: Fecha inicial (incluida).
+            end_date: Fecha final (incluida).
+            format: "csv" o "parquet".
+            compress: Comprime la salida (gzip para CSV, códec gzip en Parquet).
+            split_by_month: Escribe un fichero por mes.
+            employee_ids: Limita la exportación a estos empleados.
+
+        Returns:
+            ExportResult con los ficheros escritos y el número de filas.
+
+        Raises:
+            ValidationError: Si la entidad o el formato no son válidos, o si
+                se pide Parquet sin ``pyarrow`` instalado.
+            FileSystemError: Si no se puede escribir en el destino.
+            RepositoryError: Si falla la consulta.
+        """
+        if format not in EXPORT_FORMATS:
+            raise ValidationError(
+                message=f"Formato de exportación no soportado: {format}",
+                field="format",
+                value=format,
+            )
+        spec = self._spec(entity)
+        date_index = next(
+            i for i, (_, column) in enumerate(spec.columns) if column is spec.date_column
+        )
+        sink_class = _CsvSink if format == "csv" else _ParquetSink
+        suffix = f".{format}" + (".gz" if compress and format == "csv" else "")
+
+        directory = Path(destination)
+        result = ExportResult(entity=entity, format=format)
+        start = time.perf_counter()
+        sink = None
+        current_month: Optional[str] = None
+
+        async def open_sink(month: Optional[str]):
+            name = f"{entity}_{month}{suffix}" if month else f"{entity}{suffix}"
+            path = directory / name
+            result.files.append(path)
+            return await asyncio.to_thread(sink_class, path, spec.columns, compress)
+
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            if not split_by_month:
+                sink = await open_sink(None)
+
+            async for batch in self.iter_batches(entity, start_date, end_date, employee_ids):
+                if split_by_month:
+                    chunk: List[Tuple[Any, ...]] = []
+                    for row in batch:
+                        month = row[date_index].strftime("%Y-%m")
+                        if month != current_month:
+                            if chunk:
+                                await asyncio.to_thread(sink.write, chunk)
+                                chunk = []
+                            if sink is not None:
+                                await asyncio.to_thread(sink.close)
+                            sink = await open_sink(month)
+                            current_month = month
+                        chunk.append(row)
+                    if chunk:
+                        await asyncio.to_thread(sink.write, chunk)
+                else:
+                    await asyncio.to_thread(sink.write, batch)
+                result.rows += len(batch)
+        except OSError as e:
+            raise create_file_system_error(
+                message=f"No se pudo escribir la exportación de {entity}: {e}",
+                file_path=str(result.files[-1] if result.files else directory),
+                operation="export",
+            )
+        finally:
+            if sink is not None:
+                await asyncio.to_thread(sink.close)
+
+        result.elapsed_seconds = time.perf_counter() - start
+        self._logger.info(
+            "Exportación de {} completada: {} filas en {} ficheros ({:.2f}s)",
+            entity,
+            result.rows,
+            len(result.files),
+            result.elapsed_seconds,
+        )
+        return result
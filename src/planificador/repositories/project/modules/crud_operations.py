@@ -5,6 +5,10 @@ from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 
 from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.search.search_index import (
+    remove_from_search_index,
+    sync_search_index,
+)
 from planificador.models.project import Project
 from planificador.utils.date_utils import get_current_time
 from planificador.exceptions.base import NotFoundError, ValidationError
@@ -87,6 +91,7 @@ class CrudOperations(BaseRepository[Project]):
             self.session.add(new_project)
             await self.session.flush()
             await self.session.refresh(new_project)
+            await sync_search_index(self.session, new_project)
 
             self._logger.info(f"Proyecto creado: {new_project.reference}")
             return new_project
@@ -138,6 +143,7 @@ class CrudOperations(BaseRepository[Project]):
 
             await self.session.flush()
             await self.session.refresh(project)
+            await sync_search_index(self.session, project)
 
             self._logger.info(f"Proyecto actualizado: {project.reference}")
             return project
@@ -182,6 +188,7 @@ class CrudOperations(BaseRepository[Project]):
 
             await self.session.delete(project)
             await self.session.flush()
+            await remove_from_search_index(self.session, Project, project_id)
 
             self._logger.info(f"Proyecto eliminado: ID {project_id}")
             return True
@@ -0,0 +1,252 @@
+import re
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pendulum
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from planificador.repositories.base_repository import BaseRepository
+from planificador.models.project import Project, ProjectStatus
+from planificador.models.project_shutdown import ProjectShutdown
+from planificador.utils.business_calendar import BusinessCalendar, get_business_calendar
+from planificador.exceptions.repository.base_repository_exceptions import convert_sqlalchemy_error
+from planificador.exceptions.repository.project_repository_exceptions import ProjectRepositoryError
+
+
+# Estados que siguen abiertos (pueden estar atrasados)
+OPEN_STATUSES = (ProjectStatus.PLANNED, ProjectStatus.IN_PROGRESS, ProjectStatus.ON_HOLD)
+
+_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4}")
+_Window = Tuple[date, date]
+
+
+def _parse_date_token(token: str) -> Optional[date]:
+    try:
+        if "/" in token:
+            return datetime.strptime(token, "%d/%m/%Y").date()
+        return date.fromisoformat(token)
+    except ValueError:
+        return None
+
+
+def parse_shutdown_dates(text: Optional[str]) -> List[_Window]:
+    """
+    Interpreta el texto libre heredado de ``Project.shutdown_dates``.
+
+    Cada entrada (separada por ``;``, ``,`` o salto de línea) con una fecha
+    es una parada de un día y con dos fechas un rango. Se aceptan fechas
+    ``YYYY-MM-DD`` y ``DD/MM/YYYY``; lo demás se ignora.
+
+    Args:
+        text: Texto de fechas de parada
+
+    Returns:
+        List[Tuple[date, date]]: Ventanas de parada ordenadas
+    """
+    windows = []
+    for chunk in re.split(r"[;,\n]", text or ""):
+        dates = [_parse_date_token(token) for token in _DATE_PATTERN.findall(chunk)]
+        dates = [day for day in dates if day is not None]
+        if len(dates) == 1:
+            windows.append((dates[0], dates[0]))
+        elif len(dates) == 2:
+            windows.append((min(dates), max(dates)))
+    return sorted(windows)
+
+
+class InterventionOperations(BaseRepository[Project]):
+    """
+    Módulo para calcular el tiempo de intervención de proyectos en lote.
+
+    La intervención empieza en ``start_date`` y dura ``preparation_days`` más
+    ``duration_days`` días laborables (si falta ``duration_days`` se deduce
+    de ``end_date``). Las fechas se resuelven con el calendario laborable
+    cacheado y el solapamiento se mide contra las ventanas de parada
+    estructuradas (``ProjectShutdown``) o, si el proyecto no tiene ninguna,
+    contra las del texto heredado ``shutdown_dates``.
+    """
+
+    def __init__(self, session, calendar: Optional[BusinessCalendar] = None):
+        super().__init__(session, Project)
+        self._calendar = calendar
+        self._logger = logger.bind(module="project_intervention_operations")
+
+    @property
+    def calendar(self) -> BusinessCalendar:
+        """Calendario inyectado o el compartido de la configuración actual."""
+        return self._calendar or get_business_calendar()
+
+    async def get_by_unique_field(self, field_name: str, field_value: Any) -> Optional[Project]:
+        """Las búsquedas por campo único se resuelven en QueryOperations."""
+        return None
+
+    async def get_project_interventions(
+        self,
+        project_ids: Optional[Sequence[int]] = None,
+        include_closed: bool = False,
+        reference_date: Optional[date] = None,
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Calcula la intervención de varios proyectos con dos consultas.
+
+        Args:
+            project_ids: Proyectos a calcular (por defecto todos los no archivados)
+            include_closed: Incluye proyectos completados y cancelados
+            reference_date: Fecha de referencia para el atraso (por defecto hoy)
+
+        Returns:
+            Dict[int, Dict[str, Any]]: Intervención por ID de proyecto
+        """
+        try:
+            query = select(Project).where(Project.is_archived == False)
+            if project_ids is not None:
+                query = query.where(Project.id.in_(list(project_ids)))
+            if not include_closed:
+                query = query.where(Project.status.in_(OPEN_STATUSES))
+            result = await self.session.execute(query.order_by(Project.id))
+            projects = list(result.scalars().all())
+
+            return await self.evaluate_projects(projects, reference_date)
+
+        except SQLAlchemyError as e:
+            self._logger.error(f"Error al calcular intervenciones de proyectos: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="get_project_interventions",
+                entity_type="Project",
+            )
+        except Exception as e:
+            self._logger.error(f"Error inesperado al calcular intervenciones de proyectos: {e}")
+            raise ProjectRepositoryError(
+                message=f"Error inesperado al calcular intervenciones: {str(e)}",
+                operation="get_project_interventions",
+                entity_type="Project",
+                original_error=e,
+            )
+
+    async def evaluate_projects(
+        self,
+        projects: Iterable[Project],
+        reference_date: Optional[date] = None,
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Calcula la intervención de proyectos ya cargados.
+
+        Las ventanas de parada de todos ellos se cargan en una única consulta.
+
+        Args:
+            projects: Proyectos cargados
+            reference_date: Fecha de referencia para el atraso (por defecto hoy)
+
+        Returns:
+            Dict[int, Dict[str, Any]]: Intervención por ID de proyecto
+        """
+        projects = list(projects)
+        today = reference_date or pendulum.now().date()
+        windows = await self._load_shutdowns([project.id for project in projects])
+        return {
+            project.id: self.calculate_intervention(
+                project,
+                windows.get(project.id) or parse_shutdown_dates(project.shutdown_dates),
+                today,
+            )
+            for project in projects
+        }
+
+    async def _load_shutdowns(self, project_ids: List[int]) -> Dict[int, List[_Window]]:
+        """Ventanas de parada estructuradas por proyecto."""
+        if not project_ids:
+            return {}
+        result = await self.session.execute(
+            select(ProjectShutdown.project_id, ProjectShutdown.start_date, ProjectShutdown.end_date)
+            .where(ProjectShutdown.project_id.in_(project_ids))
+            .order_by(ProjectShutdown.project_id, ProjectShutdown.start_date)
+        )
+        windows: Dict[int, List[_Window]] = defaultdict(list)
+        for project_id, start_date, end_date in result.all():
+            windows[project_id].append((start_date, end_date))
+        return windows
+
+    def calculate_intervention(
+        self,
+        project: Project,
+        shutdowns: Sequence[_Window],
+        reference_date: date,
+    ) -> Dict[str, Any]:
+        """
+        Calcula fechas, duración, solapamiento con paradas y atraso de un proyecto.
+
+        Args:
+            project: Proyecto
+            shutdowns: Ventanas de parada del proyecto
+            reference_date: Fecha de referencia para el atraso
+
+        Returns:
+            Dict[str, Any]: Días de preparación y trabajo, fechas calculadas,
+            fecha de fin efectiva (la planificada si existe), solapamiento con
+            paradas y atraso en días naturales y laborables
+        """
+        calendar = self.calendar
+        start = project.start_date
+        preparation = project.preparation_days or 0
+        work = project.duration_days
+        if work is None and start and project.end_date:
+            work = max(0, calendar.count(start, project.end_date) - preparation)
+
+        intervention = {
+            "project_id": project.id,
+            "reference": project.reference,
+            "status": project.status.value if project.status else None,
+            "start_date": start,
+            "preparation_days": preparation,
+            "work_days": work,
+            "intervention_days": preparation + (work or 0),
+            "preparation_end_date": None,
+            "work_start_date": None,
+            "calculated_end_date": None,
+            "scheduled_end_date": project.end_date,
+            "end_date": project.end_date,
+            "shutdowns": [],
+            "shutdown_overlap_days": 0,
+            "shutdown_overlap_business_days": 0,
+            "is_overdue": False,
+            "delay_days": 0,
+            "delay_business_days": 0,
+        }
+        if start is None:
+            return intervention
+
+        total = intervention["intervention_days"]
+        if preparation:
+            intervention["preparation_end_date"] = calendar.end_of(start, preparation)
+        if work:
+            intervention["work_start_date"] = calendar.end_of(start, preparation + 1)
+        if total:
+            intervention["calculated_end_date"] = calendar.end_of(start, total)
+        end = project.end_date or intervention["calculated_end_date"]
+        intervention["end_date"] = end
+        if end is None:
+            return intervention
+
+        for shutdown_start, shutdown_end in shutdowns:
+            first, last = max(start, shutdown_start), min(end, shutdown_end)
+            if first > last:
+                continue
+            overlap = {
+                "start_date": shutdown_start,
+                "end_date": shutdown_end,
+                "overlap_days": (last - first).days + 1,
+                "overlap_business_days": calendar.count(first, last),
+            }
+            intervention["shutdowns"].append(overlap)
+            intervention["shutdown_overlap_days"] += overlap["overlap_days"]
+            intervention["shutdown_overlap_business_days"] += overlap["overlap_business_days"]
+
+        if end < reference_date and project.status in OPEN_STATUSES:
+            intervention["is_overdue"] = True
+            intervention["delay_days"] = (reference_date - end).days
+            intervention["delay_business_days"] = calendar.count(end + timedelta(days=1), reference_date)
+        return intervention
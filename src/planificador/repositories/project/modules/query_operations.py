@@ -7,7 +7,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import contains_eager, joinedload
 
 from planificador.repositories.base_repository import BaseRepository
-from planificador.models.project import Project
+from planificador.models.project import Project, ProjectStatus
+from planificador.repositories.projections import PROJECT_SUMMARY
+from planificador.schemas.response import ProjectListResponse
+from planificador.repositories.search.search_index import SearchIndex
 from planificador.exceptions.repository.base_repository_exceptions import RepositoryError, convert_sqlalchemy_error
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -210,7 +213,10 @@ class QueryOperations(BaseRepository[Project]):
         self, search_term: str, limit: Optional[int] = None
     ) -> List[Project]:
         """
-        Busca proyectos por término de búsqueda en nombre, referencia y descripción.
+        Busca proyectos por término de búsqueda en nombre, referencia y detalles.
+        
+        Usa el índice de texto completo si está disponible (resultados por
+        relevancia); si no, recurre a ILIKE.
         
         Args:
             search_term: Término de búsqueda
@@ -220,12 +226,25 @@ class QueryOperations(BaseRepository[Project]):
             List[Project]: Lista de proyectos que coinciden con la búsqueda
         """
         try:
+            search_index = SearchIndex(self.session)
+            if await search_index.is_available():
+                project_ids = await search_index.search_ids(
+                    search_term, "project", limit=limit or 1000
+                )
+                if not project_ids:
+                    return []
+                result = await self.session.execute(
+                    self._base_query().where(Project.id.in_(project_ids))
+                )
+                projects = {project.id: project for project in result.scalars().all()}
+                return [projects[pid] for pid in project_ids if pid in projects]
+            
             search_pattern = f"%{search_term}%"
             query = self._base_query().where(
                 or_(
                     Project.name.ilike(search_pattern),
                     Project.reference.ilike(search_pattern),
-                    Project.description.ilike(search_pattern)
+                    Project.details.ilike(search_pattern)
                 )
             )
             
@@ -235,6 +254,8 @@ class QueryOperations(BaseRepository[Project]):
             result = await self.session.execute(query)
             return result.scalars().all()
             
+        except RepositoryError:
+            raise
         except SQLAlchemyError as e:
             logger.error(f"Error al buscar proyectos con término '{search_term}': {e}")
             raise convert_sqlalchemy_error(
@@ -322,6 +343,54 @@ class QueryOperations(BaseRepository[Project]):
                 f"Error inesperado al obtener proyectos activos: {str(e)}"
             ) from e
 
+    async def list_project_summaries(
+        self,
+        status: Optional[ProjectStatus] = None,
+        client_id: Optional[int] = None,
+        include_archived: bool = False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> List[ProjectListResponse]:
+        """
+        Obtiene el listado de proyectos proyectando solo las columnas de la vista.
+        
+        No carga entidades ni los campos de texto largos (detalles,
+        comentarios, notas, personal requerido).
+        
+        Args:
+            status: Filtra por estado
+            client_id: Filtra por cliente
+            include_archived: Incluye los proyectos archivados
+            limit: Límite opcional de resultados
+            offset: Número de resultados a omitir
+            
+        Returns:
+            List[ProjectListResponse]: Proyectos ordenados por referencia
+        """
+        conditions = []
+        if not include_archived:
+            conditions.append(Project.is_archived == False)
+        if status is not None:
+            conditions.append(Project.status == status)
+        if client_id is not None:
+            conditions.append(Project.client_id == client_id)
+        try:
+            return await PROJECT_SUMMARY.fetch(
+                self.session, *conditions, limit=limit, offset=offset
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error al listar resúmenes de proyectos: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="list_project_summaries",
+                entity_type="Project",
+            )
+        except Exception as e:
+            logger.error(f"Error inesperado al listar resúmenes de proyectos: {e}")
+            raise RepositoryError(
+                f"Error inesperado al listar resúmenes de proyectos: {str(e)}"
+            ) from e
+
     async def filter_by_date_range(
         self, start_date: date, end_date: date, limit: Optional[int] = None
     ) -> List[Project]:
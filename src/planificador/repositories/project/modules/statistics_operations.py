@@ -8,6 +8,10 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from planificador.repositories.base_repository import BaseRepository
 from planificador.models.project import Project
+from planificador.repositories.project.modules.intervention_operations import (
+    InterventionOperations,
+    OPEN_STATUSES,
+)
 from planificador.exceptions.repository.base_repository_exceptions import RepositoryError, convert_sqlalchemy_error
 from planificador.exceptions.repository.project_repository_exceptions import ProjectRepositoryError
 
@@ -17,9 +21,10 @@ class StatisticsOperations(BaseRepository[Project]):
     Módulo para calcular estadísticas de proyectos.
     """
 
-    def __init__(self, session, query_builder):
+    def __init__(self, session, query_builder, intervention_operations=None):
         super().__init__(session, Project)
         self.query_builder = query_builder
+        self.intervention_operations = intervention_operations or InterventionOperations(session)
         self._logger = logger.bind(module="project_statistics_operations")
     
     async def get_by_unique_field(self, field_name: str, field_value: Any) -> Optional[Project]:
@@ -306,45 +311,51 @@ class StatisticsOperations(BaseRepository[Project]):
                 original_error=e,
             )
 
+    async def _evaluate_open_projects(self) -> List[Dict[str, Any]]:
+        """
+        Calcula en lote la intervención de los proyectos abiertos no archivados.
+
+        Returns:
+            List[Dict[str, Any]]: Intervención de cada proyecto con su instancia
+            en la clave ``project``
+        """
+        query = (
+            self.query_builder._base_query()
+            .where(Project.status.in_(OPEN_STATUSES))
+            .order_by(Project.id)
+        )
+        result = await self.session.execute(query)
+        projects = result.scalars().all()
+        interventions = await self.intervention_operations.evaluate_projects(projects)
+        return [
+            dict(interventions[project.id], project=project) for project in projects
+        ]
+
     async def get_overdue_projects_stats(self) -> Dict[str, Any]:
         """
         Obtiene estadísticas generales de proyectos atrasados.
+
+        La fecha de fin de cada proyecto es la planificada o, si no existe, la
+        calculada a partir de sus días de preparación y trabajo.
         
         Returns:
             Dict[str, Any]: Estadísticas de proyectos atrasados
         """
         try:
             current_date = pendulum.now().date()
-            
-            # Total de proyectos vencidos
-            query_overdue = (
-                select(func.count(Project.id))
-                .where(
-                    Project.end_date < current_date,
-                    Project.status.notin_(["Completed", "Archived"])
-                )
-            )
-            result_overdue = await self.session.execute(query_overdue)
-            total_overdue = result_overdue.scalar() or 0
-            
-            # Promedio de días de retraso
-            query_avg_delay = (
-                select(func.avg(func.julianday(current_date) - func.julianday(Project.end_date)))
-                .where(
-                    Project.end_date < current_date,
-                    Project.status.notin_(["Completed", "Archived"])
-                )
+            interventions = await self._evaluate_open_projects()
+            overdue = [item for item in interventions if item["is_overdue"]]
+            
+            total_overdue = len(overdue)
+            total_active = len(interventions)
+            avg_delay_days = (
+                sum(item["delay_days"] for item in overdue) / total_overdue
+                if total_overdue else 0
             )
-            result_avg_delay = await self.session.execute(query_avg_delay)
-            avg_delay_days = result_avg_delay.scalar() or 0
-            
-            # Total de proyectos activos
-            query_active = (
-                select(func.count(Project.id))
-                .where(Project.status.notin_(["Completed", "Archived"]))
+            avg_delay_business_days = (
+                sum(item["delay_business_days"] for item in overdue) / total_overdue
+                if total_overdue else 0
             )
-            result_active = await self.session.execute(query_active)
-            total_active = result_active.scalar() or 0
             
             return {
                 "total_overdue_projects": total_overdue,
@@ -354,6 +365,7 @@ class StatisticsOperations(BaseRepository[Project]):
                     if total_active > 0 else 0
                 ),
                 "average_delay_days": round(float(avg_delay_days), 2),
+                "average_delay_business_days": round(float(avg_delay_business_days), 2),
                 "analysis_date": current_date.isoformat()
             }
             
@@ -382,33 +394,27 @@ class StatisticsOperations(BaseRepository[Project]):
                 - id: ID del proyecto
                 - name: Nombre del proyecto
                 - reference: Referencia del proyecto
-                - end_date: Fecha de finalización
+                - end_date: Fecha de finalización (planificada o calculada)
                 - days_overdue: Días de retraso
+                - business_days_overdue: Días laborables de retraso
+                - shutdown_overlap_days: Días de parada dentro de la intervención
                 - client_name: Nombre del cliente
         """
         try:
-            current_date = pendulum.now().date()
-            
-            # Consulta base con joins necesarios
-            query = (
-                self.query_builder._base_query()
-                .where(Project.end_date < current_date)
-                .where(Project.status.notin_(["Completed", "Archived"]))
-            )
-            
-            result = await self.session.execute(query)
-            overdue_projects = result.scalars().all()
-            
             summary = []
-            for project in overdue_projects:
-                days_overdue = (current_date - project.end_date).days
+            for item in await self._evaluate_open_projects():
+                if not item["is_overdue"]:
+                    continue
+                project = item["project"]
                 summary.append({
                     "id": project.id,
                     "name": project.name,
-                    "reference": getattr(project, 'reference', None),
-                    "end_date": project.end_date.isoformat() if project.end_date else None,
-                    "days_overdue": days_overdue,
-                    "client_name": getattr(project.client, 'name', 'Sin cliente') if hasattr(project, 'client') and project.client else "Sin cliente",
+                    "reference": project.reference,
+                    "end_date": item["end_date"].isoformat(),
+                    "days_overdue": item["delay_days"],
+                    "business_days_overdue": item["delay_business_days"],
+                    "shutdown_overlap_days": item["shutdown_overlap_days"],
+                    "client_name": project.client.name if project.client else "Sin cliente",
                 })
             
             return summary
@@ -9,6 +9,9 @@ from planificador.repositories.project.interfaces.project_repository_interface i
 from planificador.repositories.project.modules.crud_operations import (
     CrudOperations,
 )
+from planificador.repositories.project.modules.intervention_operations import (
+    InterventionOperations,
+)
 from planificador.repositories.project.modules.query_operations import QueryOperations
 from planificador.repositories.project.modules.relationship_operations import (
     RelationshipOperations,
@@ -20,8 +23,11 @@ from planificador.repositories.project.modules.validation_operations import (
     ValidationOperations,
 )
 from planificador.models.project import Project, ProjectStatus, ProjectPriority
+from planificador.schemas.response import ProjectListResponse
+from planificador.database.instrumentation import instrumented_repository
 
 
+@instrumented_repository
 class ProjectRepositoryFacade(IProjectRepository):
     def __init__(
         self,
@@ -31,6 +37,7 @@ class ProjectRepositoryFacade(IProjectRepository):
         relationship_operations: Optional[RelationshipOperations] = None,
         crud_operations: Optional[CrudOperations] = None,
         statistics_operations: Optional[StatisticsOperations] = None,
+        intervention_operations: Optional[InterventionOperations] = None,
     ):
         self.session = session
         
@@ -60,11 +67,16 @@ class ProjectRepositoryFacade(IProjectRepository):
                 self._relationship_operations,
             )
             
+        if intervention_operations is not None:
+            self._intervention_operations = intervention_operations
+        else:
+            self._intervention_operations = InterventionOperations(session)
+
         if statistics_operations is not None:
             self._statistics_operations = statistics_operations
         else:
             self._statistics_operations = StatisticsOperations(
-                session, self._query_operations
+                session, self._query_operations, self._intervention_operations
             )
 
     # ============================================================================
@@ -127,6 +139,23 @@ class ProjectRepositoryFacade(IProjectRepository):
         """Obtiene proyectos activos."""
         return await self._query_operations.get_active_projects(limit)
 
+    async def list_project_summaries(
+        self,
+        status: Optional[ProjectStatus] = None,
+        client_id: Optional[int] = None,
+        include_archived: bool = False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> List[ProjectListResponse]:
+        """Obtiene el listado de proyectos proyectando solo las columnas de la vista."""
+        return await self._query_operations.list_project_summaries(
+            status=status,
+            client_id=client_id,
+            include_archived=include_archived,
+            limit=limit,
+            offset=offset,
+        )
+
     async def filter_by_date_range(self, start_date: date, end_date: date, limit: Optional[int] = None) -> List[Project]:
         """Filtra proyectos por rango de fechas."""
         return await self._query_operations.filter_by_date_range(start_date, end_date, limit)
@@ -246,6 +275,20 @@ class ProjectRepositoryFacade(IProjectRepository):
         """Obtiene estadísticas detalladas de proyectos vencidos."""
         return await self._statistics_operations.get_overdue_projects_stats()
 
+    # ============================================================================
+    # TIEMPO DE INTERVENCIÓN - Delegación a _intervention_operations
+    # ============================================================================
+    async def get_project_interventions(
+        self,
+        project_ids: Optional[List[int]] = None,
+        include_closed: bool = False,
+        reference_date: Optional[date] = None,
+    ) -> Dict[int, Dict[str, Any]]:
+        """Calcula en lote duración, fechas, paradas y atraso de los proyectos."""
+        return await self._intervention_operations.get_project_interventions(
+            project_ids, include_closed, reference_date
+        )
+
 
 
     # ============================================================================
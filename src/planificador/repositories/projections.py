@@ -0,0 +1,279 @@
+"""
+Proyecciones de columnas para vistas de listado.
+
+Las pantallas de listado y de cuadrícula solo muestran unas pocas columnas
+de cada entidad, pero las consultas de entidades completas también leen los
+``Text`` y JSON pesados (notas, descripciones, habilidades, certificaciones).
+Este módulo define, por entidad, la proyección mínima de cada esquema de
+listado (``*ListResponse``) y la lista de columnas pesadas que pueden
+diferirse cuando sí se cargan entidades.
+
+Uso:
+    ```python
+    employees = await EMPLOYEE_SUMMARY.fetch(
+        session, Employee.is_available == True, limit=50
+    )
+    stmt = select(Employee).options(*defer_heavy_columns(Employee))
+    ```
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+from sqlalchemy.sql import Select
+
+from planificador.models.client import Client
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.models.schedule import Schedule
+from planificador.models.status_code import StatusCode
+from planificador.models.team import Team
+from planificador.models.vacation import Vacation
+from planificador.models.workload import Workload
+from planificador.schemas.base.base import BaseSchema
+from planificador.schemas.response import (
+    ClientListResponse,
+    EmployeeListResponse,
+    ProjectListResponse,
+    ScheduleListResponse,
+    WorkloadListResponse,
+)
+
+
+# Columnas Text/JSON que no se muestran en listados
+HEAVY_COLUMNS: Dict[Any, Tuple[str, ...]] = {
+    Employee: ("skills", "certifications", "special_training", "notes"),
+    Project: (
+        "shutdown_dates", "required_personnel", "special_training",
+        "details", "comments", "notes",
+    ),
+    Client: ("notes",),
+    Schedule: ("description", "notes"),
+    Workload: ("notes",),
+    Vacation: ("reason", "notes"),
+    Team: ("description", "notes"),
+}
+
+
+def defer_heavy_columns(model: Any) -> List[Any]:
+    """
+    Opciones de carga que difieren las columnas pesadas de un modelo.
+
+    Las columnas diferidas se cargan con una consulta adicional al acceder
+    a ellas, lo que en una ``AsyncSession`` requiere ``session.refresh``
+    explícito; solo deben diferirse en cargas cuyo consumidor no las usa.
+
+    Args:
+        model: Modelo ORM.
+
+    Returns:
+        Lista de opciones ``defer`` (vacía si el modelo no tiene columnas pesadas).
+    """
+    return [defer(getattr(model, name)) for name in HEAVY_COLUMNS.get(model, ())]
+
+
+@dataclass(frozen=True)
+class SummaryProjection:
+    """
+    Proyección de columnas de un esquema de listado.
+
+    Attributes:
+        schema: Esquema de listado construido con ``BaseSchema.from_rows``.
+        columns: Columnas etiquetadas con el nombre de cada campo del esquema.
+        source: Modelo principal de la consulta.
+        joins: Pares (modelo, condición) unidos con INNER JOIN.
+        outer_joins: Pares (modelo, condición) unidos con LEFT OUTER JOIN.
+        order_by: Orden por defecto del listado.
+    """
+    schema: Type[BaseSchema]
+    columns: Tuple[Any, ...]
+    source: Any
+    joins: Tuple[Tuple[Any, Any], ...] = ()
+    outer_joins: Tuple[Tuple[Any, Any], ...] = ()
+    order_by: Tuple[Any, ...] = ()
+
+    def statement(
+        self,
+        *where: Any,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Select:
+        """
+        Construye el SELECT de la proyección.
+
+        Args:
+            *where: Condiciones de filtrado.
+            limit: Número máximo de filas.
+            offset: Filas a omitir.
+
+        Returns:
+            Sentencia SELECT con solo las columnas del esquema.
+        """
+        stmt = select(*self.columns).select_from(self.source)
+        for model, condition in self.joins:
+            stmt = stmt.join(model, condition)
+        for model, condition in self.outer_joins:
+            stmt = stmt.outerjoin(model, condition)
+        if where:
+            stmt = stmt.where(*where)
+        if self.order_by:
+            stmt = stmt.order_by(*self.order_by)
+        if offset:
+            stmt = stmt.offset(offset)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    async def fetch(
+        self,
+        session: AsyncSession,
+        *where: Any,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[BaseSchema]:
+        """
+        Ejecuta la proyección y construye los esquemas sin cargar entidades.
+
+        Args:
+            session: Sesión asíncrona.
+            *where: Condiciones de filtrado.
+            limit: Número máximo de filas.
+            offset: Filas a omitir.
+
+        Returns:
+            Lista de instancias del esquema.
+
+        Raises:
+            SQLAlchemyError: Si falla la consulta; cada repositorio la
+                convierte con ``convert_sqlalchemy_error``.
+        """
+        result = await session.execute(self.statement(*where, limit=limit, offset=offset))
+        return self.schema.from_rows(result.all())
+
+
+def hours_between(start: Any, end: Any) -> Optional[Decimal]:
+    """
+    Horas entre dos ``time``, con el mismo criterio que ``Schedule.hours_worked``.
+
+    Returns:
+        Horas redondeadas a dos decimales (los turnos que cruzan medianoche
+        suman 24 h) o None si falta alguna de las horas.
+    """
+    if start is None or end is None:
+        return None
+    minutes = (end.hour * 60 + end.minute) - (start.hour * 60 + start.minute)
+    seconds = minutes * 60 + end.second - start.second
+    if seconds < 0:
+        seconds += 24 * 3600
+    return round(Decimal(seconds) / 3600, 2)
+
+
+_PROJECTS_PER_CLIENT = (
+    select(func.count(Project.id))
+    .where(Project.client_id == Client.id)
+    .correlate(Client)
+    .scalar_subquery()
+)
+
+
+EMPLOYEE_SUMMARY = SummaryProjection(
+    schema=EmployeeListResponse,
+    source=Employee,
+    columns=(
+        Employee.id,
+        Employee.full_name,
+        Employee.employee_code,
+        Employee.email,
+        Employee.status,
+        Employee.position,
+        Employee.department,
+        Employee.is_available,
+    ),
+    order_by=(Employee.full_name,),
+)
+
+PROJECT_SUMMARY = SummaryProjection(
+    schema=ProjectListResponse,
+    source=Project,
+    columns=(
+        Project.id,
+        Project.name,
+        Project.reference,
+        Project.trigram,
+        Project.status,
+        Project.priority,
+        Project.start_date,
+        Project.end_date,
+        Client.name.label("client_name"),
+        Project.client_id,
+    ),
+    joins=((Client, Client.id == Project.client_id),),
+    order_by=(Project.reference,),
+)
+
+CLIENT_SUMMARY = SummaryProjection(
+    schema=ClientListResponse,
+    source=Client,
+    columns=(
+        Client.id,
+        Client.name,
+        Client.contact_person,
+        Client.email,
+        Client.phone,
+        Client.is_active,
+        _PROJECTS_PER_CLIENT.label("projects_count"),
+    ),
+    order_by=(Client.name,),
+)
+
+SCHEDULE_SUMMARY = SummaryProjection(
+    schema=ScheduleListResponse,
+    source=Schedule,
+    columns=(
+        Schedule.id,
+        Schedule.date,
+        Schedule.start_time,
+        Schedule.end_time,
+        Employee.full_name.label("employee_name"),
+        Schedule.employee_id,
+        Project.name.label("project_name"),
+        Schedule.project_id,
+        Team.name.label("team_name"),
+        Schedule.team_id,
+        StatusCode.code.label("status_code"),
+        Schedule.is_confirmed,
+        Schedule.location,
+    ),
+    joins=((Employee, Employee.id == Schedule.employee_id),),
+    outer_joins=(
+        (Project, Project.id == Schedule.project_id),
+        (Team, Team.id == Schedule.team_id),
+        (StatusCode, StatusCode.id == Schedule.status_code_id),
+    ),
+    order_by=(Schedule.date, Employee.full_name, Schedule.id),
+)
+
+WORKLOAD_SUMMARY = SummaryProjection(
+    schema=WorkloadListResponse,
+    source=Workload,
+    columns=(
+        Workload.id,
+        Employee.full_name.label("employee_name"),
+        Workload.employee_id,
+        Project.name.label("project_name"),
+        Workload.project_id,
+        Workload.date,
+        Workload.planned_hours,
+        Workload.actual_hours,
+        Workload.utilization_percentage,
+        Workload.efficiency_score,
+        Workload.is_billable,
+    ),
+    joins=((Employee, Employee.id == Workload.employee_id),),
+    outer_joins=((Project, Project.id == Workload.project_id),),
+    order_by=(Workload.date, Employee.full_name, Workload.id),
+)
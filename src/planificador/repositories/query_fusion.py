@@ -0,0 +1,210 @@
+"""
+Fusión de métricas agregadas en una sola consulta.
+
+Los reportes estadísticos suelen lanzar una cadena de ``SELECT count(...)``
+contra la misma tabla, cada uno con su propio filtro. ``FusedAggregate``
+compila todas esas métricas como agregados condicionales
+(``COUNT(CASE WHEN ... THEN 1 END)``, ``SUM(CASE WHEN ... THEN col END)``)
+dentro de un único SELECT, de modo que el reporte recorre la tabla una sola
+vez y hace un único viaje a la base de datos.
+
+Uso:
+    ```python
+    metrics = await (
+        FusedAggregate(Client)
+        .count("total")
+        .count("active", Client.is_active == True)
+        .count_each("by_status", Alert.status, list(AlertStatus))
+        .execute(session)
+    )
+    metrics["active"], metrics["by_status"]["pending"]
+    ```
+"""
+
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, case, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+
+def _enum_key(value: Any) -> Any:
+    """Clave por defecto de ``count_each``: el valor de los Enum."""
+    return value.value if isinstance(value, Enum) else value
+
+
+class FusedAggregate:
+    """
+    Constructor de un SELECT con varias métricas agregadas condicionales.
+
+    Cada método añade una métrica con nombre y devuelve la propia instancia
+    para encadenar llamadas. Las condiciones adicionales de cada métrica se
+    combinan con AND; las condiciones del constructor se aplican como WHERE
+    a todas ellas.
+
+    Attributes:
+        source: Modelo o tabla sobre la que se agrega.
+    """
+
+    def __init__(self, source: Any, *where: Any) -> None:
+        """
+        Inicializa el constructor.
+
+        Args:
+            source: Modelo o tabla sobre la que se agrega.
+            *where: Condiciones comunes a todas las métricas.
+        """
+        self.source = source
+        self._where = list(where)
+        self._columns: List[Any] = []
+        # (nombre, etiqueta, valor por defecto) de cada métrica escalar
+        self._scalars: List[Tuple[str, str, Any]] = []
+        # (nombre, [(clave, etiqueta)]) de cada métrica desglosada
+        self._groups: List[Tuple[str, List[Tuple[Any, str]]]] = []
+
+    def _add(self, expression: Any) -> str:
+        """Añade una columna con una etiqueta interna y devuelve la etiqueta."""
+        label = f"m{len(self._columns)}"
+        self._columns.append(expression.label(label))
+        return label
+
+    def _add_scalar(self, name: str, expression: Any, default: Any) -> "FusedAggregate":
+        """Registra una métrica escalar."""
+        self._scalars.append((name, self._add(expression), default))
+        return self
+
+    @staticmethod
+    def _when(conditions: Tuple[Any, ...], value: Any) -> Any:
+        """``value`` si se cumplen las condiciones, NULL en caso contrario."""
+        if not conditions:
+            return value
+        condition = conditions[0] if len(conditions) == 1 else and_(*conditions)
+        return case((condition, value))
+
+    def count(self, name: str, *conditions: Any) -> "FusedAggregate":
+        """
+        Cuenta las filas que cumplen las condiciones.
+
+        Args:
+            name: Nombre de la métrica en el resultado.
+            *conditions: Condiciones de la métrica (todas las filas si no hay).
+        """
+        if not conditions:
+            return self._add_scalar(name, func.count(), 0)
+        return self._add_scalar(name, func.count(self._when(conditions, literal(1))), 0)
+
+    def count_distinct(self, name: str, column: Any, *conditions: Any) -> "FusedAggregate":
+        """
+        Cuenta los valores distintos de una columna entre las filas que cumplen
+        las condiciones.
+
+        Args:
+            name: Nombre de la métrica en el resultado.
+            column: Columna cuyos valores distintos se cuentan.
+            *conditions: Condiciones de la métrica.
+        """
+        return self._add_scalar(
+            name, func.count(self._when(conditions, column).distinct()), 0
+        )
+
+    def sum(self, name: str, column: Any, *conditions: Any) -> "FusedAggregate":
+        """
+        Suma una columna sobre las filas que cumplen las condiciones.
+
+        Args:
+            name: Nombre de la métrica en el resultado (0 si no hay filas).
+            column: Columna o expresión a sumar.
+            *conditions: Condiciones de la métrica.
+        """
+        return self._add_scalar(name, func.sum(self._when(conditions, column)), 0)
+
+    def min(self, name: str, column: Any, *conditions: Any) -> "FusedAggregate":
+        """Mínimo de una columna (None si no hay filas)."""
+        return self._add_scalar(name, func.min(self._when(conditions, column)), None)
+
+    def max(self, name: str, column: Any, *conditions: Any) -> "FusedAggregate":
+        """Máximo de una columna (None si no hay filas)."""
+        return self._add_scalar(name, func.max(self._when(conditions, column)), None)
+
+    def avg(self, name: str, column: Any, *conditions: Any) -> "FusedAggregate":
+        """Media de una columna (None si no hay filas)."""
+        return self._add_scalar(name, func.avg(self._when(conditions, column)), None)
+
+    def count_each(
+        self,
+        name: str,
+        column: Any,
+        values: Iterable[Any],
+        *conditions: Any,
+        key: Callable[[Any], Any] = _enum_key,
+    ) -> "FusedAggregate":
+        """
+        Cuenta las filas para cada valor conocido de una columna.
+
+        Sustituye a un ``GROUP BY`` cuando los valores posibles son conocidos
+        (p. ej. los miembros de un Enum), de forma que el desglose se calcula
+        en la misma pasada que el resto de métricas.
+
+        Args:
+            name: Nombre de la métrica; su valor es un diccionario clave -> conteo.
+            column: Columna a desglosar.
+            values: Valores para los que se cuenta.
+            *conditions: Condiciones adicionales de la métrica.
+            key: Función que convierte cada valor en la clave del diccionario
+                (por defecto, el ``value`` de los Enum).
+        """
+        labels = [
+            (key(value), self._add(
+                func.count(self._when((column == value,) + conditions, literal(1)))
+            ))
+            for value in values
+        ]
+        self._groups.append((name, labels))
+        return self
+
+    def statement(self) -> Select:
+        """
+        Compila las métricas registradas en un único SELECT.
+
+        Returns:
+            Sentencia SELECT con una columna por métrica.
+
+        Raises:
+            ValueError: Si no se ha registrado ninguna métrica.
+        """
+        if not self._columns:
+            raise ValueError("FusedAggregate necesita al menos una métrica")
+        stmt = select(*self._columns).select_from(self.source)
+        if self._where:
+            stmt = stmt.where(*self._where)
+        return stmt
+
+    async def execute(self, session: AsyncSession) -> Dict[str, Any]:
+        """
+        Ejecuta la consulta y devuelve las métricas por nombre.
+
+        Args:
+            session: Sesión asíncrona.
+
+        Returns:
+            Diccionario nombre -> valor (o diccionario de conteos para las
+            métricas de ``count_each``).
+
+        Raises:
+            SQLAlchemyError: Si falla la consulta; cada repositorio la
+                convierte con ``convert_sqlalchemy_error``.
+        """
+        result = await session.execute(self.statement())
+        row: Optional[Any] = result.one_or_none()
+        values = row._mapping if row is not None else {}
+
+        metrics: Dict[str, Any] = {}
+        for name, label, default in self._scalars:
+            value = values.get(label)
+            metrics[name] = default if value is None else value
+        for name, labels in self._groups:
+            metrics[name] = {
+                group_key: values.get(label) or 0 for group_key, label in labels
+            }
+        return metrics
@@ -5,6 +5,7 @@ from typing import List, Optional, Dict, Any
 from datetime import date
 
 from planificador.models.schedule import Schedule
+from planificador.schemas.response import ScheduleListResponse
 from planificador.exceptions.repository import ScheduleRepositoryError
 
 
@@ -171,6 +172,35 @@ class IScheduleQueryOperations(ABC):
         """
         pass
 
+    @abstractmethod
+    async def list_schedule_summaries(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        employee_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[ScheduleListResponse]:
+        """
+        Obtiene el listado de horarios proyectando solo las columnas de la vista.
+        
+        Args:
+            start_date: Fecha de inicio del rango (opcional)
+            end_date: Fecha de fin del rango (opcional)
+            employee_id: ID del empleado (opcional)
+            project_id: ID del proyecto (opcional)
+            limit: Número máximo de resultados
+            offset: Número de resultados a omitir
+            
+        Returns:
+            List[ScheduleListResponse]: Horarios ordenados por fecha y empleado
+            
+        Raises:
+            ScheduleRepositoryError: Si ocurre un error durante la consulta
+        """
+        pass
+
     @abstractmethod
     async def count_schedules(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
@@ -11,6 +11,10 @@ específicas del repositorio de horarios, organizados por responsabilidad:
 - validation_module: Validaciones de datos y reglas de negocio
 - statistics_module: Operaciones de estadísticas y métricas
 - relationship_module: Gestión de relaciones y asignaciones
+- planning_import_module: Importación masiva de la hoja de planificación Excel
+- planning_grid_module: Cuadrícula de planificación en formato columnar
+- auto_planner_module: Planificación automática de la dotación de proyectos
+- scenario_module: Escenarios de planificación sobre una instantánea del tablero
 """
 
 from .crud_module import ScheduleCrudModule
@@ -18,6 +22,31 @@ from .query_module import ScheduleQueryModule
 from .validation_module import ScheduleValidationModule
 from .statistics_module import ScheduleStatisticsModule
 from .relationship_module import ScheduleRelationshipModule
+from .planning_import_module import (
+    SchedulePlanningImportModule,
+    PlanningSheetLayout,
+    PlanningImportReport,
+)
+from .planning_grid_module import (
+    SchedulePlanningGridModule,
+    PlanningGridEncoder,
+    decode_planning_grid,
+)
+from .auto_planner_module import (
+    ScheduleAutoPlannerModule,
+    AutoPlanSolver,
+    AutoPlanResult,
+    PlannerCandidate,
+)
+from .scenario_module import (
+    ScheduleScenarioModule,
+    ScheduleSnapshot,
+    PlanningScenario,
+    ScheduleEntry,
+    AssignmentEntry,
+    ScenarioChange,
+    ScenarioCommitReport,
+)
 
 __all__ = [
     "ScheduleCrudModule",
@@ -25,4 +54,21 @@ __all__ = [
     "ScheduleValidationModule",
     "ScheduleStatisticsModule",
     "ScheduleRelationshipModule",
+    "SchedulePlanningImportModule",
+    "PlanningSheetLayout",
+    "PlanningImportReport",
+    "SchedulePlanningGridModule",
+    "PlanningGridEncoder",
+    "decode_planning_grid",
+    "ScheduleAutoPlannerModule",
+    "AutoPlanSolver",
+    "AutoPlanResult",
+    "PlannerCandidate",
+    "ScheduleScenarioModule",
+    "ScheduleSnapshot",
+    "PlanningScenario",
+    "ScheduleEntry",
+    "AssignmentEntry",
+    "ScenarioChange",
+    "ScenarioCommitReport",
 ]
\ No newline at end of file
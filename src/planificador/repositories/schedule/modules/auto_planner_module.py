@@ -0,0 +1,639 @@
+# src/planificador/repositories/schedule/modules/auto_planner_module.py
+
+"""
+Módulo de planificación automática de proyectos.
+
+Rellena el tablero de un proyecto para una ventana de fechas a partir de la
+dotación diaria requerida por nivel de cualificación, asignando empleados
+sin violar sus restricciones:
+
+- vacaciones aprobadas y horarios ya existentes (un horario por día),
+- ``Employee.weekly_hours`` por semana ISO, contando los horarios existentes,
+- pertenencia activa a un equipo (opcional),
+- ``ProjectAssignment``: los asignados al proyecto tienen preferencia y
+  trabajan ``allocated_hours_per_day`` horas; opcionalmente solo ellos.
+
+Principios de Diseño:
+    - Disponibilidad precalculada: cada candidato tiene un bitset de días
+      libres (bit ``d`` = día ``d`` de la ventana), construido con una
+      consulta por tipo de restricción
+    - Voraz más búsqueda local: una pasada voraz por día prioriza la
+      continuidad en obra, los asignados y el reparto equitativo; después una
+      reparación local cubre huecos intercambiando días dentro de la semana
+      de empleados que han agotado su jornada semanal
+    - Escritura en bloque: los horarios planificados se insertan con un
+      único ``insert`` de varias filas
+
+Uso:
+    ```python
+    planner = ScheduleAutoPlannerModule(session)
+    result = await planner.plan_project(
+        project_id, {"N1": 4, "N2": 2},
+        start_date=date(2024, 4, 1), end_date=date(2024, 6, 30),
+    )
+    result.schedules_created, result.shortages
+    ```
+"""
+
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, time as dt_time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from planificador.models.employee import Employee, EmployeeStatus
+from planificador.models.project import Project
+from planificador.models.project_assignment import ProjectAssignment
+from planificador.models.schedule import Schedule
+from planificador.models.status_code import StatusCode
+from planificador.models.team_membership import TeamMembership
+from planificador.models.vacation import Vacation, VacationStatus
+from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.workload.modules.sync_module import (
+    ScheduleChangeTracker,
+    WorkloadSyncModule,
+)
+from planificador.repositories.projections import hours_between
+from planificador.exceptions import NotFoundError, ValidationError
+from planificador.exceptions.repository import (
+    ScheduleRepositoryError,
+    convert_sqlalchemy_error
+)
+
+DEFAULT_WORKING_DAYS: Tuple[int, ...] = (0, 1, 2, 3, 4)
+
+# Filas por sentencia en la inserción en bloque
+_INSERT_BATCH = 1000
+
+
+@dataclass
+class PlannerCandidate:
+    """
+    Empleado candidato para el planificador.
+
+    Attributes:
+        employee_id: ID del empleado.
+        level: Nivel de cualificación.
+        hours: Horas por día planificado.
+        free: Bitset de días libres de la ventana.
+        week_days_left: Días planificables restantes por semana según
+            ``weekly_hours`` y los horarios existentes.
+        preferred: Asignado al proyecto (tiene preferencia).
+        planned: Bitset de días planificados por el solver.
+    """
+    employee_id: int
+    level: str
+    hours: Decimal
+    free: int
+    week_days_left: List[int]
+    preferred: bool = False
+    planned: int = 0
+
+    def is_available(self, day: int, week: int) -> bool:
+        """Libre, sin planificar y con jornada semanal restante ese día."""
+        return (
+            (self.free >> day) & 1 == 1
+            and (self.planned >> day) & 1 == 0
+            and self.week_days_left[week] > 0
+        )
+
+
+class AutoPlanSolver:
+    """
+    Solver voraz con reparación local sobre bitsets de disponibilidad.
+
+    No accede a la base de datos: recibe candidatos y demanda ya calculados,
+    de modo que puede reutilizarse para simulaciones.
+
+    Attributes:
+        days: Días de la ventana.
+        week_of_day: Índice de semana de cada día.
+        candidates: Candidatos por nivel de cualificación.
+        moves: Intercambios aplicados por la reparación local.
+    """
+
+    def __init__(
+        self,
+        days: int,
+        week_of_day: Sequence[int],
+        candidates: Sequence[PlannerCandidate],
+    ):
+        """
+        Inicializa el solver.
+
+        Args:
+            days: Días de la ventana.
+            week_of_day: Índice de semana de cada día.
+            candidates: Candidatos (con sus bitsets ya calculados).
+        """
+        self.days = days
+        self.week_of_day = list(week_of_day)
+        self._week_days: Dict[int, List[int]] = {}
+        for day, week in enumerate(self.week_of_day):
+            self._week_days.setdefault(week, []).append(day)
+        self.candidates: Dict[str, List[PlannerCandidate]] = {}
+        for candidate in candidates:
+            self.candidates.setdefault(candidate.level, []).append(candidate)
+        self.moves = 0
+
+    def _plan(self, candidate: PlannerCandidate, day: int) -> None:
+        candidate.planned |= 1 << day
+        candidate.week_days_left[self.week_of_day[day]] -= 1
+
+    def _greedy(self, level: str, demand: List[int]) -> List[int]:
+        """Pasada voraz por día; devuelve el déficit de cada día."""
+        pool = self.candidates.get(level, [])
+        shortage = [0] * self.days
+        for day in range(self.days):
+            need = demand[day]
+            if need <= 0:
+                continue
+            week = self.week_of_day[day]
+            available = [c for c in pool if c.is_available(day, week)]
+            # Continuidad en obra, después asignados, después menos días planificados
+            available.sort(key=lambda c: (
+                not (day and (c.planned >> (day - 1)) & 1),
+                not c.preferred,
+                c.planned.bit_count(),
+                c.employee_id,
+            ))
+            for candidate in available[:need]:
+                self._plan(candidate, day)
+            shortage[day] = max(0, need - len(available))
+        return shortage
+
+    def _repair(self, level: str, shortage: List[int]) -> None:
+        """
+        Cubre déficits con intercambios dentro de la semana.
+
+        Para un día con déficit busca un empleado libre ese día pero sin
+        jornada semanal restante y otro empleado que pueda sustituirle en
+        uno de sus días planificados de esa semana: el primero se mueve al
+        día con déficit y el segundo cubre el día liberado.
+        """
+        pool = self.candidates.get(level, [])
+        for day in range(self.days):
+            week = self.week_of_day[day]
+            while shortage[day] > 0 and self._swap(pool, day, week):
+                shortage[day] -= 1
+                self.moves += 1
+
+    def _swap(self, pool: List[PlannerCandidate], day: int, week: int) -> bool:
+        substitutes = [c for c in pool if c.week_days_left[week] > 0]
+        if not substitutes:
+            return False
+        for blocked in pool:
+            if (
+                (blocked.free >> day) & 1 == 0
+                or (blocked.planned >> day) & 1
+                or blocked.week_days_left[week] > 0
+            ):
+                continue
+            for other_day in self._week_days[week]:
+                if not (blocked.planned >> other_day) & 1:
+                    continue
+                for substitute in substitutes:
+                    if substitute is not blocked and substitute.is_available(other_day, week):
+                        blocked.planned &= ~(1 << other_day)
+                        blocked.planned |= 1 << day
+                        self._plan(substitute, other_day)
+                        return True
+        return False
+
+    def solve(self, demand: Mapping[str, List[int]]) -> Dict[str, List[int]]:
+        """
+        Planifica la demanda de todos los niveles.
+
+        Args:
+            demand: Personas requeridas por nivel y día de la ventana.
+
+        Returns:
+            Déficit restante por nivel y día.
+        """
+        shortages = {}
+        for level, level_demand in demand.items():
+            shortage = self._greedy(level, level_demand)
+            if any(shortage):
+                self._repair(level, shortage)
+            shortages[level] = shortage
+        return shortages
+
+
+@dataclass
+class AutoPlanResult:
+    """
+    Resultado de una planificación automática.
+
+    Attributes:
+        project_id: Proyecto planificado.
+        start_date: Primer día de la ventana.
+        end_date: Último día de la ventana.
+        assignments: Pares (empleado, fecha) planificados.
+        shortages: Personas que faltan por (nivel, fecha).
+        required_days: Días-persona requeridos en la ventana.
+        existing_days: Días-persona ya cubiertos por horarios existentes.
+        candidates: Empleados candidatos considerados.
+        local_search_moves: Intercambios aplicados por la reparación local.
+        schedules_created: Horarios insertados (0 en modo simulación).
+        elapsed_seconds: Duración de la planificación.
+    """
+    project_id: int
+    start_date: date
+    end_date: date
+    assignments: List[Tuple[int, date]] = field(default_factory=list)
+    shortages: Dict[Tuple[str, date], int] = field(default_factory=dict)
+    required_days: int = 0
+    existing_days: int = 0
+    candidates: int = 0
+    local_search_moves: int = 0
+    schedules_created: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def coverage_percentage(self) -> float:
+        """Porcentaje de la demanda cubierta (existente más planificada)."""
+        if not self.required_days:
+            return 100.0
+        covered = self.required_days - sum(self.shortages.values())
+        return round(covered / self.required_days * 100, 2)
+
+
+class ScheduleAutoPlannerModule(BaseRepository[Schedule]):
+    """
+    Módulo de planificación automática de proyectos.
+
+    Attributes:
+        session: Sesión de base de datos asíncrona
+        model_class: Clase del modelo Schedule
+        _logger: Logger estructurado con contexto del módulo
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el módulo de planificación automática.
+
+        Args:
+            session: Sesión de base de datos asíncrona
+        """
+        super().__init__(session, Schedule)
+        self._logger = self._logger.bind(component="ScheduleAutoPlannerModule")
+        # Pares (empleado, fecha) modificados, para recalcular sus cargas de trabajo
+        self._schedule_changes = ScheduleChangeTracker.for_session(session)
+
+    async def get_by_unique_field(self, field_name: str, value: Any) -> Optional[Schedule]:
+        """Los horarios no tienen campos únicos además del ID."""
+        return None
+
+    async def _load_candidates(
+        self,
+        project_id: int,
+        levels: Sequence[str],
+        start_date: date,
+        end_date: date,
+        week_start: date,
+        week_end: date,
+        working_mask: int,
+        hours_per_day: Decimal,
+        team_id: Optional[int],
+        assigned_only: bool,
+    ) -> Tuple[List[PlannerCandidate], Dict[str, List[int]]]:
+        """
+        Construye los candidatos con sus bitsets y la cobertura existente.
+
+        Returns:
+            Tupla (candidatos, personas ya planificadas en el proyecto por
+            nivel y día).
+        """
+        origin = start_date.toordinal()
+        days = end_date.toordinal() - origin + 1
+        weeks = (week_end.toordinal() - week_start.toordinal() + 1) // 7
+        levels = list(levels)
+
+        def day_mask(first: date, last: Optional[date]) -> int:
+            first_day = max(first.toordinal() - origin, 0)
+            last_day = min((last or end_date).toordinal() - origin, days - 1)
+            if last_day < first_day:
+                return 0
+            return ((1 << (last_day - first_day + 1)) - 1) << first_day
+
+        conditions = [
+            Employee.status == EmployeeStatus.ACTIVE,
+            Employee.is_available.is_(True),
+            Employee.qualification_level.in_(levels),
+        ]
+        if team_id is not None:
+            conditions.append(Employee.id.in_(
+                select(TeamMembership.employee_id).where(
+                    TeamMembership.team_id == team_id,
+                    TeamMembership.is_active.is_(True),
+                    TeamMembership.start_date <= end_date,
+                    or_(TeamMembership.end_date.is_(None), TeamMembership.end_date >= start_date),
+                )
+            ))
+        result = await self.session.execute(
+            select(Employee.id, Employee.qualification_level, Employee.weekly_hours)
+            .where(and_(*conditions))
+            .order_by(Employee.id)
+        )
+        employees = result.all()
+
+        result = await self.session.execute(
+            select(
+                ProjectAssignment.employee_id,
+                ProjectAssignment.start_date,
+                ProjectAssignment.end_date,
+                ProjectAssignment.allocated_hours_per_day,
+            ).where(
+                ProjectAssignment.project_id == project_id,
+                ProjectAssignment.is_active.is_(True),
+                ProjectAssignment.start_date <= end_date,
+                or_(ProjectAssignment.end_date.is_(None), ProjectAssignment.end_date >= start_date),
+            )
+        )
+        assignment_masks: Dict[int, int] = {}
+        assignment_hours: Dict[int, Decimal] = {}
+        for employee_id, first, last, allocated in result.all():
+            assignment_masks[employee_id] = (
+                assignment_masks.get(employee_id, 0) | day_mask(first, last)
+            )
+            if allocated:
+                assignment_hours[employee_id] = Decimal(allocated)
+
+        busy: Dict[int, int] = {}
+        week_hours: Dict[int, List[Decimal]] = {}
+        coverage = {level: [0] * days for level in levels}
+        covered = set()
+        result = await self.session.execute(
+            select(
+                Schedule.employee_id,
+                Schedule.project_id,
+                Schedule.date,
+                Schedule.start_time,
+                Schedule.end_time,
+                Employee.qualification_level,
+            )
+            .join(Employee, Employee.id == Schedule.employee_id)
+            .where(
+                Schedule.date >= week_start,
+                Schedule.date <= week_end,
+                Employee.qualification_level.in_(levels),
+            )
+        )
+        week_origin = week_start.toordinal()
+        for employee_id, schedule_project, day, start_time, end_time, level in result.all():
+            hours = hours_between(start_time, end_time) or hours_per_day
+            used = week_hours.setdefault(employee_id, [Decimal(0)] * weeks)
+            used[(day.toordinal() - week_origin) // 7] += hours
+            if start_date <= day <= end_date:
+                offset = day.toordinal() - origin
+                busy[employee_id] = busy.get(employee_id, 0) | (1 << offset)
+                if schedule_project == project_id and (employee_id, offset) not in covered:
+                    covered.add((employee_id, offset))
+                    coverage[level][offset] += 1
+
+        result = await self.session.execute(
+            select(Vacation.employee_id, Vacation.start_date, Vacation.end_date)
+            .join(Employee, Employee.id == Vacation.employee_id)
+            .where(
+                Vacation.status == VacationStatus.APPROVED,
+                Vacation.start_date <= end_date,
+                Vacation.end_date >= start_date,
+                Employee.qualification_level.in_(levels),
+            )
+        )
+        for employee_id, first, last in result.all():
+            busy[employee_id] = busy.get(employee_id, 0) | day_mask(first, last)
+
+        candidates = []
+        for employee_id, level, weekly_hours in employees:
+            assigned = employee_id in assignment_masks
+            if assigned_only and not assigned:
+                continue
+            free = working_mask & ~busy.get(employee_id, 0)
+            if assigned_only:
+                free &= assignment_masks[employee_id]
+            if not free:
+                continue
+            hours = assignment_hours.get(employee_id, hours_per_day)
+            used = week_hours.get(employee_id, [Decimal(0)] * weeks)
+            candidates.append(PlannerCandidate(
+                employee_id=employee_id,
+                level=level,
+                hours=hours,
+                free=free,
+                week_days_left=[
+                    max(0, int((Decimal(weekly_hours) - spent) // hours)) for spent in used
+                ],
+                preferred=assigned,
+            ))
+        return candidates, coverage
+
+    async def _resolve_status_code(self, status_code: Optional[str]) -> Optional[int]:
+        if status_code is None:
+            return None
+        result = await self.session.execute(
+            select(StatusCode.id).where(StatusCode.code == status_code)
+        )
+        status_code_id = result.scalar_one_or_none()
+        if status_code_id is None:
+            raise ValidationError(
+                message=f"Código de estado desconocido: {status_code}",
+                field="status_code",
+                value=status_code,
+            )
+        return status_code_id
+
+    async def plan_project(
+        self,
+        project_id: int,
+        requirements: Mapping[str, int],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        team_id: Optional[int] = None,
+        assigned_only: bool = False,
+        working_days: Sequence[int] = DEFAULT_WORKING_DAYS,
+        hours_per_day: Decimal = Decimal("8"),
+        day_start: dt_time = dt_time(8),
+        status_code: Optional[str] = None,
+        dry_run: bool = False,
+        commit: bool = True
+    ) -> AutoPlanResult:
+        """
+        Planifica automáticamente la dotación de un proyecto.
+
+        Los horarios ya existentes del proyecto cuentan como cobertura: solo
+        se planifica la diferencia hasta la dotación requerida.
+
+        Args:
+            project_id: ID del proyecto.
+            requirements: Personas requeridas por día y nivel de cualificación.
+            start_date: Primer día (por defecto el inicio del proyecto).
+            end_date: Último día (por defecto el fin del proyecto).
+            team_id: Limita los candidatos a los miembros activos del equipo;
+                se registra en los horarios creados.
+            assigned_only: Limita los candidatos a los asignados al proyecto,
+                dentro de las fechas de su asignación.
+            working_days: Días de la semana planificables (0 = lunes).
+            hours_per_day: Horas por día de los empleados sin
+                ``allocated_hours_per_day`` en su asignación.
+            day_start: Hora de inicio de los horarios creados.
+            status_code: Código de estado de los horarios creados.
+            dry_run: Calcula la planificación sin escribirla.
+            commit: Confirma la transacción tras la inserción.
+
+        Returns:
+            AutoPlanResult con las asignaciones y los déficits.
+
+        Raises:
+            NotFoundError: Si el proyecto no existe.
+            ValidationError: Si la ventana, la dotación o el código de estado
+                no son válidos.
+            ScheduleRepositoryError: Si falla la consulta o la escritura; la
+                inserción se revierte completa.
+        """
+        start = time.perf_counter()
+        requirements = {level: count for level, count in requirements.items() if count > 0}
+        if not requirements:
+            raise ValidationError(
+                message="Se requiere al menos un nivel de cualificación con dotación positiva",
+                field="requirements",
+                value=dict(requirements),
+            )
+
+        try:
+            result = await self.session.execute(
+                select(Project.start_date, Project.end_date).where(Project.id == project_id)
+            )
+            project = result.one_or_none()
+            if project is None:
+                raise NotFoundError(
+                    message=f"Proyecto con ID {project_id} no encontrado",
+                    resource_type="Project",
+                    resource_id=project_id,
+                )
+            start_date = start_date or project.start_date
+            end_date = end_date or project.end_date
+            if start_date is None or end_date is None or start_date > end_date:
+                raise ValidationError(
+                    message="La ventana de planificación no es válida",
+                    field="start_date",
+                    value=f"{start_date} - {end_date}",
+                )
+
+            days = (end_date - start_date).days + 1
+            week_start = start_date - timedelta(days=start_date.weekday())
+            week_end = end_date + timedelta(days=6 - end_date.weekday())
+            week_origin = week_start.toordinal()
+            week_of_day = [(start_date.toordinal() + d - week_origin) // 7 for d in range(days)]
+            working = set(working_days)
+            working_mask = sum(
+                1 << d for d in range(days)
+                if (start_date + timedelta(days=d)).weekday() in working
+            )
+
+            candidates, coverage = await self._load_candidates(
+                project_id, list(requirements), start_date, end_date, week_start, week_end,
+                working_mask, Decimal(hours_per_day), team_id, assigned_only,
+            )
+            status_code_id = await self._resolve_status_code(status_code)
+
+            demand = {
+                level: [
+                    max(0, count - coverage[level][d]) if (working_mask >> d) & 1 else 0
+                    for d in range(days)
+                ]
+                for level, count in requirements.items()
+            }
+            solver = AutoPlanSolver(days, week_of_day, candidates)
+            shortages = solver.solve(demand)
+
+            plan = AutoPlanResult(
+                project_id=project_id,
+                start_date=start_date,
+                end_date=end_date,
+                required_days=sum(
+                    count * working_mask.bit_count() for count in requirements.values()
+                ),
+                existing_days=sum(
+                    min(count, coverage[level][d])
+                    for level, count in requirements.items()
+                    for d in range(days) if (working_mask >> d) & 1
+                ),
+                candidates=len(candidates),
+                local_search_moves=solver.moves,
+            )
+            for level, level_shortage in shortages.items():
+                for d, missing in enumerate(level_shortage):
+                    if missing:
+                        plan.shortages[(level, start_date + timedelta(days=d))] = missing
+
+            rows = []
+            for candidate in candidates:
+                end_time = (
+                    datetime.combine(start_date, day_start)
+                    + timedelta(minutes=int(candidate.hours * 60))
+                ).time()
+                planned = candidate.planned
+                while planned:
+                    d = (planned & -planned).bit_length() - 1
+                    planned &= planned - 1
+                    day = start_date + timedelta(days=d)
+                    plan.assignments.append((candidate.employee_id, day))
+                    rows.append({
+                        "employee_id": candidate.employee_id,
+                        "project_id": project_id,
+                        "team_id": team_id,
+                        "status_code_id": status_code_id,
+                        "date": day,
+                        "start_time": day_start,
+                        "end_time": end_time,
+                        "is_confirmed": False,
+                    })
+            plan.assignments.sort(key=lambda item: (item[1], item[0]))
+
+            if not dry_run and rows:
+                for offset in range(0, len(rows), _INSERT_BATCH):
+                    await self.session.execute(
+                        insert(Schedule), rows[offset:offset + _INSERT_BATCH]
+                    )
+                await WorkloadSyncModule(self.session).sync_tracked(self._schedule_changes, commit=False)
+                if commit:
+                    await self.session.commit()
+                plan.schedules_created = len(rows)
+
+        except (NotFoundError, ValidationError):
+            raise
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            self._logger.error("Error en la planificación automática: {}", e)
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="plan_project",
+                entity_type=self.model_class.__name__
+            )
+        except Exception as e:
+            await self.session.rollback()
+            self._logger.error("Error inesperado en la planificación automática: {}", e)
+            raise ScheduleRepositoryError(
+                message=f"Error inesperado en la planificación automática: {e}",
+                operation="plan_project",
+                original_error=e
+            )
+
+        plan.elapsed_seconds = time.perf_counter() - start
+        self._logger.info(
+            "Proyecto {} planificado {} - {}: {} días-persona asignados, {} sin cubrir, "
+            "{} intercambios, {:.2f}s",
+            project_id,
+            start_date,
+            end_date,
+            len(plan.assignments),
+            sum(plan.shortages.values()),
+            plan.local_search_moves,
+            plan.elapsed_seconds,
+        )
+        return plan
@@ -6,6 +6,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from planificador.models.schedule import Schedule
 from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.workload.modules.sync_module import (
+    ScheduleChangeTracker,
+    WorkloadSyncModule,
+)
 from planificador.repositories.schedule.interfaces.crud_interface import IScheduleCrudOperations
 from planificador.exceptions.repository import ScheduleRepositoryError
 
@@ -15,7 +19,9 @@ class ScheduleCrudModule(BaseRepository[Schedule], IScheduleCrudOperations):
     Módulo para operaciones CRUD del repositorio Schedule.
     
     Implementa las operaciones de creación, actualización y eliminación
-    de registros de horarios en la base de datos.
+    de registros de horarios en la base de datos. Cada escritura recalcula
+    en la misma transacción las cargas de trabajo de los pares (empleado,
+    fecha) afectados.
     """
 
     def __init__(self, session: AsyncSession):
@@ -27,6 +33,8 @@ class ScheduleCrudModule(BaseRepository[Schedule], IScheduleCrudOperations):
         """
         super().__init__(session, Schedule)
         self._logger = self._logger.bind(component="ScheduleCrudModule")
+        # Pares (empleado, fecha) modificados, para recalcular sus cargas de trabajo
+        self._schedule_changes = ScheduleChangeTracker.for_session(session)
         self._logger.debug("ScheduleCrudModule inicializado")
 
     async def create_schedule(
@@ -60,7 +68,9 @@ class ScheduleCrudModule(BaseRepository[Schedule], IScheduleCrudOperations):
             'date': schedule_date
         })
         
-        return await self.create(schedule_data_copy)
+        schedule = await self.create(schedule_data_copy)
+        await self._sync_workloads()
+        return schedule
 
     async def update_schedule(
         self,
@@ -91,6 +101,7 @@ class ScheduleCrudModule(BaseRepository[Schedule], IScheduleCrudOperations):
                 entity_id=schedule_id
             )
         
+        await self._sync_workloads()
         return updated_schedule
 
     async def delete_schedule(self, schedule_id: int) -> bool:
@@ -108,7 +119,14 @@ class ScheduleCrudModule(BaseRepository[Schedule], IScheduleCrudOperations):
         """
         self._logger.debug(f"Eliminando horario con ID {schedule_id}")
         
-        return await self.delete(schedule_id)
+        deleted = await self.delete(schedule_id)
+        if deleted:
+            await self._sync_workloads()
+        return deleted
+
+    async def _sync_workloads(self) -> None:
+        """Recalcula las cargas de trabajo de los horarios modificados, sin confirmar."""
+        await WorkloadSyncModule(self.session).sync_tracked(self._schedule_changes, commit=False)
 
     async def get_by_unique_field(self, field_name: str, value: Any) -> Optional[Schedule]:
         """
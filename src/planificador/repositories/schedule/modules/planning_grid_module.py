@@ -0,0 +1,319 @@
+# src/planificador/repositories/schedule/modules/planning_grid_module.py
+
+"""
+Módulo de la cuadrícula de planificación en formato columnar.
+
+Construye el tablero de planificación (una línea por empleado y proyecto,
+una columna por día) como un ``PlanningGridResponse`` compacto en lugar de
+un objeto pydantic por celda: los códigos de estado se codifican en
+diccionario, los días consecutivos con el mismo código en rachas y las
+fechas como huecos relativos. El trimestre completo de un centro ocupa así
+unos pocos kilobytes.
+
+Principios de Diseño:
+    - Directo desde SQL: se proyectan solo las columnas necesarias y las
+      filas se codifican a medida que llegan del cursor, sin instanciar
+      modelos ORM
+    - Un único recorrido: las filas llegan ordenadas por línea y fecha, de
+      modo que cada racha se cierra en cuanto cambia el código o el día
+
+Uso:
+    ```python
+    grid_module = SchedulePlanningGridModule(session)
+    grid = await grid_module.get_planning_grid(date(2024, 1, 1), date(2024, 3, 31))
+    payload = grid.model_dump_json()
+    for employee_id, project_id, day, code in decode_planning_grid(grid):
+        ...
+    ```
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.models.schedule import Schedule
+from planificador.models.status_code import StatusCode
+from planificador.repositories.base_repository import BaseRepository
+from planificador.schemas.response import PlanningGridResponse
+from planificador.exceptions import ValidationError
+from planificador.exceptions.repository import (
+    ScheduleRepositoryError,
+    convert_sqlalchemy_error
+)
+
+_LineKey = Tuple[int, Optional[int]]
+
+
+class PlanningGridEncoder:
+    """
+    Codificador incremental de la cuadrícula de planificación.
+
+    Las celdas deben añadirse agrupadas por línea (empleado, proyecto) y en
+    orden de fecha dentro de cada línea. Si una línea tiene más de un
+    horario el mismo día se conserva el primero.
+
+    Attributes:
+        start_date: Primer día de la cuadrícula.
+        end_date: Último día de la cuadrícula.
+        collisions: Celdas descartadas por repetir día en la misma línea.
+    """
+
+    def __init__(self, start_date: date, end_date: date):
+        """
+        Inicializa el codificador.
+
+        Args:
+            start_date: Primer día de la cuadrícula.
+            end_date: Último día de la cuadrícula.
+        """
+        self.start_date = start_date
+        self.end_date = end_date
+        self.collisions = 0
+        self._origin = start_date.toordinal()
+        self._code_index: Dict[Optional[str], int] = {}
+        self._grid = PlanningGridResponse(start_date=start_date, end_date=end_date)
+        self._line: Optional[_LineKey] = None
+        self._runs: List[int] = []
+        # Racha abierta: (primer ordinal, último ordinal, índice de código)
+        self._run: Optional[List[int]] = None
+        self._last_end = self._origin - 1
+
+    def _code(self, code: Optional[str], color: Optional[str]) -> int:
+        """Índice del código en el diccionario, añadiéndolo si es nuevo."""
+        index = self._code_index.get(code)
+        if index is None:
+            index = self._code_index[code] = len(self._grid.codes)
+            self._grid.codes.append(code)
+            self._grid.code_colors.append(color)
+        return index
+
+    def _close_run(self) -> None:
+        """Cierra la racha abierta y la añade a la línea actual."""
+        if self._run is None:
+            return
+        first, last, code = self._run
+        self._runs.extend((first - self._last_end - 1, last - first + 1, code))
+        self._grid.cells += last - first + 1
+        self._last_end = last
+        self._run = None
+
+    def _open_line(
+        self,
+        key: _LineKey,
+        employee_name: str,
+        project_reference: Optional[str]
+    ) -> None:
+        """Cierra la línea actual y empieza una nueva."""
+        self._close_run()
+        self._runs = []
+        self._last_end = self._origin - 1
+        self._line = key
+        self._grid.employee_ids.append(key[0])
+        self._grid.employee_names.append(employee_name)
+        self._grid.project_ids.append(key[1])
+        self._grid.project_references.append(project_reference)
+        self._grid.runs.append(self._runs)
+
+    def add(
+        self,
+        employee_id: int,
+        employee_name: str,
+        project_id: Optional[int],
+        project_reference: Optional[str],
+        day: date,
+        code: Optional[str],
+        color: Optional[str] = None
+    ) -> None:
+        """
+        Añade una celda a la cuadrícula.
+
+        Args:
+            employee_id: ID del empleado.
+            employee_name: Nombre del empleado.
+            project_id: ID del proyecto (None si el horario no tiene proyecto).
+            project_reference: Referencia del proyecto.
+            day: Fecha de la celda.
+            code: Código de estado (None si el horario no tiene código).
+            color: Color del código de estado.
+        """
+        key = (employee_id, project_id)
+        if key != self._line:
+            self._open_line(key, employee_name, project_reference)
+
+        ordinal = day.toordinal()
+        index = self._code(code, color)
+        run = self._run
+        if run is not None:
+            if ordinal <= run[1]:
+                self.collisions += 1
+                return
+            if ordinal == run[1] + 1 and index == run[2]:
+                run[1] = ordinal
+                return
+            self._close_run()
+        self._run = [ordinal, ordinal, index]
+
+    def build(self) -> PlanningGridResponse:
+        """
+        Cierra la última racha y devuelve la cuadrícula.
+
+        Returns:
+            Cuadrícula codificada.
+        """
+        self._close_run()
+        return self._grid
+
+
+def decode_planning_grid(
+    grid: PlanningGridResponse
+) -> Iterator[Tuple[int, Optional[int], date, Optional[str]]]:
+    """
+    Expande una cuadrícula columnar en celdas individuales.
+
+    Args:
+        grid: Cuadrícula codificada.
+
+    Yields:
+        Tuplas (employee_id, project_id, fecha, código) por día planificado.
+    """
+    one_day = timedelta(days=1)
+    for line, runs in enumerate(grid.runs):
+        employee_id = grid.employee_ids[line]
+        project_id = grid.project_ids[line]
+        day = grid.start_date
+        for offset in range(0, len(runs), 3):
+            gap, length, code_index = runs[offset:offset + 3]
+            day += timedelta(days=gap)
+            code = grid.codes[code_index]
+            for _ in range(length):
+                yield employee_id, project_id, day, code
+                day += one_day
+
+
+class SchedulePlanningGridModule(BaseRepository[Schedule]):
+    """
+    Módulo para la cuadrícula de planificación columnar.
+
+    Attributes:
+        session: Sesión de base de datos asíncrona
+        model_class: Clase del modelo Schedule
+        _logger: Logger estructurado con contexto del módulo
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el módulo de la cuadrícula.
+
+        Args:
+            session: Sesión de base de datos asíncrona
+        """
+        super().__init__(session, Schedule)
+        self._logger = self._logger.bind(component="SchedulePlanningGridModule")
+
+    async def get_by_unique_field(self, field_name: str, value: Any) -> Optional[Schedule]:
+        """Los horarios no tienen campos únicos además del ID."""
+        return None
+
+    async def get_planning_grid(
+        self,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[Sequence[int]] = None,
+        project_ids: Optional[Sequence[int]] = None,
+        batch_size: int = 2000
+    ) -> PlanningGridResponse:
+        """
+        Obtiene la cuadrícula de planificación de un periodo en formato columnar.
+
+        Las líneas se ordenan por nombre de empleado y, dentro de cada
+        empleado, por proyecto.
+
+        Args:
+            start_date: Primer día del periodo (incluido).
+            end_date: Último día del periodo (incluido).
+            employee_ids: Limita la cuadrícula a estos empleados.
+            project_ids: Limita la cuadrícula a estos proyectos.
+            batch_size: Filas leídas del cursor por lote.
+
+        Returns:
+            Cuadrícula codificada.
+
+        Raises:
+            ValidationError: Si el rango de fechas no es válido.
+            ScheduleRepositoryError: Si falla la consulta.
+        """
+        if start_date > end_date:
+            raise ValidationError(
+                message="La fecha de inicio debe ser anterior o igual a la fecha de fin",
+                field="start_date",
+                value=str(start_date),
+            )
+
+        conditions = [Schedule.date >= start_date, Schedule.date <= end_date]
+        if employee_ids is not None:
+            conditions.append(Schedule.employee_id.in_(employee_ids))
+        if project_ids is not None:
+            conditions.append(Schedule.project_id.in_(project_ids))
+
+        stmt = (
+            select(
+                Schedule.employee_id,
+                Employee.full_name,
+                Schedule.project_id,
+                Project.reference,
+                Schedule.date,
+                StatusCode.code,
+                StatusCode.color,
+            )
+            .join(Employee, Employee.id == Schedule.employee_id)
+            .outerjoin(Project, Project.id == Schedule.project_id)
+            .outerjoin(StatusCode, StatusCode.id == Schedule.status_code_id)
+            .where(and_(*conditions))
+            .order_by(
+                Employee.full_name,
+                Schedule.employee_id,
+                Schedule.project_id,
+                Schedule.date,
+                Schedule.id,
+            )
+            .execution_options(yield_per=batch_size)
+        )
+
+        encoder = PlanningGridEncoder(start_date, end_date)
+        try:
+            result = await self.session.stream(stmt)
+            async for partition in result.partitions():
+                for row in partition:
+                    encoder.add(*row)
+        except SQLAlchemyError as e:
+            self._logger.error("Error obteniendo la cuadrícula de planificación: {}", e)
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="get_planning_grid",
+                entity_type=self.model_class.__name__
+            )
+        except Exception as e:
+            self._logger.error("Error inesperado obteniendo la cuadrícula de planificación: {}", e)
+            raise ScheduleRepositoryError(
+                message=f"Error inesperado obteniendo la cuadrícula de planificación: {e}",
+                operation="get_planning_grid",
+                original_error=e
+            )
+
+        grid = encoder.build()
+        self._logger.debug(
+            "Cuadrícula de planificación {} - {}: {} líneas, {} celdas, {} códigos "
+            "({} celdas repetidas descartadas)",
+            start_date,
+            end_date,
+            len(grid.runs),
+            grid.cells,
+            len(grid.codes),
+            encoder.collisions,
+        )
+        return grid
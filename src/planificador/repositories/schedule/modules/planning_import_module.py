@@ -0,0 +1,436 @@
+# src/planificador/repositories/schedule/modules/planning_import_module.py
+
+"""
+Módulo de importación masiva de la hoja de planificación Excel.
+
+Importa la cuadrícula heredada "Planning" (una fila por línea de proyecto,
+columnas de personal marcadas con 1 y una columna por día con el código de
+la intervención) como registros ``Schedule``.
+
+Principios de Diseño:
+    - Streaming: el libro se recorre fila a fila en modo solo lectura
+    - Lookups precargados: empleados, proyectos y códigos de estado se
+      resuelven con diccionarios cargados en una consulta cada uno
+    - Upsert por lotes: inserciones y actualizaciones en bloque dentro de
+      una única transacción
+
+Uso:
+    ```python
+    import_module = SchedulePlanningImportModule(session)
+    report = await import_module.import_planning_sheet("planning.xlsx")
+    report.schedules_created, report.rows_per_second
+    ```
+"""
+
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from sqlalchemy import and_, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.models.schedule import Schedule
+from planificador.models.status_code import StatusCode
+from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.workload.modules.sync_module import (
+    ScheduleChangeTracker,
+    WorkloadSyncModule,
+)
+from planificador.repositories.search.search_index import normalize_text
+from planificador.exceptions.infrastructure import FileSystemError
+from planificador.exceptions.repository import (
+    ScheduleRepositoryError,
+    convert_sqlalchemy_error
+)
+from planificador.utils.xlsx_reader import (
+    XlsxCell,
+    XlsxReader,
+    column_index,
+    excel_serial_to_date,
+)
+
+
+# Códigos numéricos de la leyenda de la hoja -> código de StatusCode
+DEFAULT_VALUE_CODES: Dict[int, str] = {
+    1000: "VAL",  # validado sobre una intervención
+    1001: "VOY",  # día de viaje sobre una intervención
+    1002: "ARR",  # corte/parada de la unidad
+}
+
+# Código para los valores 1-999 (número de previsiones sobre el día)
+DEFAULT_FORECAST_CODE = "PRE"
+
+_ScheduleKey = Tuple[int, Optional[int], date]
+
+
+@dataclass
+class PlanningSheetLayout:
+    """
+    Disposición de la hoja de planificación.
+
+    Attributes:
+        sheet_name: Nombre de la hoja.
+        names_row: Fila con los nombres del personal.
+        dates_row: Fila con las fechas (serie Excel) de cada día.
+        first_data_row: Primera fila de líneas de proyecto.
+        reference_column: Columna con la referencia del proyecto.
+        trigram_column: Columna con el trigrama del proyecto.
+        first_employee_column: Primera columna de personal.
+        last_employee_column: Última columna de personal.
+        first_date_column: Primera columna de días.
+    """
+    sheet_name: str = "Planning"
+    names_row: int = 2
+    dates_row: int = 4
+    first_data_row: int = 5
+    reference_column: str = "A"
+    trigram_column: str = "B"
+    first_employee_column: str = "M"
+    last_employee_column: str = "AI"
+    first_date_column: str = "AM"
+
+
+@dataclass
+class PlanningImportReport:
+    """
+    Resultado de una importación.
+
+    Attributes:
+        rows_read: Líneas de proyecto procesadas.
+        cells_read: Celdas de día con código procesadas.
+        schedules_created: Registros Schedule insertados.
+        schedules_updated: Registros Schedule actualizados.
+        unknown_employees: Nombres de la hoja sin empleado asociado.
+        unknown_projects: Referencias sin proyecto asociado.
+        unknown_codes: Valores de celda sin StatusCode asociado y su frecuencia.
+        elapsed_seconds: Duración de la importación.
+    """
+    rows_read: int = 0
+    cells_read: int = 0
+    schedules_created: int = 0
+    schedules_updated: int = 0
+    unknown_employees: Set[str] = field(default_factory=set)
+    unknown_projects: Set[str] = field(default_factory=set)
+    unknown_codes: Counter = field(default_factory=Counter)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Líneas de proyecto procesadas por segundo."""
+        return self.rows_read / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def _name_key(name: Any) -> str:
+    """Clave de búsqueda de un nombre: normalizado y con espacios simples."""
+    return " ".join(normalize_text(str(name)).split()) if name else ""
+
+
+class SchedulePlanningImportModule(BaseRepository[Schedule]):
+    """
+    Módulo para la importación masiva de la hoja de planificación.
+
+    Attributes:
+        session: Sesión de base de datos asíncrona
+        model_class: Clase del modelo Schedule
+        _logger: Logger estructurado con contexto del módulo
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el módulo de importación.
+
+        Args:
+            session: Sesión de base de datos asíncrona
+        """
+        super().__init__(session, Schedule)
+        self._logger = self._logger.bind(component="SchedulePlanningImportModule")
+        # Pares (empleado, fecha) modificados, para recalcular sus cargas de trabajo
+        self._schedule_changes = ScheduleChangeTracker.for_session(session)
+
+    async def get_by_unique_field(self, field_name: str, value: Any) -> Optional[Schedule]:
+        """Los horarios no tienen campos únicos además del ID."""
+        return None
+
+    async def _load_lookups(
+        self
+    ) -> Tuple[Dict[str, int], Dict[str, int], Dict[str, int]]:
+        """
+        Precarga los diccionarios de empleados, proyectos y códigos de estado.
+
+        Los empleados se indexan por ``full_name`` y por "apellido nombre" y
+        "nombre apellido"; los proyectos por referencia y por trigrama.
+
+        Returns:
+            Tupla (empleados, proyectos, códigos de estado).
+        """
+        employees: Dict[str, int] = {}
+        result = await self.session.execute(
+            select(Employee.id, Employee.full_name, Employee.first_name, Employee.last_name)
+        )
+        for employee_id, full_name, first_name, last_name in result.all():
+            for variant in (full_name, f"{last_name} {first_name}", f"{first_name} {last_name}"):
+                employees.setdefault(_name_key(variant), employee_id)
+
+        projects: Dict[str, int] = {}
+        result = await self.session.execute(select(Project.id, Project.reference, Project.trigram))
+        for project_id, reference, trigram in result.all():
+            projects[_name_key(reference)] = project_id
+            projects.setdefault(_name_key(trigram), project_id)
+
+        result = await self.session.execute(select(StatusCode.id, StatusCode.code))
+        status_codes = {code.upper(): status_id for status_id, code in result.all()}
+
+        return employees, projects, status_codes
+
+    @staticmethod
+    def _resolve_code(
+        cell: XlsxCell,
+        value_codes: Dict[int, str],
+        colour_codes: Dict[str, str],
+        forecast_code: Optional[str],
+    ) -> Optional[str]:
+        """
+        Traduce una celda de día a un código de StatusCode.
+
+        Returns:
+            Código, cadena vacía si la celda indica disponibilidad (0) o
+            None si la celda no tiene contenido reconocible.
+        """
+        value = cell.value
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            number = int(value)
+            if number == 0:
+                return ""
+            if number in value_codes:
+                return value_codes[number]
+            if 0 < number < 1000 and forecast_code:
+                return forecast_code
+            return str(number)
+        if isinstance(value, str) and value.strip():
+            return value.strip().upper()
+        if cell.fill and cell.fill.upper() in colour_codes:
+            return colour_codes[cell.fill.upper()]
+        return None
+
+    async def _flush(
+        self,
+        pending: Dict[_ScheduleKey, Optional[int]],
+        report: PlanningImportReport
+    ) -> None:
+        """
+        Inserta o actualiza en bloque los horarios pendientes.
+
+        Args:
+            pending: Diccionario (empleado, proyecto, fecha) -> status_code_id.
+            report: Reporte a actualizar.
+        """
+        if not pending:
+            return
+
+        employee_ids = {key[0] for key in pending}
+        dates = [key[2] for key in pending]
+        existing_stmt = select(
+            Schedule.id, Schedule.employee_id, Schedule.project_id, Schedule.date
+        ).where(
+            and_(
+                Schedule.employee_id.in_(employee_ids),
+                Schedule.date.between(min(dates), max(dates))
+            )
+        )
+        result = await self.session.execute(existing_stmt)
+        existing = {
+            (employee_id, project_id, schedule_date): schedule_id
+            for schedule_id, employee_id, project_id, schedule_date in result.all()
+        }
+
+        to_insert: List[Dict[str, Any]] = []
+        to_update: List[Dict[str, Any]] = []
+        for (employee_id, project_id, schedule_date), status_code_id in pending.items():
+            schedule_id = existing.get((employee_id, project_id, schedule_date))
+            if schedule_id is None:
+                to_insert.append({
+                    "employee_id": employee_id,
+                    "project_id": project_id,
+                    "date": schedule_date,
+                    "status_code_id": status_code_id,
+                    "is_confirmed": False,
+                })
+            else:
+                to_update.append({"id": schedule_id, "status_code_id": status_code_id})
+
+        if to_insert:
+            await self.session.execute(insert(Schedule), to_insert)
+        if to_update:
+            await self.session.execute(update(Schedule), to_update)
+
+        report.schedules_created += len(to_insert)
+        report.schedules_updated += len(to_update)
+        pending.clear()
+
+    async def import_planning_sheet(
+        self,
+        path: Union[str, Path],
+        layout: Optional[PlanningSheetLayout] = None,
+        value_codes: Optional[Dict[int, str]] = None,
+        colour_codes: Optional[Dict[str, str]] = None,
+        forecast_code: Optional[str] = DEFAULT_FORECAST_CODE,
+        batch_size: int = 500,
+        commit: bool = True
+    ) -> PlanningImportReport:
+        """
+        Importa la hoja de planificación como registros Schedule.
+
+        Cada celda de día con código genera (o actualiza) un horario por cada
+        empleado marcado en la línea de proyecto. Los nombres, referencias y
+        códigos desconocidos no interrumpen la importación: se omiten y se
+        listan en el reporte.
+
+        Args:
+            path: Ruta del libro .xlsx.
+            layout: Disposición de la hoja (por defecto la de la hoja heredada).
+            value_codes: Valores numéricos de celda -> código de StatusCode.
+            colour_codes: Colores de relleno ARGB -> código de StatusCode, para
+                celdas sin valor.
+            forecast_code: Código para los valores 1-999 (None para ignorarlos).
+            batch_size: Horarios acumulados antes de cada escritura en bloque.
+            commit: Confirma la transacción al terminar.
+
+        Returns:
+            PlanningImportReport: Resumen de la importación.
+
+        Raises:
+            FileSystemError: Si el libro no se puede leer.
+            ScheduleRepositoryError: Si falla la escritura; la transacción se
+                revierte completa.
+        """
+        layout = layout or PlanningSheetLayout()
+        value_codes = DEFAULT_VALUE_CODES if value_codes is None else value_codes
+        colour_codes = {
+            colour.upper(): code for colour, code in (colour_codes or {}).items()
+        }
+        report = PlanningImportReport()
+        start = time.perf_counter()
+
+        first_employee = column_index(layout.first_employee_column)
+        last_employee = column_index(layout.last_employee_column)
+        first_date = column_index(layout.first_date_column)
+        employee_columns: Dict[str, Optional[int]] = {}
+        date_columns: Dict[str, date] = {}
+        pending: Dict[_ScheduleKey, Optional[int]] = {}
+
+        try:
+            employees, projects, status_codes = await self._load_lookups()
+
+            with XlsxReader(path) as reader:
+                for row_number, cells in reader.iter_rows(layout.sheet_name):
+                    if row_number == layout.names_row:
+                        for column, cell in cells.items():
+                            if first_employee <= column_index(column) <= last_employee and cell.value:
+                                employee_id = employees.get(_name_key(cell.value))
+                                employee_columns[column] = employee_id
+                                if employee_id is None:
+                                    report.unknown_employees.add(str(cell.value).strip())
+                        continue
+
+                    if row_number == layout.dates_row:
+                        date_columns = {
+                            column: excel_serial_to_date(cell.value)
+                            for column, cell in cells.items()
+                            if column_index(column) >= first_date
+                            and isinstance(cell.value, (int, float)) and cell.value > 0
+                        }
+                        continue
+
+                    if row_number < layout.first_data_row:
+                        continue
+
+                    reference_cell = cells.get(layout.reference_column)
+                    if reference_cell is None or not reference_cell.value:
+                        continue
+                    report.rows_read += 1
+
+                    reference = str(reference_cell.value).strip()
+                    trigram_cell = cells.get(layout.trigram_column)
+                    project_id = projects.get(_name_key(reference))
+                    if project_id is None and trigram_cell is not None:
+                        project_id = projects.get(_name_key(trigram_cell.value))
+                    if project_id is None:
+                        report.unknown_projects.add(reference)
+                        continue
+
+                    assigned = [
+                        employee_columns[column]
+                        for column, cell in cells.items()
+                        if employee_columns.get(column) is not None
+                        and isinstance(cell.value, (int, float)) and cell.value >= 1
+                    ]
+                    if not assigned:
+                        continue
+
+                    for column, schedule_date in date_columns.items():
+                        cell = cells.get(column)
+                        if cell is None:
+                            continue
+                        code = self._resolve_code(cell, value_codes, colour_codes, forecast_code)
+                        if not code:
+                            continue
+                        report.cells_read += 1
+                        status_code_id = status_codes.get(code)
+                        if status_code_id is None:
+                            report.unknown_codes[code] += 1
+                            continue
+                        for employee_id in assigned:
+                            pending[(employee_id, project_id, schedule_date)] = status_code_id
+
+                    if len(pending) >= batch_size:
+                        await self._flush(pending, report)
+
+            await self._flush(pending, report)
+            await WorkloadSyncModule(self.session).sync_tracked(self._schedule_changes, commit=False)
+            if commit:
+                await self.session.commit()
+
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            self._logger.error("Error importando la hoja de planificación: {}", e)
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="import_planning_sheet",
+                entity_type=self.model_class.__name__
+            )
+        except FileSystemError:
+            await self.session.rollback()
+            raise
+        except Exception as e:
+            await self.session.rollback()
+            self._logger.error("Error inesperado importando la hoja de planificación: {}", e)
+            raise ScheduleRepositoryError(
+                message=f"Error inesperado importando la hoja de planificación: {e}",
+                operation="import_planning_sheet",
+                original_error=e
+            )
+
+        report.elapsed_seconds = time.perf_counter() - start
+        self._logger.info(
+            "Hoja de planificación importada: {} líneas, {} creados, {} actualizados "
+            "en {:.2f}s ({:.0f} líneas/s)",
+            report.rows_read,
+            report.schedules_created,
+            report.schedules_updated,
+            report.elapsed_seconds,
+            report.rows_per_second,
+        )
+        if report.unknown_employees or report.unknown_projects or report.unknown_codes:
+            self._logger.warning(
+                "Elementos sin resolver: {} empleados, {} proyectos, códigos {}",
+                len(report.unknown_employees),
+                len(report.unknown_projects),
+                dict(report.unknown_codes),
+            )
+        return report
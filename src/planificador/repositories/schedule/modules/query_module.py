@@ -8,9 +8,17 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
+from planificador.models.employee import Employee
+from planificador.models.project import Project
 from planificador.models.schedule import Schedule
 from planificador.repositories.schedule.interfaces.query_interface import IScheduleQueryOperations
 from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.projections import (
+    SCHEDULE_SUMMARY,
+    defer_heavy_columns,
+    hours_between
+)
+from planificador.schemas.response import ScheduleListResponse
 from planificador.exceptions.repository import (
     ScheduleRepositoryError,
     convert_sqlalchemy_error
@@ -80,7 +88,7 @@ class ScheduleQueryModule(BaseRepository[Schedule], IScheduleQueryOperations):
             stmt = (
                 select(Schedule)
                 .options(
-                    selectinload(Schedule.project),
+                    selectinload(Schedule.project).options(*defer_heavy_columns(Project)),
                     selectinload(Schedule.team),
                     selectinload(Schedule.status_code)
                 )
@@ -148,8 +156,8 @@ class ScheduleQueryModule(BaseRepository[Schedule], IScheduleQueryOperations):
             stmt = (
                 select(Schedule)
                 .options(
-                    selectinload(Schedule.employee),
-                    selectinload(Schedule.project),
+                    selectinload(Schedule.employee).options(*defer_heavy_columns(Employee)),
+                    selectinload(Schedule.project).options(*defer_heavy_columns(Project)),
                     selectinload(Schedule.team),
                     selectinload(Schedule.status_code)
                 )
@@ -217,7 +225,7 @@ class ScheduleQueryModule(BaseRepository[Schedule], IScheduleQueryOperations):
             stmt = (
                 select(Schedule)
                 .options(
-                    selectinload(Schedule.employee),
+                    selectinload(Schedule.employee).options(*defer_heavy_columns(Employee)),
                     selectinload(Schedule.team),
                     selectinload(Schedule.status_code)
                 )
@@ -287,8 +295,8 @@ class ScheduleQueryModule(BaseRepository[Schedule], IScheduleQueryOperations):
             stmt = (
                 select(Schedule)
                 .options(
-                    selectinload(Schedule.employee),
-                    selectinload(Schedule.project),
+                    selectinload(Schedule.employee).options(*defer_heavy_columns(Employee)),
+                    selectinload(Schedule.project).options(*defer_heavy_columns(Project)),
                     selectinload(Schedule.status_code)
                 )
                 .where(Schedule.team_id == team_id)
@@ -357,8 +365,8 @@ class ScheduleQueryModule(BaseRepository[Schedule], IScheduleQueryOperations):
             stmt = (
                 select(Schedule)
                 .options(
-                    selectinload(Schedule.employee),
-                    selectinload(Schedule.project),
+                    selectinload(Schedule.employee).options(*defer_heavy_columns(Employee)),
+                    selectinload(Schedule.project).options(*defer_heavy_columns(Project)),
                     selectinload(Schedule.team),
                     selectinload(Schedule.status_code)
                 )
@@ -426,6 +434,70 @@ class ScheduleQueryModule(BaseRepository[Schedule], IScheduleQueryOperations):
         self._logger.debug(f"Buscando horarios con filtros: {filters}")
         return await self.find_by_criteria(filters, limit=limit, offset=offset)
 
+    async def list_schedule_summaries(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        employee_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[ScheduleListResponse]:
+        """
+        Obtiene el listado de horarios proyectando solo las columnas de la vista.
+        
+        Los nombres de empleado, proyecto, equipo y el código de estado se
+        obtienen por JOIN en la misma consulta, sin cargar entidades ni las
+        descripciones y notas de los horarios.
+        
+        Args:
+            start_date: Fecha de inicio del rango (opcional)
+            end_date: Fecha de fin del rango (opcional)
+            employee_id: ID del empleado (opcional)
+            project_id: ID del proyecto (opcional)
+            limit: Número máximo de resultados
+            offset: Número de resultados a omitir
+            
+        Returns:
+            List[ScheduleListResponse]: Horarios ordenados por fecha y empleado
+            
+        Raises:
+            ScheduleRepositoryError: Si ocurre un error durante la consulta
+        """
+        conditions = []
+        if start_date is not None:
+            conditions.append(Schedule.date >= start_date)
+        if end_date is not None:
+            conditions.append(Schedule.date <= end_date)
+        if employee_id is not None:
+            conditions.append(Schedule.employee_id == employee_id)
+        if project_id is not None:
+            conditions.append(Schedule.project_id == project_id)
+
+        try:
+            items = await SCHEDULE_SUMMARY.fetch(
+                self.session, *conditions, limit=limit, offset=offset
+            )
+            for item in items:
+                item.hours_worked = hours_between(item.start_time, item.end_time)
+            return items
+            
+        except SQLAlchemyError as e:
+            self._logger.error(f"Error de base de datos al listar horarios: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="list_schedule_summaries",
+                entity_type="Schedule",
+                entity_id=None
+            )
+        except Exception as e:
+            self._logger.error(f"Error inesperado al listar horarios: {e}")
+            raise ScheduleRepositoryError(
+                message=f"Error inesperado al listar horarios: {e}",
+                operation="list_schedule_summaries",
+                original_error=e
+            )
+
     async def get_by_unique_field(self, field_name: str, value: Any) -> Optional[Schedule]:
         """
         Obtiene un horario por un campo único específico.
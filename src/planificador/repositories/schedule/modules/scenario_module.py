@@ -0,0 +1,841 @@
+# src/planificador/repositories/schedule/modules/scenario_module.py
+
+"""
+Módulo de escenarios de planificación ("what-if").
+
+Permite probar dotaciones alternativas sin tocar las tablas: un
+``ScheduleSnapshot`` inmutable recoge el tablero real de una ventana
+(horarios, vacaciones aprobadas, asignaciones y jornada semanal) y cada
+``PlanningScenario`` guarda solo sus cambios sobre él. Las consultas de
+disponibilidad, conflictos y utilización leen primero los cambios del
+escenario y después la instantánea.
+
+Principios de Diseño:
+    - Copy-on-write: un escenario solo almacena las celdas (empleado, día)
+      y las asignaciones que modifica; ``fork`` copia ese diccionario de
+      cambios, nunca la instantánea, de modo que decenas de alternativas
+      cuestan memoria proporcional a sus cambios
+    - Sin base de datos: los cálculos sobre escenarios son síncronos y no
+      hacen consultas
+    - Confirmación atómica: ``commit_scenario`` aplica el diff del escenario
+      con borrados e inserciones en bloque en una sola transacción, tras
+      comprobar que las celdas modificadas no han cambiado desde la
+      instantánea
+
+Uso:
+    ```python
+    scenarios = ScheduleScenarioModule(session)
+    snapshot = await scenarios.load_snapshot(date(2024, 4, 1), date(2024, 6, 30))
+    base = PlanningScenario(snapshot, "base")
+    option_a = base.fork("opción A")
+    option_a.move(employee_id, day, other_employee_id)
+    option_a.conflicts(), option_a.utilization(other_employee_id)
+    await scenarios.commit_scenario(option_a)
+    ```
+"""
+
+from dataclasses import dataclass
+from datetime import date, time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, delete, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from planificador.models.employee import Employee
+from planificador.models.project_assignment import ProjectAssignment
+from planificador.models.schedule import Schedule
+from planificador.models.vacation import Vacation, VacationStatus
+from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.workload.modules.sync_module import (
+    ScheduleChangeTracker,
+    WorkloadSyncModule,
+)
+from planificador.repositories.projections import hours_between
+from planificador.exceptions import ConflictError, ValidationError
+from planificador.exceptions.repository import (
+    ScheduleRepositoryError,
+    convert_sqlalchemy_error
+)
+
+_Cell = Tuple[int, date]
+_Pair = Tuple[int, int]
+
+DEFAULT_WEEKLY_HOURS = 40
+
+
+@dataclass(frozen=True)
+class ScheduleEntry:
+    """
+    Horario de una celda del tablero.
+
+    Attributes:
+        project_id: Proyecto del horario.
+        status_code_id: Código de estado.
+        start_time: Hora de inicio.
+        end_time: Hora de fin.
+        team_id: Equipo del horario.
+        schedule_id: ID del registro real (None si lo crea un escenario).
+    """
+    project_id: Optional[int]
+    status_code_id: Optional[int] = None
+    start_time: Optional[time] = None
+    end_time: Optional[time] = None
+    team_id: Optional[int] = None
+    schedule_id: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class AssignmentEntry:
+    """
+    Asignación de un empleado a un proyecto.
+
+    Attributes:
+        start_date: Inicio de la asignación.
+        end_date: Fin de la asignación (None si es indefinida).
+        allocated_hours_per_day: Horas diarias asignadas.
+        assignment_id: ID del registro real (None si lo crea un escenario).
+    """
+    start_date: date
+    end_date: Optional[date] = None
+    allocated_hours_per_day: Optional[Decimal] = None
+    assignment_id: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class ScenarioChange:
+    """
+    Diferencia de una celda entre dos estados del tablero.
+
+    Attributes:
+        employee_id: Empleado de la celda.
+        date: Día de la celda.
+        before: Horarios antes del cambio.
+        after: Horarios después del cambio.
+    """
+    employee_id: int
+    date: date
+    before: Tuple[ScheduleEntry, ...]
+    after: Tuple[ScheduleEntry, ...]
+
+
+@dataclass
+class ScenarioCommitReport:
+    """
+    Resultado de confirmar un escenario.
+
+    Attributes:
+        schedules_created: Horarios insertados.
+        schedules_deleted: Horarios eliminados.
+        assignments_created: Asignaciones insertadas.
+        assignments_updated: Asignaciones modificadas o desactivadas.
+    """
+    schedules_created: int = 0
+    schedules_deleted: int = 0
+    assignments_created: int = 0
+    assignments_updated: int = 0
+
+
+@dataclass(frozen=True)
+class ScheduleSnapshot:
+    """
+    Instantánea inmutable del tablero real de una ventana.
+
+    Attributes:
+        start_date: Primer día de la ventana.
+        end_date: Último día de la ventana.
+        schedules: Horarios por celda (empleado, día).
+        vacations: Días de vacaciones aprobadas por empleado.
+        assignments: Asignaciones activas por (empleado, proyecto).
+        weekly_hours: Jornada semanal por empleado.
+        employee_ids: Empleados incluidos (None para todos).
+        default_hours: Horas de los horarios sin hora de inicio o fin.
+    """
+    start_date: date
+    end_date: date
+    schedules: Mapping[_Cell, Tuple[ScheduleEntry, ...]]
+    vacations: Mapping[int, frozenset]
+    assignments: Mapping[_Pair, AssignmentEntry]
+    weekly_hours: Mapping[int, int]
+    employee_ids: Optional[frozenset] = None
+    default_hours: Decimal = Decimal("8")
+
+    def contains(self, employee_id: int, day: date) -> bool:
+        """Indica si la celda está dentro de la instantánea."""
+        return (
+            self.start_date <= day <= self.end_date
+            and (self.employee_ids is None or employee_id in self.employee_ids)
+        )
+
+
+_MISSING = object()
+
+
+class PlanningScenario:
+    """
+    Escenario de planificación sobre una instantánea.
+
+    Attributes:
+        snapshot: Instantánea base.
+        name: Nombre del escenario.
+    """
+
+    def __init__(self, snapshot: ScheduleSnapshot, name: str = "scenario"):
+        """
+        Inicializa un escenario vacío (igual a la instantánea).
+
+        Args:
+            snapshot: Instantánea base.
+            name: Nombre del escenario.
+        """
+        self.snapshot = snapshot
+        self.name = name
+        self._schedules: Dict[_Cell, Tuple[ScheduleEntry, ...]] = {}
+        self._assignments: Dict[_Pair, Optional[AssignmentEntry]] = {}
+
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+
+    def entries(self, employee_id: int, day: date) -> Tuple[ScheduleEntry, ...]:
+        """Horarios de una celda en el escenario."""
+        key = (employee_id, day)
+        entries = self._schedules.get(key, _MISSING)
+        if entries is _MISSING:
+            return self.snapshot.schedules.get(key, ())
+        return entries
+
+    def assignment(self, employee_id: int, project_id: int) -> Optional[AssignmentEntry]:
+        """Asignación de un empleado a un proyecto en el escenario."""
+        key = (employee_id, project_id)
+        if key in self._assignments:
+            return self._assignments[key]
+        return self.snapshot.assignments.get(key)
+
+    def cells(self) -> Iterator[Tuple[_Cell, Tuple[ScheduleEntry, ...]]]:
+        """Recorre las celdas con horarios del escenario."""
+        for key, entries in self.snapshot.schedules.items():
+            if key not in self._schedules and entries:
+                yield key, entries
+        for key, entries in self._schedules.items():
+            if entries:
+                yield key, entries
+
+    @property
+    def changes(self) -> int:
+        """Celdas y asignaciones modificadas respecto a la instantánea."""
+        return len(self._schedules) + len(self._assignments)
+
+    # ------------------------------------------------------------------
+    # Modificación
+    # ------------------------------------------------------------------
+
+    def _check_cell(self, employee_id: int, day: date) -> None:
+        if not self.snapshot.contains(employee_id, day):
+            raise ValidationError(
+                message=f"La celda ({employee_id}, {day}) está fuera de la instantánea",
+                field="date",
+                value=str(day),
+            )
+
+    def _set(self, employee_id: int, day: date, entries: Tuple[ScheduleEntry, ...]) -> None:
+        key = (employee_id, day)
+        if self.snapshot.schedules.get(key, ()) == entries:
+            self._schedules.pop(key, None)
+        else:
+            self._schedules[key] = entries
+
+    def add(
+        self,
+        employee_id: int,
+        day: date,
+        project_id: Optional[int],
+        status_code_id: Optional[int] = None,
+        start_time: Optional[time] = None,
+        end_time: Optional[time] = None,
+        team_id: Optional[int] = None,
+    ) -> None:
+        """
+        Añade un horario a una celda.
+
+        Raises:
+            ValidationError: Si la celda está fuera de la instantánea.
+        """
+        self._check_cell(employee_id, day)
+        entry = ScheduleEntry(project_id, status_code_id, start_time, end_time, team_id)
+        self._set(employee_id, day, self.entries(employee_id, day) + (entry,))
+
+    def remove(self, employee_id: int, day: date, project_id: Any = _MISSING) -> int:
+        """
+        Elimina los horarios de una celda (solo los del proyecto, si se indica).
+
+        Returns:
+            Número de horarios eliminados.
+
+        Raises:
+            ValidationError: Si la celda está fuera de la instantánea.
+        """
+        self._check_cell(employee_id, day)
+        entries = self.entries(employee_id, day)
+        kept = tuple(
+            entry for entry in entries
+            if project_id is not _MISSING and entry.project_id != project_id
+        )
+        self._set(employee_id, day, kept)
+        return len(entries) - len(kept)
+
+    def move(
+        self,
+        employee_id: int,
+        day: date,
+        to_employee_id: int,
+        to_day: Optional[date] = None,
+        project_id: Any = _MISSING,
+    ) -> int:
+        """
+        Mueve los horarios de una celda a otro empleado y/o día.
+
+        Returns:
+            Número de horarios movidos.
+
+        Raises:
+            ValidationError: Si alguna celda está fuera de la instantánea.
+        """
+        to_day = to_day or day
+        self._check_cell(employee_id, day)
+        self._check_cell(to_employee_id, to_day)
+        moved = tuple(
+            ScheduleEntry(e.project_id, e.status_code_id, e.start_time, e.end_time, e.team_id)
+            for e in self.entries(employee_id, day)
+            if project_id is _MISSING or e.project_id == project_id
+        )
+        self.remove(employee_id, day, project_id)
+        self._set(to_employee_id, to_day, self.entries(to_employee_id, to_day) + moved)
+        return len(moved)
+
+    def assign(
+        self,
+        employee_id: int,
+        project_id: int,
+        start_date: date,
+        end_date: Optional[date] = None,
+        allocated_hours_per_day: Optional[Decimal] = None,
+    ) -> None:
+        """Crea o modifica la asignación de un empleado a un proyecto."""
+        current = self.snapshot.assignments.get((employee_id, project_id))
+        entry = AssignmentEntry(
+            start_date, end_date, allocated_hours_per_day,
+            current.assignment_id if current else None,
+        )
+        if entry == current:
+            self._assignments.pop((employee_id, project_id), None)
+        else:
+            self._assignments[(employee_id, project_id)] = entry
+
+    def unassign(self, employee_id: int, project_id: int) -> None:
+        """Elimina la asignación de un empleado a un proyecto."""
+        if (employee_id, project_id) in self.snapshot.assignments:
+            self._assignments[(employee_id, project_id)] = None
+        else:
+            self._assignments.pop((employee_id, project_id), None)
+
+    def apply_plan(self, plan: Any, status_code_id: Optional[int] = None) -> int:
+        """
+        Añade al escenario las asignaciones de un ``AutoPlanResult``.
+
+        Pensado para evaluar planificaciones calculadas con ``dry_run=True``.
+
+        Returns:
+            Horarios añadidos.
+        """
+        for employee_id, day in plan.assignments:
+            self.add(employee_id, day, plan.project_id, status_code_id)
+        return len(plan.assignments)
+
+    def fork(self, name: Optional[str] = None) -> "PlanningScenario":
+        """
+        Crea un escenario hijo con los mismos cambios.
+
+        Solo se copian los diccionarios de cambios; los escenarios padre e
+        hijo evolucionan después por separado.
+        """
+        child = PlanningScenario(self.snapshot, name or f"{self.name} (copia)")
+        child._schedules = dict(self._schedules)
+        child._assignments = dict(self._assignments)
+        return child
+
+    # ------------------------------------------------------------------
+    # Cálculos
+    # ------------------------------------------------------------------
+
+    def is_available(self, employee_id: int, day: date) -> bool:
+        """Sin horarios ni vacaciones aprobadas ese día."""
+        return (
+            not self.entries(employee_id, day)
+            and day not in self.snapshot.vacations.get(employee_id, ())
+        )
+
+    def available_employees(self, day: date, employee_ids: Sequence[int]) -> List[int]:
+        """Empleados de la lista disponibles un día."""
+        return [employee_id for employee_id in employee_ids if self.is_available(employee_id, day)]
+
+    def conflicts(self, changed_only: bool = False) -> List[Tuple[int, date, str]]:
+        """
+        Conflictos del escenario.
+
+        Un conflicto es una celda con más de un horario o un horario en un
+        día de vacaciones aprobadas.
+
+        Args:
+            changed_only: Revisa solo las celdas modificadas por el escenario.
+
+        Returns:
+            Lista ordenada de (empleado, día, motivo).
+        """
+        cells = (
+            ((key, entries) for key, entries in self._schedules.items() if entries)
+            if changed_only else self.cells()
+        )
+        found = []
+        for (employee_id, day), entries in cells:
+            if len(entries) > 1:
+                found.append((employee_id, day, "overlap"))
+            if day in self.snapshot.vacations.get(employee_id, ()):
+                found.append((employee_id, day, "vacation"))
+        return sorted(found)
+
+    def _hours(self, employee_id: int, entry: ScheduleEntry) -> Decimal:
+        hours = hours_between(entry.start_time, entry.end_time)
+        if hours is not None:
+            return hours
+        if entry.project_id is not None:
+            assignment = self.assignment(employee_id, entry.project_id)
+            if assignment is not None and assignment.allocated_hours_per_day:
+                return Decimal(assignment.allocated_hours_per_day)
+        return self.snapshot.default_hours
+
+    def utilization(self, employee_id: Optional[int] = None) -> Dict[int, Dict[date, Decimal]]:
+        """
+        Utilización semanal (horas planificadas / jornada semanal, en %).
+
+        Args:
+            employee_id: Limita el cálculo a un empleado.
+
+        Returns:
+            Diccionario empleado -> lunes de cada semana -> porcentaje.
+        """
+        hours: Dict[int, Dict[date, Decimal]] = {}
+        if employee_id is not None:
+            day = self.snapshot.start_date
+            cells = []
+            while day <= self.snapshot.end_date:
+                entries = self.entries(employee_id, day)
+                if entries:
+                    cells.append(((employee_id, day), entries))
+                day += timedelta(days=1)
+        else:
+            cells = self.cells()
+        for (cell_employee, day), entries in cells:
+            week = day - timedelta(days=day.weekday())
+            weeks = hours.setdefault(cell_employee, {})
+            weeks[week] = weeks.get(week, Decimal(0)) + sum(
+                (self._hours(cell_employee, entry) for entry in entries), Decimal(0)
+            )
+        return {
+            cell_employee: {
+                week: round(
+                    total * 100
+                    / self.snapshot.weekly_hours.get(cell_employee, DEFAULT_WEEKLY_HOURS),
+                    2,
+                )
+                for week, total in sorted(weeks.items())
+            }
+            for cell_employee, weeks in hours.items()
+        }
+
+    def diff(self, other: Optional["PlanningScenario"] = None) -> List[ScenarioChange]:
+        """
+        Celdas que difieren entre este escenario y otro (o la instantánea).
+
+        Args:
+            other: Escenario de referencia; None para la instantánea.
+
+        Returns:
+            Cambios ordenados por día y empleado, de ``other`` a este escenario.
+        """
+        keys = set(self._schedules)
+        if other is not None:
+            keys |= set(other._schedules)
+        changes = []
+        for employee_id, day in keys:
+            before = (
+                other.entries(employee_id, day) if other is not None
+                else self.snapshot.schedules.get((employee_id, day), ())
+            )
+            after = self.entries(employee_id, day)
+            if before != after:
+                changes.append(ScenarioChange(employee_id, day, before, after))
+        return sorted(changes, key=lambda change: (change.date, change.employee_id))
+
+    def assignment_changes(
+        self
+    ) -> List[Tuple[_Pair, Optional[AssignmentEntry], Optional[AssignmentEntry]]]:
+        """Asignaciones modificadas: ((empleado, proyecto), antes, después)."""
+        return [
+            (key, self.snapshot.assignments.get(key), entry)
+            for key, entry in sorted(self._assignments.items())
+        ]
+
+
+class ScheduleScenarioModule(BaseRepository[Schedule]):
+    """
+    Módulo de instantáneas y confirmación de escenarios de planificación.
+
+    Attributes:
+        session: Sesión de base de datos asíncrona
+        model_class: Clase del modelo Schedule
+        _logger: Logger estructurado con contexto del módulo
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el módulo de escenarios.
+
+        Args:
+            session: Sesión de base de datos asíncrona
+        """
+        super().__init__(session, Schedule)
+        self._logger = self._logger.bind(component="ScheduleScenarioModule")
+        # Pares (empleado, fecha) modificados, para recalcular sus cargas de trabajo
+        self._schedule_changes = ScheduleChangeTracker.for_session(session)
+
+    async def get_by_unique_field(self, field_name: str, value: Any) -> Optional[Schedule]:
+        """Los horarios no tienen campos únicos además del ID."""
+        return None
+
+    async def load_snapshot(
+        self,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[Sequence[int]] = None,
+        default_hours: Decimal = Decimal("8")
+    ) -> ScheduleSnapshot:
+        """
+        Carga la instantánea del tablero de una ventana.
+
+        Args:
+            start_date: Primer día de la ventana.
+            end_date: Último día de la ventana.
+            employee_ids: Limita la instantánea a estos empleados.
+            default_hours: Horas de los horarios sin hora de inicio o fin
+                ni asignación con horas diarias.
+
+        Returns:
+            ScheduleSnapshot inmutable.
+
+        Raises:
+            ValidationError: Si el rango de fechas no es válido.
+            ScheduleRepositoryError: Si falla la consulta.
+        """
+        if start_date > end_date:
+            raise ValidationError(
+                message="La fecha de inicio debe ser anterior o igual a la fecha de fin",
+                field="start_date",
+                value=str(start_date),
+            )
+        ids = list(employee_ids) if employee_ids is not None else None
+
+        try:
+            conditions = [Schedule.date >= start_date, Schedule.date <= end_date]
+            if ids is not None:
+                conditions.append(Schedule.employee_id.in_(ids))
+            result = await self.session.execute(
+                select(
+                    Schedule.employee_id,
+                    Schedule.date,
+                    Schedule.project_id,
+                    Schedule.status_code_id,
+                    Schedule.start_time,
+                    Schedule.end_time,
+                    Schedule.team_id,
+                    Schedule.id,
+                )
+                .where(and_(*conditions))
+                .order_by(Schedule.employee_id, Schedule.date, Schedule.id)
+            )
+            schedules: Dict[_Cell, Tuple[ScheduleEntry, ...]] = {}
+            for employee_id, day, *values in result.all():
+                key = (employee_id, day)
+                schedules[key] = schedules.get(key, ()) + (ScheduleEntry(*values),)
+
+            conditions = [
+                Vacation.status == VacationStatus.APPROVED,
+                Vacation.start_date <= end_date,
+                Vacation.end_date >= start_date,
+            ]
+            if ids is not None:
+                conditions.append(Vacation.employee_id.in_(ids))
+            result = await self.session.execute(
+                select(Vacation.employee_id, Vacation.start_date, Vacation.end_date)
+                .where(and_(*conditions))
+            )
+            vacation_days: Dict[int, set] = {}
+            for employee_id, first, last in result.all():
+                day = max(first, start_date)
+                days = vacation_days.setdefault(employee_id, set())
+                while day <= min(last, end_date):
+                    days.add(day)
+                    day += timedelta(days=1)
+
+            conditions = [
+                ProjectAssignment.is_active.is_(True),
+                ProjectAssignment.start_date <= end_date,
+                or_(ProjectAssignment.end_date.is_(None), ProjectAssignment.end_date >= start_date),
+            ]
+            if ids is not None:
+                conditions.append(ProjectAssignment.employee_id.in_(ids))
+            result = await self.session.execute(
+                select(
+                    ProjectAssignment.employee_id,
+                    ProjectAssignment.project_id,
+                    ProjectAssignment.start_date,
+                    ProjectAssignment.end_date,
+                    ProjectAssignment.allocated_hours_per_day,
+                    ProjectAssignment.id,
+                )
+                .where(and_(*conditions))
+                .order_by(ProjectAssignment.id)
+            )
+            assignments: Dict[_Pair, AssignmentEntry] = {}
+            for employee_id, project_id, *values in result.all():
+                assignments.setdefault((employee_id, project_id), AssignmentEntry(*values))
+
+            stmt = select(Employee.id, Employee.weekly_hours)
+            if ids is not None:
+                stmt = stmt.where(Employee.id.in_(ids))
+            result = await self.session.execute(stmt)
+            weekly_hours = dict(result.all())
+
+        except SQLAlchemyError as e:
+            self._logger.error("Error cargando la instantánea de planificación: {}", e)
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="load_snapshot",
+                entity_type=self.model_class.__name__
+            )
+
+        self._logger.debug(
+            "Instantánea {} - {}: {} celdas, {} asignaciones",
+            start_date,
+            end_date,
+            len(schedules),
+            len(assignments),
+        )
+        return ScheduleSnapshot(
+            start_date=start_date,
+            end_date=end_date,
+            schedules=schedules,
+            vacations={employee_id: frozenset(days) for employee_id, days in vacation_days.items()},
+            assignments=assignments,
+            weekly_hours=weekly_hours,
+            employee_ids=frozenset(ids) if ids is not None else None,
+            default_hours=default_hours,
+        )
+
+    async def _check_stale(
+        self,
+        changes: List[ScenarioChange],
+        assignment_changes: List[Tuple[_Pair, Optional[AssignmentEntry], Optional[AssignmentEntry]]]
+    ) -> None:
+        """Verifica que las celdas y asignaciones modificadas siguen como en la instantánea."""
+        if changes:
+            employee_ids = {change.employee_id for change in changes}
+            dates = [change.date for change in changes]
+            result = await self.session.execute(
+                select(Schedule.employee_id, Schedule.date, Schedule.id)
+                .where(
+                    Schedule.employee_id.in_(employee_ids),
+                    Schedule.date >= min(dates),
+                    Schedule.date <= max(dates),
+                )
+            )
+            current: Dict[_Cell, set] = {}
+            for employee_id, day, schedule_id in result.all():
+                current.setdefault((employee_id, day), set()).add(schedule_id)
+            for change in changes:
+                key = (change.employee_id, change.date)
+                expected = {entry.schedule_id for entry in change.before}
+                if current.get(key, set()) != expected:
+                    raise ConflictError(
+                        message=(
+                            f"El tablero ha cambiado desde la instantánea en la celda "
+                            f"({change.employee_id}, {change.date}); recargue el escenario"
+                        ),
+                        conflicting_field="schedule",
+                        conflicting_value=f"{change.employee_id}:{change.date}",
+                    )
+
+        # Asignaciones modificadas o desactivadas: deben seguir activas y con
+        # los valores de la instantánea para no pisar una edición concurrente
+        expected_assignments = {
+            before.assignment_id: before
+            for _, before, _ in assignment_changes if before is not None
+        }
+        if expected_assignments:
+            result = await self.session.execute(
+                select(
+                    ProjectAssignment.id,
+                    ProjectAssignment.start_date,
+                    ProjectAssignment.end_date,
+                    ProjectAssignment.allocated_hours_per_day,
+                )
+                .where(
+                    ProjectAssignment.id.in_(expected_assignments),
+                    ProjectAssignment.is_active.is_(True),
+                )
+            )
+            current_assignments = {
+                assignment_id: AssignmentEntry(*values, assignment_id=assignment_id)
+                for assignment_id, *values in result.all()
+            }
+            for assignment_id, before in expected_assignments.items():
+                if current_assignments.get(assignment_id) != before:
+                    raise ConflictError(
+                        message=(
+                            f"La asignación {assignment_id} ha cambiado desde la "
+                            f"instantánea; recargue el escenario"
+                        ),
+                        conflicting_field="assignment",
+                        conflicting_value=str(assignment_id),
+                    )
+
+    async def commit_scenario(
+        self,
+        scenario: PlanningScenario,
+        check_stale: bool = True,
+        commit: bool = True
+    ) -> ScenarioCommitReport:
+        """
+        Aplica los cambios de un escenario a la base de datos.
+
+        Los horarios eliminados o sustituidos se borran y los nuevos se
+        insertan en bloque; las asignaciones nuevas se insertan, las
+        modificadas se actualizan y las eliminadas se desactivan. Todo en
+        una transacción.
+
+        Args:
+            scenario: Escenario a confirmar.
+            check_stale: Rechaza la confirmación si alguna celda o asignación
+                modificada ha cambiado en la base de datos desde la instantánea.
+            commit: Confirma la transacción al terminar.
+
+        Returns:
+            ScenarioCommitReport con los registros afectados.
+
+        Raises:
+            ConflictError: Si el tablero ha cambiado desde la instantánea.
+            ScheduleRepositoryError: Si falla la escritura; la transacción se
+                revierte completa.
+        """
+        changes = scenario.diff()
+        assignment_changes = scenario.assignment_changes()
+        report = ScenarioCommitReport()
+        try:
+            if check_stale and (changes or assignment_changes):
+                await self._check_stale(changes, assignment_changes)
+
+            to_delete: List[int] = []
+            to_insert: List[Dict[str, Any]] = []
+            for change in changes:
+                kept = {entry.schedule_id for entry in change.after if entry.schedule_id}
+                to_delete.extend(
+                    entry.schedule_id for entry in change.before if entry.schedule_id not in kept
+                )
+                to_insert.extend(
+                    {
+                        "employee_id": change.employee_id,
+                        "date": change.date,
+                        "project_id": entry.project_id,
+                        "status_code_id": entry.status_code_id,
+                        "start_time": entry.start_time,
+                        "end_time": entry.end_time,
+                        "team_id": entry.team_id,
+                        "is_confirmed": False,
+                    }
+                    for entry in change.after if entry.schedule_id is None
+                )
+
+            assignments_to_insert: List[Dict[str, Any]] = []
+            assignments_to_update: List[Dict[str, Any]] = []
+            for (employee_id, project_id), before, after in assignment_changes:
+                if after is None:
+                    assignments_to_update.append({"id": before.assignment_id, "is_active": False})
+                elif before is None:
+                    assignments_to_insert.append({
+                        "employee_id": employee_id,
+                        "project_id": project_id,
+                        "start_date": after.start_date,
+                        "end_date": after.end_date,
+                        "allocated_hours_per_day": after.allocated_hours_per_day,
+                        "is_active": True,
+                    })
+                else:
+                    assignments_to_update.append({
+                        "id": before.assignment_id,
+                        "start_date": after.start_date,
+                        "end_date": after.end_date,
+                        "allocated_hours_per_day": after.allocated_hours_per_day,
+                    })
+
+            if to_delete:
+                await self.session.execute(delete(Schedule).where(Schedule.id.in_(to_delete)))
+            if to_insert:
+                await self.session.execute(insert(Schedule), to_insert)
+            if assignments_to_insert:
+                await self.session.execute(insert(ProjectAssignment), assignments_to_insert)
+            # UPDATE masivo por clave primaria, un lote por cada conjunto de columnas
+            update_batches: Dict[frozenset, List[Dict[str, Any]]] = {}
+            for values in assignments_to_update:
+                update_batches.setdefault(frozenset(values), []).append(values)
+            for rows in update_batches.values():
+                await self.session.execute(update(ProjectAssignment), rows)
+            if to_delete or to_insert:
+                await WorkloadSyncModule(self.session).sync_tracked(self._schedule_changes, commit=False)
+            if commit:
+                await self.session.commit()
+
+            report.schedules_deleted = len(to_delete)
+            report.schedules_created = len(to_insert)
+            report.assignments_created = len(assignments_to_insert)
+            report.assignments_updated = len(assignments_to_update)
+
+        except ConflictError:
+            raise
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            self._logger.error("Error confirmando el escenario '{}': {}", scenario.name, e)
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="commit_scenario",
+                entity_type=self.model_class.__name__
+            )
+        except Exception as e:
+            await self.session.rollback()
+            self._logger.error("Error inesperado confirmando el escenario '{}': {}", scenario.name, e)
+            raise ScheduleRepositoryError(
+                message=f"Error inesperado confirmando el escenario '{scenario.name}': {e}",
+                operation="commit_scenario",
+                original_error=e
+            )
+
+        self._logger.info(
+            "Escenario '{}' confirmado: {} horarios creados, {} eliminados, "
+            "{} asignaciones creadas, {} modificadas",
+            scenario.name,
+            report.schedules_created,
+            report.schedules_deleted,
+            report.assignments_created,
+            report.assignments_updated,
+        )
+        return report
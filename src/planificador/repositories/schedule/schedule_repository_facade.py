@@ -36,6 +36,7 @@ from loguru import logger
 from planificador.models.schedule import Schedule
 from planificador.models.employee import Employee
 from planificador.models.project import Project
+from planificador.schemas.response import PlanningGridResponse, ScheduleListResponse
 from planificador.repositories.schedule.interfaces import (
     IScheduleCrudOperations,
     IScheduleQueryOperations,
@@ -48,11 +49,24 @@ from planificador.repositories.schedule.modules import (
     ScheduleQueryModule,
     ScheduleValidationModule,
     ScheduleRelationshipModule,
-    ScheduleStatisticsModule
+    ScheduleStatisticsModule,
+    SchedulePlanningImportModule,
+    PlanningSheetLayout,
+    PlanningImportReport,
+    SchedulePlanningGridModule,
+    ScheduleAutoPlannerModule,
+    AutoPlanResult,
+    ScheduleScenarioModule,
+    ScheduleSnapshot,
+    PlanningScenario,
+    ScenarioCommitReport
 )
+from planificador.repositories.availability_cache import availability_cache
 from planificador.exceptions.repository import ScheduleRepositoryError
+from planificador.database.instrumentation import instrumented_repository
 
 
+@instrumented_repository
 class ScheduleRepositoryFacade(
     IScheduleCrudOperations,
     IScheduleQueryOperations,
@@ -86,6 +100,10 @@ class ScheduleRepositoryFacade(
         self.validation_module = ScheduleValidationModule(session)
         self.relationship_module = ScheduleRelationshipModule(session)
         self.statistics_module = ScheduleStatisticsModule(session)
+        self.planning_import_module = SchedulePlanningImportModule(session)
+        self.planning_grid_module = SchedulePlanningGridModule(session)
+        self.auto_planner_module = ScheduleAutoPlannerModule(session)
+        self.scenario_module = ScheduleScenarioModule(session)
         
         self._logger.debug("ScheduleRepositoryFacade inicializada")
 
@@ -178,6 +196,25 @@ class ScheduleRepositoryFacade(
         # Busca horarios con filtros personalizados
         return await self.query_module.search_schedules(filters, limit, offset)
 
+    async def list_schedule_summaries(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        employee_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[ScheduleListResponse]:
+        # Listado de horarios con solo las columnas de la vista
+        return await self.query_module.list_schedule_summaries(
+            start_date=start_date,
+            end_date=end_date,
+            employee_id=employee_id,
+            project_id=project_id,
+            limit=limit,
+            offset=offset
+        )
+
     async def count_schedules(self, filters: Optional[Dict[str, Any]] = None) -> int:
         # Cuenta el número de horarios que coinciden con los filtros
         return await self.query_module.count_schedules(filters)
@@ -518,6 +555,135 @@ class ScheduleRepositoryFacade(
 
 
 
+    # =============================================================================
+    # IMPORTACIÓN MASIVA
+    # =============================================================================
+
+    async def import_planning_sheet(
+        self,
+        path: str,
+        layout: Optional[PlanningSheetLayout] = None,
+        value_codes: Optional[Dict[int, str]] = None,
+        colour_codes: Optional[Dict[str, str]] = None,
+        batch_size: int = 500
+    ) -> PlanningImportReport:
+        # Importa la hoja de planificación Excel como horarios en una transacción
+        return await self.planning_import_module.import_planning_sheet(
+            path,
+            layout=layout,
+            value_codes=value_codes,
+            colour_codes=colour_codes,
+            batch_size=batch_size
+        )
+
+    # =============================================================================
+    # CUADRÍCULA DE PLANIFICACIÓN
+    # =============================================================================
+
+    async def get_planning_grid(
+        self,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[List[int]] = None,
+        project_ids: Optional[List[int]] = None
+    ) -> PlanningGridResponse:
+        # Obtiene el tablero del periodo en formato columnar compacto
+        return await self.planning_grid_module.get_planning_grid(
+            start_date,
+            end_date,
+            employee_ids=employee_ids,
+            project_ids=project_ids
+        )
+
+    # =============================================================================
+    # PLANIFICACIÓN AUTOMÁTICA
+    # =============================================================================
+
+    async def plan_project(
+        self,
+        project_id: int,
+        requirements: Dict[str, int],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        team_id: Optional[int] = None,
+        assigned_only: bool = False,
+        status_code: Optional[str] = None,
+        dry_run: bool = False
+    ) -> AutoPlanResult:
+        # Rellena el tablero del proyecto con la dotación requerida por nivel
+        return await self.auto_planner_module.plan_project(
+            project_id,
+            requirements,
+            start_date=start_date,
+            end_date=end_date,
+            team_id=team_id,
+            assigned_only=assigned_only,
+            status_code=status_code,
+            dry_run=dry_run
+        )
+
+    # =============================================================================
+    # ESCENARIOS DE PLANIFICACIÓN
+    # =============================================================================
+
+    async def load_planning_snapshot(
+        self,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[List[int]] = None
+    ) -> ScheduleSnapshot:
+        # Carga la instantánea del tablero sobre la que se crean escenarios
+        return await self.scenario_module.load_snapshot(
+            start_date,
+            end_date,
+            employee_ids=employee_ids
+        )
+
+    async def commit_scenario(
+        self,
+        scenario: PlanningScenario
+    ) -> ScenarioCommitReport:
+        # Aplica los cambios del escenario en una transacción
+        return await self.scenario_module.commit_scenario(scenario)
+
+    # =============================================================================
+    # DISPONIBILIDAD
+    # =============================================================================
+
+    async def find_free_employees(
+        self,
+        days: List[date],
+        employee_ids: Optional[List[int]] = None,
+        team_id: Optional[int] = None
+    ) -> List[int]:
+        # Empleados sin horarios ni vacaciones aprobadas en todos los días
+        return await availability_cache.find_free_employees(
+            self.session, days, employee_ids=employee_ids, team_id=team_id
+        )
+
+    async def get_free_count_per_day(
+        self,
+        start_date: date,
+        end_date: date,
+        team_id: Optional[int] = None
+    ) -> Dict[date, int]:
+        # Número de empleados libres por día del rango
+        return await availability_cache.free_count_per_day(
+            self.session, start_date, end_date, team_id=team_id
+        )
+
+    async def find_first_free_window(
+        self,
+        length: int,
+        start_date: date,
+        end_date: date,
+        team_id: Optional[int] = None
+    ) -> Optional[Tuple[date, List[int]]]:
+        # Primer hueco de días consecutivos libres y quién lo tiene
+        return await availability_cache.first_free_window(
+            self.session, length, start_date, end_date, team_id=team_id
+        )
+
     # =============================================================================
     # MÉTODOS DE CONVENIENCIA Y OPERACIONES COMPUESTAS
     # =============================================================================
@@ -0,0 +1,39 @@
+"""
+Búsqueda global sobre clientes, proyectos y empleados.
+
+Este paquete mantiene un índice de texto completo (FTS5 en SQLite, tsvector
+con índice GIN en PostgreSQL) sincronizado por los módulos CRUD y expone una
+única API de búsqueda con resultados ordenados por relevancia. Incluye además
+un índice de trigramas en memoria para búsqueda difusa y detección de
+duplicados.
+
+Uso:
+    from planificador.repositories.search import SearchIndex, fuzzy_matcher
+
+    results = await SearchIndex(session).search("mont", limit=10)
+    similar = await fuzzy_matcher.find_similar(session, "client", "Montages")
+"""
+
+__all__ = [
+    "SearchIndex",
+    "SearchResult",
+    "sync_search_index",
+    "remove_from_search_index",
+    "FuzzyMatch",
+    "FuzzyMatcher",
+    "TrigramIndex",
+    "fuzzy_matcher",
+]
+
+from .search_index import (
+    SearchIndex,
+    SearchResult,
+    remove_from_search_index,
+    sync_search_index,
+)
+from .fuzzy_matcher import (
+    FuzzyMatch,
+    FuzzyMatcher,
+    TrigramIndex,
+    fuzzy_matcher,
+)
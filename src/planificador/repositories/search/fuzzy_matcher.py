@@ -0,0 +1,469 @@
+"""Búsqueda difusa por trigramas para clientes y empleados.
+
+Mantiene en memoria un índice invertido de trigramas (al estilo de
+``pg_trgm``) sobre los nombres y códigos de clientes y el ``full_name`` de
+los empleados. El índice se construye una vez por engine con una sola
+consulta y se actualiza de forma incremental desde los módulos CRUD, por lo
+que cada búsqueda solo recorre las listas de los trigramas de la consulta en
+lugar de la tabla completa.
+
+Se usan dos medidas de similitud:
+
+- ``similarity``: trigramas compartidos / trigramas de la unión (Jaccard).
+  Adecuada para detectar duplicados ("Montajes SpA" ~ "Montages SpA").
+- ``word_similarity``: fracción de trigramas de la consulta presentes en el
+  texto. Adecuada para el cuadro de búsqueda, donde se escribe solo una
+  parte del nombre.
+
+Los cambios de los módulos CRUD se acumulan en ``Session.info`` y solo se
+aplican al índice compartido cuando la transacción se confirma; si se
+revierte, se descartan. Por lo mismo, el índice compartido se carga desde
+una conexión propia y no desde la sesión que hace la búsqueda, que podría
+tener filas escritas sin confirmar.
+"""
+
+import weakref
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Type
+
+from loguru import logger
+from sqlalchemy import event, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
+
+from planificador.models.client import Client
+from planificador.models.employee import Employee
+from planificador.exceptions.repository.base_repository_exceptions import (
+    convert_sqlalchemy_error,
+)
+from .search_index import normalize_text
+
+
+# Campos indexados por tipo de entidad
+_SOURCES: Dict[str, Tuple[Type, Tuple[str, ...]]] = {
+    "client": (Client, ("name", "code")),
+    "employee": (Employee, ("full_name",)),
+}
+
+_MODEL_TO_TYPE = {model: entity_type for entity_type, (model, _) in _SOURCES.items()}
+
+_DocKey = Tuple[int, str]
+
+# Clave de Session.info con los cambios pendientes de confirmar
+_PENDING_KEY = "fuzzy_matcher_pending"
+
+# Cambio pendiente: (buscador, engine, tipo, id, campos); campos None indica borrado
+_PendingChange = Tuple["FuzzyMatcher", Any, str, int, Optional[Dict[str, Optional[str]]]]
+
+# Pools que reutilizan una única conexión (p. ej. SQLite en memoria): una
+# conexión "propia" sería la misma que la de la sesión
+_SHARED_CONNECTION_POOLS = (StaticPool, SingletonThreadPool)
+
+
+def trigrams(value: Optional[str]) -> FrozenSet[str]:
+    """
+    Calcula los trigramas de un texto.
+
+    Cada palabra se normaliza (minúsculas, sin diacríticos) y se rellena con
+    dos espacios al inicio y uno al final, como hace ``pg_trgm``.
+
+    Args:
+        value: Texto original.
+
+    Returns:
+        Conjunto de trigramas.
+    """
+    grams: Set[str] = set()
+    for word in "".join(
+        ch if ch.isalnum() else " " for ch in normalize_text(value)
+    ).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+@dataclass(frozen=True)
+class FuzzyMatch:
+    """
+    Candidato devuelto por la búsqueda difusa.
+
+    Attributes:
+        entity_type: Tipo de entidad ("client" o "employee").
+        entity_id: ID de la entidad.
+        field: Campo que ha coincidido (p. ej. "name" o "code").
+        text: Valor del campo.
+        score: Similitud entre 0 y 1.
+    """
+    entity_type: str
+    entity_id: int
+    field: str
+    text: str
+    score: float
+
+
+class TrigramIndex:
+    """
+    Índice invertido de trigramas para un tipo de entidad.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa un índice vacío."""
+        self._texts: Dict[_DocKey, str] = {}
+        self._grams: Dict[_DocKey, FrozenSet[str]] = {}
+        self._postings: Dict[str, Set[_DocKey]] = {}
+        self._keys_by_entity: Dict[int, List[_DocKey]] = {}
+
+    def __len__(self) -> int:
+        """Número de entidades indexadas."""
+        return len(self._keys_by_entity)
+
+    def add(self, entity_id: int, fields: Dict[str, Optional[str]]) -> None:
+        """
+        Indexa (o reindexa) los campos de una entidad.
+
+        Args:
+            entity_id: ID de la entidad.
+            fields: Diccionario campo -> valor.
+        """
+        self.remove(entity_id)
+        keys: List[_DocKey] = []
+        for field_name, value in fields.items():
+            grams = trigrams(value)
+            if not grams:
+                continue
+            key = (entity_id, field_name)
+            self._texts[key] = value
+            self._grams[key] = grams
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(key)
+            keys.append(key)
+        if keys:
+            self._keys_by_entity[entity_id] = keys
+
+    def remove(self, entity_id: int) -> None:
+        """
+        Elimina una entidad del índice.
+
+        Args:
+            entity_id: ID de la entidad.
+        """
+        for key in self._keys_by_entity.pop(entity_id, ()):
+            for gram in self._grams.pop(key, ()):
+                posting = self._postings.get(gram)
+                if posting is not None:
+                    posting.discard(key)
+                    if not posting:
+                        del self._postings[gram]
+            self._texts.pop(key, None)
+
+    def search(
+        self,
+        query: str,
+        threshold: float = 0.3,
+        limit: Optional[int] = 20,
+        fields: Optional[Iterable[str]] = None,
+        word_match: bool = False,
+        exclude_id: Optional[int] = None,
+    ) -> List[Tuple[int, str, str, float]]:
+        """
+        Busca las entidades más parecidas a una consulta.
+
+        Args:
+            query: Texto a buscar.
+            threshold: Similitud mínima (0-1).
+            limit: Número máximo de entidades devueltas.
+            fields: Campos en los que buscar (por defecto todos).
+            word_match: Usa ``word_similarity`` en lugar de ``similarity``.
+            exclude_id: ID de entidad a ignorar.
+
+        Returns:
+            Tuplas (entity_id, campo, texto, score) ordenadas por score
+            descendente, con el mejor campo de cada entidad.
+        """
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+
+        allowed_fields = set(fields) if fields is not None else None
+        shared: Counter = Counter()
+        for gram in query_grams:
+            for key in self._postings.get(gram, ()):
+                shared[key] += 1
+
+        best: Dict[int, Tuple[int, str, str, float]] = {}
+        query_size = len(query_grams)
+        for key, count in shared.items():
+            entity_id, field_name = key
+            if entity_id == exclude_id:
+                continue
+            if allowed_fields is not None and field_name not in allowed_fields:
+                continue
+
+            if word_match:
+                score = count / query_size
+            else:
+                score = count / (query_size + len(self._grams[key]) - count)
+            if score < threshold:
+                continue
+
+            current = best.get(entity_id)
+            if current is None or score > current[3]:
+                best[entity_id] = (entity_id, field_name, self._texts[key], score)
+
+        ranked = sorted(best.values(), key=lambda match: (-match[3], match[2]))
+        return ranked[:limit] if limit else ranked
+
+
+class FuzzyMatcher:
+    """
+    Registro de índices de trigramas por engine y tipo de entidad.
+
+    Los índices se cargan de forma perezosa en la primera búsqueda y a partir
+    de ahí se mantienen con ``update_entity`` y ``remove_entity``, cuyos
+    cambios se aplican al confirmar la transacción de la sesión.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa el registro sin índices cargados."""
+        self._indexes: "weakref.WeakKeyDictionary[Any, Dict[str, TrigramIndex]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._logger = logger.bind(component="FuzzyMatcher")
+
+    @staticmethod
+    def _engine_key(session: AsyncSession) -> Optional[Any]:
+        """Engine síncrono de la sesión, usado como clave del registro."""
+        return getattr(getattr(session, "bind", None), "sync_engine", None)
+
+    def _loaded_index(self, session: AsyncSession, entity_type: str) -> Optional[TrigramIndex]:
+        """Índice ya cargado para la sesión, si existe."""
+        engine = self._engine_key(session)
+        if engine is None:
+            return None
+        return self._indexes.get(engine, {}).get(entity_type)
+
+    async def _load_rows(
+        self, session: AsyncSession, columns: List[Any]
+    ) -> Tuple[List[Any], bool]:
+        """
+        Lee las filas confirmadas con las que construir un índice.
+
+        Returns:
+            Tupla (filas, compartible). Si el engine no puede abrir una
+            conexión distinta de la de la sesión, las filas se leen con la
+            propia sesión y el índice no debe compartirse.
+        """
+        bind = getattr(session, "bind", None)
+        engine = self._engine_key(session)
+        if engine is None or isinstance(engine.pool, _SHARED_CONNECTION_POOLS):
+            return (await session.execute(select(*columns))).all(), False
+
+        async_engine = bind if isinstance(bind, AsyncEngine) else bind.engine
+        async with async_engine.connect() as connection:
+            return (await connection.execute(select(*columns))).all(), True
+
+    async def ensure_loaded(self, session: AsyncSession, entity_type: str) -> TrigramIndex:
+        """
+        Devuelve el índice de un tipo de entidad, construyéndolo si hace falta.
+
+        El índice se construye con los datos confirmados, leídos desde una
+        conexión distinta de la de ``session``. Si el engine comparte una
+        única conexión (SQLite en memoria) se lee con la sesión y el índice
+        se devuelve sin guardarse en el registro.
+
+        Args:
+            session: Sesión asíncrona.
+            entity_type: "client" o "employee".
+
+        Returns:
+            Índice de trigramas.
+
+        Raises:
+            ValueError: Si el tipo de entidad no está soportado.
+            RepositoryError: Si falla la carga desde la base de datos.
+        """
+        if entity_type not in _SOURCES:
+            raise ValueError(f"Tipo de entidad no soportado para búsqueda difusa: {entity_type}")
+
+        index = self._loaded_index(session, entity_type)
+        if index is not None:
+            return index
+
+        model, field_names = _SOURCES[entity_type]
+        columns = [model.id] + [getattr(model, name) for name in field_names]
+        try:
+            rows, shareable = await self._load_rows(session, columns)
+        except SQLAlchemyError as e:
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="ensure_loaded",
+                entity_type=model.__name__,
+            )
+
+        index = TrigramIndex()
+        for row in rows:
+            index.add(row[0], dict(zip(field_names, row[1:])))
+
+        if shareable:
+            self._indexes.setdefault(self._engine_key(session), {})[entity_type] = index
+        self._logger.debug(
+            "Índice de trigramas de {} cargado: {} entidades", entity_type, len(index)
+        )
+        return index
+
+    def update_entity(self, session: AsyncSession, entity: Any) -> None:
+        """
+        Registra la actualización de una entidad para cuando se confirme.
+
+        Los valores se capturan en el momento de la llamada; el índice solo
+        cambia tras el commit de la sesión.
+
+        Args:
+            session: Sesión con la que se escribió la entidad.
+            entity: Instancia de Client o Employee.
+        """
+        entity_type = _MODEL_TO_TYPE.get(type(entity))
+        if entity_type is None or getattr(entity, "id", None) is None:
+            return
+        _, field_names = _SOURCES[entity_type]
+        self._queue_change(
+            session, entity_type, entity.id, {name: getattr(entity, name) for name in field_names}
+        )
+
+    def remove_entity(self, session: AsyncSession, model_class: Type, entity_id: Any) -> None:
+        """
+        Registra el borrado de una entidad para cuando se confirme.
+
+        Args:
+            session: Sesión con la que se borró la entidad.
+            model_class: Clase del modelo.
+            entity_id: ID de la entidad.
+        """
+        entity_type = _MODEL_TO_TYPE.get(model_class)
+        if entity_type is None:
+            return
+        self._queue_change(session, entity_type, entity_id, None)
+
+    def _queue_change(
+        self,
+        session: AsyncSession,
+        entity_type: str,
+        entity_id: Any,
+        fields: Optional[Dict[str, Optional[str]]],
+    ) -> None:
+        """Acumula un cambio en ``Session.info`` hasta el fin de la transacción."""
+        engine = self._engine_key(session)
+        if engine is None:
+            return
+        session.info.setdefault(_PENDING_KEY, []).append(
+            (self, engine, entity_type, entity_id, fields)
+        )
+
+    def apply_change(
+        self,
+        engine: Any,
+        entity_type: str,
+        entity_id: Any,
+        fields: Optional[Dict[str, Optional[str]]],
+    ) -> None:
+        """
+        Aplica al índice cargado un cambio de una transacción confirmada.
+
+        Si el índice aún no se ha cargado, el cambio se ignora: leerá los
+        datos confirmados al construirse.
+
+        Args:
+            engine: Engine síncrono de la sesión que hizo el cambio.
+            entity_type: "client" o "employee".
+            entity_id: ID de la entidad.
+            fields: Campos indexados, o None si la entidad se borró.
+        """
+        index = self._indexes.get(engine, {}).get(entity_type)
+        if index is None:
+            return
+        if fields is None:
+            index.remove(entity_id)
+        else:
+            index.add(entity_id, fields)
+
+    def invalidate(self, session: Optional[AsyncSession] = None) -> None:
+        """
+        Descarta los índices cargados para que se reconstruyan.
+
+        Args:
+            session: Si se indica, solo se descartan los de su engine.
+        """
+        if session is None:
+            self._indexes.clear()
+            return
+        engine = self._engine_key(session)
+        if engine is not None:
+            self._indexes.pop(engine, None)
+
+    async def find_similar(
+        self,
+        session: AsyncSession,
+        entity_type: str,
+        text: str,
+        threshold: float = 0.3,
+        limit: Optional[int] = 20,
+        fields: Optional[Iterable[str]] = None,
+        word_match: bool = False,
+        exclude_id: Optional[int] = None,
+    ) -> List[FuzzyMatch]:
+        """
+        Busca entidades con nombre o código parecido a un texto.
+
+        Args:
+            session: Sesión asíncrona.
+            entity_type: "client" o "employee".
+            text: Texto a comparar.
+            threshold: Similitud mínima (0-1).
+            limit: Número máximo de candidatos.
+            fields: Campos en los que buscar (por defecto todos).
+            word_match: Compara solo los trigramas de la consulta (búsqueda
+                mientras se escribe) en lugar de la similitud completa.
+            exclude_id: ID a ignorar (p. ej. la propia entidad al actualizar).
+
+        Returns:
+            Candidatos ordenados por similitud descendente.
+        """
+        index = await self.ensure_loaded(session, entity_type)
+        return [
+            FuzzyMatch(
+                entity_type=entity_type,
+                entity_id=entity_id,
+                field=field_name,
+                text=value,
+                score=round(score, 4),
+            )
+            for entity_id, field_name, value, score in index.search(
+                text,
+                threshold=threshold,
+                limit=limit,
+                fields=fields,
+                word_match=word_match,
+                exclude_id=exclude_id,
+            )
+        ]
+
+
+# Instancia global del buscador difuso
+fuzzy_matcher = FuzzyMatcher()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_changes(session: Session) -> None:
+    """Aplica al índice los cambios de la transacción confirmada."""
+    changes: List[_PendingChange] = session.info.pop(_PENDING_KEY, [])
+    for matcher, engine, entity_type, entity_id, fields in changes:
+        matcher.apply_change(engine, entity_type, entity_id, fields)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_changes(session: Session) -> None:
+    """Descarta los cambios de una transacción revertida."""
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,600 @@
+"""Índice de búsqueda de texto completo para clientes, proyectos y empleados.
+
+El índice se guarda en una tabla ``search_index`` con un documento por
+entidad:
+
+- SQLite: tabla virtual FTS5 (tokenizador ``unicode61`` sin diacríticos y
+  prefijos de 2 y 3 caracteres precalculados). El ``rowid`` se deriva del
+  tipo y del ID de la entidad, de modo que actualizar o borrar un documento
+  no requiere recorrer la tabla.
+- PostgreSQL: columna ``tsvector`` con pesos (título A, resto B) e índice GIN.
+
+Los módulos CRUD llaman a ``sync_search_index`` y
+``remove_from_search_index`` dentro de la misma transacción que la escritura.
+Si el índice no existe (o el motor no está soportado), la búsqueda cae a
+``ILIKE`` sobre los campos principales.
+"""
+
+import re
+import unicodedata
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from loguru import logger
+from sqlalchemy import or_, select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from planificador.models.client import Client
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.exceptions.repository.base_repository_exceptions import (
+    convert_sqlalchemy_error,
+)
+
+
+SEARCH_TABLE = "search_index"
+
+# Espacio de rowids reservado para cada tipo de entidad (SQLite)
+_ROWID_STRIDE = 1 << 40
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """
+    Resultado de una búsqueda global.
+
+    Attributes:
+        entity_type: Tipo de entidad ("client", "project" o "employee").
+        entity_id: ID de la entidad.
+        title: Texto principal a mostrar (nombre).
+        subtitle: Texto secundario (código o referencia).
+        score: Relevancia; mayor es más relevante.
+    """
+    entity_type: str
+    entity_id: int
+    title: str
+    subtitle: str
+    score: float
+
+
+@dataclass(frozen=True)
+class _EntitySpec:
+    """Describe cómo indexar un modelo."""
+    entity_type: str
+    type_code: int
+    model: Type
+    title: Callable[[Any], Optional[str]]
+    subtitle: Callable[[Any], Optional[str]]
+    body: Callable[[Any], Iterable[Optional[str]]]
+    fallback_columns: Tuple[str, ...]
+
+
+def _join_list(value: Any) -> Optional[str]:
+    """Convierte listas JSON (habilidades, certificaciones) en texto."""
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(item) for item in value)
+    return value
+
+
+_ENTITY_SPECS: Dict[str, _EntitySpec] = {
+    "client": _EntitySpec(
+        entity_type="client",
+        type_code=1,
+        model=Client,
+        title=lambda c: c.name,
+        subtitle=lambda c: c.code,
+        body=lambda c: (c.code, c.contact_person, c.email, c.notes),
+        fallback_columns=("name", "code", "email"),
+    ),
+    "project": _EntitySpec(
+        entity_type="project",
+        type_code=2,
+        model=Project,
+        title=lambda p: p.name,
+        subtitle=lambda p: p.reference,
+        body=lambda p: (
+            p.reference, p.trigram, p.job_code, p.responsible_person,
+            p.details, p.notes,
+        ),
+        fallback_columns=("name", "reference", "trigram", "job_code"),
+    ),
+    "employee": _EntitySpec(
+        entity_type="employee",
+        type_code=3,
+        model=Employee,
+        title=lambda e: e.full_name,
+        subtitle=lambda e: e.employee_code or e.position,
+        body=lambda e: (
+            e.employee_code, e.email, e.position, e.department,
+            e.qualification_type, _join_list(e.skills), e.notes,
+        ),
+        fallback_columns=("full_name", "employee_code", "email"),
+    ),
+}
+
+_MODEL_TO_TYPE = {spec.model: spec.entity_type for spec in _ENTITY_SPECS.values()}
+
+# Disponibilidad del índice por engine (se comprueba una vez)
+_availability: "weakref.WeakKeyDictionary[Any, bool]" = weakref.WeakKeyDictionary()
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """
+    Normaliza texto para indexarlo: minúsculas y sin diacríticos.
+
+    Args:
+        value: Texto original.
+
+    Returns:
+        Texto normalizado (cadena vacía si es None).
+    """
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", str(value).lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def _tokenize(query: str) -> List[str]:
+    """Extrae los términos de una consulta ya normalizada."""
+    return _TOKEN.findall(normalize_text(query))
+
+
+class SearchIndex:
+    """
+    Índice de búsqueda global sobre una sesión asíncrona.
+
+    Es ligero de construir: el estado compartido (si el índice existe en el
+    engine) se guarda a nivel de módulo.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el índice.
+
+        Args:
+            session: Sesión asíncrona de SQLAlchemy.
+        """
+        self.session = session
+        self._logger = logger.bind(component="SearchIndex")
+
+    # ------------------------------------------------------------------
+    # Dialecto y disponibilidad
+    # ------------------------------------------------------------------
+
+    def _sync_engine(self) -> Optional[Any]:
+        """Engine síncrono asociado a la sesión, si existe."""
+        bind = getattr(self.session, "bind", None)
+        return getattr(bind, "sync_engine", None)
+
+    def _dialect(self) -> Optional[str]:
+        """Nombre del dialecto ("sqlite", "postgresql", ...)."""
+        engine = self._sync_engine()
+        return engine.dialect.name if engine is not None else None
+
+    async def is_available(self) -> bool:
+        """
+        Indica si el índice existe en la base de datos de la sesión.
+
+        El resultado se cachea por engine; ``ensure_index`` lo actualiza.
+
+        Returns:
+            True si se puede usar el índice de texto completo.
+        """
+        engine = self._sync_engine()
+        if engine is None:
+            return False
+
+        cached = _availability.get(engine)
+        if cached is not None:
+            return cached
+
+        dialect = engine.dialect.name
+        if dialect == "sqlite":
+            query = text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"
+            )
+        elif dialect == "postgresql":
+            query = text("SELECT 1 WHERE to_regclass(:name) IS NOT NULL")
+        else:
+            _availability[engine] = False
+            return False
+
+        result = await self.session.execute(query, {"name": SEARCH_TABLE})
+        available = result.scalar() is not None
+        _availability[engine] = available
+        return available
+
+    async def ensure_index(self) -> bool:
+        """
+        Crea la tabla del índice si no existe.
+
+        Returns:
+            True si el índice está disponible para el motor de la sesión.
+
+        Raises:
+            RepositoryError: Si ocurre un error creando el índice.
+        """
+        dialect = self._dialect()
+        try:
+            if dialect == "sqlite":
+                await self.session.execute(text(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+                    "entity_type UNINDEXED, entity_id UNINDEXED, "
+                    "title UNINDEXED, subtitle UNINDEXED, "
+                    "title_terms, body_terms, "
+                    "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+                ))
+            elif dialect == "postgresql":
+                await self.session.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ("
+                    "entity_type VARCHAR(20) NOT NULL, "
+                    "entity_id INTEGER NOT NULL, "
+                    "title TEXT NOT NULL, "
+                    "subtitle TEXT NOT NULL DEFAULT '', "
+                    "document TSVECTOR NOT NULL, "
+                    "PRIMARY KEY (entity_type, entity_id))"
+                ))
+                await self.session.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_{SEARCH_TABLE}_document "
+                    f"ON {SEARCH_TABLE} USING GIN (document)"
+                ))
+            else:
+                self._logger.warning(
+                    "Motor {} sin soporte de búsqueda de texto completo; se usará ILIKE",
+                    dialect,
+                )
+                return False
+        except SQLAlchemyError as e:
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="ensure_index",
+                entity_type="SearchIndex",
+            )
+
+        _availability[self._sync_engine()] = True
+        self._logger.info("Índice de búsqueda disponible ({})", dialect)
+        return True
+
+    # ------------------------------------------------------------------
+    # Sincronización
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _document(spec: _EntitySpec, entity: Any) -> Dict[str, Any]:
+        """Construye los parámetros del documento de una entidad."""
+        title = spec.title(entity) or ""
+        return {
+            "entity_type": spec.entity_type,
+            "entity_id": entity.id,
+            "rowid": spec.type_code * _ROWID_STRIDE + entity.id,
+            "title": title,
+            "subtitle": spec.subtitle(entity) or "",
+            "title_terms": normalize_text(title),
+            "body_terms": " ".join(normalize_text(v) for v in spec.body(entity) if v),
+        }
+
+    async def _write_documents(self, documents: Sequence[Dict[str, Any]]) -> None:
+        """Inserta o reemplaza documentos en el índice."""
+        if not documents:
+            return
+
+        if self._dialect() == "sqlite":
+            await self.session.execute(
+                text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :rowid"),
+                [{"rowid": d["rowid"]} for d in documents],
+            )
+            await self.session.execute(
+                text(
+                    f"INSERT INTO {SEARCH_TABLE} (rowid, entity_type, entity_id, title, "
+                    "subtitle, title_terms, body_terms) VALUES (:rowid, :entity_type, "
+                    ":entity_id, :title, :subtitle, :title_terms, :body_terms)"
+                ),
+                list(documents),
+            )
+        else:
+            await self.session.execute(
+                text(
+                    f"INSERT INTO {SEARCH_TABLE} (entity_type, entity_id, title, subtitle, document) "
+                    "VALUES (:entity_type, :entity_id, :title, :subtitle, "
+                    "setweight(to_tsvector('simple', :title_terms), 'A') || "
+                    "setweight(to_tsvector('simple', :body_terms), 'B')) "
+                    "ON CONFLICT (entity_type, entity_id) DO UPDATE SET "
+                    "title = EXCLUDED.title, subtitle = EXCLUDED.subtitle, "
+                    "document = EXCLUDED.document"
+                ),
+                list(documents),
+            )
+
+    async def index_entity(self, entity: Any) -> None:
+        """
+        Inserta o actualiza el documento de una entidad.
+
+        Args:
+            entity: Instancia de Client, Project o Employee.
+
+        Raises:
+            RepositoryError: Si ocurre un error escribiendo en el índice.
+        """
+        spec = _ENTITY_SPECS.get(_MODEL_TO_TYPE.get(type(entity), ""))
+        if spec is None or entity.id is None or not await self.is_available():
+            return
+
+        try:
+            await self._write_documents([self._document(spec, entity)])
+        except SQLAlchemyError as e:
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="index_entity",
+                entity_type=spec.model.__name__,
+                entity_id=entity.id,
+            )
+
+    async def remove_entity(self, entity_type: str, entity_id: int) -> None:
+        """
+        Elimina el documento de una entidad.
+
+        Args:
+            entity_type: Tipo de entidad ("client", "project" o "employee").
+            entity_id: ID de la entidad.
+
+        Raises:
+            RepositoryError: Si ocurre un error escribiendo en el índice.
+        """
+        spec = _ENTITY_SPECS.get(entity_type)
+        if spec is None or not await self.is_available():
+            return
+
+        try:
+            if self._dialect() == "sqlite":
+                await self.session.execute(
+                    text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :rowid"),
+                    {"rowid": spec.type_code * _ROWID_STRIDE + int(entity_id)},
+                )
+            else:
+                await self.session.execute(
+                    text(
+                        f"DELETE FROM {SEARCH_TABLE} "
+                        "WHERE entity_type = :entity_type AND entity_id = :entity_id"
+                    ),
+                    {"entity_type": entity_type, "entity_id": int(entity_id)},
+                )
+        except SQLAlchemyError as e:
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="remove_entity",
+                entity_type=spec.model.__name__,
+                entity_id=entity_id,
+            )
+
+    async def rebuild(
+        self,
+        entity_types: Optional[Sequence[str]] = None,
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Reconstruye el índice a partir de las tablas de origen.
+
+        Args:
+            entity_types: Tipos a reconstruir (por defecto todos).
+            batch_size: Documentos por sentencia de inserción.
+
+        Returns:
+            Número de documentos indexados.
+
+        Raises:
+            RepositoryError: Si ocurre un error reconstruyendo el índice.
+        """
+        if not await self.ensure_index():
+            return 0
+
+        total = 0
+        try:
+            for entity_type in entity_types or list(_ENTITY_SPECS):
+                spec = _ENTITY_SPECS[entity_type]
+                if self._dialect() == "sqlite":
+                    await self.session.execute(
+                        text(
+                            f"DELETE FROM {SEARCH_TABLE} "
+                            "WHERE rowid >= :low AND rowid < :high"
+                        ),
+                        {
+                            "low": spec.type_code * _ROWID_STRIDE,
+                            "high": (spec.type_code + 1) * _ROWID_STRIDE,
+                        },
+                    )
+                else:
+                    await self.session.execute(
+                        text(f"DELETE FROM {SEARCH_TABLE} WHERE entity_type = :entity_type"),
+                        {"entity_type": entity_type},
+                    )
+
+                result = await self.session.stream_scalars(select(spec.model))
+                async for partition in result.partitions(batch_size):
+                    await self._write_documents(
+                        [self._document(spec, entity) for entity in partition]
+                    )
+                    total += len(partition)
+        except SQLAlchemyError as e:
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="rebuild",
+                entity_type="SearchIndex",
+            )
+
+        self._logger.info("Índice de búsqueda reconstruido: {} documentos", total)
+        return total
+
+    # ------------------------------------------------------------------
+    # Búsqueda
+    # ------------------------------------------------------------------
+
+    async def search(
+        self,
+        query: str,
+        entity_types: Optional[Sequence[str]] = None,
+        limit: int = 20,
+        title_only: bool = False,
+    ) -> List[SearchResult]:
+        """
+        Busca clientes, proyectos y empleados ordenados por relevancia.
+
+        Cada término se trata como prefijo ("mont" encuentra "Montaje") y
+        todos los términos deben aparecer. Las coincidencias en el nombre
+        pesan más que en el resto de campos.
+
+        Args:
+            query: Texto introducido por el usuario.
+            entity_types: Tipos a incluir (por defecto todos).
+            limit: Número máximo de resultados.
+            title_only: Si es True, solo se busca en el nombre.
+
+        Returns:
+            Lista de resultados, del más al menos relevante.
+
+        Raises:
+            RepositoryError: Si ocurre un error en la consulta.
+        """
+        terms = _tokenize(query)
+        if not terms or limit <= 0:
+            return []
+
+        types = [t for t in (entity_types or list(_ENTITY_SPECS)) if t in _ENTITY_SPECS]
+        if not types:
+            return []
+
+        try:
+            if not await self.is_available():
+                return await self._fallback_search(terms, types, limit, title_only)
+
+            params: Dict[str, Any] = {"limit": limit}
+            type_filter = ""
+            if len(types) < len(_ENTITY_SPECS):
+                placeholders = ", ".join(f":type_{i}" for i in range(len(types)))
+                type_filter = f" AND entity_type IN ({placeholders})"
+                params.update({f"type_{i}": t for i, t in enumerate(types)})
+
+            if self._dialect() == "sqlite":
+                params["match"] = " ".join(f'"{term}"*' for term in terms)
+                if title_only:
+                    params["match"] = f"title_terms : ({params['match']})"
+                statement = text(
+                    "SELECT entity_type, entity_id, title, subtitle, "
+                    f"bm25({SEARCH_TABLE}, 0, 0, 0, 0, 10.0, 1.0) AS rank "
+                    f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :match"
+                    f"{type_filter} ORDER BY rank LIMIT :limit"
+                )
+                rows = (await self.session.execute(statement, params)).all()
+                return [
+                    SearchResult(row[0], int(row[1]), row[2], row[3], -float(row[4]))
+                    for row in rows
+                ]
+
+            weight = "A" if title_only else ""
+            params["tsquery"] = " & ".join(f"{term}:*{weight}" for term in terms)
+            statement = text(
+                "SELECT entity_type, entity_id, title, subtitle, "
+                "ts_rank(document, to_tsquery('simple', :tsquery)) AS rank "
+                f"FROM {SEARCH_TABLE} WHERE document @@ to_tsquery('simple', :tsquery)"
+                f"{type_filter} ORDER BY rank DESC LIMIT :limit"
+            )
+            rows = (await self.session.execute(statement, params)).all()
+            return [
+                SearchResult(row[0], int(row[1]), row[2], row[3], float(row[4]))
+                for row in rows
+            ]
+        except SQLAlchemyError as e:
+            self._logger.error("Error en búsqueda global '{}': {}", query, e)
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="search",
+                entity_type="SearchIndex",
+            )
+
+    async def search_ids(
+        self,
+        query: str,
+        entity_type: str,
+        limit: int = 50,
+        title_only: bool = False,
+    ) -> List[int]:
+        """
+        Busca solo los IDs de un tipo de entidad, ordenados por relevancia.
+
+        Args:
+            query: Texto de búsqueda.
+            entity_type: Tipo de entidad.
+            limit: Número máximo de IDs.
+            title_only: Si es True, solo se busca en el nombre.
+
+        Returns:
+            Lista de IDs.
+        """
+        results = await self.search(
+            query, entity_types=[entity_type], limit=limit, title_only=title_only
+        )
+        return [result.entity_id for result in results]
+
+    async def _fallback_search(
+        self, terms: List[str], types: List[str], limit: int, title_only: bool
+    ) -> List[SearchResult]:
+        """Búsqueda con ILIKE cuando el índice no está disponible."""
+        results: List[SearchResult] = []
+        for entity_type in types:
+            spec = _ENTITY_SPECS[entity_type]
+            names = spec.fallback_columns[:1] if title_only else spec.fallback_columns
+            columns = [getattr(spec.model, name) for name in names]
+            query = select(spec.model)
+            for term in terms:
+                query = query.where(or_(*(column.ilike(f"%{term}%") for column in columns)))
+            entities = (await self.session.execute(query.limit(limit))).scalars().all()
+            results.extend(
+                SearchResult(
+                    entity_type=entity_type,
+                    entity_id=entity.id,
+                    title=spec.title(entity) or "",
+                    subtitle=spec.subtitle(entity) or "",
+                    score=0.0,
+                )
+                for entity in entities
+            )
+        return results[:limit]
+
+
+async def sync_search_index(session: AsyncSession, entity: Any) -> None:
+    """
+    Actualiza el documento de una entidad tras crearla o modificarla.
+
+    Actualiza también el índice de trigramas si está cargado. No hace nada
+    si el índice de texto completo no existe en la base de datos de la sesión.
+
+    Args:
+        session: Sesión con la que se escribió la entidad.
+        entity: Instancia de Client, Project o Employee.
+    """
+    from .fuzzy_matcher import fuzzy_matcher
+
+    fuzzy_matcher.update_entity(session, entity)
+    await SearchIndex(session).index_entity(entity)
+
+
+async def remove_from_search_index(
+    session: AsyncSession, model_class: Type, entity_id: Any
+) -> None:
+    """
+    Elimina el documento de una entidad tras borrarla.
+
+    Args:
+        session: Sesión con la que se borró la entidad.
+        model_class: Clase del modelo (Client, Project o Employee).
+        entity_id: ID de la entidad borrada.
+    """
+    from .fuzzy_matcher import fuzzy_matcher
+
+    fuzzy_matcher.remove_entity(session, model_class, entity_id)
+    entity_type = _MODEL_TO_TYPE.get(model_class)
+    if entity_type is not None:
+        await SearchIndex(session).remove_entity(entity_type, entity_id)
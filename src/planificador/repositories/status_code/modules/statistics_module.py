@@ -22,13 +22,14 @@ Uso:
 
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from sqlalchemy import select, func, and_, or_, case, distinct
+from sqlalchemy import select, func, and_, or_, case, distinct, literal, cast, String, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
 from planificador.models.status_code import StatusCode
 from planificador.repositories.status_code.interfaces.statistics_interface import IStatusCodeStatisticsOperations
 from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.query_fusion import FusedAggregate
 from planificador.exceptions.repository import (
     StatusCodeRepositoryError,
     convert_sqlalchemy_error
@@ -373,48 +374,52 @@ class StatusCodeStatisticsModule(BaseRepository[StatusCode], IStatusCodeStatisti
         try:
             self._logger.debug("Generando reporte de integridad")
             
-            # Verificar códigos duplicados
-            duplicate_codes_stmt = select(
-                StatusCode.code,
-                func.count(StatusCode.id).label('count')
-            ).group_by(StatusCode.code).having(func.count(StatusCode.id) > 1)
-            
-            duplicate_codes_result = await self.session.execute(duplicate_codes_stmt)
-            duplicate_codes = list(duplicate_codes_result.all())
-            
-            # Verificar nombres duplicados
-            duplicate_names_stmt = select(
-                StatusCode.name,
-                func.count(StatusCode.id).label('count')
-            ).group_by(StatusCode.name).having(func.count(StatusCode.id) > 1)
-            
-            duplicate_names_result = await self.session.execute(duplicate_names_stmt)
-            duplicate_names = list(duplicate_names_result.all())
-            
-            # Verificar múltiples códigos por defecto
-            default_count_stmt = select(func.count(StatusCode.id)).where(StatusCode.is_default == True)
-            default_count_result = await self.session.execute(default_count_stmt)
-            default_count = default_count_result.scalar() or 0
-            
-            # Verificar códigos sin display_order
-            no_order_stmt = select(func.count(StatusCode.id)).where(StatusCode.display_order.is_(None))
-            no_order_result = await self.session.execute(no_order_stmt)
-            no_order_count = no_order_result.scalar() or 0
-            
-            # Obtener estadísticas de display_order
-            order_stats = await self.get_display_order_statistics()
+            # Conteos escalares en una sola pasada
+            counts = await (
+                FusedAggregate(StatusCode)
+                .count('total')
+                .count('defaults', StatusCode.is_default == True)
+                .count('missing_order', StatusCode.display_order.is_(None))
+                .execute(self.session)
+            )
+            default_count = counts['defaults']
+            no_order_count = counts['missing_order']
+            
+            # Valores duplicados de code, name y display_order en una sola consulta
+            duplicates_stmt = union_all(*(
+                select(
+                    literal(field_name).label('field'),
+                    cast(column, String).label('value'),
+                    func.count(StatusCode.id).label('count')
+                ).where(column.isnot(None)).group_by(column).having(func.count(StatusCode.id) > 1)
+                for field_name, column in (
+                    ('code', StatusCode.code),
+                    ('name', StatusCode.name),
+                    ('display_order', StatusCode.display_order),
+                )
+            ))
+            duplicates_result = await self.session.execute(duplicates_stmt)
+            duplicates: Dict[str, List[Any]] = {'code': [], 'name': [], 'display_order': []}
+            for row in duplicates_result.all():
+                duplicates[row.field].append(row)
+            duplicate_codes = duplicates['code']
+            duplicate_names = duplicates['name']
+            duplicate_orders = [
+                {'order': int(dup.value), 'count': dup.count}
+                for dup in duplicates['display_order']
+            ]
             
             report = {
                 'timestamp': datetime.now().isoformat(),
-                'total_records': await self.get_total_count(),
+                'total_records': counts['total'],
                 'integrity_issues': {
                     'duplicate_codes': {
                         'count': len(duplicate_codes),
-                        'details': [{'code': dup.code, 'occurrences': dup.count} for dup in duplicate_codes]
+                        'details': [{'code': dup.value, 'occurrences': dup.count} for dup in duplicate_codes]
                     },
                     'duplicate_names': {
                         'count': len(duplicate_names),
-                        'details': [{'name': dup.name, 'occurrences': dup.count} for dup in duplicate_names]
+                        'details': [{'name': dup.value, 'occurrences': dup.count} for dup in duplicate_names]
                     },
                     'multiple_defaults': {
                         'count': max(0, default_count - 1),
@@ -424,15 +429,15 @@ class StatusCodeStatisticsModule(BaseRepository[StatusCode], IStatusCodeStatisti
                         'count': no_order_count
                     },
                     'display_order_duplicates': {
-                        'count': order_stats.get('duplicates_count', 0),
-                        'details': order_stats.get('duplicate_orders', [])
+                        'count': len(duplicate_orders),
+                        'details': duplicate_orders
                     }
                 },
                 'health_score': self._calculate_health_score(
                     len(duplicate_codes),
                     len(duplicate_names),
                     max(0, default_count - 1),
-                    order_stats.get('duplicates_count', 0)
+                    len(duplicate_orders)
                 )
             }
             
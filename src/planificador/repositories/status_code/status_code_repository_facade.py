@@ -52,6 +52,7 @@ from planificador.repositories.status_code.modules import (
 from planificador.exceptions.repository import StatusCodeRepositoryError
 from planificador.exceptions.repository.base_repository_exceptions import RepositoryError
 from planificador.exceptions.base import ValidationError, NotFoundError, ConflictError, BusinessLogicError
+from planificador.database.instrumentation import instrumented_repository
 
 
 def handle_repository_errors(operation_name: str):
@@ -90,6 +91,7 @@ def handle_repository_errors(operation_name: str):
     return decorator
 
 
+@instrumented_repository
 class StatusCodeRepositoryFacade(
     IStatusCodeCrudOperations,
     IStatusCodeQueryOperations,
@@ -31,6 +31,7 @@ from planificador.models.team import Team
 from planificador.models.team_membership import TeamMembership
 from planificador.repositories.team.interfaces.statistics_interface import ITeamStatisticsOperations
 from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.query_fusion import FusedAggregate
 from planificador.exceptions.repository import (
     TeamRepositoryError,
     convert_sqlalchemy_error
@@ -350,43 +351,27 @@ class TeamStatisticsModule(BaseRepository[Team], ITeamStatisticsOperations):
                 f"Obteniendo tendencias de membresías desde {start_date} hasta {end_date}"
             )
             
-            # Membresías iniciadas en el período
-            new_memberships_stmt = (
-                select(func.count(TeamMembership.id))
-                .where(
-                    and_(
-                        TeamMembership.start_date >= start_date,
-                        TeamMembership.start_date <= end_date
-                    )
+            # Membresías iniciadas, terminadas y activas en una sola pasada
+            counts = await (
+                FusedAggregate(TeamMembership)
+                .count(
+                    'new',
+                    TeamMembership.start_date >= start_date,
+                    TeamMembership.start_date <= end_date
                 )
-            )
-            
-            # Membresías terminadas en el período
-            ended_memberships_stmt = (
-                select(func.count(TeamMembership.id))
-                .where(
-                    and_(
-                        TeamMembership.end_date >= start_date,
-                        TeamMembership.end_date <= end_date,
-                        TeamMembership.is_active == False
-                    )
+                .count(
+                    'ended',
+                    TeamMembership.end_date >= start_date,
+                    TeamMembership.end_date <= end_date,
+                    TeamMembership.is_active == False
                 )
+                .count('active', TeamMembership.is_active == True)
+                .execute(self.session)
             )
             
-            # Membresías activas actuales
-            active_memberships_stmt = (
-                select(func.count(TeamMembership.id))
-                .where(TeamMembership.is_active == True)
-            )
-            
-            # Ejecutar consultas
-            new_result = await self.session.execute(new_memberships_stmt)
-            ended_result = await self.session.execute(ended_memberships_stmt)
-            active_result = await self.session.execute(active_memberships_stmt)
-            
-            new_memberships = new_result.scalar() or 0
-            ended_memberships = ended_result.scalar() or 0
-            active_memberships = active_result.scalar() or 0
+            new_memberships = counts['new']
+            ended_memberships = counts['ended']
+            active_memberships = counts['active']
             
             # Calcular métricas
             net_change = new_memberships - ended_memberships
@@ -51,8 +51,10 @@ from planificador.repositories.team.modules import (
     TeamStatisticsModule
 )
 from planificador.exceptions.repository import TeamRepositoryError
+from planificador.database.instrumentation import instrumented_repository
 
 
+@instrumented_repository
 class TeamRepositoryFacade(
     ITeamCrudOperations,
     ITeamQueryOperations,
@@ -13,6 +13,8 @@ Módulos Disponibles:
     - VacationValidationModule: Validaciones de datos y reglas de negocio
     - VacationRelationshipModule: Gestión de relaciones con otras entidades
     - VacationStatisticsModule: Análisis estadístico y reportes
+    - VacationBalanceModule: Lecturas del libro de saldos de vacaciones
+    - VacationApprovalModule: Aprobación en lote con solapamientos y cobertura
 
 Principios de Diseño:
     - Single Responsibility: Cada módulo tiene una responsabilidad específica
@@ -76,11 +78,15 @@ from .query_module import VacationQueryModule
 from .validation_module import VacationValidationModule
 from .relationship_module import VacationRelationshipModule
 from .statistics_module import VacationStatisticsModule
+from .balance_module import VacationBalanceModule
+from .approval_module import VacationApprovalModule
 
 __all__ = [
     'VacationCrudModule',
     'VacationQueryModule', 
     'VacationValidationModule',
     'VacationRelationshipModule',
-    'VacationStatisticsModule'
+    'VacationStatisticsModule',
+    'VacationBalanceModule',
+    'VacationApprovalModule'
 ]
\ No newline at end of file
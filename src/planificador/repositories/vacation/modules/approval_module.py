@@ -0,0 +1,403 @@
+# src/planificador/repositories/vacation/modules/approval_module.py
+
+"""
+Módulo de aprobación en lote para solicitudes de vacaciones.
+
+Este módulo resuelve de una vez todas las solicitudes pendientes de un
+período: carga las pendientes, las vacaciones aprobadas y las membresías
+de equipo implicadas (tres consultas), evalúa en memoria solapamientos y
+cobertura mínima por equipo y día, y aplica las decisiones con un único
+flush en la transacción de la sesión.
+
+Cobertura:
+    Para cada equipo se calculan, con un barrido sobre los eventos de
+    inicio y fin, los miembros por día y los ausentes por día (vacaciones
+    aprobadas). Una solicitud se aprueba si, en cada día laborable que
+    cubre, cada uno de sus equipos conserva al menos el mínimo de personal
+    presente; al aprobarla se suma a los ausentes de sus equipos. Las
+    solicitudes se evalúan por orden de petición (``requested_date``, ``id``).
+
+Principios de Diseño:
+    - Single Responsibility: Solo decisiones de aprobación en lote
+    - Performance: Pocas consultas por lote, evaluación en memoria
+
+Uso:
+    ```python
+    approval_module = VacationApprovalModule(session)
+    result = await approval_module.approve_pending_batch(
+        date(2024, 7, 1), date(2024, 8, 31), min_staff=2, approved_by="rrhh"
+    )
+    await session.commit()
+    ```
+"""
+
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from planificador.config.config import settings
+from planificador.models.team_membership import TeamMembership
+from planificador.models.vacation import Vacation, VacationStatus
+from planificador.repositories.base_repository import BaseRepository
+from planificador.exceptions.repository import (
+    VacationRepositoryError,
+    convert_sqlalchemy_error
+)
+from planificador.exceptions.validation import ValidationError
+import pendulum
+
+_Interval = Tuple[date, date]
+
+
+def _clip(first: date, last: date, start: date, end: date) -> Optional[_Interval]:
+    """Intersección de dos rangos de fechas (None si no se solapan)."""
+    first, last = max(first, start), min(last, end)
+    return (first, last) if first <= last else None
+
+
+def _sweep_counts(intervals: Iterable[_Interval], start: date, end: date) -> List[int]:
+    """
+    Número de intervalos activos por día de ``start`` a ``end``.
+
+    Una pasada sobre los eventos de inicio (+1) y de fin (-1, el día
+    siguiente al último) en lugar de recorrer cada intervalo día a día.
+    """
+    events: Dict[date, int] = defaultdict(int)
+    for first, last in intervals:
+        clipped = _clip(first, last, start, end)
+        if clipped is not None:
+            events[clipped[0]] += 1
+            events[clipped[1] + timedelta(days=1)] -= 1
+    counts = []
+    active = 0
+    for offset in range((end - start).days + 1):
+        active += events.get(start + timedelta(days=offset), 0)
+        counts.append(active)
+    return counts
+
+
+def _is_working_day(day: date) -> bool:
+    """Día laborable según la configuración (días hábiles y festivos fijos)."""
+    return (
+        day.isoweekday() in settings.dates.business_days
+        and day.strftime("%m-%d") not in settings.dates.fixed_holidays
+    )
+
+
+class VacationApprovalModule(BaseRepository[Vacation]):
+    """
+    Módulo para la aprobación en lote de vacaciones pendientes.
+
+    Attributes:
+        session: Sesión de base de datos asíncrona
+        model_class: Clase del modelo Vacation
+        _logger: Logger estructurado con contexto del módulo
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el módulo de aprobación en lote.
+
+        Args:
+            session: Sesión de base de datos asíncrona
+        """
+        super().__init__(session, Vacation)
+        self._logger = self._logger.bind(component="VacationApprovalModule")
+        self._logger.debug("VacationApprovalModule inicializado")
+
+    async def get_by_unique_field(self, field_name: str, value: Any) -> Optional[Vacation]:
+        """Vacation no tiene campos únicos además del ID."""
+        return None
+
+    async def approve_pending_batch(
+        self,
+        start_date: date,
+        end_date: date,
+        min_staff: int = 1,
+        team_minimums: Optional[Dict[int, int]] = None,
+        team_id: Optional[int] = None,
+        vacation_ids: Optional[Sequence[int]] = None,
+        approved_by: Optional[str] = None,
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Aprueba o rechaza en lote las vacaciones pendientes de un período.
+
+        Se rechazan las solicitudes que se solapan con una vacación aprobada
+        del mismo empleado (incluidas las aprobadas en este lote) y las que
+        dejarían a alguno de sus equipos por debajo del mínimo de personal
+        en algún día laborable. Las decisiones se aplican con un único flush;
+        el commit corresponde a quien llama.
+
+        Args:
+            start_date: Inicio del período (solicitudes que lo solapan)
+            end_date: Fin del período
+            min_staff: Personal mínimo presente por equipo y día
+            team_minimums: Mínimos específicos por ID de equipo
+            team_id: Limita el lote a los miembros activos de este equipo
+            vacation_ids: Limita el lote a estas solicitudes
+            approved_by: Responsable registrado en las aprobadas
+            dry_run: Evalúa sin aplicar las decisiones
+
+        Returns:
+            Dict[str, Any]: IDs aprobados, rechazos con motivo y resumen
+
+        Raises:
+            ValidationError: Si el período o los mínimos no son válidos
+            VacationRepositoryError: Si ocurre un error durante el proceso
+        """
+        if end_date < start_date:
+            raise ValidationError(
+                message="La fecha de fin no puede ser anterior a la de inicio",
+                field="end_date",
+                value=end_date
+            )
+        if min_staff < 0 or any(minimum < 0 for minimum in (team_minimums or {}).values()):
+            raise ValidationError(
+                message="El personal mínimo no puede ser negativo",
+                field="min_staff",
+                value=min_staff
+            )
+
+        try:
+            self._logger.info(
+                f"Aprobación en lote del {start_date} al {end_date} "
+                f"(mínimo {min_staff}, equipo {team_id}, simulación {dry_run})"
+            )
+
+            pending = await self._load_pending(start_date, end_date, team_id, vacation_ids)
+            result = {
+                'period': {'start_date': start_date.isoformat(), 'end_date': end_date.isoformat()},
+                'approved': [],
+                'rejected': [],
+                'dry_run': dry_run,
+            }
+            if pending:
+                window = (
+                    min(vacation.start_date for vacation in pending),
+                    max(vacation.end_date for vacation in pending),
+                )
+                employee_ids = {vacation.employee_id for vacation in pending}
+                memberships = await self._load_memberships(employee_ids, window)
+                approved = await self._load_approved(
+                    employee_ids | {employee_id for _, employee_id, _ in memberships}, window
+                )
+                self._decide(pending, approved, memberships, window, min_staff, team_minimums or {}, result)
+
+                if not dry_run:
+                    await self._apply(pending, result, approved_by)
+
+            result['summary'] = {
+                'evaluated': len(pending),
+                'approved': len(result['approved']),
+                'rejected': len(result['rejected']),
+            }
+            self._logger.info(
+                f"Lote resuelto: {result['summary']['approved']} aprobadas, "
+                f"{result['summary']['rejected']} rechazadas"
+            )
+            return result
+
+        except SQLAlchemyError as e:
+            self._logger.error(f"Error en la aprobación en lote: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="approve_pending_batch",
+                entity_type=self.model_class.__name__
+            )
+        except Exception as e:
+            self._logger.error(f"Error inesperado en la aprobación en lote: {e}")
+            raise VacationRepositoryError(
+                message=f"Error inesperado en la aprobación en lote: {e}",
+                operation="approve_pending_batch",
+                entity_type=self.model_class.__name__,
+                original_error=e
+            )
+
+    async def _load_pending(
+        self,
+        start_date: date,
+        end_date: date,
+        team_id: Optional[int],
+        vacation_ids: Optional[Sequence[int]]
+    ) -> List[Vacation]:
+        """Solicitudes pendientes que solapan el período, por orden de petición."""
+        stmt = select(self.model_class).where(
+            self.model_class.status == VacationStatus.PENDING,
+            self.model_class.start_date <= end_date,
+            self.model_class.end_date >= start_date
+        )
+        if team_id is not None:
+            stmt = stmt.where(self.model_class.employee_id.in_(
+                select(TeamMembership.employee_id).where(
+                    TeamMembership.team_id == team_id,
+                    TeamMembership.is_active.is_(True)
+                )
+            ))
+        if vacation_ids is not None:
+            stmt = stmt.where(self.model_class.id.in_(list(vacation_ids)))
+        stmt = stmt.order_by(self.model_class.requested_date, self.model_class.id)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def _load_memberships(
+        self,
+        employee_ids: Iterable[int],
+        window: _Interval
+    ) -> List[Tuple[int, int, _Interval]]:
+        """Membresías activas en la ventana de los equipos de los solicitantes."""
+        teams = select(TeamMembership.team_id).where(
+            TeamMembership.employee_id.in_(list(employee_ids)),
+            TeamMembership.is_active.is_(True)
+        )
+        stmt = select(
+            TeamMembership.team_id,
+            TeamMembership.employee_id,
+            TeamMembership.start_date,
+            TeamMembership.end_date
+        ).where(
+            TeamMembership.team_id.in_(teams),
+            TeamMembership.is_active.is_(True),
+            TeamMembership.start_date <= window[1],
+            or_(TeamMembership.end_date.is_(None), TeamMembership.end_date >= window[0])
+        )
+        result = await self.session.execute(stmt)
+        return [
+            (team, employee_id, (first, last or window[1]))
+            for team, employee_id, first, last in result.all()
+        ]
+
+    async def _load_approved(
+        self,
+        employee_ids: Iterable[int],
+        window: _Interval
+    ) -> Dict[int, List[_Interval]]:
+        """Vacaciones aprobadas en la ventana por empleado."""
+        stmt = select(
+            self.model_class.employee_id,
+            self.model_class.start_date,
+            self.model_class.end_date
+        ).where(
+            self.model_class.employee_id.in_(list(employee_ids)),
+            self.model_class.status == VacationStatus.APPROVED,
+            self.model_class.start_date <= window[1],
+            self.model_class.end_date >= window[0]
+        )
+        result = await self.session.execute(stmt)
+        approved: Dict[int, List[_Interval]] = defaultdict(list)
+        for employee_id, first, last in result.all():
+            approved[employee_id].append((first, last))
+        return approved
+
+    def _decide(
+        self,
+        pending: List[Vacation],
+        approved: Dict[int, List[_Interval]],
+        memberships: List[Tuple[int, int, _Interval]],
+        window: _Interval,
+        min_staff: int,
+        team_minimums: Dict[int, int],
+        result: Dict[str, Any]
+    ) -> None:
+        """Evalúa las solicitudes en memoria y anota las decisiones en ``result``."""
+        start, end = window
+        working = [_is_working_day(start + timedelta(days=offset)) for offset in range((end - start).days + 1)]
+
+        teams_by_employee: Dict[int, List[Tuple[int, _Interval]]] = defaultdict(list)
+        members_by_team: Dict[int, List[_Interval]] = defaultdict(list)
+        absences_by_team: Dict[int, List[_Interval]] = defaultdict(list)
+        for team, employee_id, membership in memberships:
+            teams_by_employee[employee_id].append((team, membership))
+            members_by_team[team].append(membership)
+            for vacation in approved.get(employee_id, ()):
+                absence = _clip(*vacation, *membership)
+                if absence is not None:
+                    absences_by_team[team].append(absence)
+
+        present = {
+            team: [
+                members - absent
+                for members, absent in zip(
+                    _sweep_counts(intervals, start, end),
+                    _sweep_counts(absences_by_team[team], start, end)
+                )
+            ]
+            for team, intervals in members_by_team.items()
+        }
+
+        for vacation in pending:
+            rejection = self._rejection(vacation, approved, teams_by_employee, present,
+                                        working, start, min_staff, team_minimums)
+            if rejection is not None:
+                result['rejected'].append(rejection)
+                continue
+
+            result['approved'].append(vacation.id)
+            approved.setdefault(vacation.employee_id, []).append((vacation.start_date, vacation.end_date))
+            for team, membership in teams_by_employee[vacation.employee_id]:
+                absence = _clip(vacation.start_date, vacation.end_date, *membership)
+                if absence is None:
+                    continue
+                for offset in range((absence[0] - start).days, (absence[1] - start).days + 1):
+                    present[team][offset] -= 1
+
+    def _rejection(
+        self,
+        vacation: Vacation,
+        approved: Dict[int, List[_Interval]],
+        teams_by_employee: Dict[int, List[Tuple[int, _Interval]]],
+        present: Dict[int, List[int]],
+        working: List[bool],
+        start: date,
+        min_staff: int,
+        team_minimums: Dict[int, int]
+    ) -> Optional[Dict[str, Any]]:
+        """Motivo de rechazo de una solicitud (None si puede aprobarse)."""
+        for first, last in approved.get(vacation.employee_id, ()):
+            if first <= vacation.end_date and last >= vacation.start_date:
+                return {
+                    'vacation_id': vacation.id,
+                    'employee_id': vacation.employee_id,
+                    'code': 'OVERLAPPING_VACATION',
+                    'message': f'Se solapa con vacaciones aprobadas del {first} al {last}',
+                }
+
+        for team, membership in teams_by_employee[vacation.employee_id]:
+            absence = _clip(vacation.start_date, vacation.end_date, *membership)
+            if absence is None:
+                continue
+            minimum = team_minimums.get(team, min_staff)
+            for offset in range((absence[0] - start).days, (absence[1] - start).days + 1):
+                if working[offset] and present[team][offset] - 1 < minimum:
+                    day = start + timedelta(days=offset)
+                    return {
+                        'vacation_id': vacation.id,
+                        'employee_id': vacation.employee_id,
+                        'code': 'INSUFFICIENT_COVERAGE',
+                        'message': f'El equipo {team} quedaría por debajo de {minimum} personas el {day}',
+                        'team_id': team,
+                        'date': day.isoformat(),
+                    }
+        return None
+
+    async def _apply(
+        self,
+        pending: List[Vacation],
+        result: Dict[str, Any],
+        approved_by: Optional[str]
+    ) -> None:
+        """Aplica las decisiones con un único flush."""
+        approved_ids = set(result['approved'])
+        today = pendulum.today().date()
+        for vacation in pending:
+            if vacation.id in approved_ids:
+                vacation.status = VacationStatus.APPROVED
+                vacation.approved_date = today
+                vacation.approved_by = approved_by
+            else:
+                vacation.status = VacationStatus.REJECTED
+        await self.session.flush()
@@ -0,0 +1,303 @@
+# src/planificador/repositories/vacation/modules/balance_module.py
+
+"""
+Módulo de saldos para lecturas del libro de vacaciones.
+
+Este módulo lee el libro ``vacation_balances`` (totales acumulados por
+empleado, año, tipo y estado, mantenidos en la misma transacción que las
+vacaciones) en lugar de agregar el histórico de solicitudes, y permite
+reconstruirlo desde ``vacations`` cuando sea necesario.
+
+Principios de Diseño:
+    - Single Responsibility: Solo lecturas de saldos y reconstrucción del libro
+    - Performance: Cada saldo es la lectura de unas pocas filas por clave
+
+Uso:
+    ```python
+    balance_module = VacationBalanceModule(session)
+    balance = await balance_module.get_employee_balance(employee_id, 2024)
+    used = await balance_module.get_days(employee_id, 2024, VacationType.ANNUAL)
+    team = await balance_module.get_team_balances(team_id, 2024)
+    ```
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from datetime import date
+
+from sqlalchemy import select, func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from planificador.models.team_membership import TeamMembership
+from planificador.models.vacation import VacationStatus, VacationType
+from planificador.models.vacation_balance import VacationBalance
+from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.vacation_ledger import rebuild_vacation_balances
+from planificador.exceptions.repository import (
+    VacationRepositoryError,
+    convert_sqlalchemy_error
+)
+
+
+def _empty_totals() -> Dict[str, int]:
+    return {'requests': 0, 'total_days': 0, 'business_days': 0}
+
+
+def summarize_balance_rows(rows: Iterable[VacationBalance]) -> Dict[str, Any]:
+    """
+    Agrupa filas del libro de un empleado y año por estado y por tipo.
+
+    Args:
+        rows: Filas del libro
+
+    Returns:
+        Dict[str, Any]: Totales ``by_status`` (estado → totales) y
+        ``by_type`` (tipo → estado → totales), con claves en minúsculas
+    """
+    by_status = {status.value: _empty_totals() for status in VacationStatus}
+    by_type: Dict[str, Dict[str, Dict[str, int]]] = {}
+    for row in rows:
+        for totals in (
+            by_status[row.status.value],
+            by_type.setdefault(row.vacation_type.value, {}).setdefault(
+                row.status.value, _empty_totals()
+            ),
+        ):
+            totals['requests'] += row.request_count
+            totals['total_days'] += row.total_days
+            totals['business_days'] += row.business_days
+    return {'by_status': by_status, 'by_type': by_type}
+
+
+class VacationBalanceModule(BaseRepository[VacationBalance]):
+    """
+    Módulo para lecturas del libro de saldos de vacaciones.
+
+    Attributes:
+        session: Sesión de base de datos asíncrona
+        model_class: Clase del modelo VacationBalance
+        _logger: Logger estructurado con contexto del módulo
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el módulo de saldos de vacaciones.
+
+        Args:
+            session: Sesión de base de datos asíncrona
+        """
+        super().__init__(session, VacationBalance)
+        self._logger = self._logger.bind(component="VacationBalanceModule")
+        self._logger.debug("VacationBalanceModule inicializado")
+
+    async def get_by_unique_field(self, field_name: str, value: Any) -> Optional[VacationBalance]:
+        """El libro no tiene campos únicos individuales."""
+        return None
+
+    async def get_balance_rows(
+        self,
+        employee_ids: Sequence[int],
+        year: int
+    ) -> List[VacationBalance]:
+        """
+        Obtiene las filas del libro de varios empleados en un año.
+
+        Args:
+            employee_ids: IDs de los empleados
+            year: Año de inicio de las vacaciones
+
+        Returns:
+            List[VacationBalance]: Filas con al menos una solicitud
+
+        Raises:
+            VacationRepositoryError: Si ocurre un error durante la consulta
+        """
+        try:
+            stmt = select(self.model_class).where(
+                self.model_class.employee_id.in_(list(employee_ids)),
+                self.model_class.year == year,
+                self.model_class.request_count != 0
+            )
+            result = await self.session.execute(stmt)
+            return list(result.scalars().all())
+
+        except SQLAlchemyError as e:
+            self._logger.error(f"Error obteniendo saldos de vacaciones: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="get_balance_rows",
+                entity_type=self.model_class.__name__
+            )
+        except Exception as e:
+            self._logger.error(f"Error inesperado obteniendo saldos: {e}")
+            raise VacationRepositoryError(
+                message=f"Error inesperado obteniendo saldos: {e}",
+                operation="get_balance_rows",
+                entity_type=self.model_class.__name__,
+                original_error=e
+            )
+
+    async def get_employee_balance(self, employee_id: int, year: int) -> Dict[str, Any]:
+        """
+        Obtiene el saldo de un empleado en un año agrupado por estado y tipo.
+
+        Args:
+            employee_id: ID del empleado
+            year: Año de inicio de las vacaciones
+
+        Returns:
+            Dict[str, Any]: ``employee_id``, ``year``, ``by_status`` y ``by_type``
+
+        Raises:
+            VacationRepositoryError: Si ocurre un error durante la consulta
+        """
+        rows = await self.get_balance_rows([employee_id], year)
+        return {'employee_id': employee_id, 'year': year, **summarize_balance_rows(rows)}
+
+    async def get_days(
+        self,
+        employee_id: int,
+        year: int,
+        vacation_type: VacationType,
+        statuses: Sequence[VacationStatus] = (VacationStatus.APPROVED,),
+        field: str = "total_days"
+    ) -> int:
+        """
+        Suma una columna del libro para un empleado, año, tipo y estados.
+
+        Pensado para comprobaciones de aprobación: lee como mucho una fila
+        por estado.
+
+        Args:
+            employee_id: ID del empleado
+            year: Año de inicio de las vacaciones
+            vacation_type: Tipo de vacación
+            statuses: Estados a sumar (por defecto solo aprobadas)
+            field: ``total_days``, ``business_days`` o ``request_count``
+
+        Returns:
+            int: Suma de la columna
+
+        Raises:
+            VacationRepositoryError: Si ocurre un error durante la consulta
+        """
+        try:
+            column = getattr(self.model_class, field)
+            stmt = select(func.coalesce(func.sum(column), 0)).where(
+                self.model_class.employee_id == employee_id,
+                self.model_class.year == year,
+                self.model_class.vacation_type == vacation_type,
+                self.model_class.status.in_(list(statuses))
+            )
+            result = await self.session.execute(stmt)
+            return int(result.scalar() or 0)
+
+        except SQLAlchemyError as e:
+            self._logger.error(f"Error obteniendo días del libro: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="get_days",
+                entity_type=self.model_class.__name__,
+                entity_id=employee_id
+            )
+        except Exception as e:
+            self._logger.error(f"Error inesperado obteniendo días del libro: {e}")
+            raise VacationRepositoryError(
+                message=f"Error inesperado obteniendo días del libro: {e}",
+                operation="get_days",
+                entity_type=self.model_class.__name__,
+                entity_id=employee_id,
+                original_error=e
+            )
+
+    async def get_team_balances(
+        self,
+        team_id: int,
+        year: int
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Obtiene los saldos de los miembros activos de un equipo en un año.
+
+        Args:
+            team_id: ID del equipo
+            year: Año de inicio de las vacaciones
+
+        Returns:
+            Dict[int, Dict[str, Any]]: Saldo por ID de empleado (incluye
+            miembros sin solicitudes)
+
+        Raises:
+            VacationRepositoryError: Si ocurre un error durante la consulta
+        """
+        try:
+            members_stmt = select(TeamMembership.employee_id).where(
+                TeamMembership.team_id == team_id,
+                TeamMembership.is_active.is_(True),
+                TeamMembership.start_date <= date(year, 12, 31),
+                or_(
+                    TeamMembership.end_date.is_(None),
+                    TeamMembership.end_date >= date(year, 1, 1)
+                )
+            ).distinct()
+            result = await self.session.execute(members_stmt)
+            member_ids = sorted(result.scalars().all())
+
+        except SQLAlchemyError as e:
+            self._logger.error(f"Error obteniendo miembros del equipo: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="get_team_balances",
+                entity_type=self.model_class.__name__,
+                entity_id=team_id
+            )
+
+        rows_by_employee: Dict[int, List[VacationBalance]] = {employee_id: [] for employee_id in member_ids}
+        if member_ids:
+            for row in await self.get_balance_rows(member_ids, year):
+                rows_by_employee[row.employee_id].append(row)
+
+        return {
+            employee_id: {'employee_id': employee_id, 'year': year, **summarize_balance_rows(rows)}
+            for employee_id, rows in rows_by_employee.items()
+        }
+
+    async def rebuild_balances(
+        self,
+        employee_ids: Optional[Iterable[int]] = None,
+        years: Optional[Iterable[int]] = None
+    ) -> None:
+        """
+        Reconstruye el libro desde las vacaciones en la transacción actual.
+
+        Args:
+            employee_ids: Limita la reconstrucción a estos empleados
+            years: Limita la reconstrucción a estos años
+
+        Raises:
+            VacationRepositoryError: Si ocurre un error durante la reconstrucción
+        """
+        employee_ids = list(employee_ids) if employee_ids is not None else None
+        years = list(years) if years is not None else None
+        try:
+            self._logger.info(
+                f"Reconstruyendo libro de vacaciones (empleados={employee_ids}, años={years})"
+            )
+            await self.session.run_sync(
+                lambda session: rebuild_vacation_balances(session.connection(), employee_ids, years)
+            )
+
+        except SQLAlchemyError as e:
+            self._logger.error(f"Error reconstruyendo libro de vacaciones: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="rebuild_balances",
+                entity_type=self.model_class.__name__
+            )
+        except Exception as e:
+            self._logger.error(f"Error inesperado reconstruyendo libro: {e}")
+            raise VacationRepositoryError(
+                message=f"Error inesperado reconstruyendo libro: {e}",
+                operation="rebuild_balances",
+                entity_type=self.model_class.__name__,
+                original_error=e
+            )
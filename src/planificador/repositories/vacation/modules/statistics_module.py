@@ -27,10 +27,11 @@ from sqlalchemy.orm import selectinload, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
-from planificador.models.vacation import Vacation
+from planificador.models.vacation import Vacation, VacationStatus, VacationType
 from planificador.models.employee import Employee
 from planificador.repositories.vacation.interfaces.statistics_interface import IVacationStatisticsOperations
 from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.vacation.modules.balance_module import VacationBalanceModule
 from planificador.exceptions.repository import (
     VacationRepositoryError,
     convert_sqlalchemy_error
@@ -49,9 +50,13 @@ class VacationStatisticsModule(BaseRepository[Vacation], IVacationStatisticsOper
     Attributes:
         session: Sesión de base de datos asíncrona
         model_class: Clase del modelo Vacation
+        balance_module: Lecturas del libro de saldos de vacaciones
         _logger: Logger estructurado con contexto del módulo
     """
 
+    # Días anuales estándar por empleado
+    ANNUAL_ALLOWANCE = 25
+
     def __init__(self, session: AsyncSession):
         """
         Inicializa el módulo de estadísticas para vacaciones.
@@ -60,9 +65,37 @@ class VacationStatisticsModule(BaseRepository[Vacation], IVacationStatisticsOper
             session: Sesión de base de datos asíncrona
         """
         super().__init__(session, Vacation)
+        self.balance_module = VacationBalanceModule(session)
         self._logger = self._logger.bind(component="VacationStatisticsModule")
         self._logger.debug("VacationStatisticsModule inicializado")
 
+    def _balance_statistics(self, balance: Dict[str, Any]) -> Dict[str, Any]:
+        """Estadísticas de un empleado a partir de su saldo en el libro."""
+        by_status = balance['by_status']
+        approved = VacationStatus.APPROVED.value
+        annual_days = balance['by_type'].get(VacationType.ANNUAL.value, {}).get(approved, {}).get('total_days', 0)
+        sick_days = balance['by_type'].get(VacationType.SICK.value, {}).get(approved, {}).get('total_days', 0)
+        annual_allowance = self.ANNUAL_ALLOWANCE
+        
+        return {
+            'employee_id': balance['employee_id'],
+            'year': balance['year'],
+            'total_days_requested': sum(totals['total_days'] for totals in by_status.values()),
+            'approved_days': by_status[approved]['total_days'],
+            'pending_days': by_status[VacationStatus.PENDING.value]['total_days'],
+            'annual_days_used': annual_days,
+            'sick_days_used': sick_days,
+            'annual_allowance': annual_allowance,
+            'remaining_annual_days': max(0, annual_allowance - annual_days),
+            'vacation_counts': {
+                'total': sum(totals['requests'] for totals in by_status.values()),
+                'approved': by_status[approved]['requests'],
+                'pending': by_status[VacationStatus.PENDING.value]['requests'],
+                'rejected': by_status[VacationStatus.REJECTED.value]['requests']
+            },
+            'utilization_rate': round((annual_days / annual_allowance) * 100, 2) if annual_allowance > 0 else 0
+        }
+
     async def get_employee_vacation_statistics(
         self, 
         employee_id: int,
@@ -87,95 +120,9 @@ class VacationStatisticsModule(BaseRepository[Vacation], IVacationStatisticsOper
             
             self._logger.debug(f"Obteniendo estadísticas de empleado {employee_id} para año {year}")
             
-            # Consulta base para vacaciones del empleado en el año
-            base_conditions = [
-                self.model_class.employee_id == employee_id,
-                extract('year', self.model_class.start_date) == year
-            ]
-            
-            # Total de días de vacaciones
-            total_days_stmt = select(
-                func.coalesce(func.sum(self.model_class.days_requested), 0)
-            ).where(and_(*base_conditions))
-            
-            # Días por estado
-            approved_days_stmt = select(
-                func.coalesce(func.sum(self.model_class.days_requested), 0)
-            ).where(and_(
-                *base_conditions,
-                self.model_class.status == 'APPROVED'
-            ))
-            
-            pending_days_stmt = select(
-                func.coalesce(func.sum(self.model_class.days_requested), 0)
-            ).where(and_(
-                *base_conditions,
-                self.model_class.status == 'PENDING'
-            ))
-            
-            # Días por tipo de vacación
-            annual_days_stmt = select(
-                func.coalesce(func.sum(self.model_class.days_requested), 0)
-            ).where(and_(
-                *base_conditions,
-                self.model_class.vacation_type == 'ANNUAL',
-                self.model_class.status == 'APPROVED'
-            ))
-            
-            sick_days_stmt = select(
-                func.coalesce(func.sum(self.model_class.days_requested), 0)
-            ).where(and_(
-                *base_conditions,
-                self.model_class.vacation_type == 'SICK',
-                self.model_class.status == 'APPROVED'
-            ))
-            
-            # Ejecutar consultas
-            total_days_result = await self.session.execute(total_days_stmt)
-            approved_days_result = await self.session.execute(approved_days_stmt)
-            pending_days_result = await self.session.execute(pending_days_stmt)
-            annual_days_result = await self.session.execute(annual_days_stmt)
-            sick_days_result = await self.session.execute(sick_days_stmt)
-            
-            total_days = total_days_result.scalar() or 0
-            approved_days = approved_days_result.scalar() or 0
-            pending_days = pending_days_result.scalar() or 0
-            annual_days = annual_days_result.scalar() or 0
-            sick_days = sick_days_result.scalar() or 0
-            
-            # Contar vacaciones por estado
-            count_stmt = select(
-                func.count(case((self.model_class.status == 'APPROVED', 1))).label('approved_count'),
-                func.count(case((self.model_class.status == 'PENDING', 1))).label('pending_count'),
-                func.count(case((self.model_class.status == 'REJECTED', 1))).label('rejected_count'),
-                func.count(self.model_class.id).label('total_count')
-            ).where(and_(*base_conditions))
-            
-            count_result = await self.session.execute(count_stmt)
-            counts = count_result.first()
-            
-            # Calcular balance (asumiendo 25 días anuales estándar)
-            annual_allowance = 25
-            remaining_days = annual_allowance - annual_days
-            
-            statistics = {
-                'employee_id': employee_id,
-                'year': year,
-                'total_days_requested': total_days,
-                'approved_days': approved_days,
-                'pending_days': pending_days,
-                'annual_days_used': annual_days,
-                'sick_days_used': sick_days,
-                'annual_allowance': annual_allowance,
-                'remaining_annual_days': max(0, remaining_days),
-                'vacation_counts': {
-                    'total': counts.total_count if counts else 0,
-                    'approved': counts.approved_count if counts else 0,
-                    'pending': counts.pending_count if counts else 0,
-                    'rejected': counts.rejected_count if counts else 0
-                },
-                'utilization_rate': round((annual_days / annual_allowance) * 100, 2) if annual_allowance > 0 else 0
-            }
+            # Una lectura del libro de saldos en lugar de agregar el histórico
+            balance = await self.balance_module.get_employee_balance(employee_id, year)
+            statistics = self._balance_statistics(balance)
             
             self._logger.debug(f"Estadísticas calculadas para empleado {employee_id}")
             
@@ -223,77 +170,43 @@ class VacationStatisticsModule(BaseRepository[Vacation], IVacationStatisticsOper
             
             self._logger.debug(f"Obteniendo balance de equipo {team_id} para año {year}")
             
-            # Consulta para obtener empleados del equipo y sus vacaciones
-            # Nota: Asumiendo que existe una relación entre Employee y Team
-            stmt = select(
-                Employee.id.label('employee_id'),
-                Employee.name.label('employee_name'),
-                func.coalesce(func.sum(
-                    case((
-                        and_(
-                            self.model_class.vacation_type == 'ANNUAL',
-                            self.model_class.status == 'APPROVED',
-                            extract('year', self.model_class.start_date) == year
-                        ), 
-                        self.model_class.days_requested
-                    ), else_=0)
-                ), 0).label('annual_days_used'),
-                func.coalesce(func.sum(
-                    case((
-                        and_(
-                            self.model_class.status == 'PENDING',
-                            extract('year', self.model_class.start_date) == year
-                        ), 
-                        self.model_class.days_requested
-                    ), else_=0)
-                ), 0).label('pending_days')
-            ).select_from(
-                Employee
-            ).outerjoin(
-                self.model_class, Employee.id == self.model_class.employee_id
-            ).where(
-                Employee.team_id == team_id  # Asumiendo que Employee tiene team_id
-            ).group_by(Employee.id, Employee.name)
-            
-            result = await self.session.execute(stmt)
-            employee_balances = result.all()
+            balances = await self.balance_module.get_team_balances(team_id, year)
+            names = {}
+            if balances:
+                result = await self.session.execute(
+                    select(Employee.id, Employee.full_name).where(Employee.id.in_(list(balances)))
+                )
+                names = dict(result.all())
+            
+            employees = []
+            for employee_id, balance in balances.items():
+                statistics = self._balance_statistics(balance)
+                employees.append({
+                    'employee_id': employee_id,
+                    'employee_name': names.get(employee_id),
+                    'annual_allowance': statistics['annual_allowance'],
+                    'annual_days_used': statistics['annual_days_used'],
+                    'pending_days': statistics['pending_days'],
+                    'remaining_days': statistics['remaining_annual_days'],
+                    'utilization_rate': statistics['utilization_rate']
+                })
             
-            # Calcular estadísticas del equipo
+            total_allowance = len(employees) * self.ANNUAL_ALLOWANCE
+            total_used = sum(emp['annual_days_used'] for emp in employees)
             team_stats = {
                 'team_id': team_id,
                 'year': year,
-                'employee_count': len(employee_balances),
-                'total_annual_allowance': len(employee_balances) * 25,  # 25 días por empleado
-                'total_annual_used': sum(emp.annual_days_used for emp in employee_balances),
-                'total_pending_days': sum(emp.pending_days for emp in employee_balances),
-                'employees': []
+                'employee_count': len(employees),
+                'total_annual_allowance': total_allowance,
+                'total_annual_used': total_used,
+                'total_pending_days': sum(emp['pending_days'] for emp in employees),
+                'employees': employees,
+                'team_utilization_rate': (
+                    round((total_used / total_allowance) * 100, 2) if total_allowance > 0 else 0
+                ),
+                'remaining_allowance': total_allowance - total_used
             }
             
-            # Detalles por empleado
-            for emp in employee_balances:
-                annual_allowance = 25
-                remaining = annual_allowance - emp.annual_days_used
-                
-                team_stats['employees'].append({
-                    'employee_id': emp.employee_id,
-                    'employee_name': emp.employee_name,
-                    'annual_allowance': annual_allowance,
-                    'annual_days_used': emp.annual_days_used,
-                    'pending_days': emp.pending_days,
-                    'remaining_days': max(0, remaining),
-                    'utilization_rate': round((emp.annual_days_used / annual_allowance) * 100, 2)
-                })
-            
-            # Calcular métricas del equipo
-            if team_stats['total_annual_allowance'] > 0:
-                team_stats['team_utilization_rate'] = round(
-                    (team_stats['total_annual_used'] / team_stats['total_annual_allowance']) * 100, 2
-                )
-            else:
-                team_stats['team_utilization_rate'] = 0
-            
-            team_stats['remaining_allowance'] = team_stats['total_annual_allowance'] - team_stats['total_annual_used']
-            
             self._logger.debug(f"Balance calculado para equipo {team_id}")
             
             return team_stats
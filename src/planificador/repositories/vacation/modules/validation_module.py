@@ -27,10 +27,11 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
-from planificador.models.vacation import Vacation
+from planificador.models.vacation import Vacation, VacationStatus, VacationType
 from planificador.models.employee import Employee
 from planificador.repositories.vacation.interfaces.validation_interface import IVacationValidationOperations
 from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.vacation.modules.balance_module import VacationBalanceModule
 from planificador.exceptions.repository import (
     VacationRepositoryError,
     convert_sqlalchemy_error
@@ -491,7 +492,7 @@ class VacationValidationModule(BaseRepository[Vacation], IVacationValidationOper
                 start_date = data.get('start_date')
                 
                 # Verificar límite de vacaciones anuales
-                if vacation_type == 'ANNUAL' and employee_id and start_date:
+                if vacation_type in ('ANNUAL', VacationType.ANNUAL) and employee_id and start_date:
                     year = pendulum.parse(str(start_date)).year
                     annual_count = await self._count_annual_vacations(employee_id, year)
                     if annual_count >= 4:  # Máximo 4 períodos anuales por año
@@ -666,18 +667,16 @@ class VacationValidationModule(BaseRepository[Vacation], IVacationValidationOper
         return 0
     
     async def _count_annual_vacations(self, employee_id: int, year: int) -> int:
-        """Cuenta las vacaciones anuales de un empleado en un año específico."""
+        """Cuenta las vacaciones anuales pendientes o aprobadas de un empleado en un año."""
         try:
-            stmt = select(func.count(self.model_class.id)).where(
-                and_(
-                    self.model_class.employee_id == employee_id,
-                    self.model_class.vacation_type == 'ANNUAL',
-                    func.extract('year', self.model_class.start_date) == year,
-                    self.model_class.status.in_(['PENDING', 'APPROVED'])
-                )
+            # Lectura del libro de saldos: como mucho una fila por estado
+            return await VacationBalanceModule(self.session).get_days(
+                employee_id,
+                year,
+                VacationType.ANNUAL,
+                statuses=(VacationStatus.PENDING, VacationStatus.APPROVED),
+                field="request_count"
             )
-            result = await self.session.execute(stmt)
-            return result.scalar() or 0
         except Exception:
             return 0
     
@@ -34,7 +34,7 @@ from datetime import date
 from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 
-from planificador.models.vacation import Vacation
+from planificador.models.vacation import Vacation, VacationStatus, VacationType
 from planificador.repositories.vacation.interfaces import (
     IVacationCrudOperations,
     IVacationQueryOperations,
@@ -47,11 +47,14 @@ from planificador.repositories.vacation.modules import (
     VacationQueryModule,
     VacationValidationModule,
     VacationRelationshipModule,
-    VacationStatisticsModule
+    VacationStatisticsModule,
+    VacationApprovalModule
 )
 from planificador.exceptions.repository import VacationRepositoryError
+from planificador.database.instrumentation import instrumented_repository
 
 
+@instrumented_repository
 class VacationRepositoryFacade(
     IVacationCrudOperations,
     IVacationQueryOperations,
@@ -72,6 +75,8 @@ class VacationRepositoryFacade(
         validation_module: Módulo para operaciones de validación
         relationship_module: Módulo para operaciones de relaciones
         statistics_module: Módulo para operaciones de estadísticas
+        balance_module: Módulo de lectura del libro de saldos
+        approval_module: Módulo de aprobación en lote
     """
 
     def __init__(self, session: AsyncSession):
@@ -85,6 +90,8 @@ class VacationRepositoryFacade(
         self.validation_module = VacationValidationModule(session)
         self.relationship_module = VacationRelationshipModule(session)
         self.statistics_module = VacationStatisticsModule(session)
+        self.balance_module = self.statistics_module.balance_module
+        self.approval_module = VacationApprovalModule(session)
         
         self._logger.debug("VacationRepositoryFacade inicializada")
 
@@ -324,6 +331,57 @@ class VacationRepositoryFacade(
             year, include_projections
         )
 
+    # =============================================================================
+    # SALDOS DE VACACIONES
+    # =============================================================================
+
+    async def get_employee_vacation_balance(
+        self,
+        employee_id: int,
+        year: int
+    ) -> Dict[str, Any]:
+        """Obtiene el saldo del empleado desde el libro de saldos."""
+        return await self.balance_module.get_employee_balance(employee_id, year)
+
+    async def get_vacation_days(
+        self,
+        employee_id: int,
+        year: int,
+        vacation_type: VacationType,
+        statuses: Tuple[VacationStatus, ...] = (VacationStatus.APPROVED,)
+    ) -> int:
+        """Obtiene los días de un tipo y estados desde el libro de saldos."""
+        return await self.balance_module.get_days(employee_id, year, vacation_type, statuses)
+
+    async def rebuild_vacation_balances(
+        self,
+        employee_ids: Optional[List[int]] = None,
+        years: Optional[List[int]] = None
+    ) -> None:
+        """Reconstruye el libro de saldos desde las vacaciones."""
+        await self.balance_module.rebuild_balances(employee_ids, years)
+
+    # =============================================================================
+    # APROBACIÓN EN LOTE
+    # =============================================================================
+
+    async def approve_pending_vacations_batch(
+        self,
+        start_date: date,
+        end_date: date,
+        min_staff: int = 1,
+        team_minimums: Optional[Dict[int, int]] = None,
+        team_id: Optional[int] = None,
+        vacation_ids: Optional[List[int]] = None,
+        approved_by: Optional[str] = None,
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """Aprueba o rechaza en lote las vacaciones pendientes del período."""
+        return await self.approval_module.approve_pending_batch(
+            start_date, end_date, min_staff, team_minimums,
+            team_id, vacation_ids, approved_by, dry_run
+        )
+
     # =============================================================================
     # MÉTODOS COMPUESTOS DE ALTO NIVEL
     # =============================================================================
@@ -0,0 +1,277 @@
+"""
+Mantenimiento del libro de saldos de vacaciones (``vacation_balances``).
+
+Las filas del libro se mantienen en la misma transacción que las
+vacaciones: los listeners ``before_flush``/``after_flush`` calculan los
+deltas de las altas, cambios (de estado, tipo, fechas, días o empleado) y
+bajas de ``Vacation`` y los aplican con un upsert del dialecto que suma el
+delta a la fila existente o la crea (``INSERT ... ON CONFLICT DO UPDATE``).
+Las inserciones en bloque con parámetros aplican sus deltas fila a fila;
+las actualizaciones y borrados en bloque por sentencia no exponen sus filas
+y reconstruyen el libro completo después de ejecutarse.
+
+Así, las pantallas de saldo y las comprobaciones de aprobación leen unas
+pocas filas en lugar de agregar el histórico de vacaciones.
+
+Los listeners se registran al importar ``planificador.repositories``.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, event, extract, func, insert, inspect, select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from planificador.models.vacation import Vacation, VacationStatus, VacationType
+from planificador.models.vacation_balance import VacationBalance
+
+# (employee_id, year, vacation_type, status)
+BalanceKey = Tuple[int, int, VacationType, VacationStatus]
+
+# Opción de ejecución para sentencias que ya mantienen el libro por su cuenta
+SKIP_LEDGER_OPTION = "skip_vacation_ledger"
+
+_PREVIOUS_KEY = "vacation_ledger_previous"
+
+_TRACKED_FIELDS = (
+    "employee_id", "start_date", "vacation_type", "status", "total_days", "business_days",
+)
+
+_KEY_COLUMNS = ("employee_id", "year", "vacation_type", "status")
+
+
+class BalanceDeltas:
+    """Acumulador de deltas (solicitudes, días totales, días hábiles) por clave."""
+
+    def __init__(self) -> None:
+        self._deltas: Dict[BalanceKey, List[int]] = defaultdict(lambda: [0, 0, 0])
+
+    def add(self, values: Dict[str, Any], sign: int = 1) -> None:
+        """
+        Suma (o resta, con ``sign=-1``) una vacación a su clave.
+
+        Args:
+            values: Valores de la vacación (``employee_id``, ``start_date``,
+                ``vacation_type``, ``status``, ``total_days``, ``business_days``)
+            sign: 1 para sumar, -1 para restar
+        """
+        key = (
+            values["employee_id"],
+            values["start_date"].year,
+            values["vacation_type"],
+            values["status"] or VacationStatus.PENDING,
+        )
+        delta = self._deltas[key]
+        delta[0] += sign
+        delta[1] += sign * (values["total_days"] or 0)
+        delta[2] += sign * (values["business_days"] or 0)
+
+    def items(self) -> List[Tuple[BalanceKey, List[int]]]:
+        """Deltas no nulos."""
+        return [(key, delta) for key, delta in self._deltas.items() if any(delta)]
+
+    def __bool__(self) -> bool:
+        return bool(self.items())
+
+
+def _upsert_balance(connection: Connection, values: Dict[str, Any]) -> Any:
+    """
+    Sentencia que suma los totales de ``values`` a su fila del libro o la crea.
+
+    Args:
+        connection: Conexión síncrona de la transacción en curso
+        values: Clave y deltas de la fila
+
+    Returns:
+        Sentencia ``INSERT`` con la cláusula de conflicto del dialecto
+    """
+    table = VacationBalance.__table__
+    if connection.dialect.name == "mysql":
+        statement = mysql.insert(table).values(**values)
+        inserted = statement.inserted
+        return statement.on_duplicate_key_update(
+            request_count=table.c.request_count + inserted.request_count,
+            total_days=table.c.total_days + inserted.total_days,
+            business_days=table.c.business_days + inserted.business_days,
+            updated_at=func.now(),
+        )
+
+    dialect = postgresql if connection.dialect.name == "postgresql" else sqlite
+    statement = dialect.insert(table).values(**values)
+    return statement.on_conflict_do_update(
+        index_elements=[table.c[name] for name in _KEY_COLUMNS],
+        set_={
+            "request_count": table.c.request_count + statement.excluded.request_count,
+            "total_days": table.c.total_days + statement.excluded.total_days,
+            "business_days": table.c.business_days + statement.excluded.business_days,
+            "updated_at": func.now(),
+        },
+    )
+
+
+def apply_balance_deltas(connection: Connection, deltas: BalanceDeltas) -> None:
+    """
+    Aplica deltas al libro sobre la conexión de la transacción en curso.
+
+    Cada clave se aplica con un único upsert, sin la ventana entre un
+    ``UPDATE`` sin filas y el ``INSERT`` posterior en la que otra
+    transacción podría crear la misma fila.
+
+    Args:
+        connection: Conexión síncrona (``session.connection()`` en un listener
+            o dentro de ``run_sync``)
+        deltas: Deltas acumulados por clave
+    """
+    for (employee_id, year, vacation_type, status), (count, total, business) in deltas.items():
+        connection.execute(_upsert_balance(connection, {
+            "employee_id": employee_id,
+            "year": year,
+            "vacation_type": vacation_type,
+            "status": status,
+            "request_count": count,
+            "total_days": total,
+            "business_days": business,
+        }))
+
+
+def rebuild_vacation_balances(
+    connection: Connection,
+    employee_ids: Optional[Iterable[int]] = None,
+    years: Optional[Iterable[int]] = None
+) -> None:
+    """
+    Recalcula el libro desde ``vacations`` con una única agregación.
+
+    Args:
+        connection: Conexión síncrona de la transacción en curso
+        employee_ids: Limita la reconstrucción a estos empleados
+        years: Limita la reconstrucción a estos años
+    """
+    table = VacationBalance.__table__
+    vacations = Vacation.__table__
+    year = extract("year", vacations.c.start_date)
+
+    clear = delete(table)
+    aggregate = select(
+        vacations.c.employee_id,
+        year,
+        vacations.c.vacation_type,
+        vacations.c.status,
+        func.count(),
+        func.sum(vacations.c.total_days),
+        func.sum(vacations.c.business_days),
+    ).group_by(vacations.c.employee_id, year, vacations.c.vacation_type, vacations.c.status)
+    if employee_ids is not None:
+        employee_ids = list(employee_ids)
+        clear = clear.where(table.c.employee_id.in_(employee_ids))
+        aggregate = aggregate.where(vacations.c.employee_id.in_(employee_ids))
+    if years is not None:
+        years = list(years)
+        clear = clear.where(table.c.year.in_(years))
+        aggregate = aggregate.where(year.in_(years))
+
+    connection.execute(clear)
+    connection.execute(insert(table).from_select(
+        ["employee_id", "year", "vacation_type", "status",
+         "request_count", "total_days", "business_days"],
+        aggregate,
+    ))
+
+
+def _previous_values(session: Session, instances: List[Vacation]) -> Dict[Vacation, Dict[str, Any]]:
+    """
+    Valores de las vacaciones antes del flush en curso.
+
+    Se toman del historial de atributos; las instancias con algún atributo
+    asignado sin valor anterior conocido (expirado antes del cambio) se
+    leen de la base de datos en una única consulta.
+    """
+    previous: Dict[Vacation, Dict[str, Any]] = {}
+    unknown: Dict[int, Vacation] = {}
+    for instance in instances:
+        state = inspect(instance)
+        values = {}
+        for name in _TRACKED_FIELDS:
+            history = state.attrs[name].history
+            if history.deleted:
+                values[name] = history.deleted[0]
+            elif history.added and not history.unchanged:
+                unknown[instance.id] = instance
+                break
+            else:
+                values[name] = getattr(instance, name)
+        else:
+            previous[instance] = values
+
+    if unknown:
+        table = Vacation.__table__
+        rows = session.connection().execute(
+            select(table.c.id, *(table.c[name] for name in _TRACKED_FIELDS))
+            .where(table.c.id.in_(list(unknown)))
+        )
+        for row in rows.mappings():
+            previous[unknown[row["id"]]] = {name: row[name] for name in _TRACKED_FIELDS}
+    return previous
+
+
+def _current_values(instance: Vacation) -> Dict[str, Any]:
+    return {name: getattr(instance, name) for name in _TRACKED_FIELDS}
+
+
+@event.listens_for(Session, "before_flush")
+def _capture_previous_values(session: Session, flush_context: Any, instances: Any) -> None:
+    # Las bajas se leen antes del flush: después ya no hay fila que cargar
+    changed = [
+        instance
+        for instance in (*session.dirty, *session.deleted)
+        if isinstance(instance, Vacation)
+        and (instance in session.deleted or session.is_modified(instance))
+    ]
+    session.info[_PREVIOUS_KEY] = _previous_values(session, changed) if changed else {}
+
+
+@event.listens_for(Session, "after_flush")
+def _update_ledger_on_flush(session: Session, flush_context: Any) -> None:
+    previous = session.info.pop(_PREVIOUS_KEY, {})
+    deltas = BalanceDeltas()
+    for instance in session.new:
+        if isinstance(instance, Vacation):
+            deltas.add(_current_values(instance))
+    for instance, values in previous.items():
+        deltas.add(values, -1)
+        if instance not in session.deleted:
+            deltas.add(_current_values(instance))
+    if deltas:
+        apply_balance_deltas(session.connection(), deltas)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _update_ledger_on_statement(orm_execute_state: Any) -> Any:
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return None
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.class_ is not Vacation:
+        return None
+    if orm_execute_state.execution_options.get(SKIP_LEDGER_OPTION):
+        return None
+
+    parameters = orm_execute_state.parameters
+    if isinstance(parameters, dict):
+        parameters = [parameters]
+    rows = parameters if orm_execute_state.is_insert and parameters else None
+    if rows is not None and all(
+        all(name in row for name in _TRACKED_FIELDS if name != "status") for row in rows
+    ):
+        result = orm_execute_state.invoke_statement()
+        deltas = BalanceDeltas()
+        for row in rows:
+            deltas.add({**row, "status": row.get("status")})
+        apply_balance_deltas(orm_execute_state.session.connection(), deltas)
+        return result
+
+    # Sin filas conocidas: se recalcula el libro completo tras la sentencia
+    result = orm_execute_state.invoke_statement()
+    rebuild_vacation_balances(orm_execute_state.session.connection())
+    return result
@@ -25,6 +25,7 @@ from typing import List, Optional, Dict, Any
 from datetime import date
 
 from planificador.models.workload import Workload
+from planificador.schemas.response import WorkloadListResponse
 from planificador.exceptions.repository import WorkloadRepositoryError
 
 
@@ -135,4 +136,17 @@ class IWorkloadQueryOperations(ABC):
     @abstractmethod
     async def get_weekly_workload(self, employee_id: int, week_start: date) -> float:
         """Calcula total de horas trabajadas por empleado en una semana."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def list_workload_summaries(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        employee_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[WorkloadListResponse]:
+        """Obtiene el listado de cargas de trabajo con solo las columnas de la vista."""
+        pass
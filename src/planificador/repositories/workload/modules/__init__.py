@@ -20,6 +20,7 @@ Módulos Implementados:
     - WorkloadValidationModule: Validaciones de datos y reglas de negocio
     - WorkloadStatisticsModule: Análisis estadísticos y métricas
     - WorkloadRelationshipModule: Gestión de relaciones y asociaciones
+    - WorkloadSyncModule: Sincronización incremental de cargas desde horarios
 
 Uso:
     ```python
@@ -57,11 +58,15 @@ from .query_module import WorkloadQueryModule
 from .validation_module import WorkloadValidationModule
 from .statistics_module import WorkloadStatisticsModule
 from .relationship_module import WorkloadRelationshipModule
+from .sync_module import WorkloadSyncModule, ScheduleChangeTracker, WorkloadSyncReport
 
 __all__ = [
     'WorkloadCrudModule',
     'WorkloadQueryModule', 
     'WorkloadValidationModule',
     'WorkloadStatisticsModule',
-    'WorkloadRelationshipModule'
+    'WorkloadRelationshipModule',
+    'WorkloadSyncModule',
+    'ScheduleChangeTracker',
+    'WorkloadSyncReport'
 ]
\ No newline at end of file
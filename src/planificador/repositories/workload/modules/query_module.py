@@ -30,6 +30,8 @@ from sqlalchemy.exc import SQLAlchemyError
 from planificador.models.workload import Workload
 from planificador.repositories.workload.interfaces.query_interface import IWorkloadQueryOperations
 from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.projections import WORKLOAD_SUMMARY
+from planificador.schemas.response import WorkloadListResponse
 from planificador.exceptions.repository import (
     WorkloadRepositoryError,
     convert_sqlalchemy_error
@@ -408,6 +410,66 @@ class WorkloadQueryModule(BaseRepository[Workload], IWorkloadQueryOperations):
                 original_error=e
             )
 
+    async def list_workload_summaries(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        employee_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[WorkloadListResponse]:
+        """
+        Obtiene el listado de cargas de trabajo proyectando solo las columnas de la vista.
+        
+        Los nombres de empleado y proyecto se obtienen por JOIN en la misma
+        consulta, sin cargar entidades ni las notas.
+        
+        Args:
+            start_date: Fecha de inicio del rango (opcional)
+            end_date: Fecha de fin del rango (opcional)
+            employee_id: ID del empleado (opcional)
+            project_id: ID del proyecto (opcional)
+            limit: Número máximo de resultados
+            offset: Número de resultados a omitir
+        
+        Returns:
+            List[WorkloadListResponse]: Cargas ordenadas por fecha y empleado
+        
+        Raises:
+            WorkloadRepositoryError: Si ocurre un error durante la consulta
+        """
+        conditions = []
+        if start_date is not None:
+            conditions.append(self.model_class.date >= start_date)
+        if end_date is not None:
+            conditions.append(self.model_class.date <= end_date)
+        if employee_id is not None:
+            conditions.append(self.model_class.employee_id == employee_id)
+        if project_id is not None:
+            conditions.append(self.model_class.project_id == project_id)
+
+        try:
+            return await WORKLOAD_SUMMARY.fetch(
+                self.session, *conditions, limit=limit, offset=offset
+            )
+            
+        except SQLAlchemyError as e:
+            self._logger.error(f"Error SQLAlchemy al listar cargas: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="list_workload_summaries",
+                entity_type=self.model_class.__name__
+            )
+        except Exception as e:
+            self._logger.error(f"Error inesperado al listar cargas: {e}")
+            raise WorkloadRepositoryError(
+                message=f"Error inesperado al listar cargas: {e}",
+                operation="list_workload_summaries",
+                entity_type=self.model_class.__name__,
+                original_error=e
+            )
+
     async def count_workloads(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
         Cuenta el número total de cargas de trabajo con filtros opcionales.
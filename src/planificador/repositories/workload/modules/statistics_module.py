@@ -6,9 +6,21 @@ Módulo de estadísticas para operaciones analíticas del repositorio Workload.
 Este módulo implementa las operaciones de análisis estadístico y métricas
 para cargas de trabajo, incluyendo estadísticas por empleado, proyecto y equipo.
 
+Todas las agregaciones trabajan sobre las columnas reales del modelo:
+``planned_hours``, ``actual_hours``, ``date`` y las columnas de período
+precalculadas ``week_number``, ``month`` y ``year``. Cada resumen devuelve
+en una sola pasada las horas planificadas, las reales y su desviación:
+
+    - ``variance_hours``: suma de ``actual_hours - planned_hours`` de las
+      cargas con ambas horas registradas
+    - ``variance_percentage``: desviación sobre las horas planificadas de
+      esas mismas cargas (``reported_planned_hours``)
+
 Principios de Diseño:
     - Single Responsibility: Solo operaciones de análisis y estadísticas
-    - Performance Optimization: Uso de agregaciones SQL eficientes
+    - Performance Optimization: Las tendencias agrupan por las columnas de
+      período y se resuelven con el índice cubriente ``ix_workloads_period``
+      sin leer la tabla
     - Data Analysis: Métricas avanzadas para toma de decisiones
 
 Uso:
@@ -17,16 +29,18 @@ Uso:
     employee_stats = await stats_module.get_employee_workload_statistics(employee_id)
     project_stats = await stats_module.get_project_workload_statistics(project_id)
     team_stats = await stats_module.get_team_workload_statistics(team_id)
+    trends = await stats_module.get_workload_trends_analysis(start, end, 'month')
     ```
 """
 
-from typing import Dict, Any, List, Optional, Tuple
-from datetime import date, datetime, timedelta
-from decimal import Decimal
-from sqlalchemy import select, func, and_, or_, case, text
+from typing import Dict, Any, List, Optional, Iterable
+from datetime import date
+from sqlalchemy import select, func, and_, or_, case, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
+from planificador.models.employee import Employee
+from planificador.models.team_membership import TeamMembership
 from planificador.models.workload import Workload
 from planificador.repositories.workload.interfaces.statistics_interface import IWorkloadStatisticsOperations
 from planificador.repositories.base_repository import BaseRepository
@@ -34,16 +48,61 @@ from planificador.exceptions.repository import (
     WorkloadRepositoryError,
     convert_sqlalchemy_error
 )
+from planificador.exceptions.validation import ValidationError
+
+
+# Granularidades aceptadas (también en la forma de la interfaz: daily, weekly...)
+_GRANULARITIES = {
+    'day': 'day',
+    'daily': 'day',
+    'week': 'week',
+    'weekly': 'week',
+    'month': 'month',
+    'monthly': 'month',
+}
+
+# Campos sumables de un resumen de horas
+_ADDITIVE_FIELDS = (
+    'workloads',
+    'reported_workloads',
+    'planned_hours',
+    'actual_hours',
+    'reported_planned_hours',
+    'variance_hours',
+    'over_planned',
+    'under_planned',
+)
+
+_WEEKDAY_NAMES = ['Lunes', 'Martes', 'Miércoles', 'Jueves', 'Viernes', 'Sábado', 'Domingo']
+
+
+def _variance_percentage(variance: float, planned: float) -> Optional[float]:
+    """Desviación porcentual sobre las horas planificadas (None sin base)."""
+    return round(variance / planned * 100, 2) if planned > 0 else None
+
+
+def _combine(summaries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Suma varios resúmenes de horas y recalcula la desviación porcentual."""
+    totals = {field: 0 for field in _ADDITIVE_FIELDS}
+    for summary in summaries:
+        for field in _ADDITIVE_FIELDS:
+            totals[field] += summary[field]
+    for field in ('planned_hours', 'actual_hours', 'reported_planned_hours', 'variance_hours'):
+        totals[field] = round(totals[field], 2)
+    totals['variance_percentage'] = _variance_percentage(
+        totals['variance_hours'], totals['reported_planned_hours']
+    )
+    return totals
 
 
 class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOperations):
     """
     Módulo para operaciones de estadísticas del repositorio Workload.
-    
+
     Implementa las operaciones de análisis estadístico y métricas avanzadas
     para cargas de trabajo, incluyendo estadísticas por empleado, proyecto,
     equipo y análisis de tendencias.
-    
+
     Attributes:
         session: Sesión de base de datos asíncrona
         model_class: Clase del modelo Workload
@@ -53,7 +112,7 @@ class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOper
     def __init__(self, session: AsyncSession):
         """
         Inicializa el módulo de estadísticas para cargas de trabajo.
-        
+
         Args:
             session: Sesión de base de datos asíncrona
         """
@@ -61,75 +120,196 @@ class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOper
         self._logger = self._logger.bind(component="WorkloadStatisticsModule")
         self._logger.debug("WorkloadStatisticsModule inicializado")
 
+    async def get_by_unique_field(self, field_name: str, value: Any) -> Optional[Workload]:
+        """Las cargas de trabajo son únicas por (empleado, fecha), no por un campo."""
+        return None
+
+    # =============================================================================
+    # CONSTRUCCIÓN DE CONSULTAS
+    # =============================================================================
+
+    def _period_conditions(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[Any]:
+        """
+        Condiciones de período sobre ``date``.
+
+        Acota también ``year`` para que el índice de períodos busque por su
+        prefijo en lugar de recorrer todo el histórico.
+        """
+        conditions = []
+        if start_date:
+            conditions.append(self.model_class.year >= start_date.year)
+            conditions.append(self.model_class.date >= start_date)
+        if end_date:
+            conditions.append(self.model_class.year <= end_date.year)
+            conditions.append(self.model_class.date <= end_date)
+        return conditions
+
+    def _team_condition(self, team_id: int) -> Any:
+        """Cargas de empleados con membresía activa en el equipo en su fecha."""
+        return exists().where(
+            TeamMembership.team_id == team_id,
+            TeamMembership.employee_id == self.model_class.employee_id,
+            TeamMembership.is_active.is_(True),
+            TeamMembership.start_date <= self.model_class.date,
+            or_(TeamMembership.end_date.is_(None), TeamMembership.end_date >= self.model_class.date)
+        )
+
+    def _iso_year(self) -> Any:
+        """
+        Año ISO de la semana de cada carga.
+
+        ``week_number`` es la semana ISO y ``year`` el año civil, por lo que
+        los días de enero en la semana 52/53 y los de diciembre en la semana 1
+        pertenecen al año ISO anterior o siguiente.
+        """
+        model = self.model_class
+        return case(
+            (and_(model.month == 12, model.week_number == 1), model.year + 1),
+            (and_(model.month == 1, model.week_number >= 52), model.year - 1),
+            else_=model.year
+        )
+
+    def _period_keys(self, granularity: str) -> List[Any]:
+        """Columnas de agrupación para la granularidad indicada."""
+        if granularity == 'day':
+            return [self.model_class.date.label('day')]
+        if granularity == 'week':
+            return [self._iso_year().label('year'), self.model_class.week_number.label('week')]
+        return [self.model_class.year.label('year'), self.model_class.month.label('month')]
+
+    @staticmethod
+    def _period_label(row: Any, granularity: str) -> str:
+        """Etiqueta legible de un período agrupado."""
+        if granularity == 'day':
+            return row.day.isoformat()
+        if granularity == 'week':
+            return f"{row.year}-W{row.week:02d}"
+        return f"{row.year}-{row.month:02d}"
+
+    def _billable_key(self) -> Any:
+        """Clave de agrupación por facturación (nulo cuenta como no facturable)."""
+        return case((self.model_class.is_billable.is_(True), 'billable'), else_='non_billable')
+
+    def _hours_aggregates(self) -> List[Any]:
+        """Agregados de horas planificadas, reales y desviación en una pasada."""
+        model = self.model_class
+        return [
+            func.count(model.id).label('workloads'),
+            func.count(model.actual_hours).label('reported_workloads'),
+            func.sum(model.planned_hours).label('planned_hours'),
+            func.sum(model.actual_hours).label('actual_hours'),
+            func.sum(
+                case((model.actual_hours.isnot(None), model.planned_hours))
+            ).label('reported_planned_hours'),
+            func.sum(model.actual_hours - model.planned_hours).label('variance_hours'),
+            func.count(case((model.actual_hours > model.planned_hours, 1))).label('over_planned'),
+            func.count(case((model.actual_hours < model.planned_hours, 1))).label('under_planned'),
+        ]
+
+    @staticmethod
+    def _hours_summary(row: Any) -> Dict[str, Any]:
+        """Convierte una fila de ``_hours_aggregates`` en un resumen."""
+        reported_planned = float(row.reported_planned_hours or 0)
+        variance = float(row.variance_hours or 0)
+        return {
+            'workloads': row.workloads or 0,
+            'reported_workloads': row.reported_workloads or 0,
+            'planned_hours': round(float(row.planned_hours or 0), 2),
+            'actual_hours': round(float(row.actual_hours or 0), 2),
+            'reported_planned_hours': round(reported_planned, 2),
+            'variance_hours': round(variance, 2),
+            'variance_percentage': _variance_percentage(variance, reported_planned),
+            'over_planned': row.over_planned or 0,
+            'under_planned': row.under_planned or 0,
+        }
+
+    async def _grouped_hours(self, key: Any, conditions: List[Any]) -> Dict[Any, Dict[str, Any]]:
+        """Resumen de horas por cada valor de ``key``."""
+        stmt = (
+            select(key.label('key'), *self._hours_aggregates())
+            .where(*conditions)
+            .group_by(key)
+            .order_by(key)
+        )
+        result = await self.session.execute(stmt)
+        return {row.key: self._hours_summary(row) for row in result}
+
+    async def _scalar_hours(
+        self,
+        aggregate: Any,
+        conditions: List[Any],
+        operation: str,
+        entity_id: Optional[int] = None
+    ) -> float:
+        """Ejecuta un agregado escalar de horas con el manejo de errores del módulo."""
+        try:
+            result = await self.session.execute(select(aggregate).where(*conditions))
+            return round(float(result.scalar() or 0), 2)
+        except SQLAlchemyError as e:
+            self._logger.error(f"Error SQLAlchemy en {operation}: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation=operation,
+                entity_type=self.model_class.__name__,
+                entity_id=entity_id
+            )
+        except Exception as e:
+            self._logger.error(f"Error inesperado en {operation}: {e}")
+            raise WorkloadRepositoryError(
+                message=f"Error inesperado en {operation}: {e}",
+                operation=operation,
+                entity_type=self.model_class.__name__,
+                entity_id=entity_id,
+                original_error=e
+            )
+
+    # =============================================================================
+    # ESTADÍSTICAS POR EMPLEADO, PROYECTO Y EQUIPO
+    # =============================================================================
+
     async def get_employee_workload_statistics(
-        self, 
+        self,
         employee_id: int,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None
     ) -> Dict[str, Any]:
         """
         Obtiene estadísticas de carga de trabajo para un empleado específico.
-        
+
         Args:
             employee_id: ID del empleado
             start_date: Fecha de inicio del período (opcional)
             end_date: Fecha de fin del período (opcional)
-        
+
         Returns:
-            Dict[str, Any]: Estadísticas del empleado
-        
+            Dict[str, Any]: Resumen de horas planificadas, reales y desviación,
+            desglosado por proyecto y por facturación
+
         Raises:
             WorkloadRepositoryError: Si ocurre un error durante el análisis
         """
         self._logger.debug(f"Obteniendo estadísticas para empleado {employee_id}")
-        
+
         try:
-            # Construir condiciones base
-            conditions = [self.model_class.employee_id == employee_id]
-            
-            if start_date:
-                conditions.append(self.model_class.workload_date >= start_date)
-            if end_date:
-                conditions.append(self.model_class.workload_date <= end_date)
-            
-            # Consulta principal de estadísticas
+            conditions = [
+                self.model_class.employee_id == employee_id,
+                *self._period_conditions(start_date, end_date)
+            ]
+
             stmt = select(
-                func.count(self.model_class.id).label('total_workloads'),
-                func.sum(self.model_class.hours).label('total_hours'),
-                func.avg(self.model_class.hours).label('average_hours'),
-                func.min(self.model_class.hours).label('min_hours'),
-                func.max(self.model_class.hours).label('max_hours'),
+                *self._hours_aggregates(),
                 func.count(func.distinct(self.model_class.project_id)).label('unique_projects'),
-                func.min(self.model_class.workload_date).label('first_workload_date'),
-                func.max(self.model_class.workload_date).label('last_workload_date')
-            ).where(and_(*conditions))
-            
+                func.min(self.model_class.date).label('first_workload_date'),
+                func.max(self.model_class.date).label('last_workload_date')
+            ).where(*conditions)
+
             result = await self.session.execute(stmt)
-            stats_row = result.first()
-            
-            # Estadísticas por estado
-            status_stmt = select(
-                self.model_class.status,
-                func.count(self.model_class.id).label('count'),
-                func.sum(self.model_class.hours).label('hours')
-            ).where(and_(*conditions)).group_by(self.model_class.status)
-            
-            status_result = await self.session.execute(status_stmt)
-            status_stats = {row.status: {'count': row.count, 'hours': float(row.hours or 0)} 
-                          for row in status_result}
-            
-            # Estadísticas por proyecto
-            project_stmt = select(
-                self.model_class.project_id,
-                func.count(self.model_class.id).label('count'),
-                func.sum(self.model_class.hours).label('hours')
-            ).where(and_(*conditions)).group_by(self.model_class.project_id)
-            
-            project_result = await self.session.execute(project_stmt)
-            project_stats = {row.project_id: {'count': row.count, 'hours': float(row.hours or 0)} 
-                           for row in project_result}
-            
-            # Construir respuesta
+            stats_row = result.one()
+
             statistics = {
                 'employee_id': employee_id,
                 'period': {
@@ -137,22 +317,18 @@ class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOper
                     'end_date': end_date.isoformat() if end_date else None
                 },
                 'summary': {
-                    'total_workloads': stats_row.total_workloads or 0,
-                    'total_hours': float(stats_row.total_hours or 0),
-                    'average_hours': float(stats_row.average_hours or 0),
-                    'min_hours': float(stats_row.min_hours or 0),
-                    'max_hours': float(stats_row.max_hours or 0),
+                    **self._hours_summary(stats_row),
                     'unique_projects': stats_row.unique_projects or 0,
                     'first_workload_date': stats_row.first_workload_date.isoformat() if stats_row.first_workload_date else None,
                     'last_workload_date': stats_row.last_workload_date.isoformat() if stats_row.last_workload_date else None
                 },
-                'by_status': status_stats,
-                'by_project': project_stats
+                'by_project': await self._grouped_hours(self.model_class.project_id, conditions),
+                'by_billable': await self._grouped_hours(self._billable_key(), conditions)
             }
-            
+
             self._logger.debug(f"Estadísticas obtenidas para empleado {employee_id}")
             return statistics
-            
+
         except SQLAlchemyError as e:
             self._logger.error(f"Error SQLAlchemy al obtener estadísticas de empleado: {e}")
             raise convert_sqlalchemy_error(
@@ -172,72 +348,44 @@ class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOper
             )
 
     async def get_project_workload_statistics(
-        self, 
+        self,
         project_id: int,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None
     ) -> Dict[str, Any]:
         """
         Obtiene estadísticas de carga de trabajo para un proyecto específico.
-        
+
         Args:
             project_id: ID del proyecto
             start_date: Fecha de inicio del período (opcional)
             end_date: Fecha de fin del período (opcional)
-        
+
         Returns:
-            Dict[str, Any]: Estadísticas del proyecto
-        
+            Dict[str, Any]: Resumen de horas planificadas, reales y desviación,
+            desglosado por empleado y por facturación
+
         Raises:
             WorkloadRepositoryError: Si ocurre un error durante el análisis
         """
         self._logger.debug(f"Obteniendo estadísticas para proyecto {project_id}")
-        
+
         try:
-            # Construir condiciones base
-            conditions = [self.model_class.project_id == project_id]
-            
-            if start_date:
-                conditions.append(self.model_class.workload_date >= start_date)
-            if end_date:
-                conditions.append(self.model_class.workload_date <= end_date)
-            
-            # Consulta principal de estadísticas
+            conditions = [
+                self.model_class.project_id == project_id,
+                *self._period_conditions(start_date, end_date)
+            ]
+
             stmt = select(
-                func.count(self.model_class.id).label('total_workloads'),
-                func.sum(self.model_class.hours).label('total_hours'),
-                func.avg(self.model_class.hours).label('average_hours'),
+                *self._hours_aggregates(),
                 func.count(func.distinct(self.model_class.employee_id)).label('unique_employees'),
-                func.min(self.model_class.workload_date).label('first_workload_date'),
-                func.max(self.model_class.workload_date).label('last_workload_date')
-            ).where(and_(*conditions))
-            
+                func.min(self.model_class.date).label('first_workload_date'),
+                func.max(self.model_class.date).label('last_workload_date')
+            ).where(*conditions)
+
             result = await self.session.execute(stmt)
-            stats_row = result.first()
-            
-            # Estadísticas por empleado
-            employee_stmt = select(
-                self.model_class.employee_id,
-                func.count(self.model_class.id).label('count'),
-                func.sum(self.model_class.hours).label('hours')
-            ).where(and_(*conditions)).group_by(self.model_class.employee_id)
-            
-            employee_result = await self.session.execute(employee_stmt)
-            employee_stats = {row.employee_id: {'count': row.count, 'hours': float(row.hours or 0)} 
-                            for row in employee_result}
-            
-            # Estadísticas por estado
-            status_stmt = select(
-                self.model_class.status,
-                func.count(self.model_class.id).label('count'),
-                func.sum(self.model_class.hours).label('hours')
-            ).where(and_(*conditions)).group_by(self.model_class.status)
-            
-            status_result = await self.session.execute(status_stmt)
-            status_stats = {row.status: {'count': row.count, 'hours': float(row.hours or 0)} 
-                          for row in status_result}
-            
-            # Construir respuesta
+            stats_row = result.one()
+
             statistics = {
                 'project_id': project_id,
                 'period': {
@@ -245,20 +393,18 @@ class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOper
                     'end_date': end_date.isoformat() if end_date else None
                 },
                 'summary': {
-                    'total_workloads': stats_row.total_workloads or 0,
-                    'total_hours': float(stats_row.total_hours or 0),
-                    'average_hours': float(stats_row.average_hours or 0),
+                    **self._hours_summary(stats_row),
                     'unique_employees': stats_row.unique_employees or 0,
                     'first_workload_date': stats_row.first_workload_date.isoformat() if stats_row.first_workload_date else None,
                     'last_workload_date': stats_row.last_workload_date.isoformat() if stats_row.last_workload_date else None
                 },
-                'by_employee': employee_stats,
-                'by_status': status_stats
+                'by_employee': await self._grouped_hours(self.model_class.employee_id, conditions),
+                'by_billable': await self._grouped_hours(self._billable_key(), conditions)
             }
-            
+
             self._logger.debug(f"Estadísticas obtenidas para proyecto {project_id}")
             return statistics
-            
+
         except SQLAlchemyError as e:
             self._logger.error(f"Error SQLAlchemy al obtener estadísticas de proyecto: {e}")
             raise convert_sqlalchemy_error(
@@ -278,55 +424,46 @@ class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOper
             )
 
     async def get_team_workload_statistics(
-        self, 
+        self,
         team_id: int,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None
     ) -> Dict[str, Any]:
         """
         Obtiene estadísticas de carga de trabajo para un equipo específico.
-        
+
+        Una carga cuenta para el equipo si su empleado tenía una membresía
+        activa en el equipo en la fecha de la carga.
+
         Args:
             team_id: ID del equipo
             start_date: Fecha de inicio del período (opcional)
             end_date: Fecha de fin del período (opcional)
-        
+
         Returns:
-            Dict[str, Any]: Estadísticas del equipo
-        
+            Dict[str, Any]: Resumen de horas planificadas, reales y desviación,
+            desglosado por empleado y por proyecto
+
         Raises:
             WorkloadRepositoryError: Si ocurre un error durante el análisis
         """
         self._logger.debug(f"Obteniendo estadísticas para equipo {team_id}")
-        
+
         try:
-            # Nota: Asumiendo que existe una relación con empleados y equipos
-            # Esta implementación puede necesitar ajustes según el modelo de datos real
-            
-            # Por ahora, implementamos estadísticas básicas
-            # En una implementación real, se haría JOIN con tabla de empleados/equipos
-            
-            conditions = []
-            if start_date:
-                conditions.append(self.model_class.workload_date >= start_date)
-            if end_date:
-                conditions.append(self.model_class.workload_date <= end_date)
-            
-            # Consulta básica (necesitaría JOIN real con tabla de equipos)
-            base_condition = and_(*conditions) if conditions else True
-            
+            conditions = [
+                self._team_condition(team_id),
+                *self._period_conditions(start_date, end_date)
+            ]
+
             stmt = select(
-                func.count(self.model_class.id).label('total_workloads'),
-                func.sum(self.model_class.hours).label('total_hours'),
-                func.avg(self.model_class.hours).label('average_hours'),
+                *self._hours_aggregates(),
                 func.count(func.distinct(self.model_class.employee_id)).label('unique_employees'),
                 func.count(func.distinct(self.model_class.project_id)).label('unique_projects')
-            ).where(base_condition)
-            
+            ).where(*conditions)
+
             result = await self.session.execute(stmt)
-            stats_row = result.first()
-            
-            # Construir respuesta básica
+            stats_row = result.one()
+
             statistics = {
                 'team_id': team_id,
                 'period': {
@@ -334,18 +471,17 @@ class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOper
                     'end_date': end_date.isoformat() if end_date else None
                 },
                 'summary': {
-                    'total_workloads': stats_row.total_workloads or 0,
-                    'total_hours': float(stats_row.total_hours or 0),
-                    'average_hours': float(stats_row.average_hours or 0),
+                    **self._hours_summary(stats_row),
                     'unique_employees': stats_row.unique_employees or 0,
                     'unique_projects': stats_row.unique_projects or 0
                 },
-                'note': 'Estadísticas básicas - requiere implementación de relación empleado-equipo'
+                'by_employee': await self._grouped_hours(self.model_class.employee_id, conditions),
+                'by_project': await self._grouped_hours(self.model_class.project_id, conditions)
             }
-            
+
             self._logger.debug(f"Estadísticas obtenidas para equipo {team_id}")
             return statistics
-            
+
         except SQLAlchemyError as e:
             self._logger.error(f"Error SQLAlchemy al obtener estadísticas de equipo: {e}")
             raise convert_sqlalchemy_error(
@@ -364,6 +500,10 @@ class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOper
                 original_error=e
             )
 
+    # =============================================================================
+    # ANÁLISIS DE TENDENCIAS Y DISTRIBUCIÓN
+    # =============================================================================
+
     async def get_workload_trends_analysis(
         self,
         start_date: date,
@@ -372,93 +512,90 @@ class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOper
     ) -> Dict[str, Any]:
         """
         Analiza tendencias de carga de trabajo en un período específico.
-        
+
+        Agrupa por las columnas precalculadas (``date``, semana ISO o
+        ``year``/``month``) en una sola consulta resuelta con el índice
+        ``ix_workloads_period``; los totales del período se derivan de las
+        filas agrupadas sin volver a la base de datos.
+
         Args:
             start_date: Fecha de inicio del análisis
             end_date: Fecha de fin del análisis
-            group_by: Agrupación temporal ('day', 'week', 'month')
-        
+            group_by: Agrupación temporal ('day', 'week', 'month' o
+                'daily', 'weekly', 'monthly')
+
         Returns:
-            Dict[str, Any]: Análisis de tendencias
-        
+            Dict[str, Any]: Horas planificadas, reales y desviación por período
+            y resumen del período completo
+
         Raises:
+            ValidationError: Si la agrupación no es válida
             WorkloadRepositoryError: Si ocurre un error durante el análisis
         """
         self._logger.debug(f"Analizando tendencias de {start_date} a {end_date}, agrupado por {group_by}")
-        
+
         try:
-            # Determinar función de agrupación temporal
-            if group_by == 'day':
-                date_trunc = func.date(self.model_class.workload_date)
-            elif group_by == 'week':
-                # SQLite no tiene date_trunc, usamos strftime
-                date_trunc = func.strftime('%Y-%W', self.model_class.workload_date)
-            elif group_by == 'month':
-                date_trunc = func.strftime('%Y-%m', self.model_class.workload_date)
-            else:
-                raise ValueError(f"group_by inválido: {group_by}")
-            
-            # Consulta de tendencias
+            granularity = _GRANULARITIES.get(group_by)
+            if granularity is None:
+                raise ValidationError(
+                    message=f"Agrupación temporal inválida: {group_by}",
+                    field="group_by",
+                    value=group_by
+                )
+
+            keys = self._period_keys(granularity)
             stmt = select(
-                date_trunc.label('period'),
-                func.count(self.model_class.id).label('workload_count'),
-                func.sum(self.model_class.hours).label('total_hours'),
-                func.avg(self.model_class.hours).label('average_hours'),
+                *keys,
+                *self._hours_aggregates(),
                 func.count(func.distinct(self.model_class.employee_id)).label('active_employees'),
                 func.count(func.distinct(self.model_class.project_id)).label('active_projects')
             ).where(
-                and_(
-                    self.model_class.workload_date >= start_date,
-                    self.model_class.workload_date <= end_date
-                )
-            ).group_by(date_trunc).order_by(date_trunc)
-            
+                *self._period_conditions(start_date, end_date)
+            ).group_by(*keys).order_by(*keys)
+
             result = await self.session.execute(stmt)
-            trends_data = []
-            
-            for row in result:
-                trends_data.append({
-                    'period': row.period,
-                    'workload_count': row.workload_count,
-                    'total_hours': float(row.total_hours or 0),
-                    'average_hours': float(row.average_hours or 0),
+            trends_data = [
+                {
+                    'period': self._period_label(row, granularity),
+                    **self._hours_summary(row),
                     'active_employees': row.active_employees,
                     'active_projects': row.active_projects
-                })
-            
+                }
+                for row in result
+            ]
+
             # Calcular métricas de tendencia
-            if len(trends_data) >= 2:
-                first_period = trends_data[0]
-                last_period = trends_data[-1]
-                
-                hours_growth = ((last_period['total_hours'] - first_period['total_hours']) / 
-                              first_period['total_hours'] * 100) if first_period['total_hours'] > 0 else 0
-                
-                workload_growth = ((last_period['workload_count'] - first_period['workload_count']) / 
-                                 first_period['workload_count'] * 100) if first_period['workload_count'] > 0 else 0
-            else:
-                hours_growth = 0
-                workload_growth = 0
-            
+            def growth(field: str) -> float:
+                if len(trends_data) < 2 or trends_data[0][field] <= 0:
+                    return 0
+                first, last = trends_data[0][field], trends_data[-1][field]
+                return round((last - first) / first * 100, 2)
+
+            totals = _combine(trends_data)
+            periods = len(trends_data)
             analysis = {
                 'period': {
                     'start_date': start_date.isoformat(),
                     'end_date': end_date.isoformat(),
-                    'group_by': group_by
+                    'group_by': granularity
                 },
                 'trends': trends_data,
                 'summary': {
-                    'total_periods': len(trends_data),
-                    'hours_growth_percentage': round(hours_growth, 2),
-                    'workload_growth_percentage': round(workload_growth, 2),
-                    'average_hours_per_period': round(sum(p['total_hours'] for p in trends_data) / len(trends_data), 2) if trends_data else 0,
-                    'average_workloads_per_period': round(sum(p['workload_count'] for p in trends_data) / len(trends_data), 2) if trends_data else 0
+                    'total_periods': periods,
+                    **totals,
+                    'planned_hours_growth_percentage': growth('planned_hours'),
+                    'actual_hours_growth_percentage': growth('actual_hours'),
+                    'workload_growth_percentage': growth('workloads'),
+                    'average_planned_hours_per_period': round(totals['planned_hours'] / periods, 2) if periods else 0,
+                    'average_actual_hours_per_period': round(totals['actual_hours'] / periods, 2) if periods else 0
                 }
             }
-            
+
             self._logger.debug("Análisis de tendencias completado")
             return analysis
-            
+
+        except ValidationError:
+            raise
         except SQLAlchemyError as e:
             self._logger.error(f"Error SQLAlchemy al analizar tendencias: {e}")
             raise convert_sqlalchemy_error(
@@ -482,74 +619,49 @@ class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOper
     ) -> Dict[str, Any]:
         """
         Analiza la distribución de cargas de trabajo por diferentes dimensiones.
-        
+
+        Los rangos se calculan sobre las horas planificadas. El día de la
+        semana se obtiene agrupando por ``date`` en la base de datos (sin
+        funciones de fecha propias del motor) y acumulando en Python.
+
         Args:
             start_date: Fecha de inicio del análisis (opcional)
             end_date: Fecha de fin del análisis (opcional)
-        
+
         Returns:
-            Dict[str, Any]: Análisis de distribución
-        
+            Dict[str, Any]: Distribución por rango de horas, día de la semana
+            y facturación
+
         Raises:
             WorkloadRepositoryError: Si ocurre un error durante el análisis
         """
         self._logger.debug("Analizando distribución de cargas de trabajo")
-        
+
         try:
-            conditions = []
-            if start_date:
-                conditions.append(self.model_class.workload_date >= start_date)
-            if end_date:
-                conditions.append(self.model_class.workload_date <= end_date)
-            
-            base_condition = and_(*conditions) if conditions else True
-            
-            # Distribución por rangos de horas
-            hours_distribution_stmt = select(
-                case(
-                    (self.model_class.hours <= 2, '0-2 horas'),
-                    (self.model_class.hours <= 4, '2-4 horas'),
-                    (self.model_class.hours <= 6, '4-6 horas'),
-                    (self.model_class.hours <= 8, '6-8 horas'),
-                    else_='8+ horas'
-                ).label('hours_range'),
-                func.count(self.model_class.id).label('count'),
-                func.sum(self.model_class.hours).label('total_hours')
-            ).where(base_condition).group_by('hours_range')
-            
-            hours_result = await self.session.execute(hours_distribution_stmt)
-            hours_distribution = {row.hours_range: {'count': row.count, 'total_hours': float(row.total_hours or 0)} 
-                                for row in hours_result}
-            
+            conditions = self._period_conditions(start_date, end_date)
+            planned = self.model_class.planned_hours
+
+            # Distribución por rangos de horas planificadas
+            hours_range = case(
+                (planned.is_(None), 'Sin planificar'),
+                (planned <= 2, '0-2 horas'),
+                (planned <= 4, '2-4 horas'),
+                (planned <= 6, '4-6 horas'),
+                (planned <= 8, '6-8 horas'),
+                else_='8+ horas'
+            )
+            hours_distribution = await self._grouped_hours(hours_range, conditions)
+
             # Distribución por día de la semana
-            weekday_stmt = select(
-                func.strftime('%w', self.model_class.workload_date).label('weekday'),
-                func.count(self.model_class.id).label('count'),
-                func.sum(self.model_class.hours).label('total_hours')
-            ).where(base_condition).group_by('weekday')
-            
-            weekday_result = await self.session.execute(weekday_stmt)
-            weekday_names = ['Domingo', 'Lunes', 'Martes', 'Miércoles', 'Jueves', 'Viernes', 'Sábado']
-            weekday_distribution = {}
-            
-            for row in weekday_result:
-                day_name = weekday_names[int(row.weekday)]
-                weekday_distribution[day_name] = {
-                    'count': row.count, 
-                    'total_hours': float(row.total_hours or 0)
-                }
-            
-            # Distribución por estado
-            status_stmt = select(
-                self.model_class.status,
-                func.count(self.model_class.id).label('count'),
-                func.sum(self.model_class.hours).label('total_hours')
-            ).where(base_condition).group_by(self.model_class.status)
-            
-            status_result = await self.session.execute(status_stmt)
-            status_distribution = {row.status: {'count': row.count, 'total_hours': float(row.total_hours or 0)} 
-                                 for row in status_result}
-            
+            by_day = await self._grouped_hours(self.model_class.date, conditions)
+            weekday_rows: Dict[int, List[Dict[str, Any]]] = {}
+            for day, summary in by_day.items():
+                weekday_rows.setdefault(day.weekday(), []).append(summary)
+            weekday_distribution = {
+                _WEEKDAY_NAMES[weekday]: _combine(weekday_rows[weekday])
+                for weekday in sorted(weekday_rows)
+            }
+
             analysis = {
                 'period': {
                     'start_date': start_date.isoformat() if start_date else None,
@@ -558,13 +670,13 @@ class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOper
                 'distribution': {
                     'by_hours_range': hours_distribution,
                     'by_weekday': weekday_distribution,
-                    'by_status': status_distribution
+                    'by_billable': await self._grouped_hours(self._billable_key(), conditions)
                 }
             }
-            
+
             self._logger.debug("Análisis de distribución completado")
             return analysis
-            
+
         except SQLAlchemyError as e:
             self._logger.error(f"Error SQLAlchemy al analizar distribución: {e}")
             raise convert_sqlalchemy_error(
@@ -590,66 +702,51 @@ class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOper
     ) -> Dict[str, Any]:
         """
         Calcula métricas de productividad para empleados o proyectos.
-        
+
         Args:
             employee_id: ID del empleado (opcional)
             project_id: ID del proyecto (opcional)
             start_date: Fecha de inicio (opcional)
             end_date: Fecha de fin (opcional)
-        
+
         Returns:
             Dict[str, Any]: Métricas de productividad
-        
+
         Raises:
             WorkloadRepositoryError: Si ocurre un error durante el cálculo
         """
         self._logger.debug("Calculando métricas de productividad")
-        
+
         try:
-            conditions = []
-            
+            conditions = self._period_conditions(start_date, end_date)
             if employee_id:
                 conditions.append(self.model_class.employee_id == employee_id)
             if project_id:
                 conditions.append(self.model_class.project_id == project_id)
-            if start_date:
-                conditions.append(self.model_class.workload_date >= start_date)
-            if end_date:
-                conditions.append(self.model_class.workload_date <= end_date)
-            
-            base_condition = and_(*conditions) if conditions else True
-            
-            # Métricas básicas
-            basic_metrics_stmt = select(
-                func.count(self.model_class.id).label('total_workloads'),
-                func.sum(self.model_class.hours).label('total_hours'),
-                func.avg(self.model_class.hours).label('average_hours_per_workload'),
-                func.count(case((self.model_class.status == 'completed', 1))).label('completed_workloads'),
-                func.count(case((self.model_class.status == 'in_progress', 1))).label('in_progress_workloads'),
-                func.count(case((self.model_class.status == 'pending', 1))).label('pending_workloads')
-            ).where(base_condition)
-            
-            result = await self.session.execute(basic_metrics_stmt)
-            metrics_row = result.first()
-            
-            # Calcular métricas derivadas
-            total_workloads = metrics_row.total_workloads or 0
-            completed_workloads = metrics_row.completed_workloads or 0
-            
-            completion_rate = (completed_workloads / total_workloads * 100) if total_workloads > 0 else 0
-            
+
+            stmt = select(
+                *self._hours_aggregates(),
+                func.avg(self.model_class.utilization_percentage).label('average_utilization'),
+                func.avg(self.model_class.efficiency_score).label('average_efficiency'),
+                func.avg(self.model_class.productivity_index).label('average_productivity')
+            ).where(*conditions)
+
+            result = await self.session.execute(stmt)
+            metrics_row = result.one()
+            basic_metrics = self._hours_summary(metrics_row)
+
             # Métricas por día (si hay rango de fechas)
             daily_metrics = {}
             if start_date and end_date:
                 days_in_period = (end_date - start_date).days + 1
-                total_hours = float(metrics_row.total_hours or 0)
-                
                 daily_metrics = {
-                    'average_hours_per_day': total_hours / days_in_period if days_in_period > 0 else 0,
-                    'average_workloads_per_day': total_workloads / days_in_period if days_in_period > 0 else 0,
+                    'average_planned_hours_per_day': round(basic_metrics['planned_hours'] / days_in_period, 2) if days_in_period > 0 else 0,
+                    'average_actual_hours_per_day': round(basic_metrics['actual_hours'] / days_in_period, 2) if days_in_period > 0 else 0,
+                    'average_workloads_per_day': round(basic_metrics['workloads'] / days_in_period, 2) if days_in_period > 0 else 0,
                     'days_in_period': days_in_period
                 }
-            
+
+            workloads = basic_metrics['workloads']
             metrics = {
                 'filters': {
                     'employee_id': employee_id,
@@ -657,24 +754,19 @@ class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOper
                     'start_date': start_date.isoformat() if start_date else None,
                     'end_date': end_date.isoformat() if end_date else None
                 },
-                'basic_metrics': {
-                    'total_workloads': total_workloads,
-                    'total_hours': float(metrics_row.total_hours or 0),
-                    'average_hours_per_workload': float(metrics_row.average_hours_per_workload or 0),
-                    'completed_workloads': completed_workloads,
-                    'in_progress_workloads': metrics_row.in_progress_workloads or 0,
-                    'pending_workloads': metrics_row.pending_workloads or 0
-                },
+                'basic_metrics': basic_metrics,
                 'derived_metrics': {
-                    'completion_rate_percentage': round(completion_rate, 2),
-                    'efficiency_score': round(completion_rate * 0.7 + (float(metrics_row.average_hours_per_workload or 0) / 8 * 30), 2)
+                    'reporting_rate_percentage': round(basic_metrics['reported_workloads'] / workloads * 100, 2) if workloads else 0,
+                    'average_utilization_percentage': round(float(metrics_row.average_utilization or 0), 2),
+                    'average_efficiency_score': round(float(metrics_row.average_efficiency or 0), 2),
+                    'average_productivity_index': round(float(metrics_row.average_productivity or 0), 2)
                 },
                 'daily_metrics': daily_metrics
             }
-            
+
             self._logger.debug("Métricas de productividad calculadas")
             return metrics
-            
+
         except SQLAlchemyError as e:
             self._logger.error(f"Error SQLAlchemy al calcular métricas de productividad: {e}")
             raise convert_sqlalchemy_error(
@@ -691,9 +783,163 @@ class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOper
                 original_error=e
             )
 
+    # =============================================================================
+    # OPERACIONES DE LA INTERFAZ
+    # =============================================================================
+
+    async def get_employee_total_hours(self, employee_id: int, start_date: date, end_date: date) -> float:
+        """Total de horas reales de un empleado en el período."""
+        return await self._scalar_hours(
+            func.sum(self.model_class.actual_hours),
+            [self.model_class.employee_id == employee_id, *self._period_conditions(start_date, end_date)],
+            "get_employee_total_hours",
+            employee_id
+        )
+
+    async def get_employee_average_hours(self, employee_id: int, start_date: date, end_date: date) -> float:
+        """Promedio de horas reales por día registrado de un empleado."""
+        return await self._scalar_hours(
+            func.avg(self.model_class.actual_hours),
+            [self.model_class.employee_id == employee_id, *self._period_conditions(start_date, end_date)],
+            "get_employee_average_hours",
+            employee_id
+        )
+
+    async def get_employee_workload_distribution(self, employee_id: int, start_date: date, end_date: date) -> Dict[str, Any]:
+        """Horas planificadas, reales y desviación de un empleado por proyecto."""
+        statistics = await self.get_employee_workload_statistics(employee_id, start_date, end_date)
+        return {'employee_id': employee_id, 'by_project': statistics['by_project']}
+
+    async def get_project_total_hours(self, project_id: int, start_date: date, end_date: date) -> float:
+        """Total de horas reales invertidas en un proyecto en el período."""
+        return await self._scalar_hours(
+            func.sum(self.model_class.actual_hours),
+            [self.model_class.project_id == project_id, *self._period_conditions(start_date, end_date)],
+            "get_project_total_hours",
+            project_id
+        )
+
+    async def get_project_employee_distribution(self, project_id: int, start_date: date, end_date: date) -> Dict[str, Any]:
+        """Horas planificadas, reales y desviación de un proyecto por empleado."""
+        statistics = await self.get_project_workload_statistics(project_id, start_date, end_date)
+        return {'project_id': project_id, 'by_employee': statistics['by_employee']}
+
+    async def get_team_total_hours(self, team_id: int, start_date: date, end_date: date) -> float:
+        """Total de horas reales de los miembros de un equipo en el período."""
+        return await self._scalar_hours(
+            func.sum(self.model_class.actual_hours),
+            [self._team_condition(team_id), *self._period_conditions(start_date, end_date)],
+            "get_team_total_hours",
+            team_id
+        )
+
+    async def get_team_average_hours(self, team_id: int, start_date: date, end_date: date) -> float:
+        """Promedio de horas reales por día registrado de los miembros de un equipo."""
+        return await self._scalar_hours(
+            func.avg(self.model_class.actual_hours),
+            [self._team_condition(team_id), *self._period_conditions(start_date, end_date)],
+            "get_team_average_hours",
+            team_id
+        )
+
+    async def get_team_workload_distribution(self, team_id: int, start_date: date, end_date: date) -> Dict[str, Any]:
+        """Horas planificadas, reales y desviación de un equipo por empleado y proyecto."""
+        statistics = await self.get_team_workload_statistics(team_id, start_date, end_date)
+        return {
+            'team_id': team_id,
+            'by_employee': statistics['by_employee'],
+            'by_project': statistics['by_project']
+        }
+
+    async def get_workload_trends(self, start_date: date, end_date: date, granularity: str = "daily") -> List[Dict[str, Any]]:
+        """Datos de tendencia por período (ver ``get_workload_trends_analysis``)."""
+        analysis = await self.get_workload_trends_analysis(start_date, end_date, granularity)
+        return analysis['trends']
+
+    async def get_capacity_utilization(self, start_date: date, end_date: date) -> Dict[str, Any]:
+        """
+        Calcula la utilización de capacidad general.
+
+        La capacidad es la jornada diaria (``weekly_hours / 5``) de cada
+        carga registrada, de modo que la utilización compara las horas
+        planificadas y reales con la capacidad de esos mismos días.
+
+        Args:
+            start_date: Fecha de inicio del análisis
+            end_date: Fecha de fin del análisis
+
+        Returns:
+            Dict[str, Any]: Horas, capacidad y utilización planificada y real
+
+        Raises:
+            WorkloadRepositoryError: Si ocurre un error durante el cálculo
+        """
+        self._logger.debug(f"Calculando utilización de capacidad de {start_date} a {end_date}")
+
+        try:
+            stmt = select(
+                *self._hours_aggregates(),
+                func.sum(Employee.weekly_hours / 5.0).label('capacity_hours'),
+                func.count(func.distinct(self.model_class.employee_id)).label('employees')
+            ).join(
+                Employee, Employee.id == self.model_class.employee_id
+            ).where(*self._period_conditions(start_date, end_date))
+
+            result = await self.session.execute(stmt)
+            row = result.one()
+            summary = self._hours_summary(row)
+            capacity = round(float(row.capacity_hours or 0), 2)
+
+            return {
+                'period': {
+                    'start_date': start_date.isoformat(),
+                    'end_date': end_date.isoformat()
+                },
+                **summary,
+                'employees': row.employees or 0,
+                'capacity_hours': capacity,
+                'planned_utilization_percentage': round(summary['planned_hours'] / capacity * 100, 2) if capacity else 0,
+                'actual_utilization_percentage': round(summary['actual_hours'] / capacity * 100, 2) if capacity else 0
+            }
+
+        except SQLAlchemyError as e:
+            self._logger.error(f"Error SQLAlchemy al calcular utilización de capacidad: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="get_capacity_utilization",
+                entity_type=self.model_class.__name__
+            )
+        except Exception as e:
+            self._logger.error(f"Error inesperado al calcular utilización de capacidad: {e}")
+            raise WorkloadRepositoryError(
+                message=f"Error inesperado al calcular utilización de capacidad: {e}",
+                operation="get_capacity_utilization",
+                entity_type=self.model_class.__name__,
+                original_error=e
+            )
+
+    async def get_peak_workload_periods(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """Semanas con horas planificadas por encima de la media, de mayor a menor."""
+        trends = await self.get_workload_trends(start_date, end_date, 'weekly')
+        if not trends:
+            return []
+        average = sum(period['planned_hours'] for period in trends) / len(trends)
+        peaks = [period for period in trends if period['planned_hours'] > average]
+        return sorted(peaks, key=lambda period: period['planned_hours'], reverse=True)
+
     # Métodos alias para compatibilidad con la interfaz
+    async def calculate_productivity_metrics(
+        self,
+        employee_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """Alias para get_productivity_metrics."""
+        return await self.get_productivity_metrics(employee_id, project_id, start_date, end_date)
+
     async def analyze_employee_workload(
-        self, 
+        self,
         employee_id: int,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None
@@ -702,7 +948,7 @@ class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOper
         return await self.get_employee_workload_statistics(employee_id, start_date, end_date)
 
     async def analyze_project_workload(
-        self, 
+        self,
         project_id: int,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None
@@ -711,10 +957,10 @@ class WorkloadStatisticsModule(BaseRepository[Workload], IWorkloadStatisticsOper
         return await self.get_project_workload_statistics(project_id, start_date, end_date)
 
     async def analyze_team_workload(
-        self, 
+        self,
         team_id: int,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None
     ) -> Dict[str, Any]:
         """Alias para get_team_workload_statistics."""
-        return await self.get_team_workload_statistics(team_id, start_date, end_date)
\ No newline at end of file
+        return await self.get_team_workload_statistics(team_id, start_date, end_date)
@@ -0,0 +1,487 @@
+# src/planificador/repositories/workload/modules/sync_module.py
+
+"""
+Módulo de sincronización incremental de Workload desde Schedule.
+
+Mantiene las cargas de trabajo derivadas de los horarios recalculando solo
+los pares (empleado, fecha) afectados por cambios, en lugar de recalcular
+todo el histórico cada noche.
+
+Métricas derivadas por par (empleado, fecha):
+    - ``planned_hours``: suma de las horas de los horarios del día; un
+      horario sin hora de inicio o fin cuenta como jornada diaria
+      (``weekly_hours / 5``)
+    - ``project_id``: proyecto con más horas ese día
+    - ``utilization_percentage``: horas planificadas / jornada diaria
+    - ``efficiency_score``: mismo criterio que
+      ``Workload.calculate_efficiency_score``
+    - ``productivity_index``: horas reales / jornada diaria
+
+Las horas reales (``actual_hours``), la facturación y las notas se
+conservan. Un par sin horarios ni horas reales elimina su carga de trabajo.
+
+Principios de Diseño:
+    - Conjunto de cambios: ``ScheduleChangeTracker`` recoge los pares
+      modificados en los flush de la sesión y en las sentencias en bloque
+      (las actualizaciones y borrados leen sus filas antes de ejecutarse);
+      ``sync_changed_since`` los obtiene de ``Schedule.updated_at``
+    - Escrituras del repositorio de horarios: el CRUD, la importación, el
+      planificador automático y ``commit_scenario`` usan el registro de su
+      sesión (``ScheduleChangeTracker.for_session``) y recalculan sus pares
+      antes de confirmar
+    - Por lotes y en columnas: cada lote de pares se resuelve con tres
+      consultas y las métricas se calculan columna a columna
+    - Upsert respetando ``uq_workload_employee_date``: se leen los registros
+      existentes del lote y se insertan, actualizan o eliminan en bloque
+
+Uso:
+    ```python
+    tracker = ScheduleChangeTracker().attach(session)
+    ...  # cambios en horarios
+    report = await WorkloadSyncModule(session).sync_tracked(tracker)
+    ```
+"""
+
+import time as perf
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import delete, event, insert, inspect, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from planificador.models.employee import Employee
+from planificador.models.schedule import Schedule
+from planificador.models.workload import Workload
+from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.projections import hours_between
+from planificador.exceptions.repository import (
+    WorkloadRepositoryError,
+    convert_sqlalchemy_error
+)
+
+_Pair = Tuple[int, date]
+
+_HUNDRED = Decimal(100)
+_MAX_PERCENTAGE = Decimal("999.99")  # Numeric(5, 2)
+_TWO_PLACES = Decimal("0.01")
+
+# Clave de Session.info con el registro compartido de la sesión
+_TRACKER_KEY = "schedule_change_tracker"
+
+
+class ScheduleChangeTracker:
+    """
+    Registro de los pares (empleado, fecha) modificados en una sesión.
+
+    Escucha ``before_flush`` (altas, cambios con sus valores anteriores y
+    bajas de horarios) y ``do_orm_execute`` (``insert(Schedule)`` en bloque
+    con parámetros y actualizaciones o borrados en bloque, cuyas filas se
+    leen por clave primaria o por el WHERE antes de ejecutarse). Las
+    inserciones sin parámetros (``from_select``) no exponen sus filas: esos
+    pares deben marcarse con ``mark``.
+    """
+
+    def __init__(self):
+        """Inicializa un registro vacío."""
+        self._pairs: Set[_Pair] = set()
+        self._session = None
+
+    @classmethod
+    def for_session(cls, session: AsyncSession) -> "ScheduleChangeTracker":
+        """
+        Registro compartido de una sesión, conectado la primera vez que se pide.
+
+        Args:
+            session: Sesión asíncrona.
+
+        Returns:
+            El registro guardado en ``session.info``.
+        """
+        tracker = session.info.get(_TRACKER_KEY)
+        if tracker is None:
+            tracker = session.info[_TRACKER_KEY] = cls().attach(session)
+        return tracker
+
+    def attach(self, session: AsyncSession) -> "ScheduleChangeTracker":
+        """Empieza a registrar los cambios de la sesión."""
+        self._session = session.sync_session
+        event.listen(self._session, "before_flush", self._before_flush)
+        event.listen(self._session, "do_orm_execute", self._do_orm_execute)
+        return self
+
+    def detach(self) -> None:
+        """Deja de registrar cambios."""
+        if self._session is not None:
+            event.remove(self._session, "before_flush", self._before_flush)
+            event.remove(self._session, "do_orm_execute", self._do_orm_execute)
+            self._session = None
+
+    def mark(self, employee_id: int, day: date) -> None:
+        """Marca un par como modificado."""
+        self._pairs.add((employee_id, day))
+
+    def drain(self) -> Set[_Pair]:
+        """Devuelve los pares registrados y vacía el registro."""
+        pairs, self._pairs = self._pairs, set()
+        return pairs
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def _before_flush(self, session, flush_context, instances) -> None:
+        for instance in (*session.new, *session.deleted):
+            if isinstance(instance, Schedule):
+                self._pairs.add((instance.employee_id, instance.date))
+        for instance in session.dirty:
+            if not isinstance(instance, Schedule):
+                continue
+            state = inspect(instance)
+            employees = state.attrs.employee_id.history
+            dates = state.attrs.date.history
+            self._pairs.add((instance.employee_id, instance.date))
+            old_employee = (employees.deleted or [instance.employee_id])[0]
+            old_date = (dates.deleted or [instance.date])[0]
+            self._pairs.add((old_employee, old_date))
+
+    def _do_orm_execute(self, orm_execute_state) -> Any:
+        if not (orm_execute_state.is_insert or orm_execute_state.is_update
+                or orm_execute_state.is_delete):
+            return None
+        mapper = orm_execute_state.bind_mapper
+        table = Schedule.__table__
+        if mapper is not None:
+            if mapper.class_ is not Schedule:
+                return None
+        elif getattr(orm_execute_state.statement, "table", None) is not table:
+            return None
+
+        parameters = orm_execute_state.parameters
+        rows = parameters if isinstance(parameters, list) else [parameters] if parameters else []
+        if orm_execute_state.is_insert:
+            for row in rows:
+                if "employee_id" in row and "date" in row:
+                    self._pairs.add((row["employee_id"], row["date"]))
+            return None
+
+        # Pares de las filas afectadas antes de ejecutar: por clave primaria o por el WHERE
+        query = select(table.c.id, table.c.employee_id, table.c.date)
+        if rows and all("id" in row for row in rows):
+            query = query.where(table.c.id.in_([row["id"] for row in rows]))
+        elif orm_execute_state.statement.whereclause is not None:
+            query = query.where(orm_execute_state.statement.whereclause)
+        connection = orm_execute_state.session.connection()
+        before = connection.execute(query).all()
+        self._pairs.update((employee_id, day) for _, employee_id, day in before)
+        if orm_execute_state.is_delete or not before:
+            return None
+
+        # Una actualización puede mover los horarios a otro empleado o fecha
+        result = orm_execute_state.invoke_statement()
+        after = connection.execute(
+            select(table.c.employee_id, table.c.date)
+            .where(table.c.id.in_([schedule_id for schedule_id, _, _ in before]))
+        )
+        self._pairs.update((employee_id, day) for employee_id, day in after.all())
+        return result
+
+
+@dataclass
+class WorkloadSyncReport:
+    """
+    Resultado de una sincronización.
+
+    Attributes:
+        pairs: Pares (empleado, fecha) recalculados.
+        created: Cargas de trabajo insertadas.
+        updated: Cargas de trabajo actualizadas.
+        deleted: Cargas de trabajo eliminadas.
+        elapsed_seconds: Duración de la sincronización.
+    """
+    pairs: int = 0
+    created: int = 0
+    updated: int = 0
+    deleted: int = 0
+    elapsed_seconds: float = 0.0
+
+
+def _percentage(
+    values: Sequence[Optional[Decimal]], bases: Sequence[Decimal]
+) -> List[Optional[Decimal]]:
+    """``values / bases * 100`` por posición, redondeado y acotado a Numeric(5, 2)."""
+    return [
+        min(_MAX_PERCENTAGE, (value / base * _HUNDRED).quantize(_TWO_PLACES))
+        if value is not None and base else None
+        for value, base in zip(values, bases)
+    ]
+
+
+def _efficiency(
+    planned: Sequence[Optional[Decimal]], actual: Sequence[Optional[Decimal]]
+) -> List[Optional[Decimal]]:
+    """Eficiencia por posición con el criterio de ``Workload.calculate_efficiency_score``."""
+    return [
+        (min(p, a) / max(p, a) * _HUNDRED).quantize(_TWO_PLACES) if p and a else None
+        for p, a in zip(planned, actual)
+    ]
+
+
+class WorkloadSyncModule(BaseRepository[Workload]):
+    """
+    Módulo para derivar las cargas de trabajo de los horarios.
+
+    Attributes:
+        session: Sesión de base de datos asíncrona
+        model_class: Clase del modelo Workload
+        _logger: Logger estructurado con contexto del módulo
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa el módulo de sincronización.
+
+        Args:
+            session: Sesión de base de datos asíncrona
+        """
+        super().__init__(session, Workload)
+        self._logger = self._logger.bind(component="WorkloadSyncModule")
+
+    async def get_by_unique_field(self, field_name: str, value: Any) -> Optional[Workload]:
+        """Las cargas de trabajo son únicas por (empleado, fecha), no por un campo."""
+        return None
+
+    async def _sync_batch(self, pairs: List[_Pair], report: WorkloadSyncReport) -> None:
+        """Recalcula y escribe un lote de pares."""
+        employee_ids = {employee_id for employee_id, _ in pairs}
+        result = await self.session.execute(
+            select(Employee.id, Employee.weekly_hours).where(Employee.id.in_(employee_ids))
+        )
+        daily_hours = {
+            employee_id: Decimal(weekly_hours or 0) / 5 for employee_id, weekly_hours in result.all()
+        }
+
+        result = await self.session.execute(
+            select(
+                Schedule.employee_id,
+                Schedule.date,
+                Schedule.project_id,
+                Schedule.start_time,
+                Schedule.end_time,
+            )
+            .where(tuple_(Schedule.employee_id, Schedule.date).in_(pairs))
+            .order_by(Schedule.id)
+        )
+        planned: Dict[_Pair, Decimal] = {}
+        project_hours: Dict[_Pair, Dict[Optional[int], Decimal]] = {}
+        for employee_id, day, project_id, start_time, end_time in result.all():
+            key = (employee_id, day)
+            hours = hours_between(start_time, end_time)
+            if hours is None:
+                hours = daily_hours.get(employee_id, Decimal(0))
+            planned[key] = planned.get(key, Decimal(0)) + hours
+            by_project = project_hours.setdefault(key, {})
+            by_project[project_id] = by_project.get(project_id, Decimal(0)) + hours
+
+        result = await self.session.execute(
+            select(Workload.id, Workload.employee_id, Workload.date, Workload.actual_hours)
+            .where(tuple_(Workload.employee_id, Workload.date).in_(pairs))
+        )
+        existing = {(employee_id, day): (workload_id, actual)
+                    for workload_id, employee_id, day, actual in result.all()}
+
+        # Columnas del lote: solo los pares con horarios u horas reales
+        keys = [
+            key for key in pairs
+            if key in planned or (key in existing and existing[key][1] is not None)
+        ]
+        planned_column = [planned.get(key) for key in keys]
+        actual_column = [existing[key][1] if key in existing else None for key in keys]
+        capacity_column = [daily_hours.get(key[0], Decimal(0)) for key in keys]
+        utilization_column = _percentage(planned_column, capacity_column)
+        productivity_column = _percentage(actual_column, capacity_column)
+        efficiency_column = _efficiency(planned_column, actual_column)
+
+        to_insert: List[Dict[str, Any]] = []
+        to_update: List[Dict[str, Any]] = []
+        for i, (employee_id, day) in enumerate(keys):
+            by_project = project_hours.get((employee_id, day))
+            values = {
+                "project_id": max(by_project, key=by_project.get) if by_project else None,
+                "planned_hours": planned_column[i],
+                "utilization_percentage": utilization_column[i],
+                "efficiency_score": efficiency_column[i],
+                "productivity_index": productivity_column[i],
+            }
+            current = existing.get((employee_id, day))
+            if current is None:
+                to_insert.append({
+                    "employee_id": employee_id,
+                    "date": day,
+                    "week_number": day.isocalendar().week,
+                    "month": day.month,
+                    "year": day.year,
+                    **values,
+                })
+            else:
+                to_update.append({"id": current[0], **values})
+
+        kept = set(keys)
+        to_delete = [workload_id for key, (workload_id, _) in existing.items() if key not in kept]
+
+        if to_insert:
+            await self.session.execute(insert(Workload), to_insert)
+        if to_update:
+            await self.session.execute(update(Workload), to_update)
+        if to_delete:
+            await self.session.execute(delete(Workload).where(Workload.id.in_(to_delete)))
+        report.created += len(to_insert)
+        report.updated += len(to_update)
+        report.deleted += len(to_delete)
+
+    async def recompute(
+        self,
+        pairs: Iterable[_Pair],
+        batch_size: int = 500,
+        commit: bool = True
+    ) -> WorkloadSyncReport:
+        """
+        Recalcula las cargas de trabajo de los pares (empleado, fecha) indicados.
+
+        Args:
+            pairs: Pares a recalcular.
+            batch_size: Pares por lote.
+            commit: Confirma la transacción al terminar.
+
+        Returns:
+            WorkloadSyncReport con los registros afectados.
+
+        Raises:
+            WorkloadRepositoryError: Si falla la consulta o la escritura; la
+                transacción se revierte completa.
+        """
+        start = perf.perf_counter()
+        ordered = sorted(set(pairs))
+        report = WorkloadSyncReport(pairs=len(ordered))
+        try:
+            for offset in range(0, len(ordered), batch_size):
+                await self._sync_batch(ordered[offset:offset + batch_size], report)
+            if commit and ordered:
+                await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            self._logger.error(f"Error sincronizando cargas de trabajo: {e}")
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="sync_workloads",
+                entity_type=self.model_class.__name__
+            )
+        except Exception as e:
+            await self.session.rollback()
+            self._logger.error(f"Error inesperado sincronizando cargas de trabajo: {e}")
+            raise WorkloadRepositoryError(
+                message=f"Error inesperado sincronizando cargas de trabajo: {e}",
+                operation="sync_workloads",
+                original_error=e
+            )
+
+        report.elapsed_seconds = perf.perf_counter() - start
+        self._logger.info(
+            f"Cargas de trabajo sincronizadas: {report.pairs} pares, {report.created} creadas, "
+            f"{report.updated} actualizadas, {report.deleted} eliminadas "
+            f"en {report.elapsed_seconds:.2f}s"
+        )
+        return report
+
+    async def sync_tracked(
+        self,
+        tracker: ScheduleChangeTracker,
+        batch_size: int = 500,
+        commit: bool = True
+    ) -> WorkloadSyncReport:
+        """
+        Recalcula los pares registrados por un ``ScheduleChangeTracker``.
+
+        Los cambios pendientes de la sesión se vuelcan antes para que el
+        registro esté completo.
+
+        Args:
+            tracker: Registro de pares modificados.
+            batch_size: Pares por lote.
+            commit: Confirma la transacción al terminar; con False las
+                cargas de trabajo se escriben en la transacción en curso.
+
+        Raises:
+            WorkloadRepositoryError: Si falla la sincronización.
+        """
+        await self.session.flush()
+        return await self.recompute(tracker.drain(), batch_size=batch_size, commit=commit)
+
+    async def sync_changed_since(
+        self,
+        since: datetime,
+        batch_size: int = 500
+    ) -> WorkloadSyncReport:
+        """
+        Recalcula los pares con horarios creados o modificados desde una fecha.
+
+        Cubre los cambios hechos por otros procesos (incluidas inserciones y
+        actualizaciones en bloque, que también fijan ``updated_at``). Los
+        horarios eliminados no dejan rastro: sus pares deben recalcularse
+        con ``recompute`` o mediante un ``ScheduleChangeTracker``.
+
+        Args:
+            since: Instante de la última sincronización.
+            batch_size: Pares por lote.
+
+        Raises:
+            WorkloadRepositoryError: Si falla la sincronización.
+        """
+        try:
+            result = await self.session.execute(
+                select(Schedule.employee_id, Schedule.date)
+                .where(Schedule.updated_at >= since)
+                .distinct()
+            )
+            pairs = [tuple(row) for row in result.all()]
+        except SQLAlchemyError as e:
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="sync_workloads",
+                entity_type=self.model_class.__name__
+            )
+        return await self.recompute(pairs, batch_size=batch_size)
+
+    async def recompute_range(
+        self,
+        start_date: date,
+        end_date: date,
+        employee_ids: Optional[Sequence[int]] = None,
+        batch_size: int = 500
+    ) -> WorkloadSyncReport:
+        """
+        Recalcula todos los pares de un periodo (horarios y cargas existentes).
+
+        Pensado para la carga inicial o para reparar un periodo completo.
+
+        Raises:
+            WorkloadRepositoryError: Si falla la sincronización.
+        """
+        pairs: Set[_Pair] = set()
+        try:
+            for model in (Schedule, Workload):
+                stmt = select(model.employee_id, model.date).where(
+                    model.date >= start_date, model.date <= end_date
+                )
+                if employee_ids is not None:
+                    stmt = stmt.where(model.employee_id.in_(list(employee_ids)))
+                result = await self.session.execute(stmt.distinct())
+                pairs.update(tuple(row) for row in result.all())
+        except SQLAlchemyError as e:
+            raise convert_sqlalchemy_error(
+                error=e,
+                operation="sync_workloads",
+                entity_type=self.model_class.__name__
+            )
+        return await self.recompute(pairs, batch_size=batch_size)
@@ -381,7 +381,7 @@ class WorkloadValidationModule(BaseRepository[Workload], IWorkloadValidationOper
                 and_(
                     self.model_class.employee_id == employee_id,
                     self.model_class.project_id == project_id,
-                    self.model_class.workload_date == workload_date
+                    self.model_class.date == workload_date
                 )
             )
             
@@ -451,10 +451,13 @@ class WorkloadValidationModule(BaseRepository[Workload], IWorkloadValidationOper
         
         try:
             # Obtener horas existentes para el empleado en la fecha
-            stmt = select(func.sum(self.model_class.hours)).where(
+            # (las reales si ya están registradas, si no las planificadas)
+            stmt = select(
+                func.sum(func.coalesce(self.model_class.actual_hours, self.model_class.planned_hours))
+            ).where(
                 and_(
                     self.model_class.employee_id == employee_id,
-                    self.model_class.workload_date == workload_date
+                    self.model_class.date == workload_date
                 )
             )
             
@@ -36,6 +36,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
 
 from planificador.models.workload import Workload
+from planificador.schemas.response import WorkloadListResponse
 from planificador.repositories.workload.interfaces import (
     IWorkloadCrudOperations,
     IWorkloadQueryOperations,
@@ -48,11 +49,16 @@ from planificador.repositories.workload.modules import (
     WorkloadQueryModule,
     WorkloadValidationModule,
     WorkloadRelationshipModule,
-    WorkloadStatisticsModule
+    WorkloadStatisticsModule,
+    WorkloadSyncModule,
+    ScheduleChangeTracker,
+    WorkloadSyncReport
 )
 from planificador.exceptions.repository import WorkloadRepositoryError
+from planificador.database.instrumentation import instrumented_repository
 
 
+@instrumented_repository
 class WorkloadRepositoryFacade(
     IWorkloadCrudOperations,
     IWorkloadQueryOperations,
@@ -86,6 +92,7 @@ class WorkloadRepositoryFacade(
         self.validation_module = WorkloadValidationModule(session)
         self.relationship_module = WorkloadRelationshipModule(session)
         self.statistics_module = WorkloadStatisticsModule(session)
+        self.sync_module = WorkloadSyncModule(session)
         
         self._logger.debug("WorkloadRepositoryFacade inicializada")
 
@@ -199,6 +206,25 @@ class WorkloadRepositoryFacade(
         """Obtiene cargas de trabajo con paginación."""
         return await self.query_module.get_workloads_with_pagination(page, page_size, filters)
 
+    async def list_workload_summaries(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        employee_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[WorkloadListResponse]:
+        """Obtiene el listado de cargas de trabajo con solo las columnas de la vista."""
+        return await self.query_module.list_workload_summaries(
+            start_date=start_date,
+            end_date=end_date,
+            employee_id=employee_id,
+            project_id=project_id,
+            limit=limit,
+            offset=offset
+        )
+
     async def count_workloads(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Cuenta cargas de trabajo con filtros opcionales."""
         return await self.query_module.count_workloads(filters)
@@ -332,6 +358,28 @@ class WorkloadRepositoryFacade(
         """Analiza dependencias de carga de trabajo."""
         return await self.relationship_module.analyze_workload_dependencies(workload_id)
 
+    # =============================================================================
+    # SINCRONIZACIÓN DESDE HORARIOS
+    # =============================================================================
+
+    async def sync_workloads(
+        self,
+        pairs: List[Tuple[int, date]]
+    ) -> WorkloadSyncReport:
+        """Recalcula las cargas de trabajo de los pares (empleado, fecha) indicados."""
+        return await self.sync_module.recompute(pairs)
+
+    async def sync_tracked_workloads(
+        self,
+        tracker: ScheduleChangeTracker
+    ) -> WorkloadSyncReport:
+        """Recalcula las cargas de trabajo de los horarios modificados en la sesión."""
+        return await self.sync_module.sync_tracked(tracker)
+
+    async def sync_workloads_changed_since(self, since: datetime) -> WorkloadSyncReport:
+        """Recalcula las cargas de trabajo de los horarios modificados desde una fecha."""
+        return await self.sync_module.sync_changed_since(since)
+
     # =============================================================================
     # OPERACIONES DE ESTADÍSTICAS
     # =============================================================================
@@ -387,9 +435,12 @@ class WorkloadRepositoryFacade(
         end_date: Optional[date] = None
     ) -> Dict[str, Any]:
         """Obtiene análisis de distribución de carga de trabajo."""
-        return await self.statistics_module.get_workload_distribution_analysis(
-            analysis_type, start_date, end_date
+        analysis = await self.statistics_module.get_workload_distribution_analysis(
+            start_date, end_date
         )
+        if analysis_type in analysis["distribution"]:
+            analysis["distribution"] = {analysis_type: analysis["distribution"][analysis_type]}
+        return analysis
 
     async def calculate_productivity_metrics(
         self,
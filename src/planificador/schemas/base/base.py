@@ -1,9 +1,141 @@
 # src/planificador/schemas/base/base.py
 
-from pydantic import BaseModel, ConfigDict
+from copy import deepcopy
+from datetime import date, time
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Any, FrozenSet, List, Sequence, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+SchemaT = TypeVar("SchemaT", bound="BaseSchema")
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: Type["BaseSchema"]) -> TypeAdapter:
+    """TypeAdapter de ``List[schema]``, construido una sola vez por esquema."""
+    return TypeAdapter(List[schema])
+
+
+_IMMUTABLE_DEFAULTS = (type(None), bool, int, float, str, bytes, Decimal, date, time, Enum)
+
+
+def _row_layout(
+    schema: Type["BaseSchema"], row: Any
+) -> Tuple[Tuple[Tuple[str, int, Any], ...], FrozenSet[str]]:
+    """
+    Disposición de una fila respecto a los campos del esquema.
+
+    Returns:
+        Tupla ((campo, posición, valor por defecto), campos presentes en la
+        fila), en el orden de declaración de los campos. La posición es -1
+        si el campo toma su valor por defecto y -2 si ese valor es mutable y
+        debe copiarse en cada instancia.
+    """
+    positions = {name: position for position, name in enumerate(row._fields)}
+    layout = []
+    for name, field in schema.model_fields.items():
+        position = positions.get(name, -1)
+        if position < 0 and field.is_required():
+            continue
+        default = None if position >= 0 else field.get_default(call_default_factory=True)
+        if position < 0 and not isinstance(default, _IMMUTABLE_DEFAULTS):
+            position = -2
+        layout.append((name, position, default))
+    return tuple(layout), frozenset(name for name in positions if name in schema.model_fields)
 
 
 class BaseSchema(BaseModel):
     """Esquema base con configuración para ORM."""
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_rows(cls: Type[SchemaT], rows: Sequence[Any]) -> List[SchemaT]:
+        """
+        Construye una lista de esquemas a partir de filas ``Row`` sin validar.
+
+        Las columnas se asignan por su etiqueta (``select(Model.id,
+        Employee.full_name.label("employee_name"))``) y las que no son campos
+        del esquema se ignoran. Los campos ausentes toman su valor por defecto.
+        Solo debe usarse con filas de consultas propias, cuyos tipos ya son
+        los del esquema; para datos externos usar ``validate_rows``.
+
+        Equivale a ``model_construct`` por fila, pero la correspondencia
+        entre columnas y campos se calcula una sola vez para toda la lista.
+
+        Args:
+            rows: Filas de ``Result.all()`` o de una partición del cursor.
+
+        Returns:
+            Lista de instancias sin validar.
+        """
+        if not rows:
+            return []
+        layout, fields_set = _row_layout(cls, rows[0])
+        if cls.__private_attributes__:
+            return [
+                cls.model_construct(**{
+                    name: row[position] for name, position, _ in layout if position >= 0
+                })
+                for row in rows
+            ]
+
+        new = cls.__new__
+        set_attribute = object.__setattr__
+        items: List[SchemaT] = []
+        for row in rows:
+            instance = new(cls)
+            set_attribute(instance, "__dict__", {
+                name: (
+                    row[position] if position >= 0
+                    else default if position == -1
+                    else deepcopy(default)
+                )
+                for name, position, default in layout
+            })
+            set_attribute(instance, "__pydantic_fields_set__", set(fields_set))
+            set_attribute(instance, "__pydantic_extra__", None)
+            set_attribute(instance, "__pydantic_private__", None)
+            items.append(instance)
+        return items
+
+    @classmethod
+    def validate_rows(cls: Type[SchemaT], rows: Sequence[Any]) -> List[SchemaT]:
+        """
+        Valida una lista de filas ``Row`` en una sola llamada al validador.
+
+        Equivale a ``model_validate`` por fila, pero valida diccionarios
+        planos con un ``TypeAdapter`` de lista en lugar de leer atributo a
+        atributo de cada entidad ORM.
+
+        Args:
+            rows: Filas de ``Result.all()`` o de una partición del cursor.
+
+        Returns:
+            Lista de instancias validadas.
+
+        Raises:
+            pydantic.ValidationError: Si alguna fila no cumple el esquema.
+        """
+        if not rows:
+            return []
+        layout, _ = _row_layout(cls, rows[0])
+        return _list_adapter(cls).validate_python([
+            {name: row[position] for name, position, _ in layout if position >= 0}
+            for row in rows
+        ])
+
+    @classmethod
+    def dump_list_json(cls, items: Sequence["BaseSchema"]) -> bytes:
+        """
+        Serializa una lista de instancias del esquema a JSON en una sola llamada.
+
+        Args:
+            items: Instancias del esquema.
+
+        Returns:
+            Documento JSON (array) en bytes.
+        """
+        return _list_adapter(cls).dump_json(list(items))
@@ -37,6 +37,9 @@ from .response_schemas import (
     DashboardStatsResponse,
     EmployeeUtilizationResponse,
     ProjectProgressResponse,
+    
+    # Esquemas columnares
+    PlanningGridResponse,
 )
 
 __all__ = [
@@ -74,4 +77,7 @@ __all__ = [
     "DashboardStatsResponse",
     "EmployeeUtilizationResponse",
     "ProjectProgressResponse",
+    
+    # Esquemas columnares
+    "PlanningGridResponse",
 ]
\ No newline at end of file
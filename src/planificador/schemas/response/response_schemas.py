@@ -348,4 +348,34 @@ class ProjectProgressResponse(BaseSchema):
     days_remaining: Optional[int] = None
     status: ProjectStatus
     is_on_track: bool = True
-    risk_level: str  # "Bajo", "Medio", "Alto"
\ No newline at end of file
+    risk_level: str  # "Bajo", "Medio", "Alto"
+
+
+# ==========================================
+# ESQUEMAS DE RESPUESTA COLUMNARES
+# ==========================================
+
+class PlanningGridResponse(BaseSchema):
+    """
+    Cuadrícula de planificación en formato columnar compacto.
+
+    Cada fila es una línea (empleado, proyecto) del tablero. Las columnas de
+    fila son listas paralelas y las celdas se codifican por fila como
+    tripletas planas ``[hueco, longitud, código, ...]``:
+
+    - hueco: días sin planificar desde el final de la racha anterior (o desde
+      ``start_date`` en la primera racha), es decir, fechas en delta.
+    - longitud: días consecutivos con el mismo código.
+    - código: índice en ``codes`` (diccionario de códigos de estado).
+    """
+
+    start_date: date
+    end_date: date
+    codes: List[Optional[str]] = []
+    code_colors: List[Optional[str]] = []
+    employee_ids: List[int] = []
+    employee_names: List[str] = []
+    project_ids: List[Optional[int]] = []
+    project_references: List[Optional[str]] = []
+    runs: List[List[int]] = []
+    cells: int = Field(0, description="Número total de días planificados")
@@ -33,6 +33,7 @@ from .external_api_service import (
     ExternalApiService,
     ApiClient,
     RateLimiter,
+    ResponseCache,
     HttpMethod,
     AuthenticationType,
     ApiCredentials,
@@ -75,6 +76,7 @@ __all__ = [
     "ExternalApiService",
     "ApiClient",
     "RateLimiter",
+    "ResponseCache",
     "HttpMethod",
     "AuthenticationType",
     "ApiCredentials",
@@ -8,12 +8,15 @@ con servicios externos y APIs de terceros.
 """
 
 import asyncio
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Callable, Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 import json
+from collections import OrderedDict
+from urllib.parse import urlencode
 
 import aiohttp
 from loguru import logger
@@ -81,6 +84,7 @@ class ApiRequest:
     retries: int = 3
     retry_delay: float = 1.0
     credentials: Optional[ApiCredentials] = None
+    use_cache: bool = True
 
 
 @dataclass
@@ -101,47 +105,329 @@ class ApiResponse:
 
 class RateLimiter:
     """
-    Limitador de velocidad para APIs.
+    Limitador de velocidad para APIs basado en GCRA (token bucket virtual).
+    
+    En lugar de guardar las marcas de tiempo de cada request, mantiene un único
+    "tiempo teórico de llegada" (TAT). Cada llamada reserva su turno en O(1)
+    y duerme fuera de cualquier lock, de modo que las llamadas concurrentes
+    alcanzan la tasa configurada y se atienden en orden de llegada.
     """
     
-    def __init__(self, max_requests: int, time_window: int):
+    def __init__(self, max_requests: int, time_window: float,
+                 burst: Optional[int] = None,
+                 max_wait: Optional[float] = None,
+                 clock: Optional[Callable[[], float]] = None):
         """
         Inicializa el limitador de velocidad.
         
         Args:
-            max_requests: Número máximo de requests permitidos.
+            max_requests: Número máximo de requests permitidos por ventana.
             time_window: Ventana de tiempo en segundos.
+            burst: Requests que pueden hacerse de golpe sin esperar
+                (por defecto max_requests).
+            max_wait: Espera máxima en segundos antes de rechazar la request
+                (None para esperar siempre).
+            clock: Reloj monotónico en segundos (por defecto time.monotonic).
         """
+        if max_requests <= 0 or time_window <= 0:
+            raise ValueError("max_requests y time_window deben ser positivos")
+        
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests: List[datetime] = []
-        self._lock = asyncio.Lock()
+        self.burst = max(1, burst if burst is not None else max_requests)
+        self.max_wait = max_wait
+        self.emission_interval = time_window / max_requests
+        self._tolerance = self.emission_interval * (self.burst - 1)
+        self._clock = clock or time.monotonic
+        self._tat = 0.0
+    
+    def _reserve(self, now: float) -> float:
+        """
+        Reserva el siguiente turno disponible.
+        
+        Args:
+            now: Instante actual (reloj monotónico).
+            
+        Returns:
+            Segundos que hay que esperar antes de usar el turno reservado.
+        """
+        tat = max(self._tat, now)
+        self._tat = tat + self.emission_interval
+        return tat - self._tolerance - now
+    
+    def try_acquire(self) -> bool:
+        """
+        Intenta adquirir permiso sin esperar.
+        
+        Returns:
+            True si la request puede hacerse inmediatamente.
+        """
+        now = self._clock()
+        if max(self._tat, now) - self._tolerance > now:
+            return False
+        self._reserve(now)
+        return True
     
     async def acquire(self) -> None:
         """
         Adquiere permiso para hacer una request.
         
         Raises:
-            ExternalServiceError: Si se excede el límite de velocidad.
+            ExternalServiceError: Si la espera necesaria supera max_wait.
+        """
+        now = self._clock()
+        wait_time = max(self._tat, now) - self._tolerance - now
+        
+        if self.max_wait is not None and wait_time > self.max_wait:
+            raise create_external_service_error(
+                message=f"Rate limit excedido: espera de {wait_time:.2f}s "
+                        f"supera el máximo de {self.max_wait:.2f}s",
+                operation="rate_limit"
+            )
+        
+        # La reserva y la comprobación no ceden el control al event loop,
+        # por lo que no hace falta lock: cada llamada obtiene su propio turno.
+        wait_time = self._reserve(now)
+        if wait_time <= 0:
+            return
+        
+        logger.debug("Rate limit alcanzado, esperando {:.3f} segundos", wait_time)
+        try:
+            await asyncio.sleep(wait_time)
+        except asyncio.CancelledError:
+            # Devolver el turno para no penalizar a los siguientes
+            self.refund()
+            raise
+    
+    def refund(self) -> None:
+        """
+        Devuelve el último turno reservado que no llegó a usarse.
         """
-        async with self._lock:
-            now = get_current_datetime()
+        self._tat = max(self._tat - self.emission_interval, self._clock())
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtiene el estado actual del limitador.
+        
+        Returns:
+            Diccionario con la configuración y la capacidad disponible.
+        """
+        now = self._clock()
+        backlog = max(self._tat - now, 0.0)
+        available = max(self.burst - backlog / self.emission_interval, 0.0)
+        return {
+            "max_requests": self.max_requests,
+            "time_window": self.time_window,
+            "burst": self.burst,
+            "available": int(available),
+            "wait_time": max(backlog - self._tolerance, 0.0)
+        }
+
+
+def _get_header(headers: Dict[str, str], name: str) -> Optional[str]:
+    """
+    Obtiene un header sin distinguir mayúsculas y minúsculas.
+    """
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+@dataclass
+class CachedResponse:
+    """
+    Entrada de la caché de respuestas.
+    """
+    response: ApiResponse
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    
+    def is_fresh(self) -> bool:
+        """Indica si la entrada puede servirse sin contactar al servidor."""
+        return time.monotonic() < self.expires_at
+    
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers para revalidar la entrada con un GET condicional."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Caché LRU de respuestas GET con TTL y revalidación condicional.
+    
+    Las entradas se indexan por método, URL y parámetros. Mientras están
+    vigentes se sirven sin request; al caducar, si la respuesta traía
+    ETag o Last-Modified, se revalidan con un GET condicional y un 304
+    renueva la entrada sin volver a descargar el cuerpo.
+    """
+    
+    def __init__(self, default_ttl: float = 300.0, max_entries: int = 1000):
+        """
+        Inicializa la caché de respuestas.
+        
+        Args:
+            default_ttl: Segundos de validez si el servidor no indica max-age.
+            max_entries: Número máximo de respuestas almacenadas.
+        """
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+    
+    @staticmethod
+    def make_key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Construye la clave de caché de una request.
+        
+        Args:
+            method: Método HTTP.
+            url: URL completa.
+            params: Parámetros de query.
             
-            # Limpiar requests antiguos
-            cutoff_time = now - timedelta(seconds=self.time_window)
-            self.requests = [req_time for req_time in self.requests if req_time > cutoff_time]
+        Returns:
+            Clave de caché.
+        """
+        if not params:
+            return f"{method} {url}"
+        query = urlencode(sorted((str(k), str(v)) for k, v in params.items()))
+        return f"{method} {url}?{query}"
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Obtiene una entrada (vigente o caducada) y actualiza las estadísticas.
+        
+        Args:
+            key: Clave de caché.
             
-            # Verificar límite
-            if len(self.requests) >= self.max_requests:
-                oldest_request = min(self.requests)
-                wait_time = (oldest_request + timedelta(seconds=self.time_window) - now).total_seconds()
-                
-                if wait_time > 0:
-                    logger.warning(f"Rate limit alcanzado, esperando {wait_time:.2f} segundos")
-                    await asyncio.sleep(wait_time)
+        Returns:
+            Entrada almacenada o None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        if entry.is_fresh():
+            self.hits += 1
+        else:
+            self.misses += 1
+        return entry
+    
+    def store(self, key: str, response: ApiResponse) -> None:
+        """
+        Almacena una respuesta respetando Cache-Control.
+        
+        Args:
+            key: Clave de caché.
+            response: Respuesta a almacenar.
+        """
+        cache_control = (_get_header(response.headers, 'Cache-Control') or '').lower()
+        if 'no-store' in cache_control:
+            self._entries.pop(key, None)
+            return
+        
+        ttl = self.default_ttl
+        if 'no-cache' in cache_control:
+            ttl = 0.0
+        else:
+            for directive in cache_control.split(','):
+                directive = directive.strip()
+                if directive.startswith('max-age='):
+                    try:
+                        ttl = float(directive.split('=', 1)[1])
+                    except ValueError:
+                        pass
+        
+        etag = _get_header(response.headers, 'ETag')
+        last_modified = _get_header(response.headers, 'Last-Modified')
+        if ttl <= 0 and not (etag or last_modified):
+            return
+        
+        self._entries[key] = CachedResponse(
+            response=response,
+            expires_at=time.monotonic() + ttl,
+            etag=etag,
+            last_modified=last_modified
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def revalidate(self, key: str, headers: Dict[str, str]) -> Optional[ApiResponse]:
+        """
+        Renueva una entrada tras recibir un 304 Not Modified.
+        
+        Args:
+            key: Clave de caché.
+            headers: Headers de la respuesta 304.
             
-            # Registrar nueva request
-            self.requests.append(now)
+        Returns:
+            Respuesta almacenada o None si la entrada ya no existe.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        self.revalidations += 1
+        merged_headers = {**entry.response.headers, **headers}
+        refreshed = ApiResponse(
+            status_code=entry.response.status_code,
+            headers=merged_headers,
+            content=entry.response.content,
+            text=entry.response.text,
+            json_data=entry.response.json_data,
+            request_url=entry.response.request_url,
+            request_method=entry.response.request_method
+        )
+        self.store(key, refreshed)
+        return refreshed
+    
+    def invalidate(self, url_prefix: Optional[str] = None) -> int:
+        """
+        Elimina entradas de la caché.
+        
+        Args:
+            url_prefix: Si se indica, solo se eliminan las URLs con ese prefijo.
+            
+        Returns:
+            Número de entradas eliminadas.
+        """
+        if url_prefix is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+        
+        keys = [key for key in self._entries if key.split(' ', 1)[1].startswith(url_prefix)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtiene las estadísticas de la caché.
+        
+        Returns:
+            Diccionario con tamaño, aciertos, fallos y revalidaciones.
+        """
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "hit_rate": self.hits / total if total else 0.0
+        }
 
 
 class ApiClient:
@@ -152,7 +438,10 @@ class ApiClient:
     def __init__(self, base_url: Optional[str] = None,
                  default_headers: Optional[Dict[str, str]] = None,
                  default_timeout: int = 30,
-                 rate_limiter: Optional[RateLimiter] = None):
+                 rate_limiter: Optional[RateLimiter] = None,
+                 connection_limit: int = 100,
+                 connection_limit_per_host: int = 30,
+                 cache: Optional[ResponseCache] = None):
         """
         Inicializa el cliente de API.
         
@@ -161,11 +450,19 @@ class ApiClient:
             default_headers: Headers por defecto.
             default_timeout: Timeout por defecto en segundos.
             rate_limiter: Limitador de velocidad opcional.
+            connection_limit: Conexiones simultáneas máximas del pool.
+            connection_limit_per_host: Conexiones simultáneas máximas por host.
+            cache: Caché de respuestas GET opcional.
         """
         self.base_url = base_url.rstrip('/') if base_url else None
         self.default_headers = default_headers or {}
         self.default_timeout = default_timeout
         self.rate_limiter = rate_limiter
+        self.endpoint_rate_limiters: Dict[str, RateLimiter] = {}
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.cache = cache
+        self._inflight: Dict[str, "asyncio.Task[ApiResponse]"] = {}
         self.session: Optional[aiohttp.ClientSession] = None
     
     async def __aenter__(self):
@@ -187,8 +484,8 @@ class ApiClient:
         """
         if not self.session or self.session.closed:
             connector = aiohttp.TCPConnector(
-                limit=100,
-                limit_per_host=30,
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
                 ttl_dns_cache=300,
                 use_dns_cache=True
             )
@@ -205,10 +502,61 @@ class ApiClient:
         """
         Cierra la sesión HTTP.
         """
+        for task in list(self._inflight.values()):
+            task.cancel()
+        
         if self.session and not self.session.closed:
             await self.session.close()
             self.session = None
     
+    def set_endpoint_rate_limit(self, endpoint: str, max_requests: int,
+                                time_window: float,
+                                burst: Optional[int] = None) -> RateLimiter:
+        """
+        Configura un límite de velocidad propio para un endpoint.
+        
+        Se aplica además del límite del cliente a todas las URLs que empiecen
+        por el prefijo indicado (el más largo que coincida).
+        
+        Args:
+            endpoint: Prefijo de ruta relativo a base_url (p. ej. "/employees").
+            max_requests: Número máximo de requests por ventana.
+            time_window: Ventana de tiempo en segundos.
+            burst: Requests permitidas de golpe.
+            
+        Returns:
+            Limitador creado para el endpoint.
+        """
+        rate_limiter = RateLimiter(max_requests, time_window, burst=burst)
+        self.endpoint_rate_limiters['/' + endpoint.strip('/')] = rate_limiter
+        return rate_limiter
+    
+    def _get_endpoint_rate_limiter(self, url: str) -> Optional[RateLimiter]:
+        """
+        Obtiene el limitador del endpoint más específico para una URL.
+        
+        Args:
+            url: URL relativa o absoluta de la request.
+            
+        Returns:
+            Limitador del endpoint o None si no hay ninguno configurado.
+        """
+        if not self.endpoint_rate_limiters:
+            return None
+        
+        path = url
+        if self.base_url and path.startswith(self.base_url):
+            path = path[len(self.base_url):]
+        path = '/' + path.split('?', 1)[0].strip('/')
+        
+        best_match = None
+        for prefix in self.endpoint_rate_limiters:
+            if path == prefix or path.startswith(prefix.rstrip('/') + '/'):
+                if best_match is None or len(prefix) > len(best_match):
+                    best_match = prefix
+        
+        return self.endpoint_rate_limiters[best_match] if best_match else None
+    
     def _build_url(self, url: str) -> str:
         """
         Construye la URL completa.
@@ -266,6 +614,9 @@ class ApiClient:
         """
         Realiza una request HTTP.
         
+        Las requests GET se sirven desde la caché si está configurada y la
+        entrada sigue vigente; las idénticas en curso se comparten.
+        
         Args:
             request: Configuración de la request.
             
@@ -276,15 +627,102 @@ class ApiClient:
             NetworkError: Si hay problemas de conectividad.
             ExternalServiceError: Si hay errores en la API externa.
         """
+        url = self._build_url(request.url)
+        
+        if self.cache is None or not request.use_cache or request.method != HttpMethod.GET:
+            return await self._send_request(request, url)
+        
+        cache_key = ResponseCache.make_key(request.method.value, url, request.params)
+        cached = self.cache.get(cache_key)
+        if cached is not None and cached.is_fresh():
+            return cached.response
+        
+        # Compartir la request si otra idéntica ya está en curso. La request
+        # corre en su propia tarea y cada llamador la espera protegida, de modo
+        # que cancelar a uno (incluido el que la lanzó) no cancela a los demás.
+        inflight = self._inflight.get(cache_key)
+        if inflight is None:
+            extra_headers = cached.conditional_headers() if cached is not None else {}
+            inflight = asyncio.ensure_future(
+                self._fetch_and_cache(request, url, cache_key, extra_headers)
+            )
+            self._inflight[cache_key] = inflight
+            inflight.add_done_callback(
+                lambda task: self._release_inflight(cache_key, task)
+            )
+        return await asyncio.shield(inflight)
+    
+    async def _fetch_and_cache(self, request: ApiRequest, url: str, cache_key: str,
+                               extra_headers: Dict[str, str]) -> ApiResponse:
+        """
+        Envía una request GET cacheable y actualiza la caché con la respuesta.
+        
+        Args:
+            request: Configuración de la request.
+            url: URL completa.
+            cache_key: Clave de caché de la request.
+            extra_headers: Headers de revalidación de la entrada caducada.
+            
+        Returns:
+            Respuesta de la API (la almacenada si el servidor responde 304).
+        """
+        response = await self._send_request(request, url, extra_headers)
+        
+        if response.status_code == 304:
+            refreshed = self.cache.revalidate(cache_key, response.headers)
+            if refreshed is not None:
+                response = refreshed
+        elif response.status_code == 200:
+            self.cache.store(cache_key, response)
+        
+        return response
+    
+    def _release_inflight(self, cache_key: str, task: "asyncio.Task[ApiResponse]") -> None:
+        """
+        Retira una request compartida terminada.
+        
+        Args:
+            cache_key: Clave de caché de la request.
+            task: Tarea terminada.
+        """
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        if not task.cancelled():
+            # Marcar la excepción como recuperada si todos los llamadores se cancelaron
+            task.exception()
+    
+    async def _send_request(self, request: ApiRequest, url: str,
+                            extra_headers: Optional[Dict[str, str]] = None) -> ApiResponse:
+        """
+        Envía una request HTTP aplicando rate limiting y reintentos.
+        
+        Args:
+            request: Configuración de la request.
+            url: URL completa.
+            extra_headers: Headers adicionales (p. ej. de revalidación).
+            
+        Returns:
+            Respuesta de la API.
+        """
         if not self.session:
             await self.start_session()
         
-        # Aplicar rate limiting
+        # Aplicar rate limiting: primero el endpoint, que suele ser el más
+        # restrictivo, para no retener un turno del cliente mientras se espera
+        endpoint_rate_limiter = self._get_endpoint_rate_limiter(request.url)
+        if endpoint_rate_limiter:
+            await endpoint_rate_limiter.acquire()
+        
         if self.rate_limiter:
-            await self.rate_limiter.acquire()
+            try:
+                await self.rate_limiter.acquire()
+            except BaseException:
+                # La request no llega a enviarse: devolver el turno del endpoint
+                if endpoint_rate_limiter:
+                    endpoint_rate_limiter.refund()
+                raise
         
-        url = self._build_url(request.url)
-        headers = request.headers or {}
+        headers = {**(request.headers or {}), **(extra_headers or {})}
         headers = self._apply_authentication(headers, request.credentials)
         
         # Configurar datos de la request
@@ -310,15 +748,16 @@ class ApiClient:
                     url=url,
                     **kwargs
                 ) as response:
+                    # Leer el cuerpo una sola vez y decodificarlo en memoria
                     content = await response.read()
-                    text = await response.text()
+                    text = content.decode(response.charset or 'utf-8', errors='replace')
                     
                     # Intentar parsear JSON
                     json_data = None
-                    if response.content_type and 'json' in response.content_type:
+                    if content and response.content_type and 'json' in response.content_type:
                         try:
-                            json_data = await response.json()
-                        except (json.JSONDecodeError, aiohttp.ContentTypeError):
+                            json_data = json.loads(text)
+                        except json.JSONDecodeError:
                             logger.warning(f"No se pudo parsear JSON de la respuesta: {text[:200]}")
                     
                     duration = (get_current_datetime() - start_time).total_seconds()
@@ -379,7 +818,7 @@ class ApiClient:
                     original_error=e
                 )
             
-            except aiohttp.ClientTimeout as e:
+            except asyncio.TimeoutError as e:
                 if attempt < request.retries:
                     wait_time = request.retry_delay * (2 ** attempt)
                     logger.warning(f"Timeout, reintentando en {wait_time}s: {e}")
@@ -440,7 +879,11 @@ class ExternalApiService:
     def create_client(self, name: str, base_url: str,
                      default_headers: Optional[Dict[str, str]] = None,
                      rate_limit_requests: int = 100,
-                     rate_limit_window: int = 60) -> ApiClient:
+                     rate_limit_window: int = 60,
+                     rate_limit_burst: Optional[int] = None,
+                     connection_limit_per_host: int = 30,
+                     cache_ttl: Optional[float] = None,
+                     cache_max_entries: int = 1000) -> ApiClient:
         """
         Crea y registra un nuevo cliente de API.
         
@@ -450,19 +893,31 @@ class ExternalApiService:
             default_headers: Headers por defecto.
             rate_limit_requests: Límite de requests por ventana.
             rate_limit_window: Ventana de tiempo en segundos.
+            rate_limit_burst: Requests permitidas de golpe (por defecto
+                rate_limit_requests).
+            connection_limit_per_host: Conexiones simultáneas máximas por host.
+            cache_ttl: Segundos de validez de la caché de GET (None la desactiva).
+            cache_max_entries: Número máximo de respuestas en caché.
             
         Returns:
             Cliente de API creado.
         """
         rate_limiter = RateLimiter(
             max_requests=rate_limit_requests,
-            time_window=rate_limit_window
+            time_window=rate_limit_window,
+            burst=rate_limit_burst
         )
         
+        cache = None
+        if cache_ttl is not None:
+            cache = ResponseCache(default_ttl=cache_ttl, max_entries=cache_max_entries)
+        
         client = ApiClient(
             base_url=base_url,
             default_headers=default_headers,
-            rate_limiter=rate_limiter
+            rate_limiter=rate_limiter,
+            connection_limit_per_host=connection_limit_per_host,
+            cache=cache
         )
         
         self.register_client(name, client)
@@ -496,6 +951,64 @@ class ExternalApiService:
             logger.error(f"Error en request con cliente {client_name}: {e}")
             raise
     
+    async def gather_requests(self, client_name: str,
+                              requests: List[ApiRequest],
+                              max_concurrency: int = 10,
+                              return_exceptions: bool = False) -> List[Union[ApiResponse, Exception]]:
+        """
+        Realiza varias requests concurrentes con un cliente específico.
+        
+        La concurrencia se limita con un semáforo; el rate limiter y el pool de
+        conexiones del cliente siguen aplicándose. Los resultados se devuelven
+        en el mismo orden que las requests.
+        
+        Args:
+            client_name: Nombre del cliente a usar.
+            requests: Requests a realizar.
+            max_concurrency: Número máximo de requests simultáneas.
+            return_exceptions: Si es True, los errores se devuelven en la lista
+                en lugar de propagarse.
+            
+        Returns:
+            Lista de respuestas (o excepciones) en el orden de entrada.
+            
+        Raises:
+            ExternalServiceError: Si el cliente no existe o, con
+                return_exceptions=False, si alguna request falla.
+        """
+        client = self.clients.get(client_name)
+        if not client:
+            raise create_external_service_error(
+                message=f"Cliente de API no encontrado: {client_name}",
+                service_name=client_name,
+                operation="get_client"
+            )
+        
+        if not requests:
+            return []
+        
+        await client.start_session()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def run(request: ApiRequest) -> ApiResponse:
+            async with semaphore:
+                return await client.make_request(request)
+        
+        tasks = [asyncio.ensure_future(run(request)) for request in requests]
+        try:
+            results = await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except Exception as e:
+            for task in tasks:
+                task.cancel()
+            logger.error(f"Error en requests concurrentes con cliente {client_name}: {e}")
+            raise
+        
+        logger.debug(
+            f"{len(requests)} requests completadas con cliente {client_name} "
+            f"(concurrencia {max_concurrency})"
+        )
+        return list(results)
+    
     async def get_json(self, client_name: str, url: str,
                       params: Optional[Dict[str, Any]] = None,
                       headers: Optional[Dict[str, str]] = None,
@@ -575,6 +1088,19 @@ class ExternalApiService:
             except Exception as e:
                 logger.warning(f"Error al cerrar cliente {name}: {e}")
     
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Obtiene las estadísticas de caché de los clientes que la usan.
+        
+        Returns:
+            Diccionario nombre de cliente -> estadísticas de caché.
+        """
+        return {
+            name: client.cache.get_stats()
+            for name, client in self.clients.items()
+            if client.cache is not None
+        }
+    
     def get_client_names(self) -> List[str]:
         """
         Obtiene los nombres de todos los clientes registrados.
@@ -13,7 +13,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List, Union, Callable
 from enum import Enum
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from contextlib import contextmanager
 import traceback
 import asyncio
@@ -27,6 +27,8 @@ from ...exceptions.infrastructure import (
 )
 from ...utils.date_utils import get_current_datetime
 from ...config.config import get_settings
+from ...config.logging_config import AsyncBatchSink, OverflowPolicy
+from ...database.instrumentation import OperationScope
 
 
 class LogLevel(Enum):
@@ -213,6 +215,7 @@ class LoggingService:
         self.context_stack: List[LogContext] = []
         self.performance_metrics: List[PerformanceMetrics] = []
         self.handlers: Dict[str, int] = {}
+        self.batch_sinks: Dict[str, AsyncBatchSink] = {}
         self._setup_logging()
     
     def _setup_logging(self) -> None:
@@ -246,7 +249,7 @@ class LoggingService:
         """
         format_func = LogFormatter.simple_format
         
-        if self.settings.debug:
+        if self.settings.debug_mode:
             format_func = LogFormatter.detailed_format
         
         handler_id = logger.add(
@@ -269,17 +272,26 @@ class LoggingService:
             log_file_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Handler para logs generales
-            handler_id = logger.add(
-                str(log_file_path),
-                format=LogFormatter.structured_format,
-                level=self.settings.log_level,
-                rotation="10 MB",
-                retention="30 days",
-                compression="gz",
-                backtrace=True,
-                diagnose=True,
-                enqueue=True  # Para thread safety
-            )
+            if self.settings.log_async_sink:
+                handler_id = logger.add(
+                    self._create_batch_sink("file", log_file_path, max_bytes=10 * 1024 * 1024),
+                    format=LogFormatter.structured_format,
+                    level=self.settings.log_level,
+                    backtrace=True,
+                    diagnose=True
+                )
+            else:
+                handler_id = logger.add(
+                    str(log_file_path),
+                    format=LogFormatter.structured_format,
+                    level=self.settings.log_level,
+                    rotation="10 MB",
+                    retention="30 days",
+                    compression="gz",
+                    backtrace=True,
+                    diagnose=True,
+                    enqueue=True  # Para thread safety
+                )
             
             self.handlers["file"] = handler_id
         
@@ -294,23 +306,56 @@ class LoggingService:
             error_log_path = Path(self.settings.logs_dir) / "errors.log"
             error_log_path.parent.mkdir(parents=True, exist_ok=True)
             
-            handler_id = logger.add(
-                str(error_log_path),
-                format=LogFormatter.json_format,
-                level="ERROR",
-                rotation="5 MB",
-                retention="90 days",
-                compression="gz",
-                backtrace=True,
-                diagnose=True,
-                enqueue=True
-            )
+            if self.settings.log_async_sink:
+                handler_id = logger.add(
+                    self._create_batch_sink("error", error_log_path, max_bytes=5 * 1024 * 1024),
+                    format=LogFormatter.json_format,
+                    level="ERROR",
+                    backtrace=True,
+                    diagnose=True
+                )
+            else:
+                handler_id = logger.add(
+                    str(error_log_path),
+                    format=LogFormatter.json_format,
+                    level="ERROR",
+                    rotation="5 MB",
+                    retention="90 days",
+                    compression="gz",
+                    backtrace=True,
+                    diagnose=True,
+                    enqueue=True
+                )
             
             self.handlers["error"] = handler_id
         
         except Exception as e:
             logger.warning(f"No se pudo configurar logging de errores: {e}")
     
+    def _create_batch_sink(self, name: str, path: Path, max_bytes: int) -> AsyncBatchSink:
+        """
+        Crea un sink asíncrono por lotes según la configuración.
+        
+        Args:
+            name: Nombre del handler asociado.
+            path: Ruta del archivo de destino.
+            max_bytes: Tamaño máximo del archivo antes de rotar.
+            
+        Returns:
+            Sink asíncrono registrado en el servicio.
+        """
+        sink = AsyncBatchSink(
+            path,
+            max_queue_size=self.settings.log_queue_size,
+            batch_size=self.settings.log_batch_size,
+            flush_interval=self.settings.log_flush_interval,
+            overflow_policy=OverflowPolicy(self.settings.log_overflow_policy),
+            max_bytes=max_bytes,
+            compress=True
+        )
+        self.batch_sinks[name] = sink
+        return sink
+    
     def add_custom_handler(self, name: str, sink: Any, **kwargs) -> None:
         """
         Agrega un handler personalizado.
@@ -344,10 +389,37 @@ class LoggingService:
             try:
                 logger.remove(self.handlers[name])
                 del self.handlers[name]
+                if name in self.batch_sinks:
+                    self.batch_sinks.pop(name).close()
                 logger.info(f"Handler removido: {name}")
             except Exception as e:
                 logger.warning(f"Error al remover handler {name}: {e}")
     
+    def flush(self) -> None:
+        """
+        Espera a que los sinks asíncronos escriban todos los mensajes pendientes.
+        """
+        for sink in self.batch_sinks.values():
+            sink.flush()
+    
+    def shutdown(self) -> None:
+        """
+        Vacía y cierra los sinks asíncronos.
+        
+        Debe llamarse al cerrar la aplicación para no perder mensajes en cola.
+        """
+        for name in list(self.batch_sinks):
+            self.remove_handler(name)
+    
+    def get_sink_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Obtiene los contadores de los sinks asíncronos.
+        
+        Returns:
+            Estadísticas (encolados, escritos, descartados...) por handler.
+        """
+        return {name: sink.stats for name, sink in self.batch_sinks.items()}
+    
     @contextmanager
     def log_context(self, context: LogContext):
         """
@@ -465,6 +537,28 @@ class LoggingService:
             metrics.end_time = get_current_datetime()
             self.log_performance(metrics)
     
+    def log_query_operation(self, scope: OperationScope) -> None:
+        """
+        Registra como métrica de rendimiento una operación de repositorio
+        instrumentada. Se suscribe a ``query_instrumentation.add_listener``.
+        
+        Args:
+            scope: Ámbito raíz finalizado de la operación.
+        """
+        end_time = get_current_datetime()
+        self.log_performance(PerformanceMetrics(
+            operation=scope.name,
+            start_time=end_time - timedelta(milliseconds=scope.duration_ms),
+            end_time=end_time,
+            duration_ms=scope.duration_ms,
+            extra_metrics={
+                "statements": scope.statement_count,
+                "db_time_ms": round(scope.db_time_ms, 3),
+                "rows": scope.rows,
+                "n_plus_one": scope.n_plus_one,
+            }
+        ))
+    
     def log_exception(self, exception: Exception, context: Optional[LogContext] = None,
                      additional_info: Optional[Dict[str, Any]] = None) -> None:
         """
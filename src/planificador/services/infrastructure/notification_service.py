@@ -7,11 +7,16 @@ Este módulo proporciona una interfaz unificada para enviar
 notificaciones a través de diferentes canales (email, SMS, push, etc.).
 """
 
+import asyncio
+import itertools
+import smtplib
 from abc import ABC, abstractmethod
-from enum import Enum
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from email.message import EmailMessage
+from enum import Enum
+from typing import Dict, List, Optional, Any, Set, Tuple, Union
 
 from loguru import logger
 
@@ -150,11 +155,20 @@ class NotificationProvider(ABC):
 
 class EmailProvider(NotificationProvider):
     """
-    Proveedor de notificaciones por email (implementación mock).
+    Proveedor de notificaciones por email.
+    
+    Los destinatarios se envían en lotes: cada lote usa una única sesión SMTP
+    (conexión, STARTTLS y login una sola vez). Sin ``send_via_smtp`` el envío
+    se simula, como en entornos de desarrollo.
     """
     
     def __init__(self, smtp_host: str = "localhost", smtp_port: int = 587,
-                 username: Optional[str] = None, password: Optional[str] = None):
+                 username: Optional[str] = None, password: Optional[str] = None,
+                 from_address: str = "planificador@localhost",
+                 use_tls: bool = True,
+                 send_via_smtp: bool = False,
+                 batch_size: int = 50,
+                 timeout: float = 30.0):
         """
         Inicializa el proveedor de email.
         
@@ -163,15 +177,97 @@ class EmailProvider(NotificationProvider):
             smtp_port: Puerto del servidor SMTP.
             username: Usuario para autenticación.
             password: Contraseña para autenticación.
+            from_address: Remitente de los emails.
+            use_tls: Si se negocia STARTTLS al abrir la sesión.
+            send_via_smtp: Si es False, el envío se simula.
+            batch_size: Destinatarios máximos por sesión SMTP.
+            timeout: Timeout de la conexión SMTP en segundos.
         """
         self.smtp_host = smtp_host
         self.smtp_port = smtp_port
         self.username = username
         self.password = password
+        self.from_address = from_address
+        self.use_tls = use_tls
+        self.send_via_smtp = send_via_smtp
+        self.batch_size = max(1, batch_size)
+        self.timeout = timeout
+    
+    @staticmethod
+    def _is_valid_address(address: str) -> bool:
+        """
+        Validación básica de una dirección de email.
+        """
+        return "@" in address and "." in address
+    
+    def _build_message(self, request: NotificationRequest,
+                       recipient: NotificationRecipient) -> EmailMessage:
+        """
+        Construye el mensaje de email para un destinatario.
+        """
+        message = EmailMessage()
+        message["From"] = self.from_address
+        message["To"] = recipient.identifier
+        message["Subject"] = request.content.title
+        message.set_content(request.content.body)
+        if request.content.html_body:
+            message.add_alternative(request.content.html_body, subtype="html")
+        return message
+    
+    def _send_batch_smtp(self, request: NotificationRequest,
+                         recipients: List[NotificationRecipient]
+                         ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Envía un lote de emails usando una única sesión SMTP (bloqueante).
+        
+        Si la sesión se corta a mitad del lote, los emails ya aceptados por
+        el servidor se dan por enviados y solo los restantes se devuelven
+        como no entregados.
+        
+        Args:
+            request: Solicitud de notificación.
+            recipients: Destinatarios del lote.
+            
+        Returns:
+            Tupla (rechazados, no entregados): diccionarios destinatario ->
+            error con los rechazados por el servidor (definitivos) y los que
+            no llegaron a enviarse por un fallo de la sesión (reintentables).
+        """
+        rejected: Dict[str, str] = {}
+        delivered: Set[str] = set()
+        try:
+            with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=self.timeout) as smtp:
+                if self.use_tls:
+                    smtp.starttls()
+                if self.username and self.password:
+                    smtp.login(self.username, self.password)
+                
+                for recipient in recipients:
+                    try:
+                        refused = smtp.send_message(self._build_message(request, recipient))
+                        if refused:
+                            rejected[recipient.identifier] = str(refused.get(recipient.identifier, refused))
+                        else:
+                            delivered.add(recipient.identifier)
+                    except (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError,
+                            smtplib.SMTPSenderRefused) as e:
+                        rejected[recipient.identifier] = str(e)
+        except (smtplib.SMTPException, OSError) as e:
+            logger.warning(
+                "Sesión SMTP interrumpida tras {} de {} emails: {}",
+                len(delivered) + len(rejected), len(recipients), e
+            )
+            undelivered = {
+                recipient.identifier: str(e)
+                for recipient in recipients
+                if recipient.identifier not in delivered and recipient.identifier not in rejected
+            }
+            return rejected, undelivered
+        return rejected, {}
     
     async def send_notification(self, request: NotificationRequest) -> List[NotificationResult]:
         """
-        Envía notificaciones por email.
+        Envía notificaciones por email en lotes.
         
         Args:
             request: Solicitud de notificación.
@@ -184,31 +280,47 @@ class EmailProvider(NotificationProvider):
         """
         try:
             results = []
+            valid_recipients = []
             
             for recipient in request.recipients:
-                # Simulación de envío de email
-                # En una implementación real, aquí se usaría una librería como aiosmtplib
+                if self._is_valid_address(recipient.identifier):
+                    valid_recipients.append(recipient)
+                else:
+                    results.append(self._build_result(
+                        recipient,
+                        NotificationStatus.FAILED,
+                        "Dirección de email inválida"
+                    ))
+            
+            for start in range(0, len(valid_recipients), self.batch_size):
+                batch = valid_recipients[start:start + self.batch_size]
                 logger.info(
-                    f"Enviando email a {recipient.identifier}: {request.content.title}"
+                    "Enviando email a {} destinatarios: {}",
+                    len(batch), request.content.title
                 )
                 
-                # Simular éxito o fallo basado en validación básica
-                if "@" in recipient.identifier and "." in recipient.identifier:
-                    status = NotificationStatus.SENT
-                    error_message = None
-                else:
-                    status = NotificationStatus.FAILED
-                    error_message = "Dirección de email inválida"
+                rejected: Dict[str, str] = {}
+                undelivered: Dict[str, str] = {}
+                if self.send_via_smtp:
+                    rejected, undelivered = await asyncio.to_thread(
+                        self._send_batch_smtp, request, batch
+                    )
                 
-                result = NotificationResult(
-                    notification_id=f"email_{get_current_datetime().timestamp()}_{recipient.identifier}",
-                    status=status,
-                    sent_at=get_current_datetime(),
-                    recipient=recipient,
-                    error_message=error_message,
-                    provider_response={"provider": "email_mock", "smtp_host": self.smtp_host}
-                )
-                results.append(result)
+                for recipient in batch:
+                    if recipient.identifier in undelivered:
+                        results.append(self._build_result(
+                            recipient,
+                            NotificationStatus.FAILED,
+                            undelivered[recipient.identifier],
+                            retryable=True
+                        ))
+                        continue
+                    error_message = rejected.get(recipient.identifier)
+                    results.append(self._build_result(
+                        recipient,
+                        NotificationStatus.FAILED if error_message else NotificationStatus.SENT,
+                        error_message
+                    ))
             
             return results
         except Exception as e:
@@ -220,6 +332,30 @@ class EmailProvider(NotificationProvider):
                 original_error=e
             )
     
+    def _build_result(self, recipient: NotificationRecipient,
+                      status: NotificationStatus,
+                      error_message: Optional[str] = None,
+                      retryable: bool = False) -> NotificationResult:
+        """
+        Construye el resultado del envío a un destinatario.
+        
+        ``retryable`` marca los emails que no llegaron a enviarse y pueden
+        reintentarse sin riesgo de duplicados.
+        """
+        sent_at = get_current_datetime()
+        return NotificationResult(
+            notification_id=f"email_{sent_at.timestamp()}_{recipient.identifier}",
+            status=status,
+            sent_at=sent_at,
+            recipient=recipient,
+            error_message=error_message,
+            provider_response={
+                "provider": "email_smtp" if self.send_via_smtp else "email_mock",
+                "smtp_host": self.smtp_host,
+                "retryable": retryable
+            }
+        )
+    
     def get_provider_name(self) -> str:
         """
         Obtiene el nombre del proveedor.
@@ -245,13 +381,43 @@ class EmailProvider(NotificationProvider):
 class InAppProvider(NotificationProvider):
     """
     Proveedor de notificaciones in-app.
+    
+    Guarda como máximo ``max_per_user`` notificaciones por usuario (se
+    descartan las más antiguas) y mantiene el contador de no leídas
+    actualizado en cada operación, por lo que consultarlo es O(1).
     """
     
-    def __init__(self):
+    def __init__(self, max_per_user: int = 200):
         """
         Inicializa el proveedor de notificaciones in-app.
+        
+        Args:
+            max_per_user: Notificaciones máximas almacenadas por usuario.
         """
-        self.notifications_store: Dict[str, List[NotificationResult]] = {}
+        self.max_per_user = max(1, max_per_user)
+        self.notifications_store: Dict[str, "OrderedDict[str, NotificationResult]"] = {}
+        self._read_ids: Dict[str, Set[str]] = {}
+        self._unread_counts: Dict[str, int] = {}
+    
+    def _store_notification(self, user_id: str, result: NotificationResult) -> None:
+        """
+        Almacena una notificación descartando la más antigua si hace falta.
+        """
+        store = self.notifications_store.setdefault(user_id, OrderedDict())
+        read_ids = self._read_ids.setdefault(user_id, set())
+        
+        if result.notification_id in store:
+            return
+        
+        store[result.notification_id] = result
+        self._unread_counts[user_id] = self._unread_counts.get(user_id, 0) + 1
+        
+        while len(store) > self.max_per_user:
+            evicted_id, _ = store.popitem(last=False)
+            if evicted_id in read_ids:
+                read_ids.discard(evicted_id)
+            else:
+                self._unread_counts[user_id] -= 1
     
     async def send_notification(self, request: NotificationRequest) -> List[NotificationResult]:
         """
@@ -266,13 +432,14 @@ class InAppProvider(NotificationProvider):
         try:
             results = []
             
-            for recipient in request.recipients:
-                logger.info(
-                    f"Enviando notificación in-app a {recipient.identifier}: {request.content.title}"
-                )
-                
+            logger.info(
+                "Enviando notificación in-app a {} usuarios: {}",
+                len(request.recipients), request.content.title
+            )
+            
+            for index, recipient in enumerate(request.recipients):
                 result = NotificationResult(
-                    notification_id=f"inapp_{get_current_datetime().timestamp()}_{recipient.identifier}",
+                    notification_id=f"inapp_{get_current_datetime().timestamp()}_{index}_{recipient.identifier}",
                     status=NotificationStatus.DELIVERED,
                     sent_at=get_current_datetime(),
                     recipient=recipient,
@@ -280,10 +447,7 @@ class InAppProvider(NotificationProvider):
                 )
                 
                 # Almacenar la notificación para el usuario
-                user_id = recipient.identifier
-                if user_id not in self.notifications_store:
-                    self.notifications_store[user_id] = []
-                self.notifications_store[user_id].append(result)
+                self._store_notification(recipient.identifier, result)
                 
                 results.append(result)
             
@@ -326,9 +490,103 @@ class InAppProvider(NotificationProvider):
             user_id: ID del usuario.
             
         Returns:
-            Lista de notificaciones del usuario.
+            Lista de notificaciones del usuario (de la más antigua a la más reciente).
+        """
+        return list(self.notifications_store.get(user_id, {}).values())
+    
+    def get_unread_count(self, user_id: str) -> int:
+        """
+        Obtiene el número de notificaciones no leídas de un usuario.
+        
+        Args:
+            user_id: ID del usuario.
+            
+        Returns:
+            Número de notificaciones no leídas.
+        """
+        return self._unread_counts.get(user_id, 0)
+    
+    def is_read(self, user_id: str, notification_id: str) -> bool:
         """
-        return self.notifications_store.get(user_id, [])
+        Indica si una notificación ha sido leída.
+        
+        Args:
+            user_id: ID del usuario.
+            notification_id: ID de la notificación.
+            
+        Returns:
+            True si la notificación está marcada como leída.
+        """
+        return notification_id in self._read_ids.get(user_id, ())
+    
+    def mark_as_read(self, user_id: str, notification_id: str) -> bool:
+        """
+        Marca una notificación como leída.
+        
+        Args:
+            user_id: ID del usuario.
+            notification_id: ID de la notificación.
+            
+        Returns:
+            True si la notificación existía y no estaba leída.
+        """
+        store = self.notifications_store.get(user_id)
+        if not store or notification_id not in store:
+            return False
+        
+        read_ids = self._read_ids.setdefault(user_id, set())
+        if notification_id in read_ids:
+            return False
+        
+        read_ids.add(notification_id)
+        self._unread_counts[user_id] -= 1
+        return True
+    
+    def mark_all_as_read(self, user_id: str) -> int:
+        """
+        Marca todas las notificaciones de un usuario como leídas.
+        
+        Args:
+            user_id: ID del usuario.
+            
+        Returns:
+            Número de notificaciones marcadas.
+        """
+        store = self.notifications_store.get(user_id)
+        if not store:
+            return 0
+        
+        marked = self._unread_counts.get(user_id, 0)
+        self._read_ids[user_id] = set(store.keys())
+        self._unread_counts[user_id] = 0
+        return marked
+
+
+# Orden de atención en las colas de despacho (menor = antes)
+_PRIORITY_ORDER = {
+    NotificationPriority.URGENT: 0,
+    NotificationPriority.HIGH: 1,
+    NotificationPriority.NORMAL: 2,
+    NotificationPriority.LOW: 3,
+}
+
+
+@dataclass
+class DispatchJob:
+    """
+    Notificación encolada, dividida en lotes de destinatarios.
+    """
+    request: NotificationRequest
+    future: "asyncio.Future[List[NotificationResult]]"
+    pending_batches: int
+    results: List[NotificationResult] = field(default_factory=list)
+    
+    def add_results(self, results: List[NotificationResult]) -> None:
+        """Acumula los resultados de un lote y resuelve el futuro al terminar."""
+        self.results.extend(results)
+        self.pending_batches -= 1
+        if self.pending_batches <= 0 and not self.future.done():
+            self.future.set_result(self.results)
 
 
 class NotificationService:
@@ -344,6 +602,16 @@ class NotificationService:
         Inicializa el servicio de notificaciones.
         """
         self.providers: Dict[NotificationType, NotificationProvider] = {}
+        self._queues: Dict[NotificationType, asyncio.PriorityQueue] = {}
+        self._workers: Dict[NotificationType, List[asyncio.Task]] = {}
+        self._sequence = itertools.count()
+        self.workers_per_provider = 2
+        self.max_queue_size = 10000
+        self.max_retries = 3
+        self.retry_delay = 1.0
+        self.dispatch_stats: Dict[str, int] = {
+            "enqueued": 0, "batches": 0, "sent": 0, "failed": 0, "retries": 0
+        }
         self._setup_default_providers()
     
     def _setup_default_providers(self) -> None:
@@ -385,6 +653,10 @@ class NotificationService:
         """
         Envía una notificación.
         
+        Si el despacho en segundo plano está activo, la notificación pasa por
+        las colas de los workers (con su prioridad, lotes y reintentos) y se
+        espera a que se envíen todos sus lotes.
+        
         Args:
             request: Solicitud de notificación.
             
@@ -407,7 +679,10 @@ class NotificationService:
                 f"a {len(request.recipients)} destinatarios"
             )
             
-            results = await provider.send_notification(request)
+            if self.is_dispatching():
+                results = await (await self.enqueue_notification(request))
+            else:
+                results = await provider.send_notification(request)
             
             # Log de resultados
             successful = sum(1 for r in results if r.status in [NotificationStatus.SENT, NotificationStatus.DELIVERED])
@@ -434,6 +709,261 @@ class NotificationService:
                 original_error=e
             )
     
+    # ------------------------------------------------------------------
+    # Despacho en segundo plano
+    # ------------------------------------------------------------------
+    
+    async def start_dispatcher(self, workers_per_provider: Optional[int] = None,
+                               max_queue_size: Optional[int] = None) -> None:
+        """
+        Inicia las colas y los workers de despacho de cada proveedor.
+        
+        Args:
+            workers_per_provider: Workers concurrentes por proveedor.
+            max_queue_size: Lotes máximos en cola por proveedor.
+        """
+        if workers_per_provider is not None:
+            self.workers_per_provider = max(1, workers_per_provider)
+        if max_queue_size is not None:
+            self.max_queue_size = max(1, max_queue_size)
+        
+        for notification_type in self.providers:
+            self._ensure_workers(notification_type)
+        
+        logger.info(
+            "Despacho de notificaciones iniciado ({} workers por proveedor)",
+            self.workers_per_provider
+        )
+    
+    def is_dispatching(self) -> bool:
+        """
+        Indica si el despacho en segundo plano está iniciado.
+        """
+        return any(not w.done() for tasks in self._workers.values() for w in tasks)
+    
+    def _ensure_workers(self, notification_type: NotificationType) -> asyncio.PriorityQueue:
+        """
+        Crea la cola y los workers de un proveedor si aún no existen.
+        """
+        queue = self._queues.get(notification_type)
+        if queue is None:
+            queue = asyncio.PriorityQueue(maxsize=self.max_queue_size)
+            self._queues[notification_type] = queue
+        
+        workers = [w for w in self._workers.get(notification_type, []) if not w.done()]
+        while len(workers) < self.workers_per_provider:
+            workers.append(asyncio.create_task(
+                self._dispatch_worker(notification_type, queue),
+                name=f"notification-worker-{notification_type.value}-{len(workers)}"
+            ))
+        self._workers[notification_type] = workers
+        return queue
+    
+    async def stop_dispatcher(self, drain: bool = True) -> None:
+        """
+        Detiene los workers de despacho.
+        
+        Args:
+            drain: Si es True, espera a que se envíen los lotes pendientes.
+        """
+        if drain:
+            for queue in self._queues.values():
+                await queue.join()
+        
+        workers = [w for tasks in self._workers.values() for w in tasks]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        
+        # Cancelar las notificaciones que no se llegaron a enviar
+        for queue in self._queues.values():
+            while not queue.empty():
+                _, _, job, _ = queue.get_nowait()
+                if not job.future.done():
+                    job.future.cancel()
+                queue.task_done()
+        
+        self._workers.clear()
+        self._queues.clear()
+        logger.info("Despacho de notificaciones detenido")
+    
+    async def enqueue_notification(self, request: NotificationRequest,
+                                   batch_size: Optional[int] = None
+                                   ) -> "asyncio.Future[List[NotificationResult]]":
+        """
+        Encola una notificación para enviarla en segundo plano.
+        
+        Los destinatarios se dividen en lotes que los workers del proveedor
+        envían concurrentemente, con reintentos y backoff exponencial. El
+        llamador no espera al envío salvo que haga await del futuro devuelto.
+        
+        Args:
+            request: Solicitud de notificación.
+            batch_size: Destinatarios por lote (por defecto el del proveedor
+                o 50).
+            
+        Returns:
+            Futuro que se resuelve con todos los resultados del envío.
+            
+        Raises:
+            ExternalServiceError: Si no hay proveedor para el tipo de notificación.
+        """
+        provider = self.providers.get(request.notification_type)
+        if not provider:
+            raise create_external_service_error(
+                message=(
+                    f"No hay proveedor disponible para notificaciones de tipo "
+                    f"{request.notification_type.value}"
+                ),
+                service_name="notification_service",
+                operation="enqueue_notification"
+            )
+        
+        queue = self._ensure_workers(request.notification_type)
+        future: "asyncio.Future[List[NotificationResult]]" = asyncio.get_running_loop().create_future()
+        
+        size = max(1, batch_size or getattr(provider, "batch_size", 50))
+        batches = [
+            request.recipients[start:start + size]
+            for start in range(0, len(request.recipients), size)
+        ]
+        if not batches:
+            future.set_result([])
+            return future
+        
+        job = DispatchJob(request=request, future=future, pending_batches=len(batches))
+        priority = _PRIORITY_ORDER.get(request.priority, 2)
+        for recipients in batches:
+            await queue.put((priority, next(self._sequence), job, recipients))
+        
+        self.dispatch_stats["enqueued"] += 1
+        self.dispatch_stats["batches"] += len(batches)
+        logger.debug(
+            "Notificación {} encolada: {} destinatarios en {} lotes",
+            request.notification_type.value, len(request.recipients), len(batches)
+        )
+        return future
+    
+    async def _dispatch_worker(self, notification_type: NotificationType,
+                               queue: asyncio.PriorityQueue) -> None:
+        """
+        Worker que envía los lotes encolados para un proveedor.
+        """
+        while True:
+            _, _, job, recipients = await queue.get()
+            try:
+                results = await self._send_batch_with_retry(notification_type, job.request, recipients)
+                job.add_results(results)
+            except Exception as e:
+                logger.error("Error inesperado en worker de notificaciones: {}", e)
+                job.add_results(self._failed_results(recipients, str(e)))
+            finally:
+                queue.task_done()
+    
+    async def _send_batch_with_retry(self, notification_type: NotificationType,
+                                     request: NotificationRequest,
+                                     recipients: List[NotificationRecipient]) -> List[NotificationResult]:
+        """
+        Envía un lote de destinatarios reintentando con backoff exponencial.
+        
+        Solo se reintentan los destinatarios pendientes: todos si el
+        proveedor lanza una excepción, o los que devuelve marcados como
+        reintentables. Los ya enviados o rechazados no se vuelven a enviar.
+        """
+        pending = recipients
+        results: List[NotificationResult] = []
+        last_error = ""
+        attempts = 0
+        
+        while pending and attempts <= self.max_retries:
+            provider = self.providers.get(notification_type)
+            if provider is None:
+                last_error = "Proveedor no disponible"
+                break
+            
+            attempts += 1
+            try:
+                batch_results = await provider.send_notification(replace(request, recipients=pending))
+            except Exception as e:
+                last_error = str(e)
+            else:
+                retryable = [r for r in batch_results if self._is_retryable(r)]
+                results.extend(r for r in batch_results if not self._is_retryable(r))
+                pending = [r.recipient for r in retryable]
+                if retryable:
+                    last_error = retryable[0].error_message or ""
+            
+            if pending and attempts <= self.max_retries:
+                wait_time = self.retry_delay * (2 ** (attempts - 1))
+                self.dispatch_stats["retries"] += 1
+                logger.warning(
+                    "Error enviando {} de {} notificaciones {}, reintentando en {}s: {}",
+                    len(pending), len(recipients), notification_type.value, wait_time, last_error
+                )
+                await asyncio.sleep(wait_time)
+        
+        if pending:
+            logger.error(
+                "{} notificaciones {} descartadas tras {} intentos: {}",
+                len(pending), notification_type.value, attempts, last_error
+            )
+            results.extend(self._failed_results(pending, last_error))
+        
+        sent = sum(
+            1 for r in results
+            if r.status in (NotificationStatus.SENT, NotificationStatus.DELIVERED)
+        )
+        self.dispatch_stats["sent"] += sent
+        self.dispatch_stats["failed"] += len(results) - sent
+        return results
+    
+    @staticmethod
+    def _is_retryable(result: NotificationResult) -> bool:
+        """
+        Indica si un resultado fallido corresponde a un envío no realizado.
+        """
+        return (
+            result.status == NotificationStatus.FAILED
+            and bool((result.provider_response or {}).get("retryable"))
+        )
+    
+    @staticmethod
+    def _failed_results(recipients: List[NotificationRecipient],
+                        error_message: str) -> List[NotificationResult]:
+        """
+        Construye resultados fallidos para un lote de destinatarios.
+        """
+        failed_at = get_current_datetime()
+        return [
+            NotificationResult(
+                notification_id=f"failed_{failed_at.timestamp()}_{recipient.identifier}",
+                status=NotificationStatus.FAILED,
+                sent_at=failed_at,
+                recipient=recipient,
+                error_message=error_message
+            )
+            for recipient in recipients
+        ]
+    
+    def get_dispatch_stats(self) -> Dict[str, Any]:
+        """
+        Obtiene las estadísticas del despacho en segundo plano.
+        
+        Returns:
+            Contadores acumulados y lotes pendientes por tipo.
+        """
+        return {
+            **self.dispatch_stats,
+            "queued": {
+                notification_type.value: queue.qsize()
+                for notification_type, queue in self._queues.items()
+            },
+            "workers": {
+                notification_type.value: sum(1 for w in workers if not w.done())
+                for notification_type, workers in self._workers.items()
+            }
+        }
+    
     async def send_email(self, recipients: List[str], title: str, body: str,
                         html_body: Optional[str] = None,
                         priority: NotificationPriority = NotificationPriority.NORMAL) -> List[NotificationResult]:
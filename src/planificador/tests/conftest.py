@@ -3,10 +3,11 @@
 import asyncio
 import pytest
 import pytest_asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import AsyncGenerator, Generator
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from loguru import logger
 
@@ -50,6 +51,52 @@ async def test_engine():
     await engine.dispose()
 
 
+@asynccontextmanager
+async def _isolated_engine(database_url: str) -> AsyncGenerator[AsyncEngine, None]:
+    """Motor con todas las tablas creadas que se libera al salir."""
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture(scope="function")
+async def isolated_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """Fixture para un motor en memoria propio de cada test.
+    
+    A diferencia de ``test_engine``, los commits de un test no son visibles
+    en los demás, por lo que sirve para probar listeners de sesión,
+    expiración tras el commit y sentencias en bloque.
+    """
+    async with _isolated_engine("sqlite+aiosqlite:///:memory:") as engine:
+        yield engine
+
+
+@pytest.fixture(scope="function")
+async def isolated_file_engine(tmp_path: Path) -> AsyncGenerator[AsyncEngine, None]:
+    """Fixture para un motor sobre un fichero SQLite propio de cada test.
+    
+    Necesario cuando varias conexiones deben ver los mismos datos (una base
+    en memoria solo existe dentro de su conexión).
+    """
+    async with _isolated_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}") as engine:
+        yield engine
+
+
+@pytest.fixture(scope="function")
+async def isolated_session(isolated_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """Fixture para una sesión sobre ``isolated_engine``.
+    
+    Las instancias no expiran al confirmar; los tests que necesiten la
+    expiración abren su propia ``AsyncSession(isolated_engine)``.
+    """
+    async with AsyncSession(isolated_engine, expire_on_commit=False) as session:
+        yield session
+
+
 @pytest.fixture(scope="function")
 async def test_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
     """Fixture para sesión de base de datos de testing.
@@ -0,0 +1,166 @@
+"""Benchmarks de la serialización de listados.
+
+Compara la ruta actual (entidades ORM completas validadas una a una con
+``model_validate``) con la ruta en bloque desde filas ``Row`` de columnas
+proyectadas (``BaseSchema.from_rows`` y ``BaseSchema.validate_rows``) para
+un listado de 10.000 horarios. Los tiempos se muestran con ``pytest -s``.
+"""
+
+import time
+from datetime import date, time as dt_time, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from planificador.models.client import Client
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.models.schedule import Schedule
+from planificador.models.status_code import StatusCode
+from planificador.schemas.response import ScheduleListResponse
+
+_SCHEDULES = 10_000
+_EMPLOYEES = 40
+
+
+@pytest.fixture
+async def session(isolated_session):
+    """Sesión con 10.000 horarios repartidos entre 40 empleados."""
+    client = Client(name="Cliente", code="CLI")
+    status = StatusCode(code="VAL", name="Validado")
+    employees = [
+        Employee(first_name=f"Nombre{i}", last_name="Apellido", full_name=f"Empleado {i}",
+                 employee_code=f"E{i:03d}", notes="x" * 500)
+        for i in range(_EMPLOYEES)
+    ]
+    isolated_session.add_all([client, status, *employees])
+    await isolated_session.flush()
+    project = Project(reference="FR-TRN2102", trigram="TRN", name="Tricastin",
+                      client_id=client.id)
+    isolated_session.add(project)
+    await isolated_session.flush()
+
+    first_day = date(2024, 1, 1)
+    isolated_session.add_all([
+        Schedule(employee_id=employees[i % _EMPLOYEES].id, project_id=project.id,
+                 status_code_id=status.id, date=first_day + timedelta(days=i // _EMPLOYEES),
+                 start_time=dt_time(8), end_time=dt_time(16), location="Planta",
+                 description="d" * 200, notes="n" * 200)
+        for i in range(_SCHEDULES)
+    ])
+    await isolated_session.commit()
+    return isolated_session
+
+
+_ROW_COLUMNS = (
+    Schedule.id,
+    Schedule.date,
+    Schedule.start_time,
+    Schedule.end_time,
+    Employee.full_name.label("employee_name"),
+    Schedule.employee_id,
+    Project.name.label("project_name"),
+    Schedule.project_id,
+    Schedule.team_id,
+    StatusCode.code.label("status_code"),
+    Schedule.is_confirmed,
+    Schedule.location,
+)
+
+
+async def _orm_path(session):
+    """Ruta actual: entidades completas y ``model_validate`` por horario."""
+    result = await session.execute(
+        select(Schedule).options(
+            joinedload(Schedule.employee),
+            joinedload(Schedule.project),
+            joinedload(Schedule.status_code),
+        )
+    )
+    schedules = result.scalars().all()
+    start = time.perf_counter()
+    items = [
+        ScheduleListResponse.model_validate({
+            "id": schedule.id,
+            "date": schedule.date,
+            "start_time": schedule.start_time,
+            "end_time": schedule.end_time,
+            "hours_worked": schedule.hours_worked,
+            "employee_name": schedule.employee.full_name,
+            "employee_id": schedule.employee_id,
+            "project_name": schedule.project.name if schedule.project else None,
+            "project_id": schedule.project_id,
+            "team_id": schedule.team_id,
+            "status_code": schedule.status_code.code if schedule.status_code else None,
+            "is_confirmed": schedule.is_confirmed,
+            "location": schedule.location,
+        })
+        for schedule in schedules
+    ]
+    return items, time.perf_counter() - start
+
+
+async def _rows(session):
+    """Filas proyectadas para la ruta en bloque."""
+    result = await session.execute(
+        select(*_ROW_COLUMNS)
+        .join(Employee, Employee.id == Schedule.employee_id)
+        .outerjoin(Project, Project.id == Schedule.project_id)
+        .outerjoin(StatusCode, StatusCode.id == Schedule.status_code_id)
+    )
+    return result.all()
+
+
+class TestListSerializationBenchmark:
+    """Benchmarks de la construcción de listados de horarios."""
+
+    async def test_bulk_paths_match_orm_path(self, session):
+        orm_items, _ = await _orm_path(session)
+        rows = await _rows(session)
+
+        constructed = ScheduleListResponse.from_rows(rows)
+        validated = ScheduleListResponse.validate_rows(rows)
+
+        assert len(constructed) == len(validated) == len(orm_items) == _SCHEDULES
+        expected = orm_items[0].model_dump(exclude={"hours_worked"})
+        assert constructed[0].model_dump(exclude={"hours_worked"}) == expected
+        assert validated[0].model_dump(exclude={"hours_worked"}) == expected
+        assert ScheduleListResponse.dump_list_json(constructed[:2]).startswith(b'[{"id":')
+
+    async def test_bulk_construction_is_faster(self, session):
+        _, orm_seconds = await _orm_path(session)
+        rows = await _rows(session)
+
+        start = time.perf_counter()
+        ScheduleListResponse.from_rows(rows)
+        construct_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ScheduleListResponse.validate_rows(rows)
+        validate_seconds = time.perf_counter() - start
+
+        print(
+            f"\n{_SCHEDULES} horarios: model_validate por entidad {orm_seconds * 1000:.1f} ms, "
+            f"validate_rows {validate_seconds * 1000:.1f} ms, "
+            f"from_rows {construct_seconds * 1000:.1f} ms"
+        )
+        assert construct_seconds < orm_seconds
+        assert validate_seconds < orm_seconds
+
+    async def test_bulk_json_dump_is_faster(self, session):
+        items = ScheduleListResponse.from_rows(await _rows(session))
+
+        start = time.perf_counter()
+        [item.model_dump_json() for item in items]
+        per_item_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ScheduleListResponse.dump_list_json(items)
+        bulk_seconds = time.perf_counter() - start
+
+        print(
+            f"\nJSON de {_SCHEDULES} horarios: por elemento {per_item_seconds * 1000:.1f} ms, "
+            f"dump_list_json {bulk_seconds * 1000:.1f} ms"
+        )
+        assert bulk_seconds < per_item_seconds
@@ -0,0 +1,5 @@
+"""Tests unitarios para configuración.
+
+Este módulo contiene tests para la configuración de la aplicación
+y del sistema de logging.
+"""
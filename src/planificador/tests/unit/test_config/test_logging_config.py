@@ -0,0 +1,218 @@
+"""Tests para el sink asíncrono por lotes de logging.
+
+Este módulo verifica que AsyncBatchSink escribe en lotes fuera del hilo
+llamador, aplica las políticas de desbordamiento y no pierde mensajes
+pendientes al cerrarse.
+"""
+
+import io
+import threading
+
+from loguru import logger
+
+from planificador.config.logging_config import AsyncBatchSink, OverflowPolicy
+
+
+class BlockingStream(io.StringIO):
+    """Stream cuya escritura se bloquea hasta que se libera el evento."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.writing = threading.Event()
+
+    def write(self, data: str) -> int:
+        self.writing.set()
+        self.release.wait(timeout=5)
+        return super().write(data)
+
+
+class TestAsyncBatchSink:
+    """Tests para AsyncBatchSink."""
+
+    def test_writes_messages_to_file_in_batches(self, tmp_path):
+        """Verifica que los mensajes llegan al archivo agrupados en lotes."""
+        log_file = tmp_path / "app.log"
+        sink = AsyncBatchSink(log_file, batch_size=50, flush_interval=0.5)
+
+        for i in range(100):
+            sink(f"mensaje {i}\n")
+        sink.flush()
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert lines == [f"mensaje {i}" for i in range(100)]
+        assert sink.stats["written"] == 100
+        assert sink.stats["batches"] <= 10
+        sink.close()
+
+    def test_close_writes_pending_messages(self, tmp_path):
+        """Verifica que close vacía la cola antes de cerrar el archivo."""
+        log_file = tmp_path / "app.log"
+        sink = AsyncBatchSink(log_file, flush_interval=5)
+
+        sink("pendiente\n")
+        sink.close()
+
+        assert log_file.read_text(encoding="utf-8") == "pendiente\n"
+        # Los mensajes posteriores al cierre se ignoran
+        sink("ignorado\n")
+        assert sink.stats["enqueued"] == 1
+
+    def test_drop_newest_discards_when_queue_is_full(self):
+        """Verifica que DROP_NEWEST descarta sin bloquear al llamador."""
+        stream = BlockingStream()
+        sink = AsyncBatchSink(
+            stream,
+            max_queue_size=1,
+            batch_size=1,
+            flush_interval=0.01,
+            overflow_policy=OverflowPolicy.DROP_NEWEST
+        )
+
+        sink("a\n")
+        assert stream.writing.wait(timeout=5)  # El escritor está ocupado con "a"
+        sink("b\n")  # Ocupa la cola
+        sink("c\n")  # Cola llena: se descarta
+
+        assert sink.stats["dropped"] == 1
+        stream.release.set()
+        sink.close()
+        assert stream.getvalue() == "a\nb\n"
+
+    def test_drop_oldest_keeps_latest_messages(self):
+        """Verifica que DROP_OLDEST conserva los mensajes más recientes."""
+        stream = BlockingStream()
+        sink = AsyncBatchSink(
+            stream,
+            max_queue_size=1,
+            batch_size=1,
+            flush_interval=0.01,
+            overflow_policy=OverflowPolicy.DROP_OLDEST
+        )
+
+        sink("a\n")
+        assert stream.writing.wait(timeout=5)
+        sink("b\n")
+        sink("c\n")
+
+        assert sink.stats["dropped"] == 1
+        stream.release.set()
+        sink.close()
+        assert stream.getvalue() == "a\nc\n"
+
+    def test_error_messages_are_never_dropped_by_policy(self):
+        """Verifica que los mensajes ERROR esperan espacio en vez de descartarse."""
+        stream = BlockingStream()
+        sink = AsyncBatchSink(
+            stream,
+            max_queue_size=1,
+            batch_size=1,
+            flush_interval=0.01,
+            overflow_policy=OverflowPolicy.DROP_NEWEST,
+            block_timeout=5
+        )
+        handler_id = logger.add(sink, format="{message}", level="DEBUG")
+        try:
+            logger.info("a")
+            assert stream.writing.wait(timeout=5)
+            logger.info("b")
+            threading.Timer(0.1, stream.release.set).start()
+            logger.error("error crítico")
+        finally:
+            logger.remove(handler_id)
+        sink.close()
+
+        assert "error crítico" in stream.getvalue()
+        assert sink.stats["dropped"] == 0
+
+    def test_drop_oldest_never_evicts_error_messages(self):
+        """Verifica que DROP_OLDEST desaloja el mensaje no ERROR más antiguo."""
+        stream = BlockingStream()
+        sink = AsyncBatchSink(
+            stream,
+            max_queue_size=2,
+            batch_size=1,
+            flush_interval=0.01,
+            overflow_policy=OverflowPolicy.DROP_OLDEST
+        )
+        handler_id = logger.add(sink, format="{message}", level="DEBUG")
+        try:
+            logger.info("a")
+            assert stream.writing.wait(timeout=5)
+            logger.error("error crítico")
+            logger.info("b")
+            logger.info("c")
+        finally:
+            logger.remove(handler_id)
+
+        assert sink.stats["dropped"] == 1
+        stream.release.set()
+        sink.close()
+        assert stream.getvalue() == "a\nerror crítico\nc\n"
+
+    def test_drop_oldest_waits_when_only_errors_are_queued(self):
+        """Verifica que DROP_OLDEST espera en vez de desalojar mensajes ERROR."""
+        stream = BlockingStream()
+        sink = AsyncBatchSink(
+            stream,
+            max_queue_size=1,
+            batch_size=1,
+            flush_interval=0.01,
+            overflow_policy=OverflowPolicy.DROP_OLDEST,
+            block_timeout=0.05
+        )
+        handler_id = logger.add(sink, format="{message}", level="DEBUG")
+        try:
+            logger.info("a")
+            assert stream.writing.wait(timeout=5)
+            logger.error("error crítico")
+            logger.info("b")
+        finally:
+            logger.remove(handler_id)
+
+        assert sink.stats["dropped"] == 1
+        stream.release.set()
+        sink.close()
+        assert stream.getvalue() == "a\nerror crítico\n"
+
+    def test_rotates_file_when_max_bytes_exceeded(self, tmp_path):
+        """Verifica la rotación del archivo al superar el tamaño máximo."""
+        log_file = tmp_path / "app.log"
+        sink = AsyncBatchSink(log_file, batch_size=1, max_bytes=20, compress=True)
+
+        sink("x" * 15 + "\n")
+        sink.flush()
+        sink("y" * 15 + "\n")
+        sink.close()
+
+        assert log_file.read_text(encoding="utf-8") == "y" * 15 + "\n"
+        assert len(list(tmp_path.glob("app.*.log.gz"))) == 1
+
+    def test_rotations_within_same_second_keep_every_backup(self, tmp_path):
+        """Verifica que varias rotaciones en el mismo segundo no se sobrescriben."""
+        log_file = tmp_path / "app.log"
+        sink = AsyncBatchSink(log_file, batch_size=1, max_bytes=20)
+
+        for letter in "abcd":
+            sink(letter * 15 + "\n")
+            sink.flush()
+        sink.close()
+
+        backups = sorted(tmp_path.glob("app.*.log"))
+        assert [path.read_text(encoding="utf-8") for path in backups] == [
+            letter * 15 + "\n" for letter in "abc"
+        ]
+
+    def test_rotation_threshold_counts_encoded_bytes(self, tmp_path):
+        """Verifica que el tamaño se mide en bytes codificados y no en caracteres."""
+        log_file = tmp_path / "app.log"
+        sink = AsyncBatchSink(log_file, batch_size=1, max_bytes=25)
+
+        # 11 caracteres, 21 bytes en UTF-8
+        sink("ñ" * 10 + "\n")
+        sink.flush()
+        sink("xxxx\n")
+        sink.close()
+
+        assert log_file.read_text(encoding="utf-8") == "xxxx\n"
+        assert len(list(tmp_path.glob("app.*.log"))) == 1
@@ -0,0 +1,5 @@
+"""Tests unitarios para la capa de base de datos.
+
+Este módulo contiene tests para la instrumentación de consultas
+y utilidades asociadas al acceso a datos.
+"""
@@ -0,0 +1,136 @@
+"""Tests para la instrumentación de consultas a nivel de repositorio.
+
+Este módulo verifica que QueryInstrumentation atribuye las sentencias SQL a
+las operaciones y sesiones que las emiten, registra las consultas lentas y
+marca los posibles patrones N+1.
+"""
+
+import pytest
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from planificador.database.instrumentation import (
+    QueryInstrumentation,
+    normalize_statement,
+)
+
+
+@pytest.fixture
+async def engine():
+    """Engine SQLite en memoria con una tabla mínima."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)"))
+        await conn.execute(text("INSERT INTO item (name) VALUES ('a'), ('b'), ('c')"))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def instrumentation(engine):
+    """Instrumentación instalada sobre el engine de pruebas."""
+    instrumentation = QueryInstrumentation(slow_query_ms=10_000, n_plus_one_threshold=3)
+    instrumentation.install(engine)
+    yield instrumentation
+    instrumentation.uninstall(engine)
+
+
+class TestNormalizeStatement:
+    """Tests para la normalización de sentencias."""
+
+    def test_collapses_whitespace_and_expanded_params(self):
+        statement = "SELECT *\n  FROM item\n WHERE id IN (?, ?, ?)"
+        assert normalize_statement(statement) == "SELECT * FROM item WHERE id IN (?)"
+
+
+class TestQueryInstrumentation:
+    """Tests para QueryInstrumentation."""
+
+    async def test_statements_are_attributed_to_operation_and_session(self, engine, instrumentation):
+        async with AsyncSession(engine) as session:
+            with instrumentation.operation("Items.get_all") as scope:
+                await session.execute(text("SELECT * FROM item"))
+                await session.execute(text("SELECT * FROM item WHERE id = :id"), {"id": 1})
+
+        assert scope.statement_count == 2
+        assert instrumentation.get_session_stats(session)["statements"] == 2
+
+        operations = instrumentation.get_operation_stats()
+        assert [op.name for op in operations] == ["Items.get_all"]
+        assert operations[0].calls == 1
+        assert operations[0].statements == 2
+        assert not scope.n_plus_one
+
+    async def test_nested_operations_accumulate_in_root(self, engine, instrumentation):
+        async with AsyncSession(engine) as session:
+            with instrumentation.operation("Outer") as outer:
+                with instrumentation.operation("Inner") as inner:
+                    await session.execute(text("SELECT 1"))
+                await session.execute(text("SELECT 2"))
+
+        assert inner.statement_count == 1
+        assert outer.statement_count == 2
+        assert not inner.is_root
+
+    async def test_repeated_statements_flag_n_plus_one(self, engine, instrumentation):
+        received = []
+        instrumentation.add_listener(received.append)
+
+        async with AsyncSession(engine) as session:
+            with instrumentation.operation("Items.load_each") as scope:
+                for item_id in range(1, 5):
+                    await session.execute(
+                        text("SELECT * FROM item WHERE id = :id"), {"id": item_id}
+                    )
+
+        assert scope.n_plus_one
+        assert received == [scope]
+        assert scope.most_repeated(1)[0][1] == 4
+        assert instrumentation.get_operation_stats()[0].n_plus_one_flags == 1
+
+    async def test_listener_is_registered_once(self, engine, instrumentation):
+        received = []
+        instrumentation.add_listener(received.append)
+        instrumentation.add_listener(received.append)
+
+        async with AsyncSession(engine) as session:
+            with instrumentation.operation("Items.count"):
+                await session.execute(text("SELECT count(*) FROM item"))
+
+        assert len(received) == 1
+
+    async def test_slow_queries_are_logged(self, engine, instrumentation):
+        instrumentation.slow_query_ms = 0
+        messages = []
+        handler_id = logger.add(messages.append, level="WARNING", format="{message}")
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT * FROM item"))
+        finally:
+            logger.remove(handler_id)
+
+        assert any("Consulta lenta" in message for message in messages)
+
+    async def test_statement_stats_and_reset(self, engine, instrumentation):
+        async with engine.connect() as conn:
+            for _ in range(3):
+                await conn.execute(text("SELECT * FROM item"))
+
+        stats = instrumentation.get_statement_stats(order_by="count")
+        assert stats[0].statement == "SELECT * FROM item"
+        assert stats[0].count == 3
+
+        instrumentation.reset()
+        assert instrumentation.get_statement_stats() == []
+
+    async def test_uninstall_stops_recording(self, engine, instrumentation):
+        instrumentation.uninstall(engine)
+        assert not instrumentation.enabled
+
+        with instrumentation.operation("Items.get_all") as scope:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT * FROM item"))
+
+        assert scope is None
+        assert instrumentation.get_statement_stats() == []
@@ -0,0 +1,72 @@
+"""Tests para la migración que crea el índice de búsqueda.
+
+Este módulo aplica las migraciones de Alembic sobre una base SQLite con
+datos previos y verifica que el índice se rellena con las entidades que ya
+existían.
+"""
+
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from planificador.repositories.search import SearchIndex
+
+_ALEMBIC_DIR = Path(__file__).resolve().parents[5] / "alembic"
+
+_SEED = (
+    "INSERT INTO clients (id, name, code, notes, is_active, created_at, updated_at) "
+    "VALUES (1, 'Energía Andina', 'ENA', 'Cliente de montaje eléctrico', 1, "
+    "'2024-01-01', '2024-01-01')",
+    "INSERT INTO projects (id, reference, trigram, name, client_id, status, priority, "
+    "revision_number, is_archived, details, created_at, updated_at) "
+    "VALUES (1, 'P-001', 'MNT', 'Parada de planta norte', 1, 'PLANNED', 'MEDIUM', "
+    "0, 0, 'Mantención mayor', '2024-01-01', '2024-01-01')",
+    "INSERT INTO employees (id, first_name, last_name, full_name, employee_code, "
+    "status, weekly_hours, is_available, skills, created_at, updated_at) "
+    "VALUES (1, 'José', 'Muñoz', 'José Muñoz', 'E001', 'ACTIVE', 40, 1, "
+    "'[\"soldadura\", \"montaje\"]', '2024-01-01', '2024-01-01')",
+)
+
+
+@pytest.fixture
+def alembic_config(tmp_path, monkeypatch):
+    """Configuración de Alembic sobre ``planificador.db`` en un directorio temporal."""
+    monkeypatch.chdir(tmp_path)
+    config = Config()
+    config.set_main_option("script_location", str(_ALEMBIC_DIR))
+    return config
+
+
+class TestSearchIndexMigration:
+    """Tests para el relleno del índice al crearlo."""
+
+    async def test_upgrade_indexes_existing_rows(self, alembic_config, tmp_path):
+        command.upgrade(alembic_config, "a7c5e2f9b813")
+        sync_engine = create_engine(f"sqlite:///{tmp_path / 'planificador.db'}")
+        with sync_engine.begin() as connection:
+            for statement in _SEED:
+                connection.execute(text(statement))
+        sync_engine.dispose()
+
+        command.upgrade(alembic_config, "5f3a9c2e7d41")
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'planificador.db'}")
+        try:
+            async with AsyncSession(engine) as session:
+                index = SearchIndex(session)
+                assert await index.is_available()
+
+                results = await index.search("mont")
+                assert {(r.entity_type, r.entity_id) for r in results} == {
+                    ("client", 1), ("employee", 1),
+                }
+                # Sin diacríticos y con el subtítulo de la entidad
+                employee, = await index.search("jose munoz")
+                assert (employee.title, employee.subtitle) == ("José Muñoz", "E001")
+                assert await index.search_ids("mantencion", "project") == [1]
+        finally:
+            await engine.dispose()
@@ -0,0 +1 @@
+# Tests para la exportación en streaming
@@ -0,0 +1,194 @@
+"""Tests para los feeds iCalendar de horarios.
+
+Este módulo verifica el formato RFC 5545 de los feeds, la estabilidad de
+los UID y ETag, el servicio desde caché de los feeds sin cambios y la
+regeneración incremental de los feeds modificados.
+"""
+
+from datetime import date, datetime, time
+
+import pytest
+from sqlalchemy import delete, update
+
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.models.client import Client
+from planificador.models.schedule import Schedule
+from planificador.models.status_code import StatusCode
+from planificador.models.team import Team
+from planificador.models.team_membership import TeamMembership
+from planificador.models.vacation import Vacation, VacationStatus, VacationType
+from planificador.repositories.export import FeedCache, ICalFeedGenerator
+from planificador.repositories.export.ical_feed import _fold
+
+
+@pytest.fixture
+async def session(isolated_session):
+    """Sesión con dos empleados de un equipo, horarios y vacaciones."""
+    client = Client(name="Cliente", code="CLI")
+    ana = Employee(first_name="Ana", last_name="Pérez", full_name="Ana Pérez",
+                   employee_code="E01")
+    luis = Employee(first_name="Luis", last_name="Gómez", full_name="Luis Gómez",
+                    employee_code="E02")
+    status = StatusCode(code="VAL", name="Validado")
+    team = Team(name="Equipo Norte")
+    isolated_session.add_all([client, ana, luis, status, team])
+    await isolated_session.flush()
+    project = Project(reference="FR-TRN2102", trigram="TRN", name="Tricastin",
+                      client_id=client.id)
+    isolated_session.add(project)
+    await isolated_session.flush()
+    isolated_session.add_all([
+        Schedule(employee_id=ana.id, project_id=project.id, status_code_id=status.id,
+                 date=date(2024, 1, 2), start_time=time(22), end_time=time(6),
+                 location="Planta, zona 3"),
+        Schedule(employee_id=ana.id, project_id=project.id, date=date(2024, 1, 3)),
+        Schedule(employee_id=luis.id, project_id=project.id, date=date(2024, 1, 2),
+                 start_time=time(8), end_time=time(16)),
+        Vacation(employee_id=ana.id, start_date=date(2024, 1, 8), end_date=date(2024, 1, 12),
+                 vacation_type=VacationType.ANNUAL, status=VacationStatus.APPROVED,
+                 requested_date=date(2023, 12, 1), total_days=5, business_days=5),
+        Vacation(employee_id=ana.id, start_date=date(2024, 2, 1), end_date=date(2024, 2, 2),
+                 vacation_type=VacationType.ANNUAL, status=VacationStatus.PENDING,
+                 requested_date=date(2023, 12, 1), total_days=2, business_days=2),
+        TeamMembership(employee_id=ana.id, team_id=team.id, start_date=date(2023, 1, 1)),
+        TeamMembership(employee_id=luis.id, team_id=team.id, start_date=date(2023, 1, 1)),
+    ])
+    await isolated_session.commit()
+    return isolated_session
+
+
+def _events(content):
+    return content.count("BEGIN:VEVENT")
+
+
+class TestICalFormat:
+    """Tests para el formato RFC 5545 del feed."""
+
+    async def test_employee_feed_content(self, session):
+        feed = await ICalFeedGenerator(session, domain="example.com").employee_feed(1)
+
+        lines = feed.content.split("\r\n")
+        assert lines[0] == "BEGIN:VCALENDAR"
+        assert feed.content.endswith("END:VCALENDAR\r\n")
+        assert "PRODID:-//Planificador//Planning//ES" in lines
+        assert feed.events == _events(feed.content) == 3
+        assert "UID:schedule-1@example.com" in lines
+        assert "UID:vacation-1@example.com" in lines
+        # El turno nocturno termina al día siguiente
+        assert "DTSTART:20240102T220000" in lines
+        assert "DTEND:20240103T060000" in lines
+        assert "LOCATION:Planta\\, zona 3" in lines
+        # Sin horas: evento de día completo con fin exclusivo
+        assert "DTSTART;VALUE=DATE:20240103" in lines
+        assert "DTEND;VALUE=DATE:20240104" in lines
+        # Vacaciones aprobadas como día completo; las pendientes no aparecen
+        assert "DTEND;VALUE=DATE:20240113" in lines
+        assert "vacation-2@" not in feed.content
+
+    def test_long_lines_are_folded_by_octets(self):
+        line = "SUMMARY:" + "ñ" * 60
+
+        folded = _fold(line)
+
+        parts = folded.split("\r\n ")
+        assert "".join(parts) == line
+        assert all(len(part.encode("utf-8")) <= 75 for part in parts)
+
+    async def test_http_headers_and_conditional_requests(self, session):
+        feed = await ICalFeedGenerator(session).employee_feed(1)
+
+        headers = feed.http_headers
+        assert headers["ETag"] == feed.etag
+        assert feed.is_not_modified(if_none_match=feed.etag)
+        assert not feed.is_not_modified(if_none_match='"otro"')
+        assert feed.is_not_modified(if_modified_since=headers["Last-Modified"])
+        assert not feed.is_not_modified()
+
+
+class TestFeedCaching:
+    """Tests para la caché y la regeneración incremental."""
+
+    async def test_unchanged_feed_is_served_from_cache(self, session):
+        generator = ICalFeedGenerator(session)
+
+        first = await generator.employee_feed(1)
+        second = await generator.employee_feed(1)
+
+        assert second is first
+
+    async def test_update_and_delete_change_etag(self, session):
+        generator = ICalFeedGenerator(session)
+        first = await generator.employee_feed(1)
+
+        await session.execute(
+            update(Schedule).where(Schedule.id == 2)
+            .values(location="Taller", updated_at=datetime(2030, 1, 1))
+        )
+        updated = await generator.employee_feed(1)
+        assert updated.etag != first.etag
+        assert "LOCATION:Taller" in updated.content
+        assert updated.last_modified == datetime(2030, 1, 1)
+
+        await session.execute(delete(Schedule).where(Schedule.id == 1))
+        deleted = await generator.employee_feed(1)
+        assert deleted.etag != updated.etag
+        assert deleted.events == 2
+
+    async def test_refresh_regenerates_only_changed_feeds(self, session, tmp_path):
+        report = await ICalFeedGenerator(session, FeedCache(tmp_path)).refresh()
+        assert report.regenerated == [1, 2]
+        assert (tmp_path / "employee-1.ics").exists()
+
+        await session.execute(
+            update(Schedule).where(Schedule.id == 3).values(updated_at=datetime(2030, 1, 1))
+        )
+        # Una caché nueva sobre el mismo directorio conserva los ETag
+        report = await ICalFeedGenerator(session, FeedCache(tmp_path)).refresh()
+        assert report.regenerated == [2]
+        assert report.unchanged == 1
+
+    async def test_employee_without_events_gets_empty_feed(self, session):
+        generator = ICalFeedGenerator(session)
+        await generator.refresh()
+
+        await session.execute(delete(Schedule).where(Schedule.employee_id == 2))
+        report = await generator.refresh()
+
+        assert report.regenerated == [2]
+        assert generator.cache.get("employee-2").events == 0
+
+    async def test_window_limits_events(self, session):
+        generator = ICalFeedGenerator(
+            session, start_date=date(2024, 1, 3), end_date=date(2024, 1, 31)
+        )
+
+        feed = await generator.employee_feed(1)
+
+        assert feed.events == 2
+
+
+class TestTeamFeed:
+    """Tests para el feed combinado de un equipo."""
+
+    async def test_team_feed_merges_members(self, session):
+        generator = ICalFeedGenerator(session)
+
+        feed = await generator.team_feed(1)
+
+        assert feed.events == 4
+        assert "SUMMARY:Luis Gómez: FR-TRN2102" in feed.content
+        assert await generator.team_feed(1) is feed
+
+    async def test_membership_change_invalidates_team_feed(self, session):
+        generator = ICalFeedGenerator(session)
+        feed = await generator.team_feed(1)
+
+        await session.execute(
+            update(TeamMembership).where(TeamMembership.employee_id == 2)
+            .values(is_active=False)
+        )
+        updated = await generator.team_feed(1)
+
+        assert updated.etag != feed.etag
+        assert updated.events == 3
@@ -0,0 +1,141 @@
+"""Tests para StreamingExporter.
+
+Este módulo verifica la exportación por lotes a CSV, la compresión gzip,
+la división por mes, el filtrado por fechas y el esquema de Parquet.
+"""
+
+import csv
+import gzip
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from planificador.exceptions import ValidationError
+from planificador.models.client import Client
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.models.schedule import Schedule
+from planificador.models.status_code import StatusCode
+from planificador.models.vacation import Vacation, VacationStatus, VacationType
+from planificador.models.workload import Workload
+from planificador.repositories.export import StreamingExporter
+
+
+@pytest.fixture
+async def session(isolated_session):
+    """Sesión con 40 días de horarios, una carga de trabajo y una vacación."""
+    client = Client(name="Cliente", code="CLI")
+    employee = Employee(first_name="Ana", last_name="Pérez", full_name="Ana Pérez",
+                        employee_code="E01")
+    status = StatusCode(code="VAL", name="Validado")
+    isolated_session.add_all([client, employee, status])
+    await isolated_session.flush()
+    project = Project(reference="FR-TRN2102", trigram="TRN", name="Tricastin",
+                      client_id=client.id)
+    isolated_session.add(project)
+    await isolated_session.flush()
+
+    first_day = date(2024, 1, 15)
+    isolated_session.add_all([
+        Schedule(employee_id=employee.id, project_id=project.id, status_code_id=status.id,
+                 date=first_day + timedelta(days=i), location="Planta, norte")
+        for i in range(40)
+    ])
+    isolated_session.add(Workload(employee_id=employee.id, project_id=project.id, date=first_day,
+                         week_number=3, month=1, year=2024, planned_hours=Decimal("8"),
+                         is_billable=True))
+    isolated_session.add(Vacation(employee_id=employee.id, start_date=date(2024, 2, 1),
+                         end_date=date(2024, 2, 5), vacation_type=VacationType.ANNUAL,
+                         status=VacationStatus.APPROVED, requested_date=date(2024, 1, 2),
+                         total_days=5, business_days=3))
+    await isolated_session.commit()
+    return isolated_session
+
+
+def _read_csv(path, compressed=False):
+    opener = gzip.open if compressed else open
+    with opener(path, "rt", encoding="utf-8", newline="") as stream:
+        return list(csv.reader(stream))
+
+
+class TestStreamingExporter:
+    """Tests para la exportación en streaming."""
+
+    async def test_iter_batches_respects_batch_size(self, session):
+        exporter = StreamingExporter(session, batch_size=16)
+
+        sizes = [len(batch) async for batch in exporter.iter_batches("schedules")]
+
+        assert sizes == [16, 16, 8]
+
+    async def test_csv_export_with_joined_columns(self, session, tmp_path):
+        result = await StreamingExporter(session, batch_size=7).export("schedules", tmp_path)
+
+        rows = _read_csv(result.files[0])
+        assert result.rows == 40
+        assert result.files == [tmp_path / "schedules.csv"]
+        assert rows[0] == StreamingExporter.headers("schedules")
+        assert rows[1][1:6] == ["2024-01-15", "1", "E01", "Ana Pérez", "FR-TRN2102"]
+        assert rows[1][-1] == "Planta, norte"
+        assert len(rows) == 41
+
+    async def test_gzip_split_by_month_and_date_filter(self, session, tmp_path):
+        result = await StreamingExporter(session, batch_size=10).export(
+            "schedules", tmp_path,
+            start_date=date(2024, 1, 20), end_date=date(2024, 2, 10),
+            compress=True, split_by_month=True,
+        )
+
+        assert [p.name for p in result.files] == [
+            "schedules_2024-01.csv.gz", "schedules_2024-02.csv.gz"
+        ]
+        january = _read_csv(result.files[0], compressed=True)
+        february = _read_csv(result.files[1], compressed=True)
+        assert len(january) - 1 == 12
+        assert len(february) - 1 == 10
+        assert january[0] == february[0]
+        assert result.rows == 22
+
+    async def test_workloads_and_overlapping_vacations(self, session, tmp_path):
+        exporter = StreamingExporter(session)
+
+        workloads = await exporter.export("workloads", tmp_path)
+        vacations = await exporter.export(
+            "vacations", tmp_path, start_date=date(2024, 2, 4), end_date=date(2024, 2, 28)
+        )
+
+        assert _read_csv(workloads.files[0])[1][6:] == ["8.0", "", "", "True"]
+        vacation_row = dict(zip(*_read_csv(vacations.files[0])))
+        assert vacation_row["vacation_type"] == "annual"
+        assert vacation_row["status"] == "approved"
+        assert vacation_row["approved_date"] == ""
+
+    async def test_invalid_entity_and_format(self, session, tmp_path):
+        exporter = StreamingExporter(session)
+        with pytest.raises(ValidationError):
+            await exporter.export("clients", tmp_path)
+        with pytest.raises(ValidationError):
+            await exporter.export("schedules", tmp_path, format="xlsx")
+
+    async def test_parquet_schema_from_column_types(self, session, tmp_path):
+        pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+        pyarrow = pytest.importorskip("pyarrow")
+        # La primera vacación no tiene fecha de aprobación: el lote inicial
+        # no debe fijar esa columna como ``null``
+        employee_id = (await session.get(Vacation, 1)).employee_id
+        session.add(Vacation(employee_id=employee_id, start_date=date(2024, 3, 4),
+                             end_date=date(2024, 3, 5), vacation_type=VacationType.ANNUAL,
+                             status=VacationStatus.APPROVED, requested_date=date(2024, 2, 1),
+                             approved_date=date(2024, 2, 2), total_days=2, business_days=2))
+        await session.commit()
+
+        result = await StreamingExporter(session, batch_size=1).export(
+            "vacations", tmp_path, format="parquet"
+        )
+
+        table = pyarrow_parquet.read_table(result.files[0])
+        assert table.schema.field("approved_date").type == pyarrow.date32()
+        assert table.schema.field("total_days").type == pyarrow.int64()
+        assert table.schema.field("status").type == pyarrow.string()
+        assert table.column("approved_date").to_pylist() == [None, date(2024, 2, 2)]
@@ -0,0 +1,141 @@
+"""Tests para el cálculo del tiempo de intervención de proyectos.
+
+Este módulo verifica el calendario laborable precalculado, la lectura del
+texto heredado de paradas y el cálculo en lote de fechas, solapamiento con
+paradas y atraso, también a través de las estadísticas de vencidos.
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from planificador.exceptions import ValidationError
+from planificador.models.client import Client
+from planificador.models.project import Project, ProjectStatus
+from planificador.models.project_shutdown import ProjectShutdown
+from planificador.repositories.project.modules.intervention_operations import (
+    InterventionOperations,
+    parse_shutdown_dates,
+)
+from planificador.repositories.project.project_repository_facade import (
+    ProjectRepositoryFacade,
+)
+from planificador.utils.business_calendar import BusinessCalendar
+
+
+@pytest.fixture
+def calendar():
+    """Calendario de lunes a viernes con Año Nuevo y Navidad como festivos."""
+    return BusinessCalendar([1, 2, 3, 4, 5], ["01-01", "12-25"])
+
+
+@pytest.fixture
+async def session(isolated_engine):
+    """Sesión sobre una base en memoria con tres proyectos."""
+    async with AsyncSession(isolated_engine, expire_on_commit=False) as session:
+        client = Client(name="Cliente", code="CLI")
+        session.add(client)
+        await session.flush()
+        session.add_all([
+            Project(
+                reference="P-1", trigram="PUN", name="Preparación y obra", client_id=client.id,
+                start_date=date(2024, 3, 4), preparation_days=2, duration_days=5,
+                status=ProjectStatus.IN_PROGRESS,
+            ),
+            Project(
+                reference="P-2", trigram="DOS", name="Cerrado", client_id=client.id,
+                start_date=date(2024, 3, 4), end_date=date(2024, 3, 8),
+                shutdown_dates="2024-03-07", status=ProjectStatus.COMPLETED,
+            ),
+            Project(
+                reference="P-3", trigram="TRE", name="Archivado", client_id=client.id,
+                start_date=date(2024, 3, 4), end_date=date(2024, 3, 5), is_archived=True,
+            ),
+        ])
+        await session.flush()
+        session.add(ProjectShutdown(
+            project_id=1, start_date=date(2024, 3, 9), end_date=date(2024, 3, 11), label="Arrêt"
+        ))
+        await session.commit()
+        yield session
+
+
+class TestBusinessCalendar:
+    """Tests para el calendario laborable."""
+
+    def test_count_and_business_days(self, calendar):
+        assert calendar.count(date(2024, 1, 1), date(2024, 1, 31)) == 22
+        assert calendar.count(date(2024, 12, 30), date(2025, 1, 3)) == 4
+        assert calendar.count(date(2024, 2, 1), date(2024, 1, 1)) == 0
+        assert not calendar.is_business_day(date(2024, 12, 25))
+        assert calendar.is_business_day(date(2024, 12, 24))
+
+    def test_end_of_crosses_weekends_holidays_and_years(self, calendar):
+        assert calendar.end_of(date(2024, 1, 1), 5) == date(2024, 1, 8)
+        assert calendar.end_of(date(2024, 12, 30), 3) == date(2025, 1, 2)
+        assert calendar.next_business_day(date(2024, 1, 6)) == date(2024, 1, 8)
+
+    def test_end_of_requires_positive_days(self, calendar):
+        with pytest.raises(ValidationError):
+            calendar.end_of(date(2024, 1, 1), 0)
+
+
+def test_parse_shutdown_dates():
+    text = "2024-03-04 - 2024-03-08; 15/04/2024, del 01/05/2024 al 03/05/2024\nsin fecha"
+    assert parse_shutdown_dates(text) == [
+        (date(2024, 3, 4), date(2024, 3, 8)),
+        (date(2024, 4, 15), date(2024, 4, 15)),
+        (date(2024, 5, 1), date(2024, 5, 3)),
+    ]
+    assert parse_shutdown_dates(None) == []
+
+
+class TestInterventionOperations:
+    """Tests para el cálculo en lote de intervenciones."""
+
+    async def test_open_projects(self, session, calendar):
+        operations = InterventionOperations(session, calendar)
+        interventions = await operations.get_project_interventions(reference_date=date(2024, 3, 15))
+
+        assert list(interventions) == [1]
+        intervention = interventions[1]
+        assert intervention["intervention_days"] == 7
+        assert intervention["preparation_end_date"] == date(2024, 3, 5)
+        assert intervention["work_start_date"] == date(2024, 3, 6)
+        assert intervention["calculated_end_date"] == date(2024, 3, 12)
+        assert intervention["end_date"] == date(2024, 3, 12)
+        assert intervention["shutdown_overlap_days"] == 3
+        assert intervention["shutdown_overlap_business_days"] == 1
+        assert intervention["is_overdue"] is True
+        assert intervention["delay_days"] == 3
+        assert intervention["delay_business_days"] == 3
+
+    async def test_closed_project_uses_end_date_and_legacy_shutdowns(self, session, calendar):
+        operations = InterventionOperations(session, calendar)
+        interventions = await operations.get_project_interventions(
+            project_ids=[2, 3], include_closed=True, reference_date=date(2024, 3, 15)
+        )
+
+        assert list(interventions) == [2]
+        intervention = interventions[2]
+        assert intervention["work_days"] == 5
+        assert intervention["calculated_end_date"] == date(2024, 3, 8)
+        assert intervention["shutdown_overlap_days"] == 1
+        assert intervention["is_overdue"] is False
+
+    async def test_overdue_statistics_use_calculated_end_date(self, session, calendar):
+        repository = ProjectRepositoryFacade(
+            session, intervention_operations=InterventionOperations(session, calendar)
+        )
+
+        stats = await repository.get_overdue_projects_stats()
+        assert stats["total_overdue_projects"] == 1
+        assert stats["total_active_projects"] == 1
+        assert stats["overdue_percentage"] == 100
+
+        summary = await repository.get_overdue_projects_summary()
+        assert [item["reference"] for item in summary] == ["P-1"]
+        assert summary[0]["end_date"] == "2024-03-12"
+        assert summary[0]["shutdown_overlap_days"] == 3
+        assert summary[0]["client_name"] == "Cliente"
@@ -0,0 +1,209 @@
+"""Tests para la planificación automática de proyectos.
+
+Este módulo verifica que el planificador respeta vacaciones, horarios
+existentes, jornada semanal, equipos y asignaciones, que la reparación
+local cubre huecos que la pasada voraz deja y que un centro de tres meses
+con 200 personas se planifica en segundos.
+"""
+
+import time as perf
+from datetime import date, time, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from planificador.exceptions import NotFoundError, ValidationError
+from planificador.models.client import Client
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.models.project_assignment import ProjectAssignment
+from planificador.models.schedule import Schedule
+from planificador.models.status_code import StatusCode
+from planificador.models.team import Team
+from planificador.models.team_membership import TeamMembership
+from planificador.models.vacation import Vacation, VacationStatus, VacationType
+from planificador.repositories.schedule.modules import (
+    AutoPlanSolver,
+    PlannerCandidate,
+    ScheduleAutoPlannerModule,
+)
+
+_MONDAY = date(2024, 1, 1)
+_FRIDAY = date(2024, 1, 5)
+
+
+@pytest.fixture
+def engine(isolated_engine):
+    return isolated_engine
+
+
+async def _seed(session, employees):
+    """Crea un cliente, dos proyectos y los empleados indicados."""
+    client = Client(name="Cliente", code="CLI")
+    session.add(client)
+    await session.flush()
+    project = Project(reference="FR-TRN2102", trigram="TRN", name="Tricastin",
+                      client_id=client.id, start_date=_MONDAY, end_date=_FRIDAY)
+    other = Project(reference="FR-BUG0001", trigram="BUG", name="Bugey", client_id=client.id)
+    session.add_all([project, other, StatusCode(code="PRE", name="Previsión")])
+    session.add_all(employees)
+    await session.flush()
+    return project, other
+
+
+def _employee(code, level="N1", weekly_hours=40):
+    return Employee(first_name=code, last_name="Apellido", employee_code=code,
+                    qualification_level=level, weekly_hours=weekly_hours)
+
+
+async def _planned(session, project_id):
+    result = await session.execute(
+        select(Schedule.employee_id, Schedule.date)
+        .where(Schedule.project_id == project_id)
+        .order_by(Schedule.date, Schedule.employee_id)
+    )
+    return result.all()
+
+
+class TestAutoPlanSolver:
+    """Tests para el solver sobre bitsets."""
+
+    def test_greedy_prefers_continuity_and_assigned(self):
+        first = PlannerCandidate(1, "N1", Decimal(8), free=0b11111, week_days_left=[5])
+        second = PlannerCandidate(2, "N1", Decimal(8), free=0b11111, week_days_left=[5],
+                                  preferred=True)
+
+        solver = AutoPlanSolver(5, [0] * 5, [first, second])
+        shortages = solver.solve({"N1": [1] * 5})
+
+        assert shortages == {"N1": [0] * 5}
+        assert second.planned == 0b11111 and first.planned == 0
+
+    def test_local_repair_swaps_days_within_week(self):
+        # A solo puede trabajar 2 días; B solo está libre el día 0
+        a = PlannerCandidate(1, "N1", Decimal(8), free=0b111, week_days_left=[2])
+        b = PlannerCandidate(2, "N1", Decimal(8), free=0b001, week_days_left=[5])
+
+        solver = AutoPlanSolver(3, [0] * 3, [a, b])
+        # La pasada voraz asigna A los días 0 y 1 (continuidad) y deja el día 2 sin cubrir
+        shortages = solver.solve({"N1": [1, 1, 1]})
+
+        assert shortages == {"N1": [0, 0, 0]}
+        assert solver.moves == 1
+        assert a.planned == 0b110 and b.planned == 0b001
+
+
+class TestScheduleAutoPlannerModule:
+    """Tests para la planificación contra la base de datos."""
+
+    async def test_respects_vacations_existing_schedules_and_weekly_hours(self, engine):
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            ana, luis, eva = _employee("E1"), _employee("E2", weekly_hours=24), _employee("E3")
+            project, other = await _seed(session, [ana, luis, eva])
+            session.add_all([
+                Vacation(employee_id=ana.id, start_date=date(2024, 1, 3),
+                         end_date=date(2024, 1, 4), vacation_type=VacationType.ANNUAL,
+                         status=VacationStatus.APPROVED, requested_date=_MONDAY,
+                         total_days=2, business_days=2),
+                Schedule(employee_id=eva.id, project_id=other.id, date=_MONDAY),
+                Schedule(employee_id=eva.id, project_id=project.id, date=date(2024, 1, 2)),
+            ])
+            await session.commit()
+
+            result = await ScheduleAutoPlannerModule(session).plan_project(
+                project.id, {"N1": 2}, status_code="PRE"
+            )
+
+            planned = await _planned(session, project.id)
+            by_day = {}
+            for employee_id, day in planned:
+                by_day.setdefault(day, set()).add(employee_id)
+            assert all(len(people) <= 2 for people in by_day.values())
+            assert ana.id not in by_day[date(2024, 1, 3)] | by_day[date(2024, 1, 4)]
+            assert eva.id not in by_day[_MONDAY]
+            # 24 h semanales a 8 h/día: 3 días como máximo
+            assert sum(1 for employee_id, _ in planned if employee_id == luis.id) <= 3
+            assert result.existing_days == 1
+            assert result.required_days == 10
+            assert result.schedules_created == len(planned) - 1
+            assert result.coverage_percentage == round(
+                (10 - sum(result.shortages.values())) / 10 * 100, 2
+            )
+
+            status_id = await session.scalar(select(StatusCode.id).where(StatusCode.code == "PRE"))
+            created = await session.scalar(
+                select(func.count()).select_from(Schedule).where(Schedule.status_code_id == status_id)
+            )
+            assert created == result.schedules_created
+
+    async def test_team_and_assignment_constraints(self, engine):
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            ana, luis, eva = _employee("E1"), _employee("E2"), _employee("E3", level="N2")
+            project, _ = await _seed(session, [ana, luis, eva])
+            team = Team(name="Equipo")
+            session.add(team)
+            await session.flush()
+            session.add_all([
+                TeamMembership(employee_id=luis.id, team_id=team.id, start_date=_MONDAY),
+                ProjectAssignment(employee_id=luis.id, project_id=project.id, start_date=_MONDAY,
+                                  end_date=date(2024, 1, 3),
+                                  allocated_hours_per_day=Decimal("6")),
+            ])
+            await session.commit()
+
+            planner = ScheduleAutoPlannerModule(session)
+            result = await planner.plan_project(project.id, {"N1": 1}, team_id=team.id,
+                                                dry_run=True)
+            assert {employee_id for employee_id, _ in result.assignments} == {luis.id}
+            assert result.schedules_created == 0
+            assert await _planned(session, project.id) == []
+
+            result = await planner.plan_project(project.id, {"N1": 1}, assigned_only=True)
+            assert [day for _, day in result.assignments] == [
+                _MONDAY, date(2024, 1, 2), date(2024, 1, 3)
+            ]
+            end_time = await session.scalar(select(Schedule.end_time).limit(1))
+            assert end_time == time(14)
+
+    async def test_invalid_requests(self, engine):
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            project, other = await _seed(session, [_employee("E1")])
+            await session.commit()
+            planner = ScheduleAutoPlannerModule(session)
+
+            with pytest.raises(NotFoundError):
+                await planner.plan_project(999, {"N1": 1})
+            with pytest.raises(ValidationError):
+                await planner.plan_project(project.id, {"N1": 0})
+            with pytest.raises(ValidationError):
+                await planner.plan_project(other.id, {"N1": 1})
+            with pytest.raises(ValidationError):
+                await planner.plan_project(project.id, {"N1": 1}, status_code="XXX")
+
+    async def test_three_month_site_for_200_people(self, engine):
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            employees = [
+                _employee(f"E{i:03d}", level=("N1", "N2", "N3")[i % 3]) for i in range(200)
+            ]
+            project, _ = await _seed(session, employees)
+            session.add_all([
+                Vacation(employee_id=employees[i].id, start_date=_MONDAY + timedelta(days=i % 80),
+                         end_date=_MONDAY + timedelta(days=i % 80 + 9),
+                         vacation_type=VacationType.ANNUAL, status=VacationStatus.APPROVED,
+                         requested_date=_MONDAY, total_days=10, business_days=8)
+                for i in range(0, 200, 2)
+            ])
+            await session.commit()
+
+            start = perf.perf_counter()
+            result = await ScheduleAutoPlannerModule(session).plan_project(
+                project.id, {"N1": 55, "N2": 55, "N3": 55},
+                start_date=_MONDAY, end_date=_MONDAY + timedelta(days=90),
+            )
+            elapsed = perf.perf_counter() - start
+
+            assert elapsed < 10
+            assert result.schedules_created == len(result.assignments) > 10_000
+            assert result.coverage_percentage > 95
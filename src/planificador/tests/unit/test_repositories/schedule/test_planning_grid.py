@@ -0,0 +1,120 @@
+"""Tests para la cuadrícula de planificación columnar.
+
+Este módulo verifica la codificación en diccionario, rachas y fechas
+relativas del tablero, y que la decodificación reproduce las celdas.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from planificador.exceptions import ValidationError
+from planificador.models.client import Client
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.models.schedule import Schedule
+from planificador.models.status_code import StatusCode
+from planificador.repositories.schedule.modules import (
+    PlanningGridEncoder,
+    SchedulePlanningGridModule,
+    decode_planning_grid,
+)
+
+_START = date(2024, 1, 1)
+
+
+@pytest.fixture
+async def session(isolated_session):
+    """Sesión con dos empleados planificados sobre un trimestre."""
+    client = Client(name="Cliente", code="CLI")
+    ana = Employee(first_name="Ana", last_name="Pérez", full_name="Ana Pérez",
+                   employee_code="E01")
+    luis = Employee(first_name="Luis", last_name="Gómez", full_name="Luis Gómez",
+                    employee_code="E02")
+    val = StatusCode(code="VAL", name="Validado", color="#00FF00")
+    voy = StatusCode(code="VOY", name="Viaje", color="#0000FF")
+    isolated_session.add_all([client, ana, luis, val, voy])
+    await isolated_session.flush()
+    project = Project(reference="FR-TRN2102", trigram="TRN", name="Tricastin",
+                      client_id=client.id)
+    isolated_session.add(project)
+    await isolated_session.flush()
+
+    schedules = []
+    for i in range(91):
+        day = _START + timedelta(days=i)
+        code = voy if i in (0, 45) else val
+        schedules.append(Schedule(employee_id=ana.id, project_id=project.id,
+                                  status_code_id=code.id, date=day))
+        if day.weekday() < 5:
+            schedules.append(Schedule(employee_id=luis.id, project_id=project.id,
+                                      status_code_id=val.id, date=day))
+    isolated_session.add_all(schedules)
+    await isolated_session.commit()
+    return isolated_session
+
+
+class TestPlanningGridEncoder:
+    """Tests para el codificador de la cuadrícula."""
+
+    def test_runs_are_dictionary_and_delta_encoded(self):
+        encoder = PlanningGridEncoder(_START, date(2024, 1, 31))
+        for offset, code in [(2, "VAL"), (3, "VAL"), (4, "VOY"), (8, "VAL")]:
+            encoder.add(1, "Ana", 10, "REF", _START + timedelta(days=offset), code)
+
+        grid = encoder.build()
+
+        assert grid.codes == ["VAL", "VOY"]
+        assert grid.runs == [[2, 2, 0, 0, 1, 1, 3, 1, 0]]
+        assert grid.cells == 4
+
+    def test_same_day_collision_keeps_first(self):
+        encoder = PlanningGridEncoder(_START, _START)
+        encoder.add(1, "Ana", None, None, _START, "VAL")
+        encoder.add(1, "Ana", None, None, _START, "VOY")
+
+        grid = encoder.build()
+
+        assert encoder.collisions == 1
+        assert list(decode_planning_grid(grid)) == [(1, None, _START, "VAL")]
+
+
+class TestSchedulePlanningGridModule:
+    """Tests para la obtención de la cuadrícula desde la base de datos."""
+
+    async def test_grid_round_trips_schedules(self, session):
+        end = _START + timedelta(days=90)
+        grid = await SchedulePlanningGridModule(session).get_planning_grid(_START, end)
+
+        assert grid.employee_names == ["Ana Pérez", "Luis Gómez"]
+        assert grid.project_references == ["FR-TRN2102", "FR-TRN2102"]
+        # Ana: VOY, VAL x44, VOY, VAL x45 -> 4 rachas
+        assert len(grid.runs[0]) == 12
+        # Luis: una racha por semana laborable (13 semanas)
+        assert len(grid.runs[1]) // 3 == 13
+
+        cells = list(decode_planning_grid(grid))
+        assert len(cells) == grid.cells == 91 + 65
+        assert cells[0][2:] == (_START, "VOY")
+        assert all(_START <= day <= end for _, _, day, _ in cells)
+
+    async def test_grid_is_compact(self, session):
+        end = _START + timedelta(days=90)
+        grid = await SchedulePlanningGridModule(session).get_planning_grid(_START, end)
+
+        assert len(grid.model_dump_json()) < 1024
+
+    async def test_filters_and_range(self, session):
+        end = _START + timedelta(days=6)
+        grid = await SchedulePlanningGridModule(session).get_planning_grid(
+            _START, end, employee_ids=[2]
+        )
+
+        assert grid.employee_ids == [2]
+        assert grid.runs == [[0, 5, 0]]
+
+    async def test_invalid_range_raises(self, session):
+        with pytest.raises(ValidationError):
+            await SchedulePlanningGridModule(session).get_planning_grid(
+                _START, _START - timedelta(days=1)
+            )
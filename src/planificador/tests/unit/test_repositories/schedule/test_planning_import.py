@@ -0,0 +1,259 @@
+"""Tests para la importación de la hoja de planificación Excel.
+
+Este módulo verifica el lector .xlsx en streaming y la importación por
+lotes de la cuadrícula de planificación como registros Schedule.
+"""
+
+import zipfile
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+
+from planificador.exceptions.infrastructure import FileSystemError
+from planificador.models.client import Client
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.models.schedule import Schedule
+from planificador.models.status_code import StatusCode
+from planificador.repositories.schedule.modules import (
+    PlanningSheetLayout,
+    SchedulePlanningImportModule,
+)
+from planificador.utils.xlsx_reader import (
+    XlsxReader,
+    column_index,
+    column_letters,
+    excel_serial_to_date,
+)
+
+
+_NS = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+_R_NS = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+_PKG_NS = 'xmlns="http://schemas.openxmlformats.org/package/2006/relationships"'
+
+# 2022-01-03 y 2022-01-04 como fechas serie de Excel
+_DAY_1 = 44564
+_DAY_2 = 44565
+
+
+def _write_workbook(path, rows, fills=None, legend_rows=""):
+    """
+    Escribe un .xlsx mínimo con una hoja "Planning".
+
+    Args:
+        path: Ruta del fichero.
+        rows: {fila: {columna: valor}}; los textos van como textos compartidos.
+        fills: {(fila, columna): "AARRGGBB"} para celdas con relleno sólido.
+        legend_rows: XML de las filas de la hoja "Légende".
+    """
+    fills = fills or {}
+    strings = []
+    colours = sorted(set(fills.values()))
+    sheet_rows = []
+    for row_number, cells in sorted(rows.items()):
+        cell_xml = []
+        for column, value in cells.items():
+            style = ""
+            if (row_number, column) in fills:
+                style = f' s="{colours.index(fills[(row_number, column)]) + 1}"'
+            ref = f"{column}{row_number}"
+            if value is None:
+                cell_xml.append(f'<c r="{ref}"{style}/>')
+            elif isinstance(value, str):
+                strings.append(value)
+                cell_xml.append(f'<c r="{ref}" t="s"{style}><v>{len(strings) - 1}</v></c>')
+            else:
+                cell_xml.append(f'<c r="{ref}"{style}><v>{value}</v></c>')
+        sheet_rows.append(f'<row r="{row_number}">{"".join(cell_xml)}</row>')
+
+    fill_xml = "".join(
+        f'<fill><patternFill patternType="solid"><fgColor rgb="{c}"/></patternFill></fill>'
+        for c in colours
+    )
+    xf_xml = "".join(f'<xf fillId="{i + 2}"/>' for i in range(len(colours)))
+    with zipfile.ZipFile(path, "w") as workbook:
+        workbook.writestr(
+            "xl/workbook.xml",
+            f'<workbook {_NS} {_R_NS}><sheets>'
+            f'<sheet name="Légende" sheetId="1" r:id="rId1"/>'
+            f'<sheet name="Planning" sheetId="2" r:id="rId2"/></sheets></workbook>',
+        )
+        workbook.writestr(
+            "xl/_rels/workbook.xml.rels",
+            f'<Relationships {_PKG_NS}>'
+            f'<Relationship Id="rId1" Target="worksheets/sheet1.xml"/>'
+            f'<Relationship Id="rId2" Target="worksheets/sheet2.xml"/></Relationships>',
+        )
+        workbook.writestr(
+            "xl/sharedStrings.xml",
+            f'<sst {_NS}>' + "".join(f"<si><t>{s}</t></si>" for s in strings) + "</sst>",
+        )
+        workbook.writestr(
+            "xl/styles.xml",
+            f'<styleSheet {_NS}><fills>'
+            f'<fill><patternFill patternType="none"/></fill>'
+            f'<fill><patternFill patternType="gray125"/></fill>{fill_xml}</fills>'
+            f'<cellXfs><xf fillId="0"/>{xf_xml}</cellXfs></styleSheet>',
+        )
+        workbook.writestr("xl/worksheets/sheet1.xml", f"<worksheet {_NS}><sheetData>{legend_rows}</sheetData></worksheet>")
+        workbook.writestr(
+            "xl/worksheets/sheet2.xml",
+            f'<worksheet {_NS}><sheetData>{"".join(sheet_rows)}</sheetData></worksheet>',
+        )
+
+
+@pytest.fixture
+def layout():
+    """Disposición reducida: personal en D-F y días desde H."""
+    return PlanningSheetLayout(
+        names_row=1,
+        dates_row=2,
+        first_data_row=3,
+        first_employee_column="D",
+        last_employee_column="F",
+        first_date_column="H",
+    )
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    """Libro con dos líneas de proyecto, una de ellas desconocida."""
+    path = tmp_path / "planning.xlsx"
+    _write_workbook(
+        path,
+        {
+            1: {"D": "MUÑOZ José", "E": "PEREZ  Ana", "F": "DESCONOCIDO Juan"},
+            2: {"G": "Date", "H": _DAY_1, "I": _DAY_2},
+            3: {"A": "FR-TRN2102", "B": "TRN", "D": 1, "E": 1, "F": 0, "H": 1000, "I": None},
+            4: {"A": "XX-0000", "B": "XXX", "D": 1, "H": 1000},
+            5: {"A": "FR-GRS2102", "B": "GRS", "E": 1, "H": 3, "I": 1001},
+            6: {"H": 1000},
+        },
+        fills={(3, "I"): "FFFFFF00"},
+    )
+    return path
+
+
+@pytest.fixture
+async def session(isolated_session):
+    """Sesión con empleados, proyectos y códigos de estado de ejemplo."""
+    client = Client(name="Cliente", code="CLI")
+    isolated_session.add(client)
+    await isolated_session.flush()
+    isolated_session.add_all([
+        Project(reference="FR-TRN2102", trigram="TRN", name="Tricastin", client_id=client.id),
+        Project(reference="FR-GRS2102", trigram="GRS", name="Gravelines", client_id=client.id),
+        Employee(first_name="José", last_name="Muñoz", full_name="José Muñoz"),
+        Employee(first_name="Ana", last_name="Pérez", full_name="Ana Pérez"),
+        *(StatusCode(code=code, name=code) for code in ("VAL", "VOY", "PRE", "AMA")),
+    ])
+    await isolated_session.commit()
+    return isolated_session
+
+
+class TestXlsxReader:
+    """Tests para el lector .xlsx en streaming."""
+
+    def test_reads_typed_values_and_fills(self, workbook_path):
+        with XlsxReader(workbook_path) as reader:
+            assert reader.sheet_names == ["Légende", "Planning"]
+            rows = dict(reader.iter_rows("Planning", min_row=1, max_row=3))
+
+        assert sorted(rows) == [1, 2, 3]
+        assert rows[1]["D"].value == "MUÑOZ José"
+        assert rows[2]["H"].value == _DAY_1
+        assert rows[3]["I"].value is None
+        assert rows[3]["I"].fill == "FFFFFF00"
+
+    def test_helpers(self):
+        assert column_index("A") == 1
+        assert column_index("AI") == 35
+        assert [column_letters(i) for i in (1, 26, 27, 35)] == ["A", "Z", "AA", "AI"]
+        assert excel_serial_to_date(_DAY_1) == date(2022, 1, 3)
+
+    def test_rows_and_cells_without_reference_follow_the_previous_one(self, tmp_path):
+        # El atributo ``r`` es opcional en filas y celdas
+        path = tmp_path / "sin_referencias.xlsx"
+        _write_workbook(
+            path,
+            {},
+            legend_rows=(
+                '<row><c t="inlineStr"><is><t>uno</t></is></c><c><v>2</v></c></row>'
+                '<row r="4"><c r="C4"><v>3</v></c><c><v>4</v></c></row>'
+                '<row><c><v>5</v></c></row>'
+            ),
+        )
+
+        with XlsxReader(path) as reader:
+            rows = {
+                number: {column: cell.value for column, cell in cells.items()}
+                for number, cells in reader.iter_rows("Légende")
+            }
+
+        assert rows == {1: {"A": "uno", "B": 2}, 4: {"C": 3, "D": 4}, 5: {"A": 5}}
+
+    def test_missing_sheet_and_invalid_file(self, workbook_path, tmp_path):
+        with XlsxReader(workbook_path) as reader:
+            with pytest.raises(FileSystemError):
+                list(reader.iter_rows("Inexistente"))
+
+        broken = tmp_path / "broken.xlsx"
+        broken.write_text("no es un zip")
+        with pytest.raises(FileSystemError):
+            XlsxReader(broken)
+
+
+class TestPlanningImport:
+    """Tests para la importación por lotes de la hoja de planificación."""
+
+    async def _schedules(self, session):
+        result = await session.execute(
+            select(Schedule.employee_id, Schedule.project_id, Schedule.date, StatusCode.code)
+            .join(StatusCode, Schedule.status_code_id == StatusCode.id)
+            .order_by(Schedule.project_id, Schedule.date, Schedule.employee_id)
+        )
+        return result.all()
+
+    async def test_imports_grid_and_reports_unknowns(self, session, workbook_path, layout):
+        report = await SchedulePlanningImportModule(session).import_planning_sheet(
+            workbook_path,
+            layout=layout,
+            colour_codes={"ffffff00": "AMA"},
+            batch_size=2,
+        )
+
+        assert report.rows_read == 3
+        assert report.schedules_created == 6
+        assert report.schedules_updated == 0
+        assert report.unknown_employees == {"DESCONOCIDO Juan"}
+        assert report.unknown_projects == {"XX-0000"}
+        assert report.rows_per_second > 0
+
+        day_1, day_2 = date(2022, 1, 3), date(2022, 1, 4)
+        assert await self._schedules(session) == [
+            (1, 1, day_1, "VAL"), (2, 1, day_1, "VAL"),
+            (1, 1, day_2, "AMA"), (2, 1, day_2, "AMA"),
+            (2, 2, day_1, "PRE"),
+            (2, 2, day_2, "VOY"),
+        ]
+
+    async def test_reimport_updates_existing_rows(self, session, workbook_path, layout):
+        module = SchedulePlanningImportModule(session)
+        await module.import_planning_sheet(workbook_path, layout=layout)
+
+        report = await module.import_planning_sheet(
+            workbook_path, layout=layout, value_codes={1000: "VOY", 1001: "VOY"}
+        )
+
+        assert report.schedules_created == 0
+        assert report.schedules_updated == 4
+        assert {row.code for row in await self._schedules(session)} == {"VOY", "PRE"}
+
+    async def test_unknown_codes_are_counted(self, session, workbook_path, layout):
+        report = await SchedulePlanningImportModule(session).import_planning_sheet(
+            workbook_path, layout=layout, forecast_code=None
+        )
+
+        assert report.unknown_codes == {"3": 1}
+        assert report.schedules_created == 3
@@ -0,0 +1,231 @@
+"""Tests para los escenarios de planificación.
+
+Este módulo verifica que los escenarios solo almacenan sus cambios sobre
+la instantánea, que ``fork`` aísla escenarios hermanos, que los cálculos
+de disponibilidad, conflictos y utilización leen el escenario y que la
+confirmación aplica el diff en una transacción.
+"""
+
+from datetime import date, time, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, select
+
+from planificador.exceptions import ConflictError, ValidationError
+from planificador.models.client import Client
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.models.project_assignment import ProjectAssignment
+from planificador.models.schedule import Schedule
+from planificador.models.vacation import Vacation, VacationStatus, VacationType
+from planificador.models.workload import Workload
+from planificador.repositories.schedule.modules import (
+    AutoPlanResult,
+    PlanningScenario,
+    ScheduleScenarioModule,
+)
+
+_MONDAY = date(2024, 1, 1)
+_END = date(2024, 1, 14)
+
+
+@pytest.fixture
+async def session(isolated_session):
+    """Sesión con dos empleados, un proyecto asignado, horarios y vacaciones."""
+    client = Client(name="Cliente", code="CLI")
+    ana = Employee(first_name="Ana", last_name="Pérez", employee_code="E01")
+    luis = Employee(first_name="Luis", last_name="Gómez", employee_code="E02",
+                    weekly_hours=20)
+    isolated_session.add_all([client, ana, luis])
+    await isolated_session.flush()
+    project = Project(reference="FR-TRN2102", trigram="TRN", name="Tricastin",
+                      client_id=client.id)
+    isolated_session.add(project)
+    await isolated_session.flush()
+    isolated_session.add_all([
+        Schedule(employee_id=ana.id, project_id=project.id,
+                 date=_MONDAY + timedelta(days=i), start_time=time(8), end_time=time(16))
+        for i in range(5)
+    ])
+    isolated_session.add_all([
+        Vacation(employee_id=luis.id, start_date=date(2024, 1, 3), end_date=date(2024, 1, 4),
+                 vacation_type=VacationType.ANNUAL, status=VacationStatus.APPROVED,
+                 requested_date=_MONDAY, total_days=2, business_days=2),
+        ProjectAssignment(employee_id=luis.id, project_id=project.id, start_date=_MONDAY,
+                          allocated_hours_per_day=Decimal("5")),
+    ])
+    await isolated_session.commit()
+    return isolated_session
+
+
+async def _snapshot(session):
+    return await ScheduleScenarioModule(session).load_snapshot(_MONDAY, _END)
+
+
+class TestPlanningScenario:
+    """Tests para los cálculos en memoria sobre escenarios."""
+
+    async def test_snapshot_contents(self, session):
+        snapshot = await _snapshot(session)
+
+        assert len(snapshot.schedules) == 5
+        assert snapshot.vacations[2] == {date(2024, 1, 3), date(2024, 1, 4)}
+        assert snapshot.assignments[(2, 1)].allocated_hours_per_day == Decimal("5")
+        assert snapshot.weekly_hours == {1: 40, 2: 20}
+
+    async def test_fork_isolates_changes(self, session):
+        base = PlanningScenario(await _snapshot(session), "base")
+        option = base.fork("opción")
+
+        option.move(1, _MONDAY, 2)
+
+        assert option.changes == 2
+        assert base.changes == 0
+        assert base.entries(1, _MONDAY) and not option.entries(1, _MONDAY)
+        assert option.entries(2, _MONDAY)[0].project_id == 1
+        assert [change.employee_id for change in option.diff(base)] == [1, 2]
+
+    async def test_reverting_a_change_drops_it(self, session):
+        scenario = PlanningScenario(await _snapshot(session))
+        scenario.assign(2, 1, _MONDAY, allocated_hours_per_day=Decimal("6"))
+        scenario.assign(2, 1, _MONDAY, allocated_hours_per_day=Decimal("5"))
+        scenario.add(2, _MONDAY, 1)
+        scenario.remove(2, _MONDAY)
+
+        assert scenario.changes == 0
+        assert scenario.diff() == []
+
+    async def test_availability_conflicts_and_utilization(self, session):
+        scenario = PlanningScenario(await _snapshot(session))
+        assert scenario.available_employees(date(2024, 1, 3), [1, 2]) == []
+        assert scenario.available_employees(date(2024, 1, 6), [1, 2]) == [1, 2]
+
+        scenario.move(1, date(2024, 1, 3), 2)
+        scenario.add(1, date(2024, 1, 2), 1)
+
+        assert scenario.conflicts() == [
+            (1, date(2024, 1, 2), "overlap"),
+            (2, date(2024, 1, 3), "vacation"),
+        ]
+        assert scenario.conflicts(changed_only=True) == scenario.conflicts()
+        utilization = scenario.utilization()
+        # Ana: 4 horarios de 8 h más uno sin horas (8 h por defecto) = 40 h
+        assert utilization[1] == {_MONDAY: Decimal("100.00")}
+        # Luis: 8 h sobre una jornada de 20 h
+        assert scenario.utilization(2) == {2: {_MONDAY: Decimal("40.00")}}
+
+        scenario.add(2, date(2024, 1, 8), 1)
+        # Sin horas: se usan las horas diarias de la asignación
+        assert scenario.utilization(2)[2][date(2024, 1, 8)] == Decimal("25.00")
+
+    async def test_cells_outside_snapshot_are_rejected(self, session):
+        scenario = PlanningScenario(await _snapshot(session))
+
+        with pytest.raises(ValidationError):
+            scenario.add(1, _END + timedelta(days=1), 1)
+
+    async def test_apply_plan(self, session):
+        scenario = PlanningScenario(await _snapshot(session))
+        plan = AutoPlanResult(project_id=1, start_date=_MONDAY, end_date=_END,
+                              assignments=[(2, date(2024, 1, 8)), (2, date(2024, 1, 9))])
+
+        assert scenario.apply_plan(plan) == 2
+        assert len(scenario.diff()) == 2
+
+
+class TestCommitScenario:
+    """Tests para la confirmación de escenarios."""
+
+    async def test_commit_applies_diff(self, session):
+        module = ScheduleScenarioModule(session)
+        scenario = PlanningScenario(await module.load_snapshot(_MONDAY, _END))
+        scenario.move(1, _MONDAY, 2)
+        scenario.remove(1, date(2024, 1, 2))
+        scenario.unassign(2, 1)
+        scenario.assign(1, 1, _MONDAY, _END, Decimal("8"))
+
+        report = await module.commit_scenario(scenario)
+
+        assert (report.schedules_created, report.schedules_deleted) == (1, 2)
+        assert (report.assignments_created, report.assignments_updated) == (1, 1)
+        rows = await session.execute(
+            select(Schedule.employee_id, Schedule.date).order_by(Schedule.date)
+        )
+        assert rows.all()[:2] == [(2, _MONDAY), (1, date(2024, 1, 3))]
+        reloaded = await module.load_snapshot(_MONDAY, _END)
+        assert set(reloaded.assignments) == {(1, 1)}
+
+    async def test_commit_recomputes_workloads_of_changed_cells(self, session):
+        module = ScheduleScenarioModule(session)
+        scenario = PlanningScenario(await module.load_snapshot(_MONDAY, _END))
+        scenario.move(1, _MONDAY, 2)
+
+        await module.commit_scenario(scenario)
+
+        rows = await session.execute(
+            select(Workload.employee_id, Workload.date, Workload.planned_hours)
+            .order_by(Workload.employee_id)
+        )
+        # El horario movido deja a Ana sin carga ese día y se la da a Luis
+        assert rows.all() == [(2, _MONDAY, Decimal("8.00"))]
+
+    async def test_stale_snapshot_is_rejected(self, session):
+        module = ScheduleScenarioModule(session)
+        scenario = PlanningScenario(await module.load_snapshot(_MONDAY, _END))
+        scenario.remove(1, _MONDAY)
+
+        session.add(Schedule(employee_id=1, project_id=1, date=_MONDAY))
+        await session.commit()
+
+        with pytest.raises(ConflictError):
+            await module.commit_scenario(scenario)
+
+    async def test_concurrent_assignment_edit_is_rejected(self, session):
+        module = ScheduleScenarioModule(session)
+        scenario = PlanningScenario(await module.load_snapshot(_MONDAY, _END))
+        scenario.assign(2, 1, _MONDAY, _END, Decimal("6"))
+
+        assignment = await session.scalar(select(ProjectAssignment))
+        assignment.allocated_hours_per_day = Decimal("4")
+        await session.commit()
+
+        with pytest.raises(ConflictError):
+            await module.commit_scenario(scenario)
+        assert (await session.scalar(select(ProjectAssignment.allocated_hours_per_day))) == Decimal("4")
+
+    async def test_assignment_updates_are_one_bulk_write_per_key_set(self, session):
+        session.add_all([
+            ProjectAssignment(employee_id=1, project_id=1, start_date=_MONDAY),
+            Employee(first_name="Marta", last_name="Ruiz", employee_code="E03"),
+        ])
+        await session.commit()
+        session.add(ProjectAssignment(employee_id=3, project_id=1, start_date=_MONDAY))
+        await session.commit()
+        module = ScheduleScenarioModule(session)
+        scenario = PlanningScenario(await module.load_snapshot(_MONDAY, _END))
+        scenario.assign(1, 1, _MONDAY, _END, Decimal("8"))
+        scenario.assign(2, 1, _MONDAY, _END, Decimal("6"))
+        scenario.unassign(3, 1)
+
+        statements = []
+        engine = session.bind.sync_engine
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            report = await module.commit_scenario(scenario)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert report.assignments_updated == 3
+        updates = [s for s in statements if s.startswith("UPDATE project_assignments")]
+        assert len(updates) == 2
+        rows = await session.execute(
+            select(ProjectAssignment.employee_id, ProjectAssignment.allocated_hours_per_day,
+                   ProjectAssignment.is_active)
+            .order_by(ProjectAssignment.employee_id)
+        )
+        assert rows.all() == [(1, Decimal("8"), True), (2, Decimal("6"), True), (3, None, False)]
@@ -0,0 +1 @@
+# Tests para el índice de búsqueda global
@@ -0,0 +1,229 @@
+"""Tests para la búsqueda difusa por trigramas.
+
+Este módulo verifica el índice de trigramas en memoria, su carga perezosa
+desde la base de datos (solo con datos confirmados), la actualización
+incremental, la detección de clientes y empleados casi duplicados y la
+búsqueda de empleados con errores tipográficos.
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from planificador.models.client import Client
+from planificador.models.employee import Employee
+from planificador.repositories.client.modules.advanced_query_operations import (
+    AdvancedQueryOperations,
+)
+from planificador.repositories.client.modules.validation_operations import (
+    ValidationOperations,
+)
+from planificador.repositories.employee.modules.query_operations import (
+    QueryOperations as EmployeeQueryOperations,
+)
+from planificador.repositories.search import (
+    FuzzyMatcher,
+    TrigramIndex,
+    remove_from_search_index,
+    sync_search_index,
+)
+from planificador.repositories.search.fuzzy_matcher import fuzzy_matcher, trigrams
+
+
+def _concrete(module_class):
+    """Subclase instanciable de un módulo de repositorio.
+
+    Los módulos de operaciones no implementan todos los métodos abstractos
+    de sus interfaces (los completa la fachada); aquí solo interesan los
+    métodos de búsqueda difusa.
+    """
+    concrete = type(module_class.__name__, (module_class,), {})
+    concrete.__abstractmethods__ = frozenset()
+    return concrete
+
+
+@pytest.fixture
+async def session(isolated_file_engine):
+    """Sesión sobre un fichero SQLite con clientes y empleados de ejemplo.
+
+    El índice compartido se carga desde una conexión propia, por lo que los
+    datos de ejemplo se confirman y la base no puede estar en memoria.
+    """
+    async with AsyncSession(isolated_file_engine, expire_on_commit=False) as session:
+        session.add_all([
+            Client(name="Montajes Industriales SpA", code="MISA"),
+            Client(name="Energía Andina", code="ENA"),
+            Employee(first_name="José", last_name="Muñoz", full_name="José Muñoz"),
+        ])
+        await session.commit()
+        yield session
+
+
+class TestTrigramIndex:
+    """Tests para TrigramIndex."""
+
+    def test_trigrams_are_normalized_and_padded(self):
+        assert trigrams("Ñu") == trigrams("nu") == frozenset({"  n", " nu", "nu "})
+        assert trigrams("  ") == frozenset()
+
+    def test_similarity_ranking_and_threshold(self):
+        index = TrigramIndex()
+        index.add(1, {"name": "Montajes Industriales"})
+        index.add(2, {"name": "Montages Industriales"})
+        index.add(3, {"name": "Energía Andina"})
+
+        results = index.search("Montajes Industriales", threshold=0.5)
+
+        assert [r[0] for r in results] == [1, 2]
+        assert results[0][3] == 1.0
+        assert 0.5 <= results[1][3] < 1.0
+
+    def test_word_match_finds_partial_terms(self):
+        index = TrigramIndex()
+        index.add(1, {"name": "Montajes Industriales del Norte"})
+
+        assert index.search("norte", threshold=0.5) == []
+        assert [r[0] for r in index.search("norte", threshold=0.5, word_match=True)] == [1]
+
+    def test_remove_and_reindex(self):
+        index = TrigramIndex()
+        index.add(1, {"name": "Alfa", "code": "ALF"})
+        index.add(1, {"name": "Beta", "code": "BET"})
+
+        assert index.search("Alfa") == []
+        assert index.search("Beta")[0][:2] == (1, "name")
+
+        index.remove(1)
+        assert len(index) == 0
+        assert index.search("Beta") == []
+
+
+class TestFuzzyMatcher:
+    """Tests para FuzzyMatcher sobre una base de datos real."""
+
+    async def test_loads_once_and_updates_incrementally(self, session):
+        matcher = FuzzyMatcher()
+        index = await matcher.ensure_loaded(session, "client")
+        assert len(index) == 2
+        assert await matcher.ensure_loaded(session, "client") is index
+
+        client = Client(name="Constructora Pacífico", code="CPA")
+        session.add(client)
+        await session.flush()
+        matcher.update_entity(session, client)
+        await session.commit()
+        matches = await matcher.find_similar(session, "client", "Constructora Pacifico")
+        assert [(m.entity_id, m.score) for m in matches] == [(client.id, 1.0)]
+
+        matcher.remove_entity(session, Client, client.id)
+        await session.commit()
+        assert await matcher.find_similar(session, "client", "Constructora Pacifico") == []
+
+    async def test_crud_hooks_update_global_matcher(self, session):
+        fuzzy_matcher.invalidate(session)
+        await fuzzy_matcher.ensure_loaded(session, "employee")
+
+        employee = Employee(first_name="Ana", last_name="Pérez", full_name="Ana Pérez")
+        session.add(employee)
+        await session.flush()
+        await sync_search_index(session, employee)
+        await session.commit()
+        assert (await fuzzy_matcher.find_similar(session, "employee", "ana perez"))[0].entity_id == employee.id
+
+        await remove_from_search_index(session, Employee, employee.id)
+        await session.commit()
+        assert await fuzzy_matcher.find_similar(session, "employee", "ana perez") == []
+
+    async def test_changes_wait_for_commit_and_are_dropped_on_rollback(self, session):
+        await session.commit()
+        matcher = FuzzyMatcher()
+        await matcher.ensure_loaded(session, "client")
+
+        client = Client(name="Constructora Pacífico", code="CPA")
+        session.add(client)
+        await session.flush()
+        matcher.update_entity(session, client)
+        matcher.remove_entity(session, Client, 1)
+        # Antes del commit el índice compartido no ve los cambios
+        assert await matcher.find_similar(session, "client", "Constructora Pacifico") == []
+        assert [m.entity_id for m in await matcher.find_similar(session, "client", "Montajes Industriales SpA")] == [1]
+
+        await session.rollback()
+        assert await matcher.find_similar(session, "client", "Constructora Pacifico") == []
+        assert [m.entity_id for m in await matcher.find_similar(session, "client", "Montajes Industriales SpA")] == [1]
+        assert "fuzzy_matcher_pending" not in session.info
+
+        # Un commit posterior no reaplica los cambios descartados
+        await session.commit()
+        assert await matcher.find_similar(session, "client", "Constructora Pacifico") == []
+
+    async def test_shared_index_ignores_uncommitted_rows(self, session):
+        matcher = FuzzyMatcher()
+        client = Client(name="Constructora Pacífico", code="CPA")
+        session.add(client)
+        await session.flush()
+
+        # La carga no ve la fila escrita sin confirmar por la propia sesión
+        assert await matcher.find_similar(session, "client", "Constructora Pacifico") == []
+        assert session.in_transaction()
+
+        await session.rollback()
+        assert await matcher.find_similar(session, "client", "Constructora Pacifico") == []
+
+    async def test_in_memory_engine_builds_private_index(self, isolated_session):
+        matcher = FuzzyMatcher()
+        isolated_session.add(Client(name="Constructora Pacífico", code="CPA"))
+        await isolated_session.flush()
+
+        index = await matcher.ensure_loaded(isolated_session, "client")
+
+        # Una sola conexión: se lee con la sesión y el índice no se comparte
+        assert len(index) == 1
+        assert await matcher.ensure_loaded(isolated_session, "client") is not index
+        assert isolated_session.in_transaction()
+        await isolated_session.rollback()
+        assert len(await matcher.ensure_loaded(isolated_session, "client")) == 0
+
+    async def test_search_clients_fuzzy_tolerates_typos(self, session):
+        fuzzy_matcher.invalidate(session)
+        operations = _concrete(AdvancedQueryOperations)(session)
+
+        clients = await operations.search_clients_fuzzy("montages", similarity_threshold=0.4)
+
+        assert [c.name for c in clients] == ["Montajes Industriales SpA"]
+        assert await operations.search_clients_fuzzy("   ") == []
+
+    async def test_validation_flags_near_duplicates(self, session):
+        fuzzy_matcher.invalidate(session)
+        validation = _concrete(ValidationOperations)(session)
+
+        near_duplicates = await validation.find_near_duplicates(
+            {"name": "Montajes Industrial SpA", "code": "MIS"}
+        )
+
+        assert [m.text for m in near_duplicates] == ["Montajes Industriales SpA"]
+        assert near_duplicates[0].score >= 0.6
+
+        existing_id = near_duplicates[0].entity_id
+        assert await validation.find_near_duplicates(
+            {"name": "Montajes Industriales SpA"}, exclude_id=existing_id
+        ) == []
+
+    async def test_employee_search_by_name_tolerates_typos(self, session):
+        fuzzy_matcher.invalidate(session)
+        operations = _concrete(EmployeeQueryOperations)(session)
+
+        assert [e.full_name for e in await operations.search_by_name("Muñoz")] == ["José Muñoz"]
+        assert [e.full_name for e in await operations.search_by_name("jose munos")] == ["José Muñoz"]
+        assert await operations.search_by_name("Pérez") == []
+
+    async def test_employee_similar_names(self, session):
+        fuzzy_matcher.invalidate(session)
+        operations = _concrete(EmployeeQueryOperations)(session)
+
+        similar = await operations.find_similar_names("Jose Munoz")
+
+        assert [m.text for m in similar] == ["José Muñoz"]
+        assert await operations.find_similar_names(
+            "José Muñoz", exclude_id=similar[0].entity_id
+        ) == []
+        assert await operations.find_similar_names("Ana Pérez") == []
@@ -0,0 +1,111 @@
+"""Tests para SearchIndex.
+
+Este módulo verifica el índice de búsqueda global sobre SQLite (FTS5):
+sincronización de documentos, ranking, búsqueda por prefijo y
+recurso a ILIKE cuando el índice no existe.
+"""
+
+import pytest
+
+from planificador.models.client import Client
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.repositories.search import (
+    SearchIndex,
+    remove_from_search_index,
+    sync_search_index,
+)
+
+
+@pytest.fixture
+def session(isolated_session):
+    """Sesión sobre una base de datos SQLite en memoria con las tablas creadas."""
+    return isolated_session
+
+
+@pytest.fixture
+async def populated_session(session):
+    """Sesión con clientes, proyectos y empleados de ejemplo."""
+    montajes = Client(name="Montajes Industriales del Norte", code="MIN", email="info@min.cl")
+    energia = Client(name="Energía Andina", code="ENA", notes="Cliente de montaje eléctrico")
+    session.add_all([montajes, energia])
+    await session.flush()
+    session.add_all([
+        Project(
+            reference="P-001", trigram="MNT", name="Parada de planta norte",
+            client_id=montajes.id, details="Mantención mayor",
+        ),
+        Employee(
+            first_name="José", last_name="Muñoz", full_name="José Muñoz",
+            employee_code="E001", skills=["soldadura", "montaje"],
+        ),
+        Employee(
+            first_name="Ana", last_name="Pérez", full_name="Ana Pérez",
+            employee_code="E002",
+        ),
+    ])
+    await session.flush()
+    return session
+
+
+class TestSearchIndex:
+    """Tests para SearchIndex sobre SQLite FTS5."""
+
+    async def test_rebuild_and_ranked_prefix_search(self, populated_session):
+        index = SearchIndex(populated_session)
+        assert await index.rebuild() == 5
+
+        results = await index.search("mont")
+
+        # El nombre pesa más que el resto de campos
+        assert results[0].entity_type == "client"
+        assert results[0].title == "Montajes Industriales del Norte"
+        assert {(r.entity_type, r.title) for r in results} >= {
+            ("client", "Energía Andina"),
+            ("employee", "José Muñoz"),
+        }
+        assert results == sorted(results, key=lambda r: r.score, reverse=True)
+
+    async def test_search_ignores_accents_and_filters_types(self, populated_session):
+        index = SearchIndex(populated_session)
+        await index.rebuild()
+
+        results = await index.search("jose munoz", entity_types=["employee"])
+        assert [r.title for r in results] == ["José Muñoz"]
+
+        assert await index.search("jose", entity_types=["client"]) == []
+        assert await index.search("   ") == []
+
+    async def test_title_only_search(self, populated_session):
+        index = SearchIndex(populated_session)
+        await index.rebuild()
+
+        assert await index.search_ids("soldadura", "employee", title_only=True) == []
+        assert len(await index.search_ids("soldadura", "employee")) == 1
+
+    async def test_sync_and_remove_keep_index_up_to_date(self, session):
+        index = SearchIndex(session)
+        await index.ensure_index()
+
+        client = Client(name="Constructora Pacífico", code="CPA")
+        session.add(client)
+        await session.flush()
+        await sync_search_index(session, client)
+        assert [r.entity_id for r in await index.search("pacif")] == [client.id]
+
+        client.name = "Constructora Atlántico"
+        await session.flush()
+        await sync_search_index(session, client)
+        assert await index.search("pacif") == []
+        assert [r.title for r in await index.search("atlan")] == ["Constructora Atlántico"]
+
+        await remove_from_search_index(session, Client, client.id)
+        assert await index.search("atlan") == []
+
+    async def test_falls_back_to_ilike_without_index(self, populated_session):
+        index = SearchIndex(populated_session)
+        assert not await index.is_available()
+
+        results = await index.search("MIN", entity_types=["client"])
+
+        assert [r.title for r in results] == ["Montajes Industriales del Norte"]
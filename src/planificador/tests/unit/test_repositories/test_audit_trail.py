@@ -0,0 +1,199 @@
+"""Tests para el registro de auditoría de la planificación.
+
+Este módulo verifica que las altas, cambios (también sobre instancias
+expiradas) y bajas de proyectos, horarios y asignaciones guardan diffs por
+columna con su usuario y mes, que las sentencias en bloque también se
+auditan y que las consultas por entidad, proyecto y rango funcionan.
+"""
+
+import json
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import delete, event, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from planificador.exceptions import ValidationError
+from planificador.models.change_log import ChangeLog
+from planificador.models.client import Client
+from planificador.models.employee import Employee
+from planificador.models.project import Project, ProjectStatus
+from planificador.models.schedule import Schedule
+from planificador.repositories.audit_trail import (
+    AuditTrail,
+    clear_audit_context,
+    set_audit_context,
+)
+
+
+@pytest.fixture
+async def session(isolated_engine):
+    """Sesión sobre una base en memoria con un cliente y un empleado."""
+    async with AsyncSession(isolated_engine) as session:
+        session.add_all([
+            Client(name="Cliente", code="CLI"),
+            Employee(first_name="Ana", last_name="Pérez", employee_code="E01"),
+        ])
+        await session.commit()
+        yield session
+
+
+async def _log(session: AsyncSession):
+    result = await session.execute(select(ChangeLog).order_by(ChangeLog.id))
+    return [
+        (entry.entity_type, entry.entity_id, entry.project_id, entry.action, entry.diff)
+        for entry in result.scalars().all()
+    ]
+
+
+class TestAuditCapture:
+    """Tests para la escritura del registro."""
+
+    async def test_project_lifecycle(self, session: AsyncSession):
+        set_audit_context(session, "jperez", change_reason="Alta")
+        project = Project(
+            reference="P-1", trigram="PUN", name="Parada", client_id=1,
+            start_date=date(2024, 3, 4),
+        )
+        session.add(project)
+        await session.commit()
+
+        # Instancia expirada tras el commit: el valor anterior se lee de la BD
+        set_audit_context(session, "mgarcia", change_reason="Retraso del cliente")
+        project.start_date = date(2024, 3, 11)
+        project.end_date = date(2024, 3, 29)
+        project.name = "Parada"
+        await session.commit()
+
+        clear_audit_context(session)
+        await session.delete(project)
+        await session.commit()
+
+        log = await _log(session)
+        assert [entry[3] for entry in log] == ["insert", "update", "delete"]
+        assert log[0][4]["start_date"] == [None, "2024-03-04"]
+        assert log[0][4]["status"] == [None, "planned"]
+        assert log[1][:4] == ("Project", 1, 1, "update")
+        assert log[1][4] == {
+            "end_date": [None, "2024-03-29"],
+            "start_date": ["2024-03-04", "2024-03-11"],
+        }
+        assert log[2][4] == {}
+
+        entries = (await session.execute(select(ChangeLog).order_by(ChangeLog.id))).scalars().all()
+        assert [entry.changed_by for entry in entries] == ["jperez", "mgarcia", "system"]
+        assert entries[1].change_reason == "Retraso del cliente"
+        assert entries[1].period == entries[1].change_date.year * 100 + entries[1].change_date.month
+
+    async def test_schedules_are_logged_under_their_project(self, session: AsyncSession):
+        session.add(Project(reference="P-1", trigram="PUN", name="Parada", client_id=1))
+        await session.flush()
+        schedule = Schedule(employee_id=1, project_id=1, date=date(2024, 3, 4))
+        session.add(schedule)
+        await session.flush()
+        schedule.location = "Sitio X"
+        await session.flush()
+
+        history = await AuditTrail(session).get_project_history(1, entity_types=["Schedule"])
+        assert [(entry.action, entry.changed_columns) for entry in history] == [
+            ("insert", ["date", "employee_id", "is_confirmed", "project_id"]),
+            ("update", ["location"]),
+        ]
+
+    async def test_bulk_statements(self, session: AsyncSession):
+        await session.execute(insert(Project), [
+            {"reference": f"P-{number}", "trigram": f"P{number:02d}", "name": "Bulk", "client_id": 1}
+            for number in (1, 2)
+        ])
+        await session.execute(
+            update(Project).where(Project.id == 2).values(status=ProjectStatus.ON_HOLD)
+        )
+        await session.execute(delete(Project).where(Project.id == 1))
+
+        log = await _log(session)
+        assert [entry[:4] for entry in log] == [
+            ("Project", 1, 1, "insert"),
+            ("Project", 2, 2, "insert"),
+            ("Project", 2, 2, "update"),
+            ("Project", 1, 1, "delete"),
+        ]
+        assert log[2][4] == {"status": ["planned", "on_hold"]}
+
+    async def test_bulk_insert_audits_only_its_own_rows(self, session: AsyncSession):
+        engine = session.bind.sync_engine
+
+        # Otra transacción inserta un proyecto justo antes que la sentencia
+        def concurrent_insert(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO projects") and "RETURNING" in statement:
+                cursor.execute(
+                    "INSERT INTO projects (reference, trigram, name, client_id, status, priority,"
+                    " revision_number, is_archived, created_at, updated_at) VALUES ('X-1', 'XXX',"
+                    " 'Ajeno', 1, 'PLANNED', 'MEDIUM', 1, 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                )
+
+        event.listen(engine, "before_cursor_execute", concurrent_insert)
+        try:
+            result = await session.execute(
+                insert(Project).returning(Project.reference),
+                [{"reference": "P-1", "trigram": "P01", "name": "Bulk", "client_id": 1}],
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", concurrent_insert)
+
+        assert result.all() == [("P-1",)]
+        log = await _log(session)
+        assert [entry[:4] for entry in log] == [("Project", 2, 2, "insert")]
+        assert log[0][4]["reference"] == [None, "P-1"]
+
+    async def test_bulk_insert_with_explicit_ids(self, session: AsyncSession):
+        await session.execute(insert(Project), [
+            {"id": number, "reference": f"P-{number}", "trigram": f"P{number:02d}",
+             "name": "Bulk", "client_id": 1}
+            for number in (7, 3)
+        ])
+
+        assert [entry[:4] for entry in await _log(session)] == [
+            ("Project", 3, 3, "insert"),
+            ("Project", 7, 7, "insert"),
+        ]
+
+
+class TestAuditTrail:
+    """Tests para las consultas por rango."""
+
+    @pytest.fixture
+    async def trail(self, session: AsyncSession):
+        for day, project_id in ((1, 1), (10, 1), (10, 2), (20, 1)):
+            moment = datetime(2024, 3, day, 12)
+            session.add(ChangeLog(
+                entity_type="Project", entity_id=project_id, project_id=project_id,
+                action="update", changes=json.dumps({"name": ["a", "b"]}),
+                changed_by="jperez" if project_id == 1 else "mgarcia",
+                change_date=moment, period=202403,
+            ))
+        session.add(ChangeLog(
+            entity_type="Project", entity_id=1, project_id=1, action="update",
+            changed_by="jperez", change_date=datetime(2024, 2, 28), period=202402,
+        ))
+        await session.flush()
+        return AuditTrail(session)
+
+    async def test_range_queries(self, trail: AuditTrail):
+        week = await trail.get_changes(date(2024, 3, 4), date(2024, 3, 10))
+        assert [entry.entity_id for entry in week] == [1, 2]
+
+        site = await trail.get_changes(date(2024, 3, 1), date(2024, 3, 31), project_id=1)
+        assert [entry.change_date.day for entry in site] == [1, 10, 20]
+
+        by_user = await trail.get_changes(date(2024, 2, 1), date(2024, 3, 31), changed_by="mgarcia")
+        assert len(by_user) == 1
+
+        history = await trail.get_entity_history("Project", 1, limit=2)
+        assert [entry.period for entry in history] == [202402, 202403]
+
+        with pytest.raises(ValidationError):
+            await trail.get_changes(date(2024, 3, 10), date(2024, 3, 1))
+
+    async def test_prune_whole_months(self, trail: AuditTrail):
+        assert await trail.prune_before(date(2024, 3, 15)) == 1
+        assert len(await trail.get_entity_history("Project", 1)) == 3
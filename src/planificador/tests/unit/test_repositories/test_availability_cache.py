@@ -0,0 +1,210 @@
+"""Tests para la caché de disponibilidad en bitmaps.
+
+Este módulo verifica las operaciones de bits (libres en varios días, libres
+por día y primer hueco), la carga desde horarios, vacaciones aprobadas y
+plantilla activa, el filtro por equipo y la invalidación precisa al
+terminar cada transacción.
+"""
+
+import time as perf
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from planificador.exceptions import ValidationError
+from planificador.models.client import Client
+from planificador.models.employee import Employee, EmployeeStatus
+from planificador.models.project import Project
+from planificador.models.schedule import Schedule
+from planificador.models.team import Team
+from planificador.models.team_membership import TeamMembership
+from planificador.models.vacation import Vacation, VacationStatus, VacationType
+from planificador.repositories.availability_cache import (
+    AvailabilityIndex,
+    availability_cache,
+)
+
+_MONDAY = date(2024, 1, 1)
+
+
+def _days(*offsets):
+    return [_MONDAY + timedelta(days=offset) for offset in offsets]
+
+
+def _bits(*offsets):
+    return sum(1 << offset for offset in offsets)
+
+
+class TestAvailabilityIndex:
+    """Tests para las operaciones en memoria."""
+
+    @pytest.fixture
+    def index(self):
+        index = AvailabilityIndex()
+        index.store_year(2024, {1: _bits(0, 1), 2: _bits(2), 3: 0})
+        index.store_year(2025, {1: 0, 2: 0})
+        return index
+
+    def test_free_on_all(self, index):
+        assert index.free_on_all(_days(0, 3)) == [2, 3]
+        assert index.free_on_all(_days(3), employee_ids=[1, 9]) == [1]
+        # El empleado 3 no está en la plantilla de 2025
+        assert index.free_on_all([date(2024, 12, 31), date(2025, 1, 1)]) == [1, 2]
+
+    def test_free_count_per_day(self, index):
+        counts = index.free_count_per_day(_MONDAY, _MONDAY + timedelta(days=3))
+        assert list(counts.values()) == [2, 2, 2, 3]
+
+    def test_first_free_window(self, index):
+        end = _MONDAY + timedelta(days=6)
+        assert index.first_free_windows(3, _MONDAY, end) == {
+            1: _MONDAY + timedelta(days=2),
+            2: _MONDAY + timedelta(days=3),
+            3: _MONDAY,
+        }
+        assert index.first_free_window(5, _MONDAY, end, employee_ids=[1, 2]) == (
+            _MONDAY + timedelta(days=2), [1]
+        )
+        assert index.first_free_window(7, _MONDAY, end, employee_ids=[1, 2]) is None
+
+    def test_window_across_years(self, index):
+        index.store_year(2024, {1: _bits(*range(366))})
+        window = index.first_free_window(2, date(2024, 12, 30), date(2025, 1, 5))
+        assert window == (date(2025, 1, 1), [1, 2])
+
+    def test_unloaded_year_is_rejected(self, index):
+        with pytest.raises(KeyError):
+            index.free_on_all([date(2023, 6, 1)])
+
+
+@pytest.fixture
+async def engine(isolated_engine):
+    async with AsyncSession(isolated_engine) as session:
+        client = Client(name="Cliente", code="CLI")
+        team = Team(name="Equipo")
+        session.add_all([
+            client,
+            team,
+            Employee(first_name="Ana", last_name="Pérez", employee_code="E01"),
+            Employee(first_name="Luis", last_name="Gómez", employee_code="E02"),
+            Employee(first_name="Eva", last_name="Ruiz", employee_code="E03"),
+            Employee(first_name="Baja", last_name="Inactiva", employee_code="E04",
+                     status=EmployeeStatus.INACTIVE),
+        ])
+        await session.flush()
+        session.add_all([
+            Project(reference="FR-TRN2102", trigram="TRN", name="Tricastin", client_id=client.id),
+            Schedule(employee_id=1, project_id=1, date=_MONDAY),
+            Vacation(employee_id=2, start_date=date(2024, 1, 2), end_date=date(2024, 1, 3),
+                     vacation_type=VacationType.ANNUAL, status=VacationStatus.APPROVED,
+                     requested_date=_MONDAY, total_days=2, business_days=2),
+            Vacation(employee_id=3, start_date=_MONDAY, end_date=date(2024, 1, 5),
+                     vacation_type=VacationType.ANNUAL, status=VacationStatus.PENDING,
+                     requested_date=_MONDAY, total_days=5, business_days=5),
+            TeamMembership(employee_id=2, team_id=team.id, start_date=_MONDAY),
+            TeamMembership(employee_id=3, team_id=team.id, start_date=_MONDAY),
+        ])
+        await session.commit()
+    return isolated_engine
+
+
+class TestAvailabilityCache:
+    """Tests para la carga, el filtro por equipo y la invalidación."""
+
+    async def test_loads_schedules_vacations_and_workforce(self, engine):
+        async with AsyncSession(engine) as session:
+            assert await availability_cache.find_free_employees(session, _days(0)) == [2, 3]
+            assert await availability_cache.find_free_employees(session, _days(0, 1)) == [3]
+            assert await availability_cache.find_free_employees(
+                session, _days(2), team_id=1
+            ) == [3]
+            counts = await availability_cache.free_count_per_day(
+                session, _MONDAY, _MONDAY + timedelta(days=3)
+            )
+            assert list(counts.values()) == [2, 2, 2, 3]
+            window = await availability_cache.first_free_window(
+                session, 3, _MONDAY, _MONDAY + timedelta(days=9), team_id=1
+            )
+            assert window == (_MONDAY, [3])
+
+    async def test_commit_invalidates_only_touched_employees(self, engine):
+        async with AsyncSession(engine) as session:
+            await availability_cache.find_free_employees(session, _days(0))
+            index = availability_cache.loaded_index(session)
+
+            session.add(Schedule(employee_id=3, project_id=1, date=_MONDAY))
+            await session.flush()
+            # Hasta el commit la caché no cambia
+            assert index.stale_employees(2024) == set()
+            await session.commit()
+
+            assert index.stale_employees(2024) == {3}
+            assert await availability_cache.find_free_employees(session, _days(0)) == [2]
+            assert index.stale_employees(2024) == set()
+
+    async def test_vacation_approval_and_bulk_insert(self, engine):
+        async with AsyncSession(engine) as session:
+            await availability_cache.find_free_employees(session, _days(0))
+            index = availability_cache.loaded_index(session)
+
+            vacation = await session.get(Vacation, 2)
+            vacation.status = VacationStatus.APPROVED
+            await session.execute(insert(Schedule), [
+                {"employee_id": 2, "project_id": 1, "date": date(2024, 2, 1)},
+            ])
+            await session.commit()
+
+            assert index.stale_employees(2024) == {2, 3}
+            assert await availability_cache.find_free_employees(
+                session, [_MONDAY, date(2024, 2, 1)]
+            ) == []
+
+    async def test_bulk_delete_resets_and_rollback_invalidates(self, engine):
+        async with AsyncSession(engine) as session:
+            assert await availability_cache.find_free_employees(session, _days(0)) == [2, 3]
+
+            await session.execute(delete(Schedule))
+            await session.commit()
+            assert availability_cache.loaded_index(session).years == []
+            assert await availability_cache.find_free_employees(session, _days(0)) == [1, 2, 3]
+
+            session.add(Schedule(employee_id=2, project_id=1, date=_MONDAY))
+            await session.flush()
+            await session.rollback()
+            assert availability_cache.loaded_index(session).stale_employees(2024) == {2}
+
+    async def test_invalid_arguments(self, engine):
+        async with AsyncSession(engine) as session:
+            with pytest.raises(ValidationError):
+                await availability_cache.first_free_window(session, 0, _MONDAY, _MONDAY)
+            with pytest.raises(ValidationError):
+                await availability_cache.free_count_per_day(
+                    session, _MONDAY, _MONDAY - timedelta(days=1)
+                )
+
+    async def test_workforce_queries_are_fast_once_loaded(self, engine):
+        async with AsyncSession(engine) as session:
+            await session.execute(insert(Employee), [
+                {"first_name": f"N{i}", "last_name": "Apellido", "full_name": f"N{i} Apellido",
+                 "employee_code": f"X{i:04d}"}
+                for i in range(500)
+            ])
+            await session.execute(insert(Schedule), [
+                {"employee_id": 5 + i, "project_id": 1, "date": _MONDAY + timedelta(days=day)}
+                for i in range(500)
+                for day in range(i % 7, 366, 3)
+            ])
+            await session.commit()
+            index = await availability_cache.ensure_loaded(session, _MONDAY, date(2024, 12, 31))
+
+            days = _days(10, 11, 12)
+            began = perf.perf_counter()
+            for _ in range(100):
+                free = index.free_on_all(days)
+            per_query = (perf.perf_counter() - began) / 100
+
+            assert per_query < 0.005
+            assert 1 in free and len(free) < 503
+            assert index.first_free_window(3, _MONDAY, date(2024, 3, 31)) is not None
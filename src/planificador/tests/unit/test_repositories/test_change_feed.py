@@ -0,0 +1,188 @@
+"""Tests para el flujo de cambios (outbox) de los repositorios.
+
+Este módulo verifica que las altas, cambios y bajas del flush y las
+sentencias en bloque escriben eventos en la misma transacción, y que los
+consumidores leen por lotes, avanzan su checkpoint, esperan a que se
+rellenen los huecos de posiciones y permiten purgar.
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from planificador.exceptions import RepositoryError
+from planificador.models.change_event import ChangeEvent, ChangeOperation
+from planificador.models.client import Client
+from planificador.models.project import Project, ProjectStatus
+from planificador.repositories import change_feed
+from planificador.repositories.change_feed import (
+    SKIP_CAPTURE_OPTION,
+    ChangeFeed,
+    prune_change_events,
+)
+
+INSERT, UPDATE, DELETE = ChangeOperation.INSERT, ChangeOperation.UPDATE, ChangeOperation.DELETE
+
+
+@pytest.fixture
+async def session(isolated_engine):
+    """Sesión sobre una base en memoria propia."""
+    async with AsyncSession(isolated_engine) as session:
+        yield session
+
+
+async def _events(session: AsyncSession):
+    result = await session.execute(select(ChangeEvent).order_by(ChangeEvent.id))
+    return [
+        (event.entity, event.entity_id, event.operation, event.changed_columns)
+        for event in result.scalars().all()
+    ]
+
+
+def _project(client_id, number, **kwargs):
+    return Project(
+        reference=f"P-{number}", trigram=f"P{number:02d}", name=f"Proyecto {number}",
+        client_id=client_id, **kwargs
+    )
+
+
+class TestChangeCapture:
+    """Tests para la escritura de eventos."""
+
+    async def test_flush_changes(self, session: AsyncSession):
+        client = Client(name="Cliente", code="CLI")
+        session.add(client)
+        await session.flush()
+        project = _project(client.id, 1)
+        session.add(project)
+        await session.commit()
+
+        # Instancia expirada tras el commit: solo se registran las columnas asignadas
+        project.status = ProjectStatus.IN_PROGRESS
+        project.end_date = date(2024, 6, 30)
+        await session.flush()
+        await session.delete(project)
+        await session.commit()
+
+        assert await _events(session) == [
+            ("Client", 1, INSERT, None),
+            ("Project", 1, INSERT, None),
+            ("Project", 1, UPDATE, "end_date,status"),
+            ("Project", 1, DELETE, None),
+        ]
+        version = (await session.execute(
+            select(ChangeEvent.version).where(ChangeEvent.operation == UPDATE)
+        )).scalar_one()
+        assert version == 1
+
+    async def test_rollback_discards_events(self, session: AsyncSession):
+        session.add(Client(name="Cliente", code="CLI"))
+        await session.flush()
+        await session.rollback()
+        assert await _events(session) == []
+
+    async def test_bulk_statements(self, session: AsyncSession):
+        await session.execute(insert(Client), [
+            {"id": number, "name": f"Cliente {number}"} for number in (1, 2)
+        ])
+        await session.execute(update(Client), [{"id": 2, "is_active": False}])
+        await session.execute(update(Client).where(Client.id == 1).values(notes="x"))
+        await session.execute(delete(Client))
+        # Las sentencias marcadas no se capturan
+        await session.execute(
+            insert(Client).values(name="Oculto"),
+            execution_options={SKIP_CAPTURE_OPTION: True},
+        )
+
+        assert await _events(session) == [
+            ("Client", 1, INSERT, None),
+            ("Client", 2, INSERT, None),
+            ("Client", 2, UPDATE, "is_active"),
+            ("Client", None, UPDATE, None),
+            ("Client", None, DELETE, None),
+        ]
+
+
+class TestChangeFeed:
+    """Tests para el consumo con checkpoint."""
+
+    @pytest.fixture
+    async def populated(self, session: AsyncSession):
+        client = Client(name="Cliente", code="CLI")
+        session.add(client)
+        await session.flush()
+        session.add_all([_project(client.id, number) for number in range(1, 5)])
+        await session.commit()
+        return session
+
+    async def test_consume_in_batches_with_checkpoint(self, populated: AsyncSession):
+        seen = []
+
+        async def handler(events):
+            seen.append([event.entity_id for event in events])
+
+        feed = ChangeFeed(populated, "grid", entities=["Project"], batch_size=3)
+        assert await feed.consume(handler) == 4
+        assert seen == [[1, 2, 3], [4]]
+        assert await feed.get_position() == 5
+
+        # Solo se entregan los eventos nuevos
+        project = (await populated.execute(select(Project).where(Project.id == 2))).scalar_one()
+        project.name = "Renombrado"
+        await populated.commit()
+        assert await feed.consume(handler) == 1
+        assert seen[-1] == [2]
+
+    async def test_failed_batch_keeps_checkpoint(self, populated: AsyncSession):
+        async def handler(events):
+            raise RuntimeError("fallo")
+
+        feed = ChangeFeed(populated, "alerts")
+        with pytest.raises(RepositoryError):
+            await feed.consume(handler)
+        assert await feed.get_position() == 0
+        assert len(await feed.read()) == 5
+
+    async def test_gap_holds_checkpoint_until_timeout(self, populated: AsyncSession, monkeypatch):
+        clock = [100.0]
+        monkeypatch.setattr(change_feed.time, "monotonic", lambda: clock[0])
+        # La posición 3 simula una transacción que aún no ha confirmado
+        await populated.execute(delete(ChangeEvent).where(ChangeEvent.id == 3))
+        await populated.commit()
+        seen = []
+
+        async def handler(events):
+            seen.extend(event.id for event in events)
+
+        feed = ChangeFeed(populated, "grid", gap_timeout=10)
+        assert await feed.consume(handler) == 2
+        assert await feed.get_position() == 2
+
+        clock[0] += 5
+        assert await feed.consume(handler) == 0
+        clock[0] += 6
+        assert await feed.consume(handler) == 2
+        assert seen == [1, 2, 4, 5]
+        assert await feed.get_position() == 5
+
+    async def test_sqlite_does_not_wait_for_gaps(self, populated: AsyncSession):
+        await populated.execute(delete(ChangeEvent).where(ChangeEvent.id == 3))
+        await populated.commit()
+
+        feed = ChangeFeed(populated, "grid")
+
+        assert feed.gap_timeout == 0
+        assert [event.id for event in await feed.read()] == [1, 2, 4, 5]
+
+    async def test_prune_keeps_unread_events(self, populated: AsyncSession):
+        async def handler(events):
+            return None
+
+        assert await prune_change_events(populated) == 0
+        await ChangeFeed(populated, "fast").consume(handler)
+        await ChangeFeed(populated, "slow", batch_size=2).consume(handler, max_batches=1)
+
+        assert await prune_change_events(populated) == 2
+        assert [event[1] for event in await _events(populated)] == [2, 3, 4]
@@ -0,0 +1,149 @@
+"""Tests para DashboardComposer.
+
+Este módulo verifica la ejecución concurrente de widgets en sesiones
+independientes, el límite de concurrencia, los timeouts por widget y los
+resultados parciales.
+"""
+
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from planificador.models.client import Client
+from planificador.models.employee import Employee, EmployeeStatus
+from planificador.repositories.client.modules.statistics_operations import (
+    StatisticsOperations as ClientStatisticsOperations,
+)
+from planificador.repositories.dashboard_composer import DashboardComposer
+from planificador.repositories.employee.modules.statistics_operations import (
+    StatisticsOperations as EmployeeStatisticsOperations,
+)
+
+
+@pytest.fixture
+async def session(isolated_file_engine):
+    """Sesión sobre un fichero SQLite (las sesiones de los widgets lo comparten)."""
+    async with AsyncSession(isolated_file_engine, expire_on_commit=False) as session:
+        session.add_all([
+            Client(name="Alfa", code="A", is_active=True),
+            Client(name="Beta", code="B", is_active=False),
+            Employee(first_name="Ana", last_name="Pérez", full_name="Ana Pérez",
+                     status=EmployeeStatus.ACTIVE),
+        ])
+        await session.commit()
+        yield session
+
+
+def _sleeping_widget(seconds, value, sessions=None):
+    """Widget que espera ``seconds`` y devuelve ``value``."""
+    async def query(session):
+        if sessions is not None:
+            sessions.append(session)
+        await asyncio.sleep(seconds)
+        return value
+    return query
+
+
+class TestDashboardComposer:
+    """Tests para la composición concurrente de widgets."""
+
+    async def test_widgets_run_concurrently_on_separate_sessions(self, session):
+        sessions = []
+        composer = DashboardComposer.from_session(session, max_concurrency=3)
+        for i in range(3):
+            composer.add_widget(f"w{i}", _sleeping_widget(0.2, i, sessions))
+
+        start = time.perf_counter()
+        dashboard = await composer.compose()
+
+        assert time.perf_counter() - start < 0.5
+        assert dashboard.values == {"w0": 0, "w1": 1, "w2": 2}
+        assert not dashboard.partial
+        assert len({id(s) for s in sessions}) == 3
+        assert session not in sessions
+
+    async def test_concurrency_limit(self, session):
+        active = 0
+        peak = 0
+
+        async def query(_session):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+
+        composer = DashboardComposer.from_session(session, max_concurrency=2)
+        for i in range(5):
+            composer.add_widget(f"w{i}", query)
+        await composer.compose()
+
+        assert peak == 2
+
+    async def test_timeout_and_error_return_partial_results(self, session):
+        async def failing(_session):
+            raise RuntimeError("boom")
+
+        async def real_query(widget_session):
+            result = await widget_session.execute(select(Client.name).order_by(Client.name))
+            return list(result.scalars())
+
+        composer = (
+            DashboardComposer.from_session(session)
+            .add_widget("slow", _sleeping_widget(1.0, "late"), timeout=0.05, default=[])
+            .add_widget("broken", failing, default={})
+            .add_widget("clients", real_query)
+        )
+        dashboard = await composer.compose()
+
+        assert dashboard.partial
+        assert dashboard.values == {"slow": [], "broken": {}, "clients": ["Alfa", "Beta"]}
+        assert dashboard.widgets["slow"].status == "timeout"
+        assert dashboard.failed == {"slow": "timeout tras 0.05s", "broken": "boom"}
+
+    def test_rejects_duplicate_widgets(self, session):
+        composer = DashboardComposer.from_session(session)
+        composer.add_widget("w", _sleeping_widget(0, 1))
+        with pytest.raises(ValueError):
+            composer.add_widget("w", _sleeping_widget(0, 2))
+
+
+class TestComposedDashboards:
+    """Tests para los dashboards que usan el compositor."""
+
+    async def test_employee_summary(self, session):
+        summary = await EmployeeStatisticsOperations(session).get_comprehensive_summary()
+
+        assert summary["status_distribution"]["active"] == 1
+        assert "generated_at" in summary
+
+    async def test_employee_summary_defaults_keep_each_section_shape(self, session, monkeypatch):
+        async def failing(self, *args, **kwargs):
+            raise RuntimeError("boom")
+
+        for method in ("get_salary_statistics", "get_team_participation_stats",
+                       "get_vacation_statistics", "get_skills_distribution"):
+            monkeypatch.setattr(EmployeeStatisticsOperations, method, failing)
+
+        summary = await EmployeeStatisticsOperations(session).get_comprehensive_summary()
+
+        assert set(summary["incomplete_sections"]) == {
+            "salary_statistics", "team_participation", "vacation_statistics", "top_skills"
+        }
+        assert summary["salary_statistics"]["average"] == 0.0
+        assert summary["team_participation"]["distribution"] == {}
+        assert summary["vacation_statistics"]["approval_rate"] == 0.0
+        assert summary["top_skills"] == {}
+        assert summary["status_distribution"]["active"] == 1
+
+    async def test_client_dashboard(self, session):
+        concrete = type("StatisticsOperations", (ClientStatisticsOperations,), {})
+        concrete.__abstractmethods__ = frozenset()
+
+        metrics = await concrete(session).get_comprehensive_dashboard_metrics()
+
+        assert metrics["total_clients"] == 2
+        assert metrics["clients_by_status"] == {"active": 1, "inactive": 1}
@@ -0,0 +1,175 @@
+"""Tests para las proyecciones de columnas de los listados.
+
+Este módulo verifica que los ``list_*_summaries`` de los repositorios
+seleccionan solo las columnas de cada vista y construyen los esquemas de
+listado, y que las columnas pesadas se difieren en las cargas de entidades.
+"""
+
+from datetime import date, time
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from planificador.models.client import Client
+from planificador.models.employee import Employee, EmployeeStatus
+from planificador.models.project import Project
+from planificador.models.schedule import Schedule
+from planificador.models.status_code import StatusCode
+from planificador.models.workload import Workload
+from planificador.repositories.base_repository import BaseRepository
+from planificador.repositories.client.modules.query_operations import (
+    QueryOperations as ClientQueryOperations,
+)
+from planificador.repositories.employee.modules.query_operations import (
+    QueryOperations as EmployeeQueryOperations,
+)
+from planificador.repositories.project.modules.query_operations import (
+    QueryOperations as ProjectQueryOperations,
+)
+from planificador.repositories.projections import (
+    SCHEDULE_SUMMARY,
+    defer_heavy_columns,
+    hours_between,
+)
+from planificador.repositories.schedule.modules import ScheduleQueryModule
+from planificador.repositories.workload.modules import WorkloadQueryModule
+from planificador.schemas.response import (
+    ClientListResponse,
+    EmployeeListResponse,
+    ScheduleListResponse,
+)
+
+
+def _concrete(module_class):
+    """Subclase instanciable de un módulo que no implementa toda su interfaz."""
+    concrete = type(module_class.__name__, (module_class,), {})
+    concrete.__abstractmethods__ = frozenset()
+    return concrete
+
+
+@pytest.fixture
+def engine(isolated_engine):
+    return isolated_engine
+
+
+@pytest.fixture
+async def session(engine):
+    """Sesión con dos empleados, un proyecto, horarios y cargas de trabajo."""
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        client = Client(name="Cliente", code="CLI", notes="n" * 1000)
+        ana = Employee(first_name="Ana", last_name="Pérez", full_name="Ana Pérez",
+                       employee_code="E01", department="Mecánica",
+                       skills=["soldadura"] * 100, notes="n" * 1000)
+        luis = Employee(first_name="Luis", last_name="Gómez", full_name="Luis Gómez",
+                        employee_code="E02", status=EmployeeStatus.INACTIVE)
+        status = StatusCode(code="VAL", name="Validado")
+        session.add_all([client, ana, luis, status])
+        await session.flush()
+        project = Project(reference="FR-TRN2102", trigram="TRN", name="Tricastin",
+                          client_id=client.id, details="d" * 1000)
+        session.add(project)
+        await session.flush()
+        session.add_all([
+            Schedule(employee_id=ana.id, project_id=project.id, status_code_id=status.id,
+                     date=date(2024, 1, 2), start_time=time(8), end_time=time(16, 30),
+                     notes="n" * 1000),
+            Schedule(employee_id=luis.id, project_id=project.id, date=date(2024, 1, 1)),
+            Workload(employee_id=ana.id, project_id=project.id, date=date(2024, 1, 2),
+                     week_number=1, month=1, year=2024, planned_hours=Decimal("8"),
+                     is_billable=True),
+        ])
+        await session.commit()
+        yield session
+
+
+def _capture_statements(engine):
+    """Registra el SQL ejecutado sobre el engine."""
+    statements = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    return statements
+
+
+class TestSummaryProjections:
+    """Tests para los listados proyectados de cada repositorio."""
+
+    async def test_employee_summaries_select_only_view_columns(self, engine, session):
+        statements = _capture_statements(engine)
+
+        items = await EmployeeQueryOperations(session).list_employee_summaries(
+            status=EmployeeStatus.ACTIVE
+        )
+
+        assert [type(item) for item in items] == [EmployeeListResponse]
+        assert items[0].full_name == "Ana Pérez"
+        assert items[0].department == "Mecánica"
+        sql = statements[-1]
+        assert "skills" not in sql and "notes" not in sql
+
+    async def test_project_summaries_join_client_name(self, session):
+        items = await ProjectQueryOperations(session).list_project_summaries()
+
+        assert [(item.reference, item.client_name) for item in items] == [
+            ("FR-TRN2102", "Cliente")
+        ]
+
+    async def test_client_summaries_count_projects(self, session):
+        items = await _concrete(ClientQueryOperations)(session).list_client_summaries()
+
+        assert items == [ClientListResponse(id=items[0].id, name="Cliente", projects_count=1)]
+
+    async def test_schedule_summaries_with_names_and_hours(self, session):
+        items = await ScheduleQueryModule(session).list_schedule_summaries(
+            start_date=date(2024, 1, 1), end_date=date(2024, 1, 31)
+        )
+
+        assert [(item.date, item.employee_name) for item in items] == [
+            (date(2024, 1, 1), "Luis Gómez"),
+            (date(2024, 1, 2), "Ana Pérez"),
+        ]
+        assert items[1].status_code == "VAL"
+        assert items[1].project_name == "Tricastin"
+        assert items[1].hours_worked == Decimal("8.50")
+        assert items[0].hours_worked is None
+        assert items[0].status_code is None
+
+    async def test_workload_summaries(self, session):
+        items = await _concrete(WorkloadQueryModule)(session).list_workload_summaries(
+            employee_id=1
+        )
+
+        assert [(item.employee_name, item.project_name, item.planned_hours) for item in items] == [
+            ("Ana Pérez", "Tricastin", Decimal("8"))
+        ]
+
+    async def test_pagination(self, session):
+        page = await SCHEDULE_SUMMARY.fetch(session, limit=1, offset=1)
+
+        assert [type(item) for item in page] == [ScheduleListResponse]
+        assert page[0].employee_name == "Ana Pérez"
+
+
+class TestDeferredHeavyColumns:
+    """Tests para el diferido de columnas pesadas en cargas de entidades."""
+
+    async def test_get_all_defers_heavy_columns(self, session):
+        session.expunge_all()
+        repository = _concrete(BaseRepository)(session, Employee)
+
+        employees = await repository.get_all(defer_heavy=True)
+
+        unloaded = inspect(employees[0]).unloaded
+        assert {"skills", "certifications", "special_training", "notes"} <= unloaded
+        assert "full_name" not in unloaded
+
+    def test_models_without_heavy_columns(self):
+        assert defer_heavy_columns(StatusCode) == []
+
+    def test_hours_between_crosses_midnight(self):
+        assert hours_between(time(22), time(6)) == Decimal("8.00")
+        assert hours_between(None, time(6)) is None
@@ -0,0 +1,130 @@
+"""Tests para FusedAggregate.
+
+Este módulo verifica que las métricas condicionales se calculan en una
+única consulta y que los reportes migrados devuelven los mismos datos.
+"""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from planificador.models.alert import Alert, AlertStatus, AlertType
+from planificador.models.client import Client
+from planificador.models.employee import Employee
+from planificador.repositories.alert.modules.statistics_operations import (
+    StatisticsOperations as AlertStatisticsOperations,
+)
+from planificador.repositories.client.modules.statistics_operations import (
+    StatisticsOperations as ClientStatisticsOperations,
+)
+from planificador.repositories.query_fusion import FusedAggregate
+
+
+def _concrete(module_class):
+    """Subclase instanciable de un módulo que no implementa toda su interfaz."""
+    concrete = type(module_class.__name__, (module_class,), {})
+    concrete.__abstractmethods__ = frozenset()
+    return concrete
+
+
+@pytest.fixture
+def engine(isolated_engine):
+    """Engine SQLite en memoria con las tablas creadas."""
+    return isolated_engine
+
+
+@pytest.fixture
+async def session(engine):
+    """Sesión con clientes y alertas de ejemplo."""
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add_all([
+            Client(name="Alfa", code="A", is_active=True),
+            Client(name="Beta", code="B", is_active=True),
+            Client(name="Gamma", code="C", is_active=False),
+        ])
+        employee = Employee(first_name="Ana", last_name="Pérez", full_name="Ana Pérez")
+        session.add(employee)
+        await session.flush()
+        session.add_all([
+            Alert(user_id=employee.id, alert_type=AlertType.CONFLICT,
+                  status=AlertStatus.NEW, title="a", message="a"),
+            Alert(user_id=employee.id, alert_type=AlertType.CONFLICT,
+                  status=AlertStatus.RESOLVED, title="b", message="b"),
+            Alert(user_id=employee.id, alert_type=AlertType.SYSTEM_ERROR,
+                  status=AlertStatus.NEW, title="c", message="c"),
+        ])
+        await session.flush()
+        yield session
+
+
+@pytest.fixture
+def statements(engine):
+    """Lista con las sentencias SQL ejecutadas a partir de este punto."""
+    executed = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    yield executed
+    event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
+class TestFusedAggregate:
+    """Tests para el constructor de métricas fusionadas."""
+
+    async def test_conditional_metrics_in_one_statement(self, session, statements):
+        metrics = await (
+            FusedAggregate(Client)
+            .count("total")
+            .count("active", Client.is_active == True)
+            .count("active_named_a", Client.is_active == True, Client.name == "Alfa")
+            .count_distinct("codes", Client.code, Client.is_active == True)
+            .sum("ids", Client.id, Client.is_active == False)
+            .min("first", Client.name)
+            .max("last", Client.name)
+            .execute(session)
+        )
+
+        assert metrics == {
+            "total": 3, "active": 2, "active_named_a": 1, "codes": 2,
+            "ids": 3, "first": "Alfa", "last": "Gamma",
+        }
+        assert len(statements) == 1
+
+    async def test_count_each_and_defaults_on_empty_selection(self, session):
+        metrics = await (
+            FusedAggregate(Alert, Alert.title == "no existe")
+            .count("total")
+            .sum("ids", Alert.id)
+            .avg("avg_id", Alert.id)
+            .count_each("by_status", Alert.status, list(AlertStatus))
+            .execute(session)
+        )
+
+        assert metrics["total"] == 0
+        assert metrics["ids"] == 0
+        assert metrics["avg_id"] is None
+        assert metrics["by_status"] == {status.value: 0 for status in AlertStatus}
+
+    def test_statement_requires_metrics(self):
+        with pytest.raises(ValueError):
+            FusedAggregate(Client).statement()
+
+
+class TestFusedReports:
+    """Tests para los reportes migrados a una sola pasada."""
+
+    async def test_weekly_alert_statistics(self, session, statements):
+        stats = await AlertStatisticsOperations(session).get_weekly_statistics()
+
+        assert stats["total_alerts"] == 3
+        assert stats["by_status"] == {"new": 2, "resolved": 1}
+        assert stats["by_type"] == {"conflict": 2, "system_error": 1}
+        assert len(statements) == 1
+
+    async def test_client_counts_by_status(self, session, statements):
+        counts = await _concrete(ClientStatisticsOperations)(session).get_client_counts_by_status()
+
+        assert counts == {"active": 2, "inactive": 1}
+        assert len(statements) == 1
@@ -0,0 +1,195 @@
+"""Tests para el libro de saldos de vacaciones.
+
+Este módulo verifica que las filas de ``VacationBalance`` se mantienen en
+la misma transacción que las vacaciones: altas, aprobaciones y rechazos
+(también sobre instancias expiradas), cambios de días, bajas, inserciones
+y actualizaciones en bloque, y la reconstrucción desde el histórico.
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import delete, event, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from planificador.models.employee import Employee
+from planificador.models.vacation import Vacation, VacationStatus, VacationType
+from planificador.models.vacation_balance import VacationBalance
+from planificador.repositories.vacation_ledger import (
+    BalanceDeltas,
+    apply_balance_deltas,
+    rebuild_vacation_balances,
+)
+
+
+def _vacation(employee_id, start, days, vacation_type=VacationType.ANNUAL, **kwargs):
+    return Vacation(
+        employee_id=employee_id,
+        start_date=start,
+        end_date=date.fromordinal(start.toordinal() + days - 1),
+        vacation_type=vacation_type,
+        requested_date=date(2024, 1, 1),
+        total_days=days,
+        business_days=kwargs.pop("business_days", days),
+        **kwargs
+    )
+
+
+@pytest.fixture
+async def session(isolated_engine):
+    """Sesión sobre una base en memoria propia, con expiración tras el commit."""
+    async with AsyncSession(isolated_engine) as session:
+        session.add(Employee(first_name="Ana", last_name="Pérez", employee_code="E01"))
+        await session.commit()
+        yield session
+
+
+async def _ledger(session: AsyncSession):
+    result = await session.execute(
+        select(
+            VacationBalance.employee_id,
+            VacationBalance.year,
+            VacationBalance.vacation_type,
+            VacationBalance.status,
+            VacationBalance.request_count,
+            VacationBalance.total_days,
+            VacationBalance.business_days,
+        )
+        .where(VacationBalance.request_count != 0)
+        .order_by(VacationBalance.year, VacationBalance.vacation_type, VacationBalance.status)
+    )
+    return [tuple(row) for row in result.all()]
+
+
+class TestVacationBalanceLedger:
+    """Tests para el mantenimiento transaccional del libro."""
+
+    async def test_create_and_approve(self, session: AsyncSession):
+        employee_id = 1
+        vacation = _vacation(employee_id, date(2024, 7, 1), 5, business_days=3)
+        session.add_all([vacation, _vacation(employee_id, date(2024, 8, 1), 2)])
+        await session.commit()
+
+        assert await _ledger(session) == [
+            (employee_id, 2024, VacationType.ANNUAL, VacationStatus.PENDING, 2, 7, 5),
+        ]
+
+        # La instancia está expirada tras el commit: el estado anterior se lee de la BD
+        vacation.status = VacationStatus.APPROVED
+        await session.commit()
+
+        assert await _ledger(session) == [
+            (employee_id, 2024, VacationType.ANNUAL, VacationStatus.APPROVED, 1, 5, 3),
+            (employee_id, 2024, VacationType.ANNUAL, VacationStatus.PENDING, 1, 2, 2),
+        ]
+
+    async def test_reject_edit_and_delete(self, session: AsyncSession):
+        employee_id = 1
+        vacation = _vacation(employee_id, date(2024, 12, 30), 4, VacationType.PERSONAL)
+        session.add(vacation)
+        await session.flush()
+
+        vacation.status = VacationStatus.REJECTED
+        vacation.total_days = 3
+        await session.flush()
+        assert await _ledger(session) == [
+            (employee_id, 2024, VacationType.PERSONAL, VacationStatus.REJECTED, 1, 3, 4),
+        ]
+
+        # El año del saldo es el del inicio de la vacación
+        vacation.start_date = date(2025, 1, 2)
+        await session.flush()
+        assert [row[1] for row in await _ledger(session)] == [2025]
+
+        await session.delete(vacation)
+        await session.commit()
+        assert await _ledger(session) == []
+
+    async def test_rollback_discards_ledger_changes(self, session: AsyncSession):
+        session.add(_vacation(1, date(2024, 7, 1), 5))
+        await session.flush()
+        assert len(await _ledger(session)) == 1
+
+        await session.rollback()
+        assert await _ledger(session) == []
+
+    async def test_bulk_statements(self, session: AsyncSession):
+        employee_id = 1
+        await session.execute(insert(Vacation), [
+            {"employee_id": employee_id, "start_date": date(2024, 3, day), "end_date": date(2024, 3, day),
+             "vacation_type": VacationType.SICK, "requested_date": date(2024, 3, 1),
+             "total_days": 1, "business_days": 1}
+            for day in range(1, 4)
+        ])
+        assert await _ledger(session) == [
+            (employee_id, 2024, VacationType.SICK, VacationStatus.PENDING, 3, 3, 3),
+        ]
+
+        # Las sentencias sin filas conocidas reconstruyen el libro tras ejecutarse
+        await session.execute(
+            update(Vacation)
+            .where(Vacation.start_date > date(2024, 3, 1))
+            .values(status=VacationStatus.APPROVED)
+        )
+        assert await _ledger(session) == [
+            (employee_id, 2024, VacationType.SICK, VacationStatus.APPROVED, 2, 2, 2),
+            (employee_id, 2024, VacationType.SICK, VacationStatus.PENDING, 1, 1, 1),
+        ]
+
+        await session.execute(delete(Vacation))
+        assert await _ledger(session) == []
+
+    async def test_rebuild_matches_incremental_ledger(self, session: AsyncSession):
+        employee_id = 1
+        session.add_all([
+            _vacation(employee_id, date(2023, 5, 1), 3, status=VacationStatus.APPROVED),
+            _vacation(employee_id, date(2024, 5, 1), 2),
+            _vacation(employee_id, date(2024, 6, 1), 1, VacationType.TRAINING),
+        ])
+        await session.commit()
+        incremental = await _ledger(session)
+
+        await session.execute(delete(VacationBalance))
+        await session.run_sync(
+            lambda session: rebuild_vacation_balances(session.connection(), years=[2024])
+        )
+        assert await _ledger(session) == incremental[1:]
+
+        await session.run_sync(lambda session: rebuild_vacation_balances(session.connection()))
+        assert await _ledger(session) == incremental
+
+    async def test_deltas_are_applied_with_one_upsert_per_key(self, session: AsyncSession):
+        deltas = BalanceDeltas()
+        values = {"employee_id": 1, "start_date": date(2024, 7, 1), "vacation_type": VacationType.ANNUAL,
+                  "status": VacationStatus.APPROVED, "total_days": 5, "business_days": 3}
+        deltas.add(values)
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            for _ in range(2):
+                await session.run_sync(lambda session: apply_balance_deltas(session.connection(), deltas))
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(statements) == 2
+        assert all("ON CONFLICT" in statement for statement in statements)
+        assert await _ledger(session) == [
+            (1, 2024, VacationType.ANNUAL, VacationStatus.APPROVED, 2, 10, 6),
+        ]
+
+    async def test_balance_key_is_unique(self, session: AsyncSession):
+        for _ in range(2):
+            session.add(VacationBalance(
+                employee_id=1,
+                year=2024,
+                vacation_type=VacationType.ANNUAL,
+                status=VacationStatus.APPROVED,
+            ))
+        with pytest.raises(IntegrityError):
+            await session.flush()
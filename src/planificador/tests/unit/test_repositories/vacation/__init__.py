@@ -0,0 +1 @@
+# src/planificador/tests/unit/test_repositories/vacation/__init__.py
@@ -0,0 +1,184 @@
+"""Tests para la aprobación en lote de vacaciones.
+
+Este módulo verifica ``approve_pending_batch`` sobre una base en memoria:
+solapamientos con vacaciones ya aprobadas y con las aprobadas antes en el
+mismo lote, cobertura mínima por equipo (y sus mínimos específicos), días
+no laborables y simulación sin cambios.
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+
+from planificador.models.employee import Employee
+from planificador.models.team import Team
+from planificador.models.team_membership import TeamMembership
+from planificador.models.vacation import Vacation, VacationStatus, VacationType
+from planificador.models.vacation_balance import VacationBalance
+from planificador.tests.utils.imports import import_module_directly
+
+VacationApprovalModule = import_module_directly(
+    "planificador.repositories.vacation.modules.approval_module"
+).VacationApprovalModule
+
+# Semana laborable del lunes 1 al viernes 5 de julio de 2024
+_MONDAY = date(2024, 7, 1)
+
+
+def _vacation(employee, start, end, status=VacationStatus.PENDING, requested_day=1):
+    days = (end - start).days + 1
+    return Vacation(
+        employee_id=employee.id,
+        start_date=start,
+        end_date=end,
+        vacation_type=VacationType.ANNUAL,
+        status=status,
+        requested_date=date(2024, 6, requested_day),
+        total_days=days,
+        business_days=days,
+    )
+
+
+@pytest.fixture
+async def staff(isolated_session):
+    """Equipo de tres personas y un empleado sin equipo."""
+    team = Team(name="Montaje", code="MON")
+    employees = [
+        Employee(first_name=name, last_name="Pérez", employee_code=f"E{number}")
+        for number, name in enumerate(("Ana", "Luis", "Marta", "Pablo"), start=1)
+    ]
+    isolated_session.add_all([team, *employees])
+    await isolated_session.flush()
+    isolated_session.add_all([
+        TeamMembership(employee_id=employee.id, team_id=team.id, start_date=date(2024, 1, 1))
+        for employee in employees[:3]
+    ])
+    await isolated_session.commit()
+    return team, employees
+
+
+async def _add(session, *vacations):
+    session.add_all(vacations)
+    await session.commit()
+    return [vacation.id for vacation in vacations]
+
+
+async def _statuses(session, ids):
+    session.expire_all()
+    result = await session.execute(select(Vacation.id, Vacation.status).where(Vacation.id.in_(ids)))
+    return dict(result.all())
+
+
+class TestApprovePendingBatch:
+    """Tests para las decisiones del lote."""
+
+    async def test_overlap_with_already_approved_vacation(self, isolated_session, staff):
+        _, (ana, *_) = staff
+        _, pending = await _add(
+            isolated_session,
+            _vacation(ana, _MONDAY, date(2024, 7, 3), status=VacationStatus.APPROVED),
+            _vacation(ana, date(2024, 7, 3), date(2024, 7, 5)),
+        )
+
+        result = await VacationApprovalModule(isolated_session).approve_pending_batch(
+            _MONDAY, date(2024, 7, 31)
+        )
+
+        assert result['approved'] == []
+        assert [(r['vacation_id'], r['code']) for r in result['rejected']] == [
+            (pending, 'OVERLAPPING_VACATION')
+        ]
+        assert (await _statuses(isolated_session, [pending]))[pending] == VacationStatus.REJECTED
+
+    async def test_overlap_with_request_approved_earlier_in_batch(self, isolated_session, staff):
+        _, employees = staff
+        pablo = employees[3]
+        first, second = await _add(
+            isolated_session,
+            _vacation(pablo, _MONDAY, date(2024, 7, 5), requested_day=1),
+            _vacation(pablo, date(2024, 7, 4), date(2024, 7, 10), requested_day=2),
+        )
+
+        result = await VacationApprovalModule(isolated_session).approve_pending_batch(
+            _MONDAY, date(2024, 7, 31), approved_by="rrhh"
+        )
+
+        assert result['approved'] == [first]
+        assert [(r['vacation_id'], r['code']) for r in result['rejected']] == [
+            (second, 'OVERLAPPING_VACATION')
+        ]
+        assert await _statuses(isolated_session, [first, second]) == {
+            first: VacationStatus.APPROVED, second: VacationStatus.REJECTED
+        }
+
+    async def test_min_staff_counts_requests_approved_in_batch(self, isolated_session, staff):
+        team, (ana, luis, *_) = staff
+        first, second = await _add(
+            isolated_session,
+            _vacation(ana, _MONDAY, date(2024, 7, 2), requested_day=1),
+            _vacation(luis, date(2024, 7, 2), date(2024, 7, 3), requested_day=2),
+        )
+
+        result = await VacationApprovalModule(isolated_session).approve_pending_batch(
+            _MONDAY, date(2024, 7, 31), min_staff=2
+        )
+
+        assert result['approved'] == [first]
+        rejection, = result['rejected']
+        assert rejection['vacation_id'] == second
+        assert rejection['code'] == 'INSUFFICIENT_COVERAGE'
+        assert (rejection['team_id'], rejection['date']) == (team.id, '2024-07-02')
+
+    async def test_team_minimum_overrides_min_staff(self, isolated_session, staff):
+        team, (ana, luis, *_) = staff
+        ids = await _add(
+            isolated_session,
+            _vacation(ana, _MONDAY, date(2024, 7, 2), requested_day=1),
+            _vacation(luis, date(2024, 7, 2), date(2024, 7, 3), requested_day=2),
+        )
+
+        result = await VacationApprovalModule(isolated_session).approve_pending_batch(
+            _MONDAY, date(2024, 7, 31), min_staff=2, team_minimums={team.id: 1}
+        )
+
+        assert result['approved'] == ids
+        assert result['rejected'] == []
+
+    async def test_non_working_days_are_ignored(self, isolated_session, staff):
+        _, (ana, luis, marta, _) = staff
+        # Sábado 6, domingo 7 y el festivo fijo del martes 16 de julio
+        ids = await _add(
+            isolated_session,
+            _vacation(ana, date(2024, 7, 6), date(2024, 7, 7), requested_day=1),
+            _vacation(luis, date(2024, 7, 6), date(2024, 7, 7), requested_day=2),
+            _vacation(marta, date(2024, 7, 16), date(2024, 7, 16), requested_day=3),
+            _vacation(luis, date(2024, 7, 16), date(2024, 7, 16), requested_day=4),
+        )
+
+        result = await VacationApprovalModule(isolated_session).approve_pending_batch(
+            _MONDAY, date(2024, 7, 31), min_staff=2
+        )
+
+        assert result['approved'] == ids
+        assert result['rejected'] == []
+
+    async def test_dry_run_leaves_database_unchanged(self, isolated_session, staff):
+        _, (ana, luis, *_) = staff
+        ids = await _add(
+            isolated_session,
+            _vacation(ana, _MONDAY, date(2024, 7, 2), requested_day=1),
+            _vacation(luis, _MONDAY, date(2024, 7, 2), requested_day=2),
+        )
+
+        result = await VacationApprovalModule(isolated_session).approve_pending_batch(
+            _MONDAY, date(2024, 7, 31), min_staff=2, dry_run=True
+        )
+
+        assert result['dry_run']
+        assert result['summary'] == {'evaluated': 2, 'approved': 1, 'rejected': 1}
+        assert not isolated_session.dirty
+        await isolated_session.commit()
+        assert await _statuses(isolated_session, ids) == dict.fromkeys(ids, VacationStatus.PENDING)
+        statuses = await isolated_session.scalars(select(VacationBalance.status).distinct())
+        assert list(statuses) == [VacationStatus.PENDING]
@@ -0,0 +1 @@
+# Tests para el repositorio de cargas de trabajo
@@ -0,0 +1,210 @@
+"""Tests para las estadísticas de cargas de trabajo.
+
+Este módulo verifica que las estadísticas usan las columnas reales del
+modelo (horas planificadas y reales, fecha y columnas de período), que la
+desviación se calcula en la misma pasada, que las semanas ISO que cruzan
+el año se agrupan correctamente y que las tendencias de años de datos se
+resuelven con el índice cubriente de períodos.
+"""
+
+import time as perf
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import insert, text
+
+from planificador.exceptions.validation import ValidationError
+from planificador.models.client import Client
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.models.team import Team
+from planificador.models.team_membership import TeamMembership
+from planificador.models.workload import Workload
+from planificador.repositories.workload.modules import (
+    WorkloadStatisticsModule,
+    WorkloadValidationModule,
+)
+
+
+def _concrete(module_class):
+    """Subclase instanciable de un módulo que no implementa toda su interfaz."""
+    concrete = type(module_class.__name__, (module_class,), {})
+    concrete.__abstractmethods__ = frozenset()
+    return concrete
+
+
+def _row(employee_id, day, planned, actual=None, project_id=1, billable=False):
+    return {
+        "employee_id": employee_id,
+        "project_id": project_id,
+        "date": day,
+        "week_number": day.isocalendar().week,
+        "month": day.month,
+        "year": day.year,
+        "planned_hours": Decimal(planned),
+        "actual_hours": None if actual is None else Decimal(actual),
+        "is_billable": billable,
+    }
+
+
+@pytest.fixture
+async def session(isolated_session):
+    """Sesión con dos empleados (uno en un equipo) y dos proyectos."""
+    client = Client(name="Cliente", code="CLI")
+    ana = Employee(first_name="Ana", last_name="Pérez", employee_code="E01")
+    luis = Employee(first_name="Luis", last_name="Gómez", employee_code="E02",
+                    weekly_hours=20)
+    team = Team(name="Equipo")
+    isolated_session.add_all([client, ana, luis, team])
+    await isolated_session.flush()
+    isolated_session.add_all([
+        Project(reference="FR-TRN2102", trigram="TRN", name="Tricastin", client_id=client.id),
+        Project(reference="FR-BUG0001", trigram="BUG", name="Bugey", client_id=client.id),
+        TeamMembership(employee_id=ana.id, team_id=team.id, start_date=date(2024, 1, 1)),
+    ])
+    await isolated_session.commit()
+    return isolated_session
+
+
+async def _seed(session, rows):
+    await session.execute(insert(Workload), rows)
+    await session.commit()
+
+
+class TestWorkloadStatistics:
+    """Tests para los resúmenes por empleado, proyecto y equipo."""
+
+    async def test_employee_statistics_with_variance(self, session):
+        await _seed(session, [
+            _row(1, date(2024, 1, 2), "8", "10", billable=True),
+            _row(1, date(2024, 1, 3), "8", "6", project_id=2),
+            _row(1, date(2024, 1, 4), "4"),
+            _row(2, date(2024, 1, 2), "4", "4"),
+        ])
+
+        statistics = await WorkloadStatisticsModule(session).get_employee_workload_statistics(1)
+
+        summary = statistics["summary"]
+        assert summary["workloads"] == 3 and summary["reported_workloads"] == 2
+        assert (summary["planned_hours"], summary["actual_hours"]) == (20.0, 16.0)
+        # La desviación solo compara cargas con horas reales: 16 frente a 16
+        assert summary["variance_hours"] == 0.0
+        assert summary["variance_percentage"] == 0.0
+        assert (summary["over_planned"], summary["under_planned"]) == (1, 1)
+        assert summary["first_workload_date"] == "2024-01-02"
+        assert statistics["by_project"][2]["variance_hours"] == -2.0
+        assert statistics["by_billable"]["billable"]["variance_percentage"] == 25.0
+
+    async def test_project_and_team_statistics(self, session):
+        await _seed(session, [
+            _row(1, date(2024, 1, 2), "8", "9"),
+            _row(2, date(2024, 1, 2), "4", "4"),
+            # Antes de la membresía de Ana en el equipo
+            _row(1, date(2023, 12, 29), "8", "8"),
+        ])
+        module = WorkloadStatisticsModule(session)
+
+        project = await module.get_project_workload_statistics(1, date(2024, 1, 1))
+        assert project["summary"]["unique_employees"] == 2
+        assert project["by_employee"][1]["variance_hours"] == 1.0
+
+        team = await module.get_team_workload_statistics(1)
+        assert team["summary"]["workloads"] == 1
+        assert list(team["by_employee"]) == [1]
+        assert await module.get_team_total_hours(1, date(2023, 1, 1), date(2024, 12, 31)) == 9.0
+        assert await module.get_employee_average_hours(1, date(2023, 1, 1), date(2024, 12, 31)) == 8.5
+
+    async def test_capacity_and_peaks(self, session):
+        await _seed(session, [
+            _row(1, date(2024, 1, 2), "8", "8"),
+            _row(2, date(2024, 1, 2), "2", "4"),
+            _row(1, date(2024, 1, 9), "2"),
+        ])
+        module = WorkloadStatisticsModule(session)
+
+        capacity = await module.get_capacity_utilization(date(2024, 1, 1), date(2024, 1, 31))
+        # 8 + 4 + 8 horas de jornada diaria
+        assert capacity["capacity_hours"] == 20.0
+        assert capacity["planned_utilization_percentage"] == 60.0
+
+        peaks = await module.get_peak_workload_periods(date(2024, 1, 1), date(2024, 1, 31))
+        assert [peak["period"] for peak in peaks] == ["2024-W01"]
+
+
+class TestWorkloadTrends:
+    """Tests para tendencias y distribución por período."""
+
+    async def test_iso_weeks_across_years(self, session):
+        await _seed(session, [
+            _row(1, date(2024, 12, 30), "8", "8"),
+            _row(1, date(2025, 1, 2), "8", "7"),
+            _row(1, date(2027, 1, 1), "8"),
+        ])
+
+        analysis = await WorkloadStatisticsModule(session).get_workload_trends_analysis(
+            date(2024, 12, 1), date(2027, 1, 31), "weekly"
+        )
+
+        assert [trend["period"] for trend in analysis["trends"]] == ["2025-W01", "2026-W53"]
+        assert analysis["trends"][0]["workloads"] == 2
+        assert analysis["summary"]["variance_hours"] == -1.0
+        assert analysis["summary"]["planned_hours"] == 24.0
+
+    async def test_invalid_grouping_is_rejected(self, session):
+        with pytest.raises(ValidationError):
+            await WorkloadStatisticsModule(session).get_workload_trends_analysis(
+                date(2024, 1, 1), date(2024, 1, 31), "quarter"
+            )
+
+    async def test_distribution(self, session):
+        await _seed(session, [
+            _row(1, date(2024, 1, 1), "8", "8"),
+            _row(2, date(2024, 1, 1), "3"),
+            _row(1, date(2024, 1, 2), "10", billable=True),
+        ])
+
+        distribution = (
+            await WorkloadStatisticsModule(session).get_workload_distribution_analysis()
+        )["distribution"]
+
+        assert set(distribution["by_hours_range"]) == {"2-4 horas", "6-8 horas", "8+ horas"}
+        assert distribution["by_weekday"]["Lunes"]["planned_hours"] == 11.0
+        assert distribution["by_billable"]["billable"]["workloads"] == 1
+
+    async def test_years_of_data_use_covering_index(self, session):
+        start = date(2021, 1, 1)
+        rows = [
+            _row(employee_id, start + timedelta(days=offset), "8", "7.5")
+            for offset in range(3 * 365)
+            for employee_id in (1, 2)
+        ]
+        await _seed(session, rows)
+        module = WorkloadStatisticsModule(session)
+
+        began = perf.perf_counter()
+        analysis = await module.get_workload_trends_analysis(
+            start, date(2023, 12, 31), "monthly"
+        )
+        elapsed = perf.perf_counter() - began
+
+        assert elapsed < 1
+        assert len(analysis["trends"]) == 36
+        assert analysis["summary"]["variance_percentage"] == -6.25
+        plan = await session.execute(text(
+            "EXPLAIN QUERY PLAN SELECT year, month, sum(planned_hours), sum(actual_hours) "
+            "FROM workloads WHERE year >= 2021 AND date >= '2021-01-01' GROUP BY year, month"
+        ))
+        assert "COVERING INDEX ix_workloads_period" in " ".join(row[-1] for row in plan)
+
+
+class TestDailyHoursValidation:
+    """Tests para la validación de horas diarias sobre las columnas reales."""
+
+    async def test_daily_hours_limit(self, session):
+        await _seed(session, [_row(1, date(2024, 1, 2), "8", "9")])
+        validation = _concrete(WorkloadValidationModule)(session)
+
+        assert await validation.validate_employee_daily_hours(1, date(2024, 1, 2), 3)
+        with pytest.raises(ValidationError):
+            await validation.validate_employee_daily_hours(1, date(2024, 1, 2), 4)
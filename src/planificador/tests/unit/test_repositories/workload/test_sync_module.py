@@ -0,0 +1,175 @@
+"""Tests para la sincronización incremental de cargas de trabajo.
+
+Este módulo verifica el cálculo de las métricas derivadas de los horarios,
+el upsert por (empleado, fecha), el registro de cambios de la sesión y la
+sincronización por ``updated_at``.
+"""
+
+from datetime import date, datetime, time
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import delete, insert, select, update
+
+from planificador.models.client import Client
+from planificador.models.employee import Employee
+from planificador.models.project import Project
+from planificador.models.schedule import Schedule
+from planificador.models.workload import Workload
+from planificador.repositories.workload.modules import (
+    ScheduleChangeTracker,
+    WorkloadSyncModule,
+)
+
+_DAY = date(2024, 1, 2)
+
+
+@pytest.fixture
+async def session(isolated_session):
+    """Sesión con un empleado de 40 h, dos proyectos y horarios de un día."""
+    client = Client(name="Cliente", code="CLI")
+    ana = Employee(first_name="Ana", last_name="Pérez", employee_code="E01")
+    isolated_session.add_all([client, ana])
+    await isolated_session.flush()
+    isolated_session.add_all([
+        Project(reference="FR-TRN2102", trigram="TRN", name="Tricastin", client_id=client.id),
+        Project(reference="FR-BUG0001", trigram="BUG", name="Bugey", client_id=client.id),
+    ])
+    await isolated_session.flush()
+    isolated_session.add_all([
+        Schedule(employee_id=1, project_id=1, date=_DAY, start_time=time(8), end_time=time(10)),
+        Schedule(employee_id=1, project_id=2, date=_DAY, start_time=time(10), end_time=time(16)),
+    ])
+    await isolated_session.commit()
+    return isolated_session
+
+
+async def _workloads(session):
+    result = await session.execute(
+        select(Workload).order_by(Workload.employee_id, Workload.date)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().all()
+
+
+class TestWorkloadSync:
+    """Tests para el recálculo por pares."""
+
+    async def test_recompute_derives_metrics(self, session):
+        report = await WorkloadSyncModule(session).recompute([(1, _DAY)])
+
+        assert (report.created, report.updated, report.deleted) == (1, 0, 0)
+        [workload] = await _workloads(session)
+        assert workload.planned_hours == Decimal("8")
+        assert workload.project_id == 2
+        assert workload.utilization_percentage == Decimal("100.00")
+        assert (workload.week_number, workload.month, workload.year) == (1, 1, 2024)
+        assert workload.efficiency_score is None
+
+    async def test_upsert_keeps_actual_hours(self, session):
+        module = WorkloadSyncModule(session)
+        await module.recompute([(1, _DAY)])
+        await session.execute(update(Workload).values(actual_hours=Decimal("10"), notes="nota"))
+        await session.commit()
+
+        report = await module.recompute([(1, _DAY)])
+
+        assert (report.created, report.updated) == (0, 1)
+        [workload] = await _workloads(session)
+        assert workload.actual_hours == Decimal("10")
+        assert workload.notes == "nota"
+        expected = Workload(planned_hours=Decimal("8"), actual_hours=Decimal("10"))
+        assert float(workload.efficiency_score) == pytest.approx(
+            expected.calculate_efficiency_score()
+        )
+        assert workload.productivity_index == Decimal("125.00")
+
+    async def test_pair_without_schedules_is_removed(self, session):
+        module = WorkloadSyncModule(session)
+        await module.recompute([(1, _DAY), (1, date(2024, 1, 3))])
+        assert len(await _workloads(session)) == 1
+
+        await session.execute(Schedule.__table__.delete())
+        report = await module.recompute([(1, _DAY)])
+
+        assert report.deleted == 1
+        assert await _workloads(session) == []
+
+
+class TestChangeTracking:
+    """Tests para el registro de cambios y la sincronización incremental."""
+
+    async def test_tracker_collects_flush_and_bulk_changes(self, session):
+        tracker = ScheduleChangeTracker().attach(session)
+        schedule = await session.get(Schedule, 1)
+        schedule.date = date(2024, 1, 5)
+        session.add(Schedule(employee_id=1, project_id=1, date=date(2024, 1, 8)))
+        await session.flush()
+        await session.execute(insert(Schedule), [
+            {"employee_id": 1, "project_id": 1, "date": date(2024, 1, 9)},
+        ])
+
+        assert tracker.drain() == {
+            (1, _DAY), (1, date(2024, 1, 5)), (1, date(2024, 1, 8)), (1, date(2024, 1, 9)),
+        }
+        tracker.detach()
+
+    async def test_tracker_reads_statement_updates_and_deletes(self, session):
+        tracker = ScheduleChangeTracker().attach(session)
+
+        # Por clave primaria: fecha anterior y nueva
+        await session.execute(update(Schedule), [{"id": 1, "date": date(2024, 1, 4)}])
+        assert tracker.drain() == {(1, _DAY), (1, date(2024, 1, 4))}
+
+        await session.execute(
+            update(Schedule).where(Schedule.id == 2).values(date=date(2024, 1, 6))
+        )
+        assert tracker.drain() == {(1, _DAY), (1, date(2024, 1, 6))}
+
+        await session.execute(delete(Schedule).where(Schedule.id.in_([1, 2])))
+        assert tracker.drain() == {(1, date(2024, 1, 4)), (1, date(2024, 1, 6))}
+        assert await session.scalar(select(Schedule.id)) is None
+        tracker.detach()
+
+    async def test_session_tracker_is_shared(self, session):
+        tracker = ScheduleChangeTracker.for_session(session)
+
+        assert ScheduleChangeTracker.for_session(session) is tracker
+        await session.execute(delete(Schedule).where(Schedule.id == 1))
+        assert tracker.drain() == {(1, _DAY)}
+        tracker.detach()
+
+    async def test_sync_tracked_recomputes_only_touched_pairs(self, session):
+        module = WorkloadSyncModule(session)
+        await module.recompute([(1, _DAY)])
+        tracker = ScheduleChangeTracker().attach(session)
+
+        session.add(Schedule(employee_id=1, project_id=1, date=date(2024, 1, 3)))
+        report = await module.sync_tracked(tracker)
+
+        assert report.pairs == 1 and report.created == 1
+        workloads = await _workloads(session)
+        # Sin horas: jornada diaria de 40 / 5 = 8 h
+        assert workloads[1].planned_hours == Decimal("8")
+        tracker.detach()
+
+    async def test_sync_changed_since(self, session):
+        await session.execute(
+            update(Schedule).where(Schedule.id == 1).values(updated_at=datetime(2030, 1, 1))
+        )
+        await session.execute(
+            update(Schedule).where(Schedule.id == 2).values(updated_at=datetime(2020, 1, 1))
+        )
+
+        report = await WorkloadSyncModule(session).sync_changed_since(datetime(2029, 1, 1))
+
+        assert report.pairs == 1
+        [workload] = await _workloads(session)
+        assert workload.planned_hours == Decimal("8")
+
+    async def test_recompute_range(self, session):
+        report = await WorkloadSyncModule(session).recompute_range(
+            date(2024, 1, 1), date(2024, 1, 31)
+        )
+
+        assert report.pairs == 1 and report.created == 1
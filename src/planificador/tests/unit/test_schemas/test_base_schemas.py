@@ -7,6 +7,9 @@ del schema base que sirve como fundamento para todos los demás schemas
 del sistema.
 """
 
+from collections import namedtuple
+from typing import List
+
 import pytest
 from pydantic import BaseModel, ValidationError
 from planificador.schemas.base.base import BaseSchema
@@ -299,4 +302,66 @@ class TestBaseSchemaEdgeCases:
         
         orm_obj = MockORM()
         schema_instance = DerivedSchema.model_validate(orm_obj)
-        assert schema_instance.field == "orm_value"
\ No newline at end of file
+        assert schema_instance.field == "orm_value"
+
+class TestBaseSchemaBulkRows:
+    """Tests para la construcción de listados desde filas Row."""
+
+    @staticmethod
+    def _rows(*values):
+        Row = namedtuple("Row", ["id", "name", "extra"])
+        return [Row(*row) for row in values]
+
+    class ItemSchema(BaseSchema):
+        id: int
+        name: str
+        tags: List[str] = []
+        active: bool = True
+
+    def test_from_rows_maps_columns_and_defaults(self):
+        """Test que from_rows asigna columnas por nombre y aplica valores por defecto."""
+        items = self.ItemSchema.from_rows(self._rows((1, "uno", "x"), (2, "dos", "y")))
+
+        assert [item.model_dump() for item in items] == [
+            {"id": 1, "name": "uno", "tags": [], "active": True},
+            {"id": 2, "name": "dos", "tags": [], "active": True},
+        ]
+        assert items[0].model_fields_set == {"id", "name"}
+        items[0].tags.append("a")
+        assert items[1].tags == []
+
+    def test_from_rows_equals_model_validate(self):
+        """Test que from_rows produce lo mismo que model_validate."""
+        rows = self._rows((1, "uno", "x"))
+
+        assert self.ItemSchema.from_rows(rows) == [
+            self.ItemSchema.model_validate({"id": 1, "name": "uno"})
+        ]
+
+    def test_from_rows_instances_accept_assignment(self):
+        """Test que cada instancia de from_rows tiene su propio conjunto de campos."""
+        items = self.ItemSchema.from_rows(self._rows((1, "uno", "x"), (2, "dos", "y")))
+
+        items[0].name = "cambiado"
+        items[0].active = False
+
+        assert items[0].name == "cambiado"
+        assert items[0].model_fields_set == {"id", "name", "active"}
+        assert items[1].model_fields_set == {"id", "name"}
+
+    def test_validate_rows_validates(self):
+        """Test que validate_rows valida y convierte los valores."""
+        assert self.ItemSchema.validate_rows(self._rows(("3", "tres", None)))[0].id == 3
+
+        with pytest.raises(ValidationError):
+            self.ItemSchema.validate_rows(self._rows(("no", "tres", None)))
+
+    def test_empty_rows_and_json_dump(self):
+        """Test listas vacías y serialización en bloque."""
+        assert self.ItemSchema.from_rows([]) == []
+        assert self.ItemSchema.validate_rows([]) == []
+
+        items = self.ItemSchema.from_rows(self._rows((1, "uno", None)))
+        assert self.ItemSchema.dump_list_json(items) == (
+            b'[{"id":1,"name":"uno","tags":[],"active":true}]'
+        )
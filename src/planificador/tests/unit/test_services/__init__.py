@@ -1 +1,5 @@
-"""Tests unitarios para $($dir.Replace("test_", ""))."""`n
\ No newline at end of file
+"""Tests unitarios para servicios.
+
+Este módulo contiene tests para los servicios de infraestructura
+(logging, notificaciones y APIs externas).
+"""
@@ -0,0 +1,245 @@
+"""Tests para el cliente de APIs externas.
+
+Este módulo verifica el limitador GCRA (adquisición sin espera, espera
+máxima, devolución del turno al cancelar), los límites por endpoint del
+ApiClient y, contra un servidor aiohttp local, la caché con revalidación,
+la compartición de requests en curso y el límite de conexiones por host.
+"""
+
+import asyncio
+from collections import Counter
+
+import pytest
+from aiohttp import test_utils, web
+
+from planificador.exceptions.infrastructure import ExternalServiceError
+from planificador.tests.utils.imports import import_module_directly
+
+try:
+    api_module = import_module_directly("planificador.services.infrastructure.external_api_service")
+except ImportError as error:
+    pytest.skip(f"external_api_service no se puede importar: {error}", allow_module_level=True)
+
+ApiClient = api_module.ApiClient
+ApiRequest = api_module.ApiRequest
+HttpMethod = api_module.HttpMethod
+RateLimiter = api_module.RateLimiter
+ResponseCache = api_module.ResponseCache
+
+
+class FakeClock:
+    """Reloj monotónico controlado por el test."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ApiStub:
+    """Servidor HTTP local que cuenta las requests y retiene las lentas."""
+
+    def __init__(self):
+        self.hits = Counter()
+        self.conditional = 0
+        self.active = 0
+        self.max_active = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.url = ""
+
+    async def fresh(self, request):
+        self.hits["fresh"] += 1
+        return web.json_response({"n": self.hits["fresh"]}, headers={"Cache-Control": "max-age=60"})
+
+    async def stale(self, request):
+        self.hits["stale"] += 1
+        if request.headers.get("If-None-Match") == '"v1"':
+            self.conditional += 1
+            return web.Response(status=304, headers={"ETag": '"v1"', "Cache-Control": "no-cache"})
+        return web.json_response(
+            {"n": self.hits["stale"]}, headers={"ETag": '"v1"', "Cache-Control": "no-cache"}
+        )
+
+    async def slow(self, request):
+        self.hits["slow"] += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.started.set()
+        try:
+            await self.release.wait()
+        finally:
+            self.active -= 1
+        return web.json_response({"n": self.hits["slow"]})
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+async def stub():
+    stub = ApiStub()
+    app = web.Application()
+    app.router.add_get("/fresh", stub.fresh)
+    app.router.add_get("/stale", stub.stale)
+    app.router.add_get("/slow", stub.slow)
+    server = test_utils.TestServer(app)
+    await server.start_server()
+    stub.url = str(server.make_url("")).rstrip("/")
+    yield stub
+    stub.release.set()
+    await server.close()
+
+
+def _get(url: str, **kwargs):
+    return ApiRequest(HttpMethod.GET, url, retries=0, **kwargs)
+
+
+class TestRateLimiter:
+    """Tests para el limitador GCRA."""
+
+    def test_try_acquire_allows_burst_then_rate(self, clock):
+        limiter = RateLimiter(2, 1.0, clock=clock)
+
+        assert limiter.try_acquire()
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+
+        clock.now = 0.5
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+        assert limiter.get_stats()["wait_time"] == pytest.approx(0.5)
+
+    async def test_acquire_rejects_waits_above_max_wait(self, clock):
+        limiter = RateLimiter(1, 10.0, max_wait=1.0, clock=clock)
+
+        await limiter.acquire()
+        with pytest.raises(ExternalServiceError):
+            await limiter.acquire()
+
+        # El rechazo no consume turno
+        clock.now = 10.0
+        assert limiter.try_acquire()
+
+    async def test_cancelled_acquire_refunds_its_turn(self, clock):
+        limiter = RateLimiter(1, 10.0, clock=clock)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        clock.now = 10.0
+        assert limiter.try_acquire()
+
+
+class TestEndpointRateLimits:
+    """Tests para los límites por endpoint del cliente."""
+
+    def test_most_specific_prefix_wins(self):
+        client = ApiClient(base_url="https://api.example.com")
+        employees = client.set_endpoint_rate_limit("/employees", 10, 1.0)
+        vacations = client.set_endpoint_rate_limit("employees/vacations/", 2, 1.0)
+
+        assert client._get_endpoint_rate_limiter("/employees/7?full=1") is employees
+        assert client._get_endpoint_rate_limiter("employees/vacations/3") is vacations
+        assert client._get_endpoint_rate_limiter(
+            "https://api.example.com/employees"
+        ) is employees
+        assert client._get_endpoint_rate_limiter("/employees-archive") is None
+
+    async def test_endpoint_limit_is_acquired_before_client_limit(self, clock):
+        client = ApiClient(
+            base_url="http://127.0.0.1:9", rate_limiter=RateLimiter(1, 10.0, clock=clock)
+        )
+        endpoint = client.set_endpoint_rate_limit("/slow", 1, 10.0)
+        endpoint.max_wait = 0
+        assert endpoint.try_acquire()
+
+        async with client:
+            with pytest.raises(ExternalServiceError):
+                await client.make_request(ApiRequest(HttpMethod.GET, "/slow"))
+
+        # El rechazo del endpoint no gasta el turno del cliente
+        assert client.rate_limiter.try_acquire()
+
+    async def test_waiting_on_client_limit_refunds_endpoint_turn(self, clock):
+        client = ApiClient(
+            base_url="http://127.0.0.1:9", rate_limiter=RateLimiter(1, 10.0, clock=clock)
+        )
+        endpoint = client.set_endpoint_rate_limit("/slow", 1, 10.0)
+        assert client.rate_limiter.try_acquire()
+
+        async with client:
+            request = asyncio.create_task(client.make_request(ApiRequest(HttpMethod.GET, "/slow")))
+            await asyncio.sleep(0)
+            request.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await request
+
+        assert endpoint.try_acquire()
+
+
+class TestApiClientAgainstServer:
+    """Tests del ApiClient contra un servidor aiohttp local."""
+
+    async def test_fresh_responses_are_served_from_cache(self, stub):
+        cache = ResponseCache()
+        async with ApiClient(base_url=stub.url, cache=cache) as client:
+            first = await client.make_request(_get("/fresh"))
+            second = await client.make_request(_get("/fresh"))
+            uncached = await client.make_request(_get("/fresh", use_cache=False))
+
+        assert first.json_data == second.json_data == {"n": 1}
+        assert uncached.json_data == {"n": 2}
+        assert stub.hits["fresh"] == 2
+        assert cache.get_stats()["hits"] == 1
+
+    async def test_stale_entries_are_revalidated_with_etag(self, stub):
+        cache = ResponseCache()
+        async with ApiClient(base_url=stub.url, cache=cache) as client:
+            await client.make_request(_get("/stale"))
+            revalidated = await client.make_request(_get("/stale"))
+
+        assert revalidated.status_code == 200
+        assert revalidated.json_data == {"n": 1}
+        assert stub.conditional == 1
+        assert cache.get_stats()["revalidations"] == 1
+
+    async def test_identical_requests_share_one_call_and_survive_cancellation(self, stub):
+        async with ApiClient(base_url=stub.url, cache=ResponseCache()) as client:
+            owner = asyncio.create_task(client.make_request(_get("/slow")))
+            await asyncio.sleep(0)
+            waiters = [asyncio.create_task(client.make_request(_get("/slow"))) for _ in range(2)]
+            await stub.started.wait()
+
+            # Cancelar al llamador que lanzó la request no afecta a los demás
+            owner.cancel()
+            await asyncio.sleep(0)
+            stub.release.set()
+            responses = await asyncio.gather(*waiters)
+
+        assert owner.cancelled()
+        assert [response.json_data for response in responses] == [{"n": 1}, {"n": 1}]
+        assert stub.hits["slow"] == 1
+        assert client._inflight == {}
+
+    async def test_connections_per_host_are_limited(self, stub):
+        async with ApiClient(base_url=stub.url, connection_limit_per_host=2) as client:
+            assert client.session.connector.limit_per_host == 2
+            requests = [
+                asyncio.create_task(client.make_request(_get("/slow"))) for _ in range(5)
+            ]
+            await stub.started.wait()
+            await asyncio.sleep(0.05)
+            assert stub.active == 2
+            stub.release.set()
+            await asyncio.gather(*requests)
+
+        assert stub.hits["slow"] == 5
+        assert stub.max_active == 2
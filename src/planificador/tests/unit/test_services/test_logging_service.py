@@ -0,0 +1,41 @@
+"""Tests para el registro de métricas de consultas en LoggingService.
+
+Este módulo verifica que las operaciones de repositorio instrumentadas
+llegan a ``LoggingService.log_performance`` a través del listener de
+``query_instrumentation``.
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from planificador.database.instrumentation import QueryInstrumentation
+from planificador.tests.utils.imports import import_module_directly
+
+try:
+    logging_module = import_module_directly("planificador.services.infrastructure.logging_service")
+except ImportError as error:
+    pytest.skip(f"logging_service no se puede importar: {error}", allow_module_level=True)
+
+
+async def test_query_operations_are_logged_as_performance_metrics():
+    service = logging_module.logging_service
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrumentation = QueryInstrumentation(n_plus_one_threshold=1)
+    instrumentation.install(engine)
+    instrumentation.add_listener(service.log_query_operation)
+    try:
+        with instrumentation.operation("Items.load"):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                await conn.execute(text("SELECT 2"))
+    finally:
+        instrumentation.uninstall(engine)
+        await engine.dispose()
+
+    metrics = service.performance_metrics[-1]
+    assert metrics.operation == "Items.load"
+    assert metrics.success
+    assert metrics.duration_ms >= metrics.extra_metrics["db_time_ms"]
+    assert metrics.extra_metrics["statements"] == 2
+    assert metrics.extra_metrics["n_plus_one"] is True
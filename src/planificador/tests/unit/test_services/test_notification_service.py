@@ -0,0 +1,193 @@
+"""Tests para el envío de notificaciones por email.
+
+Este módulo verifica, contra un servidor SMTP local, que los emails se
+envían en lotes de una sesión, que el despacho respeta la prioridad y que
+un corte a mitad de lote solo reintenta los destinatarios no entregados.
+"""
+
+import asyncio
+
+import pytest
+
+from planificador.tests.utils.imports import import_module_directly
+
+try:
+    notification_module = import_module_directly(
+        "planificador.services.infrastructure.notification_service"
+    )
+except ImportError as error:
+    pytest.skip(f"notification_service no se puede importar: {error}", allow_module_level=True)
+
+EmailProvider = notification_module.EmailProvider
+NotificationContent = notification_module.NotificationContent
+NotificationPriority = notification_module.NotificationPriority
+NotificationRecipient = notification_module.NotificationRecipient
+NotificationRequest = notification_module.NotificationRequest
+NotificationService = notification_module.NotificationService
+NotificationStatus = notification_module.NotificationStatus
+NotificationType = notification_module.NotificationType
+
+
+class SmtpStub:
+    """Servidor SMTP mínimo que registra los destinatarios de cada email."""
+
+    def __init__(self):
+        self.delivered = []
+        self.sessions = 0
+        self.refused = set()
+        self.disconnect_after = None
+        self.port = 0
+
+    async def handle(self, reader, writer):
+        self.sessions += 1
+        session, accepted, recipients = self.sessions, 0, []
+        writer.write(b"220 stub ESMTP\r\n")
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            command = line.decode().strip()
+            verb = command[:4].upper()
+            if verb == "MAIL":
+                # Solo la primera sesión se corta tras ``disconnect_after`` emails
+                if session == 1 and self.disconnect_after is not None \
+                        and accepted >= self.disconnect_after:
+                    break
+                recipients = []
+                writer.write(b"250 OK\r\n")
+            elif verb == "RCPT":
+                address = command.split(":", 1)[1].strip().strip("<>")
+                if address in self.refused:
+                    writer.write(b"550 Mailbox unavailable\r\n")
+                else:
+                    recipients.append(address)
+                    writer.write(b"250 OK\r\n")
+            elif verb == "DATA":
+                writer.write(b"354 Fin con <CRLF>.<CRLF>\r\n")
+                while (await reader.readline()) not in (b".\r\n", b""):
+                    pass
+                self.delivered.extend(recipients)
+                accepted += 1
+                writer.write(b"250 OK\r\n")
+            elif verb == "QUIT":
+                writer.write(b"221 Adios\r\n")
+                break
+            else:
+                writer.write(b"250 stub\r\n")
+            await writer.drain()
+        writer.close()
+
+
+@pytest.fixture
+async def smtp():
+    stub = SmtpStub()
+    server = await asyncio.start_server(stub.handle, "127.0.0.1", 0)
+    stub.port = server.sockets[0].getsockname()[1]
+    yield stub
+    server.close()
+    await server.wait_closed()
+
+
+def _provider(smtp, batch_size=50):
+    return EmailProvider(
+        smtp_host="127.0.0.1", smtp_port=smtp.port, use_tls=False,
+        send_via_smtp=True, batch_size=batch_size, timeout=5,
+    )
+
+
+def _request(*addresses, priority=NotificationPriority.NORMAL):
+    return NotificationRequest(
+        notification_type=NotificationType.EMAIL,
+        recipients=[NotificationRecipient(identifier=address) for address in addresses],
+        content=NotificationContent(title="Planificación", body="Turno asignado"),
+        priority=priority,
+    )
+
+
+@pytest.fixture
+async def service(smtp):
+    service = NotificationService()
+    service.retry_delay = 0
+    yield service
+    await service.stop_dispatcher(drain=False)
+
+
+class TestEmailProvider:
+    """Tests para el envío SMTP por lotes."""
+
+    async def test_each_batch_uses_one_session(self, smtp):
+        addresses = [f"user{number}@example.com" for number in range(5)]
+        results = await _provider(smtp, batch_size=2).send_notification(_request(*addresses))
+
+        assert [result.status for result in results] == [NotificationStatus.SENT] * 5
+        assert smtp.delivered == addresses
+        assert smtp.sessions == 3
+
+    async def test_interrupted_session_reports_delivered_recipients(self, smtp):
+        smtp.disconnect_after = 2
+        addresses = [f"user{number}@example.com" for number in range(4)]
+        results = await _provider(smtp).send_notification(_request(*addresses))
+
+        statuses = {result.recipient.identifier: result.status for result in results}
+        assert statuses == {
+            "user0@example.com": NotificationStatus.SENT,
+            "user1@example.com": NotificationStatus.SENT,
+            "user2@example.com": NotificationStatus.FAILED,
+            "user3@example.com": NotificationStatus.FAILED,
+        }
+        assert all(result.provider_response["retryable"] for result in results[2:])
+
+
+class TestNotificationDispatch:
+    """Tests para el despacho en segundo plano."""
+
+    async def test_failure_midway_retries_only_undelivered_recipients(self, smtp, service):
+        smtp.disconnect_after = 2
+        smtp.refused.add("baja@example.com")
+        service.register_provider(NotificationType.EMAIL, _provider(smtp))
+        addresses = ["a@example.com", "b@example.com", "baja@example.com", "c@example.com"]
+
+        future = await service.enqueue_notification(_request(*addresses))
+        results = await future
+
+        statuses = {result.recipient.identifier: result.status for result in results}
+        assert statuses["baja@example.com"] == NotificationStatus.FAILED
+        assert [statuses[a] for a in ("a@example.com", "b@example.com", "c@example.com")] == [
+            NotificationStatus.SENT
+        ] * 3
+        # Nadie recibe el email dos veces
+        assert sorted(smtp.delivered) == ["a@example.com", "b@example.com", "c@example.com"]
+        assert smtp.sessions == 2
+        assert service.get_dispatch_stats()["retries"] == 1
+
+    async def test_batches_are_sent_in_priority_order(self, smtp, service):
+        service.register_provider(NotificationType.EMAIL, _provider(smtp))
+        await service.start_dispatcher(workers_per_provider=1)
+
+        futures = [
+            await service.enqueue_notification(_request("low@example.com", priority=NotificationPriority.LOW)),
+            await service.enqueue_notification(_request("normal@example.com")),
+            await service.enqueue_notification(
+                _request("urgent1@example.com", "urgent2@example.com", priority=NotificationPriority.URGENT),
+                batch_size=1,
+            ),
+        ]
+        await asyncio.gather(*futures)
+
+        assert smtp.delivered == [
+            "urgent1@example.com", "urgent2@example.com", "normal@example.com", "low@example.com"
+        ]
+
+    async def test_send_email_uses_dispatcher_while_running(self, smtp, service):
+        service.register_provider(NotificationType.EMAIL, _provider(smtp, batch_size=2))
+        await service.start_dispatcher(workers_per_provider=1)
+        smtp.disconnect_after = 1
+        addresses = [f"user{number}@example.com" for number in range(3)]
+
+        results = await service.send_email(addresses, "Planificación", "Turno asignado")
+
+        # El corte a mitad de lote se reintenta en los workers
+        assert [result.status for result in results] == [NotificationStatus.SENT] * 3
+        assert sorted(smtp.delivered) == addresses
+        stats = service.get_dispatch_stats()
+        assert (stats["enqueued"], stats["batches"], stats["retries"]) == (1, 2, 1)
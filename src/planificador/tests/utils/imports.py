@@ -0,0 +1,43 @@
+"""Importación de módulos cuyos paquetes no se pueden inicializar en testing."""
+
+import importlib
+import sys
+import types
+from pathlib import Path
+from types import ModuleType
+
+_SRC = Path(__file__).resolve().parents[3]
+
+
+def import_module_directly(name: str) -> ModuleType:
+    """Importa un módulo sin ejecutar el ``__init__`` de sus paquetes padre.
+
+    Algunos paquetes (p. ej. ``planificador.services``) reexportan en su
+    ``__init__`` módulos que dependen de componentes no disponibles en el
+    entorno de testing. Si la importación normal falla, se registran los
+    paquetes padre como paquetes vacíos que apuntan a su directorio y se
+    importa solo el módulo pedido con sus dependencias reales.
+
+    Args:
+        name: Nombre completo del módulo (``planificador.services.x.y``).
+
+    Returns:
+        El módulo importado.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        pass
+
+    parts = name.split(".")
+    for depth in range(1, len(parts)):
+        package_name = ".".join(parts[:depth])
+        package = sys.modules.get(package_name)
+        if package is not None and hasattr(package, "__path__"):
+            continue
+        package = types.ModuleType(package_name)
+        package.__path__ = [str(_SRC.joinpath(*parts[:depth]))]
+        sys.modules[package_name] = package
+        if depth > 1:
+            setattr(sys.modules[".".join(parts[:depth - 1])], parts[depth - 1], package)
+    return importlib.import_module(name)
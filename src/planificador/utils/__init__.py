@@ -9,6 +9,7 @@ validaciones, formateo de datos y constantes del sistema.
 
 Módulos:
     date_utils: Utilidades para manejo de fechas con Pendulum
+    business_calendar: Calendario laborable cacheado por configuración
     validators: Validaciones personalizadas
     formatters: Formateo de datos
     constants: Constantes del sistema
@@ -46,6 +47,7 @@ from .date_utils import (
     DateFormat,
     WeekDay
 )
+from .business_calendar import BusinessCalendar, get_business_calendar
 
 __all__ = [
     # Funciones de fecha y tiempo
@@ -78,4 +80,7 @@ __all__ = [
     "format_date_for_display",
     "DateFormat",
     "WeekDay",
+    # Calendario laborable
+    "BusinessCalendar",
+    "get_business_calendar",
 ]
\ No newline at end of file
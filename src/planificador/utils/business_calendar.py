@@ -0,0 +1,138 @@
+# src/planificador/utils/business_calendar.py
+
+"""
+Calendario de días laborables con tablas anuales precalculadas.
+
+Las funciones de ``date_utils`` recorren los días uno a uno y consultan la
+configuración en cada paso. Este módulo construye, una vez por año y por
+configuración (días hábiles y festivos fijos), una tabla con el número
+acumulado de días laborables y la lista de ordinales de esos días, de modo
+que:
+
+    - ``is_business_day`` y ``count`` (días laborables en un rango) son O(1)
+      por año recorrido
+    - ``end_of`` (fecha del N-ésimo día laborable desde una fecha) es O(1)
+      por año recorrido
+
+Los calendarios se cachean por configuración con ``get_business_calendar``.
+
+Ejemplos:
+    >>> calendar = get_business_calendar()
+    >>> calendar.count(date(2024, 1, 1), date(2024, 1, 31))
+    22
+    >>> calendar.end_of(date(2024, 1, 1), 5)
+    datetime.date(2024, 1, 8)
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+from ..config.config import get_settings
+from ..exceptions import ValidationError
+
+
+class BusinessCalendar:
+    """
+    Calendario laborable para una configuración de días hábiles y festivos.
+
+    Attributes:
+        business_days: Días hábiles de la semana (1=Lunes, 7=Domingo)
+        holidays: Festivos fijos en formato ``MM-DD``
+    """
+
+    def __init__(self, business_days: Iterable[int], holidays: Iterable[str]):
+        self.business_days = frozenset(business_days)
+        self.holidays = frozenset(holidays)
+        # Año -> (acumulados por día del año, ordinales de días laborables)
+        self._years: Dict[int, Tuple[List[int], List[int]]] = {}
+
+    def _year(self, year: int) -> Tuple[List[int], List[int]]:
+        """Tabla del año, construida la primera vez que se consulta."""
+        table = self._years.get(year)
+        if table is None:
+            cumulative = [0]
+            ordinals: List[int] = []
+            day = date(year, 1, 1)
+            while day.year == year:
+                if day.isoweekday() in self.business_days and day.strftime("%m-%d") not in self.holidays:
+                    ordinals.append(day.toordinal())
+                cumulative.append(len(ordinals))
+                day += timedelta(days=1)
+            table = self._years[year] = (cumulative, ordinals)
+        return table
+
+    def is_business_day(self, day: date) -> bool:
+        """Indica si la fecha es laborable."""
+        cumulative, _ = self._year(day.year)
+        index = day.timetuple().tm_yday
+        return cumulative[index] > cumulative[index - 1]
+
+    def count(self, start: date, end: date) -> int:
+        """Días laborables entre ``start`` y ``end``, ambos incluidos (0 si el rango está vacío)."""
+        if start > end:
+            return 0
+        total = 0
+        for year in range(start.year, end.year + 1):
+            cumulative, _ = self._year(year)
+            first = start.timetuple().tm_yday if year == start.year else 1
+            last = end.timetuple().tm_yday if year == end.year else len(cumulative) - 1
+            total += cumulative[last] - cumulative[first - 1]
+        return total
+
+    def end_of(self, start: date, days: int) -> date:
+        """
+        Fecha del ``days``-ésimo día laborable contando desde ``start`` (incluido).
+
+        Args:
+            start: Primer día del trabajo
+            days: Días laborables de trabajo (al menos 1)
+
+        Returns:
+            date: Último día laborable del trabajo
+
+        Raises:
+            ValidationError: Si ``days`` es menor que 1 o no hay días hábiles
+        """
+        if days < 1:
+            raise ValidationError(
+                message="El número de días laborables debe ser al menos 1",
+                field="days",
+                value=days
+            )
+        if not self.business_days:
+            raise ValidationError(
+                message="La configuración no tiene días hábiles",
+                field="business_days",
+                value=sorted(self.business_days)
+            )
+        year = start.year
+        cumulative, ordinals = self._year(year)
+        offset = cumulative[start.timetuple().tm_yday - 1]
+        remaining = days
+        while remaining > len(ordinals) - offset:
+            remaining -= len(ordinals) - offset
+            year += 1
+            _, ordinals = self._year(year)
+            offset = 0
+        return date.fromordinal(ordinals[offset + remaining - 1])
+
+    def next_business_day(self, day: date) -> date:
+        """Primer día laborable igual o posterior a ``day``."""
+        return self.end_of(day, 1)
+
+
+@lru_cache(maxsize=8)
+def _calendar_for(business_days: Tuple[int, ...], holidays: Tuple[str, ...]) -> BusinessCalendar:
+    return BusinessCalendar(business_days, holidays)
+
+
+def get_business_calendar() -> BusinessCalendar:
+    """
+    Calendario de la configuración actual, cacheado por días hábiles y festivos.
+
+    Returns:
+        BusinessCalendar: Calendario compartido para esa configuración
+    """
+    dates = get_settings().dates
+    return _calendar_for(tuple(sorted(dates.business_days)), tuple(sorted(dates.fixed_holidays)))
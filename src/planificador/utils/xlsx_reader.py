@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""
+Lectura en streaming de libros Excel (.xlsx).
+
+Un .xlsx es un ZIP con una hoja XML por pestaña. Este módulo recorre la hoja
+con ``iterparse`` fila a fila, vaciando cada fila una vez procesada y
+separándola de ``sheetData``, por lo que la memoria usada no depende del
+tamaño de la hoja. Solo se cargan
+completos los textos compartidos y los rellenos de los estilos, necesarios
+para resolver el valor y el color de cada celda.
+
+No se evalúan fórmulas: se devuelve el último valor calculado guardado en
+el fichero.
+
+Uso:
+    ```python
+    with XlsxReader("planning.xlsx") as reader:
+        for row_number, cells in reader.iter_rows("Planning"):
+            cell = cells.get("A")
+    ```
+"""
+
+import posixpath
+import re
+import zipfile
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from xml.etree import ElementTree
+
+from loguru import logger
+
+from ..exceptions.infrastructure import create_file_system_error
+
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_SHEET_DATA_TAG = f"{{{_MAIN_NS}}}sheetData"
+_ROW_TAG = f"{{{_MAIN_NS}}}row"
+_CELL_TAG = f"{{{_MAIN_NS}}}c"
+_VALUE_TAG = f"{{{_MAIN_NS}}}v"
+_INLINE_TAG = f"{{{_MAIN_NS}}}is"
+_TEXT_TAG = f"{{{_MAIN_NS}}}t"
+
+_CELL_REF = re.compile(r"([A-Z]+)(\d+)")
+
+# Día 0 de las fechas serie de Excel (sistema 1900, con el falso 29/02/1900)
+_EXCEL_EPOCH = date(1899, 12, 30)
+
+
+@dataclass(frozen=True)
+class XlsxCell:
+    """
+    Celda leída de una hoja.
+
+    Attributes:
+        value: Valor de la celda (str, int, float o bool).
+        fill: Color de relleno sólido en formato ARGB ("FFFFFF00"), si lo hay.
+    """
+    value: Any
+    fill: Optional[str] = None
+
+
+def column_index(letters: str) -> int:
+    """
+    Convierte una columna en letras a su índice (A=1, Z=26, AA=27).
+
+    Args:
+        letters: Letras de la columna.
+
+    Returns:
+        Índice de la columna empezando en 1.
+    """
+    index = 0
+    for char in letters.upper():
+        index = index * 26 + (ord(char) - ord("A") + 1)
+    return index
+
+
+def column_letters(index: int) -> str:
+    """
+    Convierte un índice de columna en sus letras (1=A, 26=Z, 27=AA).
+
+    Args:
+        index: Índice de la columna empezando en 1.
+
+    Returns:
+        Letras de la columna.
+    """
+    letters = ""
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def excel_serial_to_date(serial: Union[int, float]) -> date:
+    """
+    Convierte una fecha serie de Excel en ``date``.
+
+    Args:
+        serial: Número de días desde el 30/12/1899.
+
+    Returns:
+        Fecha correspondiente.
+    """
+    return _EXCEL_EPOCH + timedelta(days=int(serial))
+
+
+class XlsxReader:
+    """
+    Lector de solo lectura y en streaming de un fichero .xlsx.
+
+    Attributes:
+        path: Ruta del fichero.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Abre el fichero y carga los textos compartidos y los estilos.
+
+        Args:
+            path: Ruta del fichero .xlsx.
+
+        Raises:
+            FileSystemError: Si el fichero no existe o no es un .xlsx válido.
+        """
+        self.path = Path(path)
+        try:
+            self._zip = zipfile.ZipFile(self.path)
+            self._sheets = self._load_sheet_paths()
+            self._shared_strings = self._load_shared_strings()
+            self._fills = self._load_style_fills()
+        except (OSError, KeyError, zipfile.BadZipFile, ElementTree.ParseError) as e:
+            raise create_file_system_error(
+                message=f"No se pudo abrir el libro Excel {self.path}: {e}",
+                file_path=str(self.path),
+                operation="read_xlsx",
+            )
+        logger.debug("Libro Excel abierto: {} ({} hojas)", self.path, len(self._sheets))
+
+    def __enter__(self) -> "XlsxReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Cierra el fichero."""
+        self._zip.close()
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """Nombres de las hojas en el orden del libro."""
+        return list(self._sheets)
+
+    def _parse(self, member: str) -> ElementTree.Element:
+        """Parsea completo un XML pequeño del paquete."""
+        with self._zip.open(member) as stream:
+            return ElementTree.parse(stream).getroot()
+
+    def _load_sheet_paths(self) -> Dict[str, str]:
+        """Resuelve la ruta interna de cada hoja a partir de sus relaciones."""
+        workbook = self._parse("xl/workbook.xml")
+        rels = self._parse("xl/_rels/workbook.xml.rels")
+        targets = {
+            rel.get("Id"): rel.get("Target")
+            for rel in rels.iter(f"{{{_PKG_REL_NS}}}Relationship")
+        }
+        sheets: Dict[str, str] = {}
+        for sheet in workbook.iter(f"{{{_MAIN_NS}}}sheet"):
+            target = targets[sheet.get(f"{{{_REL_NS}}}id")]
+            if target.startswith("/"):
+                sheets[sheet.get("name")] = target.lstrip("/")
+            else:
+                sheets[sheet.get("name")] = posixpath.normpath(posixpath.join("xl", target))
+        return sheets
+
+    def _load_shared_strings(self) -> List[str]:
+        """Carga la tabla de textos compartidos."""
+        if "xl/sharedStrings.xml" not in self._zip.namelist():
+            return []
+        return [
+            "".join(text.text or "" for text in item.iter(_TEXT_TAG))
+            for item in self._parse("xl/sharedStrings.xml")
+        ]
+
+    def _load_style_fills(self) -> List[Optional[str]]:
+        """Color de relleno sólido (ARGB) de cada estilo de celda."""
+        if "xl/styles.xml" not in self._zip.namelist():
+            return []
+        styles = self._parse("xl/styles.xml")
+        fills: List[Optional[str]] = []
+        fills_node = styles.find(f"{{{_MAIN_NS}}}fills")
+        for fill in (fills_node if fills_node is not None else []):
+            pattern = fill.find(f"{{{_MAIN_NS}}}patternFill")
+            color = pattern.find(f"{{{_MAIN_NS}}}fgColor") if pattern is not None else None
+            if pattern is not None and pattern.get("patternType") == "solid" and color is not None:
+                fills.append(color.get("rgb"))
+            else:
+                fills.append(None)
+
+        cell_xfs = styles.find(f"{{{_MAIN_NS}}}cellXfs")
+        return [
+            fills[int(xf.get("fillId", 0))] if int(xf.get("fillId", 0)) < len(fills) else None
+            for xf in (cell_xfs if cell_xfs is not None else [])
+        ]
+
+    def _cell_value(self, cell: ElementTree.Element) -> Any:
+        """Valor tipado de una celda."""
+        cell_type = cell.get("t", "n")
+        if cell_type == "inlineStr":
+            inline = cell.find(_INLINE_TAG)
+            return "".join(t.text or "" for t in inline.iter(_TEXT_TAG)) if inline is not None else None
+
+        node = cell.find(_VALUE_TAG)
+        if node is None or node.text is None:
+            return None
+        raw = node.text
+        if cell_type == "s":
+            return self._shared_strings[int(raw)]
+        if cell_type == "b":
+            return raw == "1"
+        if cell_type in ("str", "e"):
+            return raw
+        number = float(raw)
+        return int(number) if number.is_integer() else number
+
+    def iter_rows(
+        self,
+        sheet_name: str,
+        min_row: int = 1,
+        max_row: Optional[int] = None,
+    ) -> Iterator[Tuple[int, Dict[str, XlsxCell]]]:
+        """
+        Recorre las filas de una hoja en streaming.
+
+        Solo se devuelven las celdas con valor o con relleno de color; las
+        filas vacías se omiten. Las filas y celdas sin atributo ``r`` (que el
+        formato permite omitir) toman la posición siguiente a la anterior.
+
+        Args:
+            sheet_name: Nombre de la hoja.
+            min_row: Primera fila (1-based) a devolver.
+            max_row: Última fila a devolver (por defecto hasta el final).
+
+        Yields:
+            Tuplas (número de fila, {columna: XlsxCell}).
+
+        Raises:
+            FileSystemError: Si la hoja no existe o el XML está dañado.
+        """
+        member = self._sheets.get(sheet_name)
+        if member is None:
+            raise create_file_system_error(
+                message=f"La hoja '{sheet_name}' no existe en {self.path}",
+                file_path=str(self.path),
+                operation="read_xlsx",
+            )
+
+        try:
+            with self._zip.open(member) as stream:
+                sheet_data: Optional[ElementTree.Element] = None
+                row_number = 0
+                for event, element in ElementTree.iterparse(stream, events=("start", "end")):
+                    if event == "start":
+                        if element.tag == _SHEET_DATA_TAG:
+                            sheet_data = element
+                        continue
+                    if element.tag != _ROW_TAG:
+                        continue
+                    reference = element.get("r")
+                    row_number = int(reference) if reference else row_number + 1
+                    if max_row is not None and row_number > max_row:
+                        break
+                    if row_number >= min_row:
+                        cells = self._row_cells(element)
+                        if cells:
+                            yield row_number, cells
+                    self._release_row(element, sheet_data)
+        except ElementTree.ParseError as e:
+            raise create_file_system_error(
+                message=f"Hoja '{sheet_name}' dañada en {self.path}: {e}",
+                file_path=str(self.path),
+                operation="read_xlsx",
+            )
+
+    @staticmethod
+    def _release_row(row: ElementTree.Element, sheet_data: Optional[ElementTree.Element]) -> None:
+        """
+        Libera una fila procesada.
+
+        ``clear`` vacía la fila, pero el elemento seguiría colgando de
+        ``sheetData``; se separa también para que las filas ya leídas no se
+        acumulen. Las filas se procesan en orden, así que es el primer hijo.
+        """
+        row.clear()
+        if sheet_data is not None and len(sheet_data) and sheet_data[0] is row:
+            del sheet_data[0]
+
+    def _row_cells(self, row: ElementTree.Element) -> Dict[str, XlsxCell]:
+        """Celdas con valor o color de una fila."""
+        cells: Dict[str, XlsxCell] = {}
+        column = 0
+        for cell in row.iter(_CELL_TAG):
+            reference = cell.get("r")
+            if reference:
+                match = _CELL_REF.match(reference)
+                if match is None:
+                    continue
+                column = column_index(match.group(1))
+            else:
+                column += 1
+            value = self._cell_value(cell)
+            style = int(cell.get("s", 0))
+            fill = self._fills[style] if style < len(self._fills) else None
+            if value is not None or fill is not None:
+                cells[column_letters(column)] = XlsxCell(value=value, fill=fill)
+        return cells